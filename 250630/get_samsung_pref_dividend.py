@@ -1,10 +1,20 @@
 
 import yfinance as yf
 import json
+import os
+import sys
+
+# 공유 시장 데이터 캐시가 있으면 사용 (MARKET_DATA_OFFLINE=1 이면 캐시만 사용)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'w_preferred_many_company_effective_years_with_window_size'))
+try:
+    from market_data_cache import get_market_data_cache
+except ImportError:
+    get_market_data_cache = None
 
 # 삼성전자 우선주 티커는 005935.KS 입니다.
 ticker = "005935.KS"
-samsung_pref = yf.Ticker(ticker)
+samsung_pref = get_market_data_cache().ticker(ticker) if get_market_data_cache else yf.Ticker(ticker)
 
 # 배당금 정보 가져오기
 dividends = samsung_pref.dividends
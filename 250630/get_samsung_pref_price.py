@@ -2,12 +2,25 @@
 import yfinance as yf
 import json
 from datetime import datetime
+import os
+import sys
+
+# 공유 시장 데이터 캐시가 있으면 사용 (MARKET_DATA_OFFLINE=1 이면 캐시만 사용)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'w_preferred_many_company_effective_years_with_window_size'))
+try:
+    from market_data_cache import get_market_data_cache
+except ImportError:
+    get_market_data_cache = None
 
 # 삼성전자 우선주 티커는 005935.KS 입니다.
 ticker = "005935.KS"
 
 # 데이터 가져오기 (현재 날짜까지)
-data = yf.download(ticker, start="2015-01-01", end=datetime.now().strftime('%Y-%m-%d'))
+if get_market_data_cache:
+    data = get_market_data_cache().download(ticker, start="2015-01-01", end=datetime.now().strftime('%Y-%m-%d'))
+else:
+    data = yf.download(ticker, start="2015-01-01", end=datetime.now().strftime('%Y-%m-%d'))
 
 # 필요한 데이터만 추출하여 딕셔너리로 변환
 price_dict = {}
@@ -6,6 +6,13 @@ import seaborn as sns
 from datetime import datetime, timedelta
 import platform
 import matplotlib.font_manager as fm
+import os
+import sys
+
+# 외부 배당금은 공용 레지스트리 하나에서 읽음 (dividend_data.py, DIVIDEND_REGISTRY_PATH로 경로 변경 가능)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'w_preferred_many_company_effective_years_with_window_size'))
+from dividend_data import registry_dividends
 
 # OS에 맞게 한글 폰트 설정
 system_name = platform.system()
@@ -163,35 +170,8 @@ if __name__ == "__main__":
 
     print(f"{start_date}부터 {end_date}까지 삼성전자와 삼성전자(우)의 일별 가격 차이 계산 중...")
 
-    # Investing.com에서 추출한 삼성전자(우) 배당금 데이터
-    dividend_history_pref = [
-        {"Ex-dividend Date": "6월 26, 2025", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 27, 2025", "Dividend": 365.00},
-        {"Ex-dividend Date": "12월 26, 2024", "Dividend": 364.00},
-        {"Ex-dividend Date": "9월 26, 2024", "Dividend": 361.00},
-        {"Ex-dividend Date": "6월 26, 2024", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 27, 2024", "Dividend": 361.00},
-        {"Ex-dividend Date": "12월 26, 2023", "Dividend": 362.00},
-        {"Ex-dividend Date": "9월 25, 2023", "Dividend": 361.00},
-        {"Ex-dividend Date": "6월 28, 2023", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 29, 2023", "Dividend": 361.00},
-        {"Ex-dividend Date": "12월 27, 2022", "Dividend": 362.00},
-        {"Ex-dividend Date": "9월 28, 2022", "Dividend": 361.00},
-        {"Ex-dividend Date": "6월 28, 2022", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 29, 2022", "Dividend": 361.00},
-        {"Ex-dividend Date": "12월 28, 2021", "Dividend": 362.00},
-        {"Ex-dividend Date": "9월 28, 2021", "Dividend": 361.00},
-        {"Ex-dividend Date": "6월 28, 2021", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 29, 2021", "Dividend": 361.00},
-        {"Ex-dividend Date": "12월 28, 2020", "Dividend": 1933.00},
-        {"Ex-dividend Date": "9월 27, 2020", "Dividend": 354.00}
-    ]
-
-    # 배당금 데이터를 pandas Series로 변환
-    external_dividends_series = pd.Series({
-        pd.to_datetime(item["Ex-dividend Date"], format='%m월 %d, %Y'): item["Dividend"]
-        for item in dividend_history_pref
-    }).sort_index()
+    # 삼성전자(우) 배당금은 공용 배당금 레지스트리(dividend_registry.csv)에서 읽음
+    external_dividends_series = registry_dividends(samsung_elec_pref_ticker)
 
     price_data_df = get_stock_data_with_diff_and_dividends(
         samsung_elec_ticker, 
@@ -6,6 +6,13 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import platform
 import matplotlib.font_manager as fm
+import os
+import sys
+
+# 외부 배당금은 공용 레지스트리 하나에서 읽음 (dividend_data.py, DIVIDEND_REGISTRY_PATH로 경로 변경 가능)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'w_preferred_many_company_effective_years_with_window_size'))
+from dividend_data import registry_dividends
 
 # OS에 맞게 한글 폰트 설정
 system_name = platform.system()
@@ -261,34 +268,8 @@ def run_backtest(json_file_path, initial_stock_type, initial_shares, start_date_
         buy_hold_portfolio_values = [] # 일별 Buy & Hold 포트폴리오 가치 저장
         accumulated_buy_hold_dividends = 0.0 # 누적 배당금
 
-        # 삼성전자 보통주 배당금 데이터 (Investing.com에서 추출)
-        dividend_history_elec = [
-            {"Ex-dividend Date": "6월 26, 2025", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 27, 2025", "Dividend": 365.00},
-            {"Ex-dividend Date": "12월 26, 2024", "Dividend": 363.00},
-            {"Ex-dividend Date": "9월 26, 2024", "Dividend": 361.00},
-            {"Ex-dividend Date": "6월 26, 2024", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 27, 2024", "Dividend": 361.00},
-            {"Ex-dividend Date": "12월 26, 2023", "Dividend": 361.00},
-            {"Ex-dividend Date": "9월 25, 2023", "Dividend": 361.00},
-            {"Ex-dividend Date": "6월 28, 2023", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 29, 2023", "Dividend": 361.00},
-            {"Ex-dividend Date": "12월 27, 2022", "Dividend": 361.00},
-            {"Ex-dividend Date": "9월 28, 2022", "Dividend": 361.00},
-            {"Ex-dividend Date": "6월 28, 2022", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 29, 2022", "Dividend": 361.00},
-            {"Ex-dividend Date": "12월 28, 2021", "Dividend": 361.00},
-            {"Ex-dividend Date": "9월 28, 2021", "Dividend": 361.00},
-            {"Ex-dividend Date": "6월 28, 2021", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 29, 2021", "Dividend": 361.00},
-            {"Ex-dividend Date": "12월 28, 2020", "Dividend": 1932.00},
-            {"Ex-dividend Date": "9월 27, 2020", "Dividend": 354.00}
-        ]
-
-        external_dividends_elec_series = pd.Series({
-            pd.to_datetime(item["Ex-dividend Date"], format='%m월 %d, %Y'): item["Dividend"]
-            for item in dividend_history_elec
-        }).sort_index()
+        # 삼성전자 보통주 배당금은 공용 배당금 레지스트리(dividend_registry.csv)에서 읽음
+        external_dividends_elec_series = registry_dividends('005930.KS')
 
         for date, row in df_backtest.iterrows():
             # 배당금 누적
@@ -12,54 +12,36 @@ import json
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
-import platform
-import matplotlib.font_manager as fm
+import os
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
-# Font setup for Korean text - Enhanced version
+# Optional shared on-disk market data cache and Korean font lookup (see ../w_preferred_many_company_effective_years_with_window_size)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'w_preferred_many_company_effective_years_with_window_size'))
+try:
+    from market_data_cache import get_market_data_cache, set_offline
+except ImportError:
+    get_market_data_cache = None
+    set_offline = None
+
+# Korean font lookup is cached per environment by the shared korean_font module
+try:
+    from korean_font import apply_korean_font
+except ImportError:
+    apply_korean_font = None
+
+# Font setup for Korean text (applied when charts are generated)
 def setup_korean_font():
-    """Setup Korean fonts with fallback options"""
-    system_name = platform.system()
-    
-    # Get available fonts
-    available_fonts = [f.name for f in fm.fontManager.ttflist]
-    
-    # Korean font candidates by system
-    if system_name == 'Windows':
-        font_candidates = ['Malgun Gothic', 'NanumGothic', 'Gulim', 'Dotum']
-    elif system_name == 'Darwin':
-        font_candidates = ['AppleGothic', 'AppleSDGothicNeo', 'NanumGothic']
-    else:  # Linux and others
-        font_candidates = ['NanumGothic', 'NanumBarunGothic', 'DejaVu Sans']
-    
-    # Find first available Korean font
-    selected_font = None
-    for font in font_candidates:
-        if font in available_fonts:
-            selected_font = font
-            break
-        # Case-insensitive search
-        for available in available_fonts:
-            if font.lower() in available.lower():
-                selected_font = available
-                break
-        if selected_font:
-            break
-    
-    # Set font
-    if selected_font:
-        plt.rcParams['font.family'] = selected_font
-        print(f"✅ Korean font set: {selected_font}")
-    else:
-        plt.rcParams['font.family'] = ['sans-serif']
-        print("⚠️  No Korean font found. Korean text may display as boxes.")
-    
-    plt.rcParams['axes.unicode_minus'] = False
-    return selected_font is not None
+    """Setup Korean fonts, reusing the cached font lookup"""
+    if apply_korean_font is not None:
+        return apply_korean_font(plt)
 
-# Initialize Korean font
-setup_korean_font()
+    plt.rcParams['font.family'] = ['sans-serif']
+    plt.rcParams['axes.unicode_minus'] = False
+    print("⚠️  No Korean font found. Korean text may display as boxes.")
+    return False
 
 # Extended Korean companies database
 KOREAN_DIVIDEND_COMPANIES = {
@@ -89,14 +71,22 @@ KOREAN_DIVIDEND_COMPANIES = {
 class KoreanDividendAnalyzer:
     """Korean Dividend Analysis System"""
     
-    def __init__(self):
+    def __init__(self, use_cache=False):
         self.companies = KOREAN_DIVIDEND_COMPANIES
         self.analysis_results = {}
+        # Route Yahoo Finance requests through the shared disk cache when requested and available
+        self.market_data = get_market_data_cache() if use_cache and get_market_data_cache else None
+        
+    def _ticker(self, ticker):
+        """Return a cached ticker when the market data cache is enabled, else yf.Ticker"""
+        if self.market_data is not None:
+            return self.market_data.ticker(ticker)
+        return yf.Ticker(ticker)
         
     def get_dividend_history(self, ticker, years=10):
         """Get dividend history for a specific ticker"""
         try:
-            stock = yf.Ticker(ticker)
+            stock = self._ticker(ticker)
             start_date = (datetime.now() - timedelta(days=years*365)).strftime('%Y-%m-%d')
             dividends = stock.dividends[start_date:]
             
@@ -147,7 +137,7 @@ class KoreanDividendAnalyzer:
     def get_stock_info(self, ticker):
         """Get current stock information including price and market cap"""
         try:
-            stock = yf.Ticker(ticker)
+            stock = self._ticker(ticker)
             info = stock.info
             hist = stock.history(period='5d')
             
@@ -411,6 +401,7 @@ class KoreanDividendAnalyzer:
         investment_scores = [results['investment_score'] for results in self.analysis_results.values()]
         sectors = [results['sector'] for results in self.analysis_results.values()]
         
+        setup_korean_font()
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
         
         # 1. Dividend Yield by Company
@@ -502,7 +493,16 @@ class KoreanDividendAnalyzer:
 
 def main():
     """Main function to run the Korean dividend analysis"""
-    analyzer = KoreanDividendAnalyzer()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Korean Dividend Analysis System')
+    parser.add_argument('--cache', action='store_true', help='Use the shared on-disk market data cache')
+    parser.add_argument('--offline', action='store_true', help='Serve market data from the cache only (implies --cache)')
+    args = parser.parse_args()
+    
+    if args.offline and set_offline:
+        set_offline(True)
+    analyzer = KoreanDividendAnalyzer(use_cache=args.cache or args.offline)
     
     print("🚀 한국 배당주 분석을 시작합니다...")
     results = analyzer.analyze_all_companies(min_consecutive_years=5)
@@ -6,6 +6,13 @@ import seaborn as sns
 from datetime import datetime, timedelta
 import platform
 import matplotlib.font_manager as fm
+import os
+import sys
+
+# 외부 배당금은 공용 레지스트리 하나에서 읽음 (dividend_data.py, DIVIDEND_REGISTRY_PATH로 경로 변경 가능)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'w_preferred_many_company_effective_years_with_window_size'))
+from dividend_data import registry_dividends
 
 # OS에 맞게 한글 폰트 설정
 system_name = platform.system()
@@ -338,35 +345,8 @@ def generate_stock_data_for_periods():
     samsung_elec_ticker = '005930.KS'
     samsung_elec_pref_ticker = '005935.KS'
     
-    # Investing.com에서 추출한 삼성전자(우) 배당금 데이터
-    dividend_history_pref = [
-        {"Ex-dividend Date": "6월 26, 2025", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 27, 2025", "Dividend": 365.00},
-        {"Ex-dividend Date": "12월 26, 2024", "Dividend": 364.00},
-        {"Ex-dividend Date": "9월 26, 2024", "Dividend": 361.00},
-        {"Ex-dividend Date": "6월 26, 2024", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 27, 2024", "Dividend": 361.00},
-        {"Ex-dividend Date": "12월 26, 2023", "Dividend": 362.00},
-        {"Ex-dividend Date": "9월 25, 2023", "Dividend": 361.00},
-        {"Ex-dividend Date": "6월 28, 2023", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 29, 2023", "Dividend": 361.00},
-        {"Ex-dividend Date": "12월 27, 2022", "Dividend": 362.00},
-        {"Ex-dividend Date": "9월 28, 2022", "Dividend": 361.00},
-        {"Ex-dividend Date": "6월 28, 2022", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 29, 2022", "Dividend": 361.00},
-        {"Ex-dividend Date": "12월 28, 2021", "Dividend": 362.00},
-        {"Ex-dividend Date": "9월 28, 2021", "Dividend": 361.00},
-        {"Ex-dividend Date": "6월 28, 2021", "Dividend": 361.00},
-        {"Ex-dividend Date": "3월 29, 2021", "Dividend": 361.00},
-        {"Ex-dividend Date": "12월 28, 2020", "Dividend": 1933.00},
-        {"Ex-dividend Date": "9월 27, 2020", "Dividend": 354.00}
-    ]
-
-    # 배당금 데이터를 pandas Series로 변환
-    external_dividends_series = pd.Series({
-        pd.to_datetime(item["Ex-dividend Date"], format='%m월 %d, %Y'): item["Dividend"]
-        for item in dividend_history_pref
-    }).sort_index()
+    # 삼성전자(우) 배당금은 공용 배당금 레지스트리(dividend_registry.csv)에서 읽음
+    external_dividends_series = registry_dividends(samsung_elec_pref_ticker)
     
     # 다양한 기간 설정 (3년, 5년, 10년, 20년, 30년)
     today = datetime.now()
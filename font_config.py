@@ -1,55 +1,27 @@
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
-import platform
+import os
+import sys
 import warnings
 
+# 한글 폰트 탐색과 캐시는 공용 모듈(korean_font)을 사용
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'w_preferred_many_company_effective_years_with_window_size'))
+from korean_font import apply_korean_font
+
 def setup_korean_font_robust():
     """
-    더 안정적인 한글 폰트 설정 함수
+    더 안정적인 한글 폰트 설정 함수 (폰트 탐색 결과는 환경마다 한 번만 계산해 캐시 파일에 저장)
     """
     # 경고 메시지 억제
     warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
     
-    # 사용 가능한 모든 폰트 목록 가져오기
-    available_fonts = [f.name for f in fm.fontManager.ttflist]
-    
-    # 한글 폰트 우선순위 목록
-    korean_font_candidates = [
-        'NanumGothic',
-        'NanumBarunGothic', 
-        'NanumMyeongjo',
-        'Nanum Gothic',
-        'DejaVu Sans'
-    ]
-    
-    selected_font = None
-    
-    # 사용 가능한 한글 폰트 찾기
-    for font_candidate in korean_font_candidates:
-        if font_candidate in available_fonts:
-            selected_font = font_candidate
-            break
-        # 대소문자 구분 없이 검색
-        for available_font in available_fonts:
-            if font_candidate.lower() in available_font.lower():
-                selected_font = available_font
-                break
-        if selected_font:
-            break
-    
-    # 폰트 설정
-    if selected_font:
-        plt.rcParams['font.family'] = selected_font
-        print(f"한글 폰트 설정: {selected_font}")
-    else:
-        # 대안: sans-serif 사용하고 한글이 있는 폰트 찾기
+    found = apply_korean_font(plt)
+    if not found:
+        # 대안: sans-serif 사용 (한글이 깨질 수 있음)
         plt.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
-        print("기본 폰트를 사용합니다. 한글이 깨질 수 있습니다.")
-    
-    # 마이너스 기호 깨짐 방지
-    plt.rcParams['axes.unicode_minus'] = False
     
-    return selected_font is not None
+    return found
 
 def setup_korean_font():
     """
@@ -7,6 +7,13 @@ import seaborn as sns
 from datetime import datetime, timedelta
 import platform
 import matplotlib.font_manager as fm
+import os
+import sys
+
+# 외부 배당금은 공용 레지스트리 하나에서 읽음 (dividend_data.py, DIVIDEND_REGISTRY_PATH로 경로 변경 가능)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'w_preferred_many_company_effective_years_with_window_size'))
+from dividend_data import load_dividend_registry, registry_dividends
 
 # OS에 맞게 한글 폰트 설정
 system_name = platform.system()
@@ -27,55 +34,31 @@ elif system_name == 'Linux':
 plt.rcParams['axes.unicode_minus'] = False # 마이너스 폰트 깨짐 방지
 
 # 우선주를 가진 한국 주요 회사들의 리스트 (실제 작동하는 4개 회사만)
+# 외부 배당금 데이터는 공용 dividend_registry.csv에서 티커별로 관리 (python dividend_data.py --import ...)
 PREFERRED_STOCK_COMPANIES = {
     '삼성전자': {
         'common': '005930.KS',      # 삼성전자
         'preferred': '005935.KS',   # 삼성전자(우)
         'name': '삼성전자',
-        'sector': '전자/반도체',
-        'dividend_data': [
-            {"Ex-dividend Date": "6월 26, 2025", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 27, 2025", "Dividend": 365.00},
-            {"Ex-dividend Date": "12월 26, 2024", "Dividend": 364.00},
-            {"Ex-dividend Date": "9월 26, 2024", "Dividend": 361.00},
-            {"Ex-dividend Date": "6월 26, 2024", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 27, 2024", "Dividend": 361.00},
-            {"Ex-dividend Date": "12월 26, 2023", "Dividend": 362.00},
-            {"Ex-dividend Date": "9월 25, 2023", "Dividend": 361.00},
-            {"Ex-dividend Date": "6월 28, 2023", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 29, 2023", "Dividend": 361.00},
-            {"Ex-dividend Date": "12월 27, 2022", "Dividend": 362.00},
-            {"Ex-dividend Date": "9월 28, 2022", "Dividend": 361.00},
-            {"Ex-dividend Date": "6월 28, 2022", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 29, 2022", "Dividend": 361.00},
-            {"Ex-dividend Date": "12월 28, 2021", "Dividend": 362.00},
-            {"Ex-dividend Date": "9월 28, 2021", "Dividend": 361.00},
-            {"Ex-dividend Date": "6월 28, 2021", "Dividend": 361.00},
-            {"Ex-dividend Date": "3월 29, 2021", "Dividend": 361.00},
-            {"Ex-dividend Date": "12월 28, 2020", "Dividend": 1933.00},
-            {"Ex-dividend Date": "9월 27, 2020", "Dividend": 354.00}
-        ]
+        'sector': '전자/반도체'
     },
     'LG화학': {
         'common': '051910.KS',      # LG화학
         'preferred': '051915.KS',   # LG화학(우)
         'name': 'LG화학',
-        'sector': '화학',
-        'dividend_data': None  # yfinance에서 자동 수집
+        'sector': '화학'
     },
     'LG전자': {
         'common': '066570.KS',      # LG전자
         'preferred': '066575.KS',   # LG전자(우)
         'name': 'LG전자',
-        'sector': '전자',
-        'dividend_data': None
+        'sector': '전자'
     },
     '현대자동차': {
         'common': '005380.KS',      # 현대자동차
         'preferred': '005385.KS',   # 현대자동차(우)
         'name': '현대자동차',
-        'sector': '자동차',
-        'dividend_data': None
+        'sector': '자동차'
     }
 }
 
@@ -282,24 +265,20 @@ def get_company_dividend_data(company_name, start_date=None, end_date=None, stoc
     
     if stock_type == 'preferred':
         ticker = company_info['preferred']
-        dividend_data = company_info['dividend_data']
         print(f"📊 {company_name} 우선주 배당금 데이터 수집 중...")
     else:  # common
         ticker = company_info['common']
-        dividend_data = None  # 보통주는 외부 데이터 없이 yfinance만 사용
         print(f"📈 {company_name} 보통주 배당금 데이터 수집 중...")
     
-    # 외부 배당금 데이터 처리 (우선주만)
+    # 외부 배당금 레지스트리 데이터 처리 (우선주만, 보통주는 yfinance만 사용)
     external_dividends = pd.Series(dtype=float)
-    if stock_type == 'preferred' and dividend_data is not None:
+    if stock_type == 'preferred':
         try:
-            external_dividends = pd.Series({
-                pd.to_datetime(item["Ex-dividend Date"], format='%m월 %d, %Y'): item["Dividend"]
-                for item in dividend_data
-            }).sort_index()
-            print(f"✓ {company_name} {stock_type} 외부 배당금 데이터: {len(external_dividends)}개 항목")
+            external_dividends = registry_dividends(ticker)
+            if not external_dividends.empty:
+                print(f"✓ {company_name} {stock_type} 외부 배당금 데이터: {len(external_dividends)}개 항목")
         except Exception as e:
-            print(f"❌ {company_name} {stock_type} 외부 배당금 데이터 파싱 실패: {e}")
+            print(f"❌ {company_name} {stock_type} 외부 배당금 레지스트리 로드 실패: {e}")
     
     # yfinance에서 배당금 데이터 가져오기
     yfinance_dividends = get_yfinance_dividend_data(ticker, start_date, end_date)
@@ -452,12 +431,18 @@ def print_available_companies():
             companies_by_sector[sector] = []
         companies_by_sector[sector].append((name, info))
     
+    try:
+        registry = load_dividend_registry()
+    except ValueError as e:
+        print(f"❌ {e}")
+        registry = {}
+    
     for sector, companies in companies_by_sector.items():
         print(f"\n🏭 {sector}:")
         for name, info in companies:
             common_ticker = info['common']
             preferred_ticker = info['preferred']
-            has_dividend_data = "✓" if info['dividend_data'] is not None else "○"
+            has_dividend_data = "✓" if preferred_ticker in registry else "○"
             print(f"  {has_dividend_data} {name}: {common_ticker} / {preferred_ticker}")
     
     print(f"\n📈 총 {len(PREFERRED_STOCK_COMPANIES)}개 회사 분석 가능")
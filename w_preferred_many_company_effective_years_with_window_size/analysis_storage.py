@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+기간별 분석 데이터({회사명}_stock_analysis_{기간}.*) 저장소
+
+stock_diff.py가 생성하고 분석/백테스트 스크립트가 읽는 기간별 데이터를
+Parquet 또는 Feather 같은 컬럼 기반 형식으로 저장합니다.
+- 읽는 쪽은 필요한 컬럼만 지정해서 로드할 수 있습니다. (columns 인자)
+- JSON은 기존 형식과 동일한 내보내기(export) 용도로 계속 지원합니다.
+- pyarrow가 설치되어 있지 않으면 JSON으로 저장합니다.
+
+저장 형식은 ANALYSIS_STORAGE_FORMAT 환경 변수(parquet, feather, json)로 바꿀 수 있습니다.
+
+한 프로세스에서 여러 단계를 실행할 때(pipeline.py)는 shared_frame_cache() 블록 안에서
+저장/로드한 데이터를 메모리에 보관하여 다음 단계가 같은 파일을 다시 읽지 않도록 합니다.
+
+기존 JSON 파일 변환:
+    python analysis_storage.py --migrate
+    python analysis_storage.py --migrate --format feather --remove-json
+"""
+
+import contextlib
+import glob
+import json
+import os
+
+import pandas as pd
+
+from instrumentation import timed
+
+try:
+    import pyarrow  # noqa: F401  (Parquet/Feather 엔진)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+STORAGE_FORMAT_ENV = 'ANALYSIS_STORAGE_FORMAT'
+
+# 형식별 파일 확장자 (읽을 때는 이 순서로 찾음)
+STORAGE_EXTENSIONS = {
+    'parquet': '.parquet',
+    'feather': '.feather',
+    'json': '.json',
+}
+
+# 사분위수 윈도우 상태 파일 확장자 (incremental_update.py)
+WINDOW_STATE_EXTENSION = '.window_state.npz'
+
+# JSON 파일의 날짜 인덱스 형식 (기존 형식 유지)
+JSON_DATE_FORMAT = '%y-%m-%d'
+
+_fallback_warned = False
+
+# shared_frame_cache() 블록 안에서만 사용: {절대 경로: ((mtime_ns, size), 전체 DataFrame)}
+_shared_frames = None
+
+
+def get_default_storage_format():
+    """
+    기본 저장 형식을 반환합니다.
+
+    Returns:
+        str: 'parquet', 'feather' 또는 'json'
+    """
+    storage_format = os.environ.get(STORAGE_FORMAT_ENV, '').strip().lower()
+    if storage_format:
+        if storage_format not in STORAGE_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 저장 형식입니다: {storage_format} (parquet, feather, json)")
+    else:
+        storage_format = 'parquet'
+
+    if storage_format != 'json' and not PYARROW_AVAILABLE:
+        global _fallback_warned
+        if not _fallback_warned:
+            print(f"⚠️ pyarrow가 설치되어 있지 않아 {storage_format} 대신 JSON으로 저장합니다. (pip install pyarrow)")
+            _fallback_warned = True
+        return 'json'
+    return storage_format
+
+
+def _storage_format_of(path):
+    """파일 확장자로 저장 형식을 판별합니다."""
+    extension = os.path.splitext(path)[1].lower()
+    for storage_format, format_extension in STORAGE_EXTENSIONS.items():
+        if extension == format_extension:
+            return storage_format
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {path}")
+
+
+def analysis_data_path(company_name, period, storage_format=None, directory='.'):
+    """
+    회사/기간별 분석 데이터 파일 경로를 반환합니다.
+
+    Args:
+        company_name (str): 회사명
+        period (str): 분석 기간 (예: '20년')
+        storage_format (str, optional): 저장 형식 (기본값: get_default_storage_format())
+        directory (str): 데이터 디렉터리 (기본값: 현재 디렉터리)
+
+    Returns:
+        str: 파일 경로
+    """
+    storage_format = storage_format or get_default_storage_format()
+    safe_company_name = company_name.replace('/', '_').replace('\\', '_')
+    return os.path.join(directory, f'{safe_company_name}_stock_analysis_{period}{STORAGE_EXTENSIONS[storage_format]}')
+
+
+def window_state_path(company_name, period, directory='.'):
+    """
+    회사/기간별 사분위수 윈도우 상태 파일 경로를 반환합니다. (저장 형식과 관계없이 하나)
+
+    Args:
+        company_name (str): 회사명
+        period (str): 분석 기간 (예: '20년')
+        directory (str): 데이터 디렉터리 (기본값: 현재 디렉터리)
+
+    Returns:
+        str: 파일 경로 ({회사명}_stock_analysis_{기간}.window_state.npz)
+    """
+    safe_company_name = company_name.replace('/', '_').replace('\\', '_')
+    return os.path.join(directory, f'{safe_company_name}_stock_analysis_{period}{WINDOW_STATE_EXTENSION}')
+
+
+def find_analysis_data_path(company_name, period, directory='.'):
+    """
+    이미 저장된 분석 데이터 파일을 찾습니다. (parquet → feather → json 순서)
+
+    Args:
+        company_name (str): 회사명
+        period (str): 분석 기간 (예: '20년')
+        directory (str): 데이터 디렉터리 (기본값: 현재 디렉터리)
+
+    Returns:
+        str: 존재하는 파일 경로, 없으면 JSON 파일 경로 (기존 오류 메시지와 호환)
+    """
+    for storage_format in STORAGE_EXTENSIONS:
+        if storage_format != 'json' and not PYARROW_AVAILABLE:
+            continue
+        path = analysis_data_path(company_name, period, storage_format, directory)
+        if os.path.exists(path):
+            return path
+    return analysis_data_path(company_name, period, 'json', directory)
+
+
+def _columnar_file_columns(path, storage_format):
+    """Parquet/Feather 파일의 컬럼 목록을 데이터를 읽지 않고 가져옵니다."""
+    import pyarrow as pa
+    if storage_format == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.read_schema(path).names
+    import pyarrow.ipc as ipc
+    with pa.memory_map(path) as source:
+        return ipc.open_file(source).schema.names
+
+
+@contextlib.contextmanager
+def shared_frame_cache():
+    """
+    블록 안에서 읽고 쓴 분석 데이터를 메모리에 보관합니다. (pipeline.py의 단계 간 데이터 전달용)
+
+    - read_analysis_file: 파일마다 처음 한 번만 전체를 읽고, 이후에는 요청한 컬럼만 복사해서 반환
+    - write_analysis_file: Parquet/Feather로 저장한 DataFrame을 그대로 보관 (다음 단계는 파일을 읽지 않음)
+    블록 밖(다른 프로세스 등)에서 파일이 바뀌면 수정 시각/크기가 달라지므로 다시 읽습니다.
+    """
+    global _shared_frames
+    previous = _shared_frames
+    if previous is None:
+        _shared_frames = {}
+    try:
+        yield
+    finally:
+        _shared_frames = previous
+
+
+def _file_state(path):
+    """공유 캐시 유효성 확인용 파일 상태 (수정 시각, 크기)"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_file(path, storage_format, columns):
+    """파일 형식에 맞게 읽어 날짜 순으로 정렬된 DataFrame을 반환합니다."""
+    if storage_format == 'json':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        df = pd.DataFrame.from_dict(data, orient='index')
+        df.index = pd.to_datetime(df.index, format=JSON_DATE_FORMAT)
+        if columns is not None:
+            df = df[[col for col in columns if col in df.columns]]
+    else:
+        if columns is not None:
+            available = set(_columnar_file_columns(path, storage_format))
+            columns = [col for col in columns if col in available]
+        if storage_format == 'parquet':
+            # 인덱스(Date)는 pandas 메타데이터로 함께 복원됨
+            df = pd.read_parquet(path, columns=columns)
+        else:
+            # Feather는 인덱스를 저장하지 않으므로 Date 컬럼으로 저장/복원
+            read_columns = None if columns is None else ['Date'] + columns
+            df = pd.read_feather(path, columns=read_columns).set_index('Date')
+
+    df.index.name = 'Date'
+    return df.sort_index()
+
+
+@timed()
+def read_analysis_file(path, columns=None):
+    """
+    분석 데이터 파일을 읽어 날짜 인덱스(Date) DataFrame으로 반환합니다.
+
+    Args:
+        path (str): .parquet, .feather 또는 .json 파일 경로
+        columns (list, optional): 읽을 컬럼 목록 (파일에 없는 컬럼은 무시, 기본값: 전체)
+
+    Returns:
+        pd.DataFrame: 날짜 순으로 정렬된 데이터
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+    """
+    storage_format = _storage_format_of(path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    if _shared_frames is None:
+        return _read_file(path, storage_format, columns)
+
+    key = os.path.abspath(path)
+    state = _file_state(path)
+    cached = _shared_frames.get(key)
+    if cached is None or cached[0] != state:
+        cached = (state, _read_file(path, storage_format, None))
+        _shared_frames[key] = cached
+
+    df = cached[1]
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    return df.copy()
+
+
+@timed()
+def write_analysis_file(df, path):
+    """
+    분석 데이터를 파일 확장자에 맞는 형식으로 저장합니다.
+
+    Args:
+        df (pd.DataFrame): 날짜 인덱스 DataFrame
+        path (str): 저장할 파일 경로 (.parquet, .feather, .json)
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    storage_format = _storage_format_of(path)
+    df = df.copy()
+    df.index = pd.DatetimeIndex(df.index, name='Date')
+
+    if storage_format == 'json':
+        # 기존 JSON 형식 유지: YY-mm-dd 문자열 인덱스
+        df.index = df.index.strftime(JSON_DATE_FORMAT)
+        df.to_json(path, orient='index', indent=4)
+    elif storage_format == 'parquet':
+        df.to_parquet(path)
+    else:
+        df.reset_index().to_feather(path)
+
+    if _shared_frames is not None:
+        key = os.path.abspath(path)
+        if storage_format == 'json':
+            # JSON은 저장하면서 값이 반올림되므로 다음 읽기에서 파일 내용을 사용
+            _shared_frames.pop(key, None)
+        else:
+            # Parquet/Feather는 저장한 값이 그대로 읽히므로 파일을 다시 읽지 않음
+            _shared_frames[key] = (_file_state(path), df.sort_index())
+    return path
+
+
+def load_analysis_data(company_name, period, columns=None, directory='.'):
+    """
+    회사/기간별 분석 데이터를 로드합니다.
+
+    Args:
+        company_name (str): 회사명
+        period (str): 분석 기간 (예: '20년')
+        columns (list, optional): 읽을 컬럼 목록 (기본값: 전체)
+        directory (str): 데이터 디렉터리 (기본값: 현재 디렉터리)
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스 DataFrame
+
+    Raises:
+        FileNotFoundError: 데이터 파일이 없는 경우
+    """
+    return read_analysis_file(find_analysis_data_path(company_name, period, directory), columns)
+
+
+def save_analysis_data(df, company_name, period, storage_format=None, export_json=False, directory='.'):
+    """
+    회사/기간별 분석 데이터를 저장합니다.
+
+    다른 컬럼 기반 형식으로 저장된 같은 기간의 이전 파일은 제거하여 최신 파일이 읽히도록 합니다.
+    (export_json=True이면 기존 형식의 JSON 파일도 함께 저장)
+
+    Args:
+        df (pd.DataFrame): 날짜 인덱스 DataFrame
+        company_name (str): 회사명
+        period (str): 분석 기간 (예: '20년')
+        storage_format (str, optional): 저장 형식 (기본값: get_default_storage_format())
+        export_json (bool): JSON 파일도 함께 내보낼지 여부
+        directory (str): 데이터 디렉터리 (기본값: 현재 디렉터리)
+
+    Returns:
+        str: 저장한 (기본 형식) 파일 경로
+    """
+    storage_format = storage_format or get_default_storage_format()
+    path = write_analysis_file(df, analysis_data_path(company_name, period, storage_format, directory))
+
+    for other_format in STORAGE_EXTENSIONS:
+        if other_format == storage_format:
+            continue
+        other_path = analysis_data_path(company_name, period, other_format, directory)
+        if other_format == 'json':
+            if export_json:
+                write_analysis_file(df, other_path)
+        elif os.path.exists(other_path):
+            os.remove(other_path)
+    return path
+
+
+def migrate_json_files(directory='.', storage_format=None, remove_json=False):
+    """
+    기존 *_stock_analysis_*.json 파일을 컬럼 기반 형식으로 변환합니다.
+
+    Args:
+        directory (str): 변환할 파일이 있는 디렉터리 (기본값: 현재 디렉터리)
+        storage_format (str, optional): 변환할 형식 (기본값: get_default_storage_format())
+        remove_json (bool): 변환 후 원본 JSON 파일 삭제 여부
+
+    Returns:
+        list: 변환된 파일 경로 목록
+    """
+    storage_format = storage_format or get_default_storage_format()
+    if storage_format == 'json':
+        print("❌ 변환할 컬럼 형식이 없습니다. (pyarrow 설치 또는 --format 확인)")
+        return []
+
+    migrated = []
+    json_files = sorted(glob.glob(os.path.join(directory, '*_stock_analysis_*.json')))
+    for json_path in json_files:
+        try:
+            df = read_analysis_file(json_path)
+            target_path = os.path.splitext(json_path)[0] + STORAGE_EXTENSIONS[storage_format]
+            write_analysis_file(df, target_path)
+            before = os.path.getsize(json_path)
+            after = os.path.getsize(target_path)
+            print(f"✅ {os.path.basename(json_path)} → {os.path.basename(target_path)} "
+                  f"({before:,} → {after:,} bytes)")
+            if remove_json:
+                os.remove(json_path)
+            migrated.append(target_path)
+        except Exception as e:
+            print(f"❌ {json_path} 변환 실패: {e}")
+
+    print(f"📦 변환 완료: {len(migrated)}/{len(json_files)}개 파일")
+    return migrated
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='기간별 분석 데이터 저장소 관리')
+    parser.add_argument('--migrate', '-m', action='store_true', help='기존 JSON 파일을 컬럼 기반 형식으로 변환')
+    parser.add_argument('--format', '-f', type=str, choices=['parquet', 'feather'],
+                        help='변환할 형식 (기본값: parquet)')
+    parser.add_argument('--directory', '-d', type=str, default='.', help='데이터 디렉터리 (기본값: 현재 디렉터리)')
+    parser.add_argument('--remove-json', action='store_true', help='변환 후 원본 JSON 파일 삭제')
+
+    args = parser.parse_args()
+
+    if args.migrate:
+        migrate_json_files(args.directory, args.format, args.remove_json)
+    else:
+        parser.print_help()
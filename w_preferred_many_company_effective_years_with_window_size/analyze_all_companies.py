@@ -7,51 +7,44 @@
 """
 
 import pandas as pd
-import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-import platform
-import matplotlib.font_manager as fm
 import numpy as np
 from datetime import datetime
 import os
+from analysis_storage import find_analysis_data_path
+from instrumentation import add_instrumentation_arguments, start_from_args, timed
+from lazy_imports import lazy_pyplot, lazy_seaborn
+from price_panel import load_panel_frame
+from render_profile import RENDER_PROFILES, chart_path, save_chart, set_render_profile
 
-# OS에 맞게 한글 폰트 설정
-system_name = platform.system()
-if system_name == 'Windows':
-    plt.rcParams['font.family'] = 'Malgun Gothic'
-elif system_name == 'Darwin': # Mac OS
-    plt.rcParams['font.family'] = 'AppleGothic'
-elif system_name == 'Linux':
-    # 나눔고딕 폰트가 있는지 확인
-    if fm.findfont('NanumGothic', fontext='ttf'):
-        plt.rcParams['font.family'] = 'NanumGothic'
-    else:
-        print("나눔고딕 폰트가 설치되어 있지 않습니다. 'sudo apt-get install fonts-nanum*'으로 설치할 수 있습니다.")
-        plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['axes.unicode_minus'] = False
+# matplotlib/seaborn은 그래프를 처음 그릴 때 import 하고 한글 폰트도 그때 설정 (lazy_imports)
+plt = lazy_pyplot()
+sns = lazy_seaborn(plt)
+
+# 생성 파일 (차트는 render_profile.chart_path 기준 경로, pipeline.py가 출력 확인에 사용)
+REPORT_FILE = 'company_analysis_report.md'
+BOXPLOT_CHART = 'company_comparison_boxplot.png'
+HEATMAP_CHART = 'company_correlation_heatmap.png'
+TIMESERIES_CHART = 'company_timeseries_comparison.png'
+CHART_FILES = [BOXPLOT_CHART, HEATMAP_CHART, TIMESERIES_CHART]
 
-def load_company_data(company_name, period='20년'):
+@timed()
+def load_company_data(company_name, period='20년', columns=('Price_Diff_Ratio',)):
     """
     특정 회사의 분석 데이터를 로드합니다.
     
     Args:
         company_name (str): 회사명
         period (str): 분석 기간 (기본값: '20년')
+        columns (tuple, optional): 로드할 컬럼 (기본값: Price_Diff_Ratio만, None이면 전체)
         
     Returns:
         pd.DataFrame: 로드된 데이터프레임, 실패 시 None
     """
     try:
-        safe_company_name = company_name.replace('/', '_').replace('\\', '_')
-        json_file = f'./{safe_company_name}_stock_analysis_{period}.json'
+        json_file = find_analysis_data_path(company_name, period)
         
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        df = pd.DataFrame.from_dict(data, orient='index')
-        df.index = pd.to_datetime(df.index, format='%y-%m-%d')
-        df = df.sort_index()
+        # 모든 회사 데이터를 모은 패널 파일을 메모리 매핑으로 읽음 (price_panel.py)
+        df = load_panel_frame(company_name, period, columns=None if columns is None else list(columns))
         
         return df
         
@@ -62,11 +55,12 @@ def load_company_data(company_name, period='20년'):
         print(f"❌ {company_name} 데이터 로드 실패: {e}")
         return None
 
+@timed()
 def generate_company_comparison_report():
     """
     모든 회사들의 Price_Diff_Ratio 비교 리포트를 생성합니다.
     """
-    from stock_diff import PREFERRED_STOCK_COMPANIES
+    from companies import PREFERRED_STOCK_COMPANIES
     
     print("📊 회사별 Price_Diff_Ratio 비교 분석 시작")
     print("=" * 80)
@@ -153,9 +147,10 @@ def generate_company_comparison_report():
     plt.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1.15, 1))
     
     plt.tight_layout()
-    plt.savefig('company_comparison_boxplot.png', dpi=300, bbox_inches='tight')
+    boxplot_path = save_chart(plt, BOXPLOT_CHART)
     plt.close()
-    print(f"\n📊 회사별 박스플롯 비교 저장: company_comparison_boxplot.png")
+    if boxplot_path:
+        print(f"\n📊 회사별 박스플롯 비교 저장: {boxplot_path}")
     
     # 3. 히트맵 (상관관계 분석)
     if len(company_data) >= 2:
@@ -185,9 +180,10 @@ def generate_company_comparison_report():
                        square=True, fmt='.2f', cbar_kws={"shrink": .8})
             plt.title('회사별 Price_Diff_Ratio 상관관계', fontsize=16, fontweight='bold')
             plt.tight_layout()
-            plt.savefig('company_correlation_heatmap.png', dpi=300, bbox_inches='tight')
+            heatmap_path = save_chart(plt, HEATMAP_CHART)
             plt.close()
-            print(f"📊 상관관계 히트맵 저장: company_correlation_heatmap.png")
+            if heatmap_path:
+                print(f"📊 상관관계 히트맵 저장: {heatmap_path}")
     
     # 4. 시계열 비교 (대표 회사들)
     top_companies = stats_df.head(5).index.tolist()  # 평균이 낮은 상위 5개 회사
@@ -205,9 +201,10 @@ def generate_company_comparison_report():
     plt.grid(True, alpha=0.3)
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.savefig('company_timeseries_comparison.png', dpi=300, bbox_inches='tight')
+    timeseries_path = save_chart(plt, TIMESERIES_CHART)
     plt.close()
-    print(f"📊 시계열 비교 그래프 저장: company_timeseries_comparison.png")
+    if timeseries_path:
+        print(f"📊 시계열 비교 그래프 저장: {timeseries_path}")
     
     # 5. 업종별 분석
     sector_stats = {}
@@ -239,7 +236,7 @@ def generate_company_comparison_report():
         print(f"{sector:^15} | 평균: {avg_mean:^8.2f} | 변동성: {avg_std:^8.2f} | 회사수: {company_count:^3}")
     
     # 6. 리포트 파일 생성
-    report_file = 'company_analysis_report.md'
+    report_file = REPORT_FILE
     
     with open(report_file, 'w', encoding='utf-8') as f:
         f.write("# 📊 우선주 가격차이 비율 종합 분석 리포트\n\n")
@@ -265,9 +262,9 @@ def generate_company_comparison_report():
             f.write(f"| {summary['sector']} | {summary['avg_mean']:.2f}% | {summary['avg_std']:.2f}% | {summary['company_count']} | {summary['companies']} |\n")
         
         f.write("\n## 📊 생성된 차트\n\n")
-        f.write("1. `company_comparison_boxplot.png`: 회사별 분포 비교\n")
-        f.write("2. `company_correlation_heatmap.png`: 회사간 상관관계\n")
-        f.write("3. `company_timeseries_comparison.png`: 시계열 비교\n\n")
+        f.write(f"1. `{chart_path(BOXPLOT_CHART)}`: 회사별 분포 비교\n")
+        f.write(f"2. `{chart_path(HEATMAP_CHART)}`: 회사간 상관관계\n")
+        f.write(f"3. `{chart_path(TIMESERIES_CHART)}`: 시계열 비교\n\n")
         
         f.write("## 💡 주요 발견\n\n")
         
@@ -309,12 +306,19 @@ if __name__ == "__main__":
         type=str,
         help='분석할 특정 회사명 (예: 삼성전자, LG화학). 지정하지 않으면 모든 회사 분석'
     )
+    parser.add_argument('--render-profile', type=str, choices=list(RENDER_PROFILES),
+                        help='차트 저장 프로파일 (report: 300 DPI PNG, draft: 저해상도 PNG, svg, none: 저장 안 함)')
+    add_instrumentation_arguments(parser)
     
     args = parser.parse_args()
+    start_from_args(args)
+
+    if args.render_profile:
+        set_render_profile(args.render_profile)
     
     if args.company:
         # 특정 회사만 분석
-        from stock_diff import PREFERRED_STOCK_COMPANIES
+        from companies import PREFERRED_STOCK_COMPANIES
         
         if args.company in PREFERRED_STOCK_COMPANIES:
             print(f"🎯 {args.company} 개별 분석 시작")
@@ -346,7 +350,7 @@ if __name__ == "__main__":
         else:
             print(f"❌ '{args.company}'는 지원되지 않는 회사입니다.")
             print("\n📋 지원하는 회사 목록:")
-            from stock_diff import print_available_companies
+            from companies import print_available_companies
             print_available_companies()
     else:
         # 기본값: 모든 회사 분석
@@ -1,75 +1,413 @@
-import pandas as pd
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-import platform
-import matplotlib.font_manager as fm
 import os
+import time
+from analysis_storage import find_analysis_data_path, read_analysis_file
+from instrumentation import add_instrumentation_arguments, start_from_args, timed
+from lazy_imports import lazy_pyplot, lazy_seaborn
+from parallel_runner import resolve_jobs, run_tasks
+from render_profile import RENDER_PROFILES, save_chart, saved_chart_paths, set_render_profile
 
-# 나눔고딕 폰트 설정 (경고 메시지 제거)
-nanum_font_path = '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'
-
-# 폰트 경로가 존재하는지 확인하고 설정
-if os.path.exists(nanum_font_path):
-    print(f"✅ 나눔고딕 폰트 발견: {nanum_font_path}")
-    # 폰트를 matplotlib에 등록
-    font_prop = fm.FontProperties(fname=nanum_font_path)
-    plt.rcParams['font.family'] = font_prop.get_name()
-    print(f"✅ 나눔고딕 폰트 설정 완료: {font_prop.get_name()}")
-else:
-    print("⚠️ 나눔고딕 폰트를 찾을 수 없어 기본 폰트를 사용합니다.")
-    # OS별 기본 한글 폰트 설정
-    system_name = platform.system()
-    if system_name == 'Windows':
-        plt.rcParams['font.family'] = 'Malgun Gothic'
-    elif system_name == 'Darwin':  # Mac OS
-        plt.rcParams['font.family'] = 'AppleGothic'
-    else:  # Linux 기본
-        plt.rcParams['font.family'] = 'sans-serif'
-
-plt.rcParams['axes.unicode_minus'] = False  # 마이너스 폰트 깨짐 방지
-
-# matplotlib 폰트 캐시 새로고침 (경고 메시지 제거)
-try:
-    fm._get_font.cache_clear()
-except AttributeError:
-    pass  # 오래된 matplotlib 버전에서는 이 메서드가 없을 수 있음
-
-def analyze_price_diff_ratio(json_file_path, company_name="삼성전자"):
+# matplotlib/seaborn은 그래프를 처음 그릴 때 import 하고 한글 폰트도 그때 설정 (lazy_imports)
+plt = lazy_pyplot()
+sns = lazy_seaborn(plt)
+
+# 그래프에 사용하는 컬럼 (데이터 파일에서 필요한 컬럼만 로드)
+PERCENTILE_COLUMNS = ['Price_Diff_Ratio_25th_Percentile', 'Price_Diff_Ratio_75th_Percentile'] + [
+    f'Price_Diff_Ratio_{q}th_Percentile_{window}' for window in ('2year', '3year', '5year') for q in (25, 75)
+]
+ANALYSIS_COLUMNS = ['Stock1_Close', 'Stock2_Close', 'Price_Difference', 'Price_Diff_Ratio'] + PERCENTILE_COLUMNS
+TIMESERIES_COLUMNS = ['Price_Diff_Ratio'] + PERCENTILE_COLUMNS
+
+def _safe_company_name(company_name):
+    """파일명에 사용할 수 있도록 회사명의 경로 구분자를 바꿉니다."""
+    return company_name.replace('/', '_').replace('\\', '_')
+
+
+def _plot_distribution(fig, df, spec):
+    """히스토그램과 박스 플롯"""
+    company_name = spec['company']
+    price_diff_ratio = df['Price_Diff_Ratio']
+
+    plt.subplot(1, 2, 1)
+    sns.histplot(price_diff_ratio, kde=True)
+    plt.title(f'Price_Diff_Ratio 히스토그램 ({company_name})')
+    plt.xlabel('Price_Diff_Ratio (%)')
+    plt.ylabel('빈도')
+
+    plt.subplot(1, 2, 2)
+    sns.boxplot(y=price_diff_ratio)
+    plt.title(f'Price_Diff_Ratio 박스 플롯 ({company_name})')
+    plt.ylabel('Price_Diff_Ratio (%)')
+
+
+def _plot_stock_prices(fig, df, spec):
+    """보통주 종가, 우선주 종가, 가격 차이 (3단 그래프)"""
+    company_name = spec['company']
+    axes = fig.subplots(3, 1)
+    fig.suptitle(f'{company_name} 보통주와 우선주 종가 및 가격 차이', fontsize=16)
+
+    # 첫 번째 서브플롯: 보통주 종가
+    if 'Stock1_Close' in df.columns:
+        axes[0].plot(df.index, df['Stock1_Close'], label=f'{company_name} 보통주', color='blue', linewidth=1.5)
+        axes[0].set_title(f'{company_name} 보통주 종가')
+        axes[0].set_ylabel('가격 (원)')
+        axes[0].grid(True, alpha=0.3)
+        axes[0].tick_params(axis='x', rotation=45)
+
+    # 두 번째 서브플롯: 우선주 종가
+    if 'Stock2_Close' in df.columns:
+        axes[1].plot(df.index, df['Stock2_Close'], label=f'{company_name} 우선주', color='red', linewidth=1.5)
+        axes[1].set_title(f'{company_name} 우선주 종가')
+        axes[1].set_ylabel('가격 (원)')
+        axes[1].grid(True, alpha=0.3)
+        axes[1].tick_params(axis='x', rotation=45)
+
+    # 세 번째 서브플롯: 가격 차이
+    if 'Price_Difference' in df.columns:
+        axes[2].plot(df.index, df['Price_Difference'], label='가격 차이', color='green', linewidth=1.5)
+        axes[2].set_title(f'가격 차이 ({company_name} 보통주 - 우선주)')
+        axes[2].set_ylabel('가격 차이 (원)')
+        axes[2].set_xlabel('날짜')
+        axes[2].grid(True, alpha=0.3)
+        axes[2].tick_params(axis='x', rotation=45)
+        # 0선 표시
+        axes[2].axhline(y=0, color='black', linestyle='--', alpha=0.5)
+
+
+def _plot_overall_ratio_lines(df):
+    """가격 차이 비율 그래프의 공통 기준선 (0선, 전체 기간 평균, 전체 기간 25%/75% 분위)"""
+    # 0선 표시
+    plt.axhline(y=0, color='black', linestyle='--', alpha=0.5)
+
+    # 전체 기간 평균선 표시
+    mean_ratio = df['Price_Diff_Ratio'].mean()
+    plt.axhline(y=mean_ratio, color='orange', linestyle=':', alpha=0.7, label=f'전체기간 평균: {mean_ratio:.2f}%')
+
+    # 전체 기간 25%, 75% 사분위수 선 표시
+    q25_overall = df['Price_Diff_Ratio'].quantile(0.25)
+    q75_overall = df['Price_Diff_Ratio'].quantile(0.75)
+    plt.axhline(y=q25_overall, color='gray', linestyle='-.', alpha=0.5, label=f'전체기간 25% 분위: {q25_overall:.2f}%')
+    plt.axhline(y=q75_overall, color='gray', linestyle='-.', alpha=0.5, label=f'전체기간 75% 분위: {q75_overall:.2f}%')
+
+
+def _plot_ratio_window(fig, df, spec):
+    """가격 차이 비율과 슬라이딩 윈도우 사분위수 (analyze_price_diff_ratio)"""
+    company_name, period, window_info = spec['company'], spec['period'], spec['window']
+    has_default_window = ('Price_Diff_Ratio_25th_Percentile' in df.columns and
+                          'Price_Diff_Ratio_75th_Percentile' in df.columns)
+
+    plt.plot(df.index, df['Price_Diff_Ratio'], label='가격 차이 비율', color='purple', linewidth=1.5)
+
+    plt.title(f'가격 차이 비율 (%) - {window_info} 슬라이딩 윈도우 사분위수 포함 ({company_name} {period})', fontsize=16)
+    plt.ylabel('비율 (%)')
+    plt.xlabel('날짜')
+    plt.grid(True, alpha=0.3)
+    plt.xticks(rotation=45)
+
+    _plot_overall_ratio_lines(df)
+
+    # 해당 윈도우의 슬라이딩 윈도우 사분위수 선 표시
+    if window_info == '2year' and has_default_window and 'Price_Diff_Ratio_25th_Percentile_2year' not in df.columns:
+        # 기본 윈도우 사용 (컬럼명에 _2year 없는 경우)
+        plt.plot(df.index, df['Price_Diff_Ratio_25th_Percentile'],
+                 color='blue', linestyle='--', alpha=0.8, linewidth=1,
+                 label=f'{window_info} 슬라이딩 25% 분위')
+        plt.plot(df.index, df['Price_Diff_Ratio_75th_Percentile'],
+                 color='red', linestyle='--', alpha=0.8, linewidth=1,
+                 label=f'{window_info} 슬라이딩 75% 분위')
+    else:
+        # 명시적 윈도우 컬럼 사용
+        q25_col = f'Price_Diff_Ratio_25th_Percentile_{window_info}'
+        q75_col = f'Price_Diff_Ratio_75th_Percentile_{window_info}'
+        if q25_col in df.columns and q75_col in df.columns:
+            plt.plot(df.index, df[q25_col],
+                     color='blue', linestyle='--', alpha=0.8, linewidth=1,
+                     label=f'{window_info} 슬라이딩 25% 분위')
+            plt.plot(df.index, df[q75_col],
+                     color='red', linestyle='--', alpha=0.8, linewidth=1,
+                     label=f'{window_info} 슬라이딩 75% 분위')
+
+    plt.legend()
+
+
+def _plot_normalized(fig, df, spec):
+    """모든 데이터를 0-1 범위로 정규화한 통합 그래프"""
+    company_name = spec['company']
+    col_name_map = {
+        'Stock1_Close': f'{company_name} 보통주 종가',
+        'Stock2_Close': f'{company_name} 우선주 종가',
+        'Price_Difference': '가격 차이',
+        'Price_Diff_Ratio': '가격 차이 비율'
+    }
+
+    # 각 데이터를 0-1 범위로 정규화
+    for col in col_name_map:
+        if col in df.columns:
+            data = df[col]
+            normalized_data = (data - data.min()) / (data.max() - data.min())
+            plt.plot(df.index, normalized_data, label=col_name_map[col], linewidth=1.5, alpha=0.8)
+
+    plt.title(f'정규화된 시계열 데이터 비교 (0-1 범위) - {company_name}')
+    plt.xlabel('날짜')
+    plt.ylabel('정규화된 값 (0-1)')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.xticks(rotation=45)
+
+
+def _plot_period_timeseries(fig, df, spec):
+    """기간 x 윈도우 사이즈별 시계열 그래프 (generate_timeseries_plots_for_all_periods)"""
+    company_name, period, window_size = spec['company'], spec['period'], spec['window']
+
+    # 기본 시계열 그래프
+    plt.plot(df.index, df['Price_Diff_Ratio'],
+             label='가격 차이 비율', color='purple', linewidth=1.5, alpha=0.8)
+
+    _plot_overall_ratio_lines(df)
+
+    # 윈도우 사이즈별 슬라이딩 윈도우 사분위수 선 표시
+    q25_col = f'Price_Diff_Ratio_25th_Percentile_{window_size}'
+    q75_col = f'Price_Diff_Ratio_75th_Percentile_{window_size}'
+
+    if q25_col in df.columns and q75_col in df.columns:
+        plt.plot(df.index, df[q25_col],
+                 color='blue', linestyle='--', alpha=0.8, linewidth=1.5,
+                 label=f'{window_size} 슬라이딩 25% 분위')
+        plt.plot(df.index, df[q75_col],
+                 color='red', linestyle='--', alpha=0.8, linewidth=1.5,
+                 label=f'{window_size} 슬라이딩 75% 분위')
+    else:
+        # 기본 2year 윈도우가 있는 경우
+        if 'Price_Diff_Ratio_25th_Percentile' in df.columns and 'Price_Diff_Ratio_75th_Percentile' in df.columns:
+            plt.plot(df.index, df['Price_Diff_Ratio_25th_Percentile'],
+                     color='blue', linestyle='--', alpha=0.8, linewidth=1.5,
+                     label='슬라이딩 25% 분위')
+            plt.plot(df.index, df['Price_Diff_Ratio_75th_Percentile'],
+                     color='red', linestyle='--', alpha=0.8, linewidth=1.5,
+                     label='슬라이딩 75% 분위')
+
+    plt.title(f'가격 차이 비율 ({company_name} {period}, {window_size} 윈도우)', fontsize=16)
+    plt.ylabel('비율 (%)')
+    plt.xlabel('날짜')
+    plt.grid(True, alpha=0.3)
+    plt.xticks(rotation=45)
+    plt.legend()
+
+
+# 차트 종류별 (그리기 함수, 그림 크기, 저장 파일명, 저장 후 메시지)
+CHART_KINDS = {
+    'distribution': (_plot_distribution, (12, 6), '{company}_price_diff_ratio_distribution_{period}.png',
+                     "히스토그램과 박스플롯이 '{path}'로 저장되었습니다."),
+    'stock_prices': (_plot_stock_prices, (15, 12), '{company}_stock_prices_and_difference_{period}.png',
+                     "종가 및 가격 차이 그래프가 '{path}'로 저장되었습니다."),
+    'ratio_window': (_plot_ratio_window, (15, 8), '{company}_price_diff_ratio_timeseries_{period}_{window}.png',
+                     "  - {window} 윈도우 시계열 그래프: '{path}' 저장 완료"),
+    'normalized': (_plot_normalized, (15, 8), '{company}_normalized_comparison_{period}.png',
+                   "정규화된 통합 그래프가 '{path}'로 저장되었습니다."),
+    'period_timeseries': (_plot_period_timeseries, (15, 8),
+                          '{company}_price_diff_ratio_timeseries_{period}_{window}.png',
+                          "✓ {path} 저장 완료"),
+}
+
+
+def chart_spec(kind, data_path, company_name, period, window=None):
     """
-    JSON 파일에서 Price_Diff_Ratio의 분포를 분석하고 해석 가이드를 제공합니다.
+    차트 하나를 그리는 데 필요한 정보(스펙)를 만듭니다.
 
     Args:
-        json_file_path (str): 분석할 JSON 파일의 경로.
+        kind (str): 차트 종류 (CHART_KINDS 키)
+        data_path (str): 분석 데이터 파일 경로
+        company_name (str): 회사명
+        period (str): 분석 기간 (예: '20년')
+        window (str): 윈도우 사이즈 (예: '2year', 윈도우별 차트만)
+
+    Returns:
+        dict: 차트 스펙 (pickle 가능, 작업 프로세스로 전달)
+    """
+    filename = CHART_KINDS[kind][2].format(company=_safe_company_name(company_name), period=period, window=window)
+    return {'kind': kind, 'data_path': data_path, 'company': company_name, 'period': period,
+            'window': window, 'filename': filename}
+
+
+def company_chart_paths(company_name, periods):
+    """
+    analyze_company_all_periods가 기간마다 저장하는 차트 파일 경로를 반환합니다. (pipeline.py 출력 확인용)
+
+    Args:
+        company_name (str): 회사명
+        periods (list): 분석 기간 목록 (예: ['3년', '20년'])
+
+    Returns:
+        list: 현재 프로파일의 차트 파일 경로 목록 (none 프로파일이면 빈 목록)
+    """
+    filenames = []
+    for period in periods:
+        for kind in ('distribution', 'stock_prices', 'normalized'):
+            filenames.append(chart_spec(kind, None, company_name, period)['filename'])
+        for window_size in ('2year', '3year', '5year'):
+            filenames.append(chart_spec('period_timeseries', None, company_name, period, window_size)['filename'])
+    return saved_chart_paths(filenames)
+
+
+@timed()
+def render_chart(df, spec):
+    """
+    스펙에 맞는 차트를 그려 저장하고 Figure를 닫습니다. (그리는 중 오류가 나도 Figure는 닫힘)
+
+    Args:
+        df (pd.DataFrame): 분석 데이터
+        spec (dict): chart_spec()으로 만든 스펙
+
+    Returns:
+        str: 저장한 파일 경로 (none 프로파일이면 None)
+    """
+    plot, figsize, _, message = CHART_KINDS[spec['kind']]
+    fig = plt.figure(figsize=figsize)
+    try:
+        plot(fig, df, spec)
+        fig.tight_layout()
+        path = save_chart(fig, spec['filename'])
+    finally:
+        plt.close(fig)
+    if path:
+        print(message.format(path=path, **spec))
+    return path
+
+
+@timed()
+def render_chart_batch(data_path, specs):
+    """
+    데이터 파일을 한 번 읽어 해당 파일의 차트들을 그립니다. (작업 프로세스에서 실행)
+
+    차트 하나가 실패해도 나머지 차트는 계속 그립니다.
+
+    Args:
+        data_path (str): 분석 데이터 파일 경로
+        specs (list): 같은 데이터 파일의 차트 스펙 목록
+
+    Returns:
+        tuple: (저장한 파일 경로 목록, 실패한 차트 파일명 목록)
+    """
+    df = read_analysis_file(data_path, columns=ANALYSIS_COLUMNS)
+    saved, failed = [], []
+    for spec in specs:
+        try:
+            path = render_chart(df, spec)
+        except Exception as e:
+            print(f"❌ {spec['filename']} 차트 생성 중 오류: {e}")
+            failed.append(spec['filename'])
+            continue
+        if path:
+            saved.append(path)
+    return saved, failed
+
+
+class ChartQueue:
+    """
+    차트 작업 큐
+
+    분석 함수는 차트를 바로 그리지 않고 스펙만 추가하며, render()에서 모아 둔 차트를
+    프로세스 풀(parallel_runner.run_tasks, Agg 백엔드)로 나누어 그립니다.
+    - 작업 단위는 데이터 파일 (파일을 한 번만 읽음). 파일 수가 프로세스 수보다 적으면 차트 단위로 나눔
+    - 같은 파일명의 차트가 다시 추가되면 나중 스펙만 남깁니다. (순차 실행 때 마지막으로 저장되던 그래프와 같음)
+    - 작업 프로세스는 CHART_RENDER_PROFILE 환경 변수로 같은 저장 프로파일을 사용합니다.
+    - 그리지 못한 차트는 failed에 (회사명, 파일명)으로 남습니다.
+    """
+
+    def __init__(self):
+        self._specs = {}  # 저장 파일명 -> 스펙 (추가 순서 유지)
+        self.failed = []
+
+    def __len__(self):
+        return len(self._specs)
+
+    def add(self, spec):
+        """차트 스펙을 추가합니다."""
+        self._specs.pop(spec['filename'], None)
+        self._specs[spec['filename']] = spec
+
+    def _tasks(self, jobs):
+        """run_tasks용 (key, args) 작업 목록을 만듭니다."""
+        batches = {}
+        for spec in self._specs.values():
+            batches.setdefault(spec['data_path'], []).append(spec)
+
+        if resolve_jobs(jobs) > len(batches):
+            return [((spec['company'], spec['filename']), (spec['data_path'], [spec]))
+                    for spec in self._specs.values()]
+        return [((specs[0]['company'], specs[0]['period'], os.path.basename(data_path)), (data_path, specs))
+                for data_path, specs in batches.items()]
+
+    @timed()
+    def render(self, jobs=1):
+        """
+        모아 둔 차트를 모두 그리고 큐를 비웁니다.
+
+        Args:
+            jobs (int | None): 프로세스 수 (parallel_runner.resolve_jobs 참고, 1이면 현재 프로세스에서 순서대로)
+
+        Returns:
+            list: 저장한 파일 경로 목록
+        """
+        if not self._specs:
+            return []
+
+        total = len(self._specs)
+        tasks = self._tasks(jobs)
+        self._specs = {}
+
+        print(f"\n🖼️ 차트 {total}개 생성 중...")
+        started = time.perf_counter()
+        outcomes = run_tasks(render_chart_batch, tasks, jobs)
+        saved = []
+        for key, (_, specs) in tasks:
+            result = outcomes[key]['result']
+            if result is None:
+                # 데이터 파일을 읽지 못하는 등 작업 전체가 실패
+                self.failed.extend((spec['company'], spec['filename']) for spec in specs)
+                continue
+            saved.extend(result[0])
+            company = {spec['filename']: spec['company'] for spec in specs}
+            self.failed.extend((company[filename], filename) for filename in result[1])
+        print(f"🖼️ 차트 {len(saved)}/{total}개 저장 ({time.perf_counter() - started:.1f}초)")
+        return saved
+
+
+@timed()
+def analyze_price_diff_ratio(json_file_path, company_name="삼성전자", chart_queue=None):
+    """
+    데이터 파일(Parquet/Feather/JSON)에서 Price_Diff_Ratio의 분포를 분석하고 해석 가이드를 제공합니다.
+
+    Args:
+        json_file_path (str): 분석할 데이터 파일의 경로.
         company_name (str): 분석할 회사명 (기본값: "삼성전자")
+        chart_queue (ChartQueue): 차트를 추가할 큐 (None이면 분석이 끝난 뒤 현재 프로세스에서 바로 그림)
+
+    Returns:
+        bool: 분석 성공 여부 (오류는 출력만 하고 False 반환)
     """
     try:
         # 파일명에서 기간 정보 추출
-        import os
         filename = os.path.basename(json_file_path)
         period = "기본"  # 기본값
-        
-        # 파일명 패턴: {회사명}_stock_analysis_{기간}.json
+
+        # 파일명 패턴: {회사명}_stock_analysis_{기간}.{parquet|feather|json}
         if '_stock_analysis_' in filename:
             try:
-                period = filename.split('_stock_analysis_')[1].replace('.json', '')
+                period = os.path.splitext(filename.split('_stock_analysis_')[1])[0]
             except:
                 period = "기본"
-        
+
         print(f"\n=== {company_name} ({period}) Price_Diff_Ratio 분석 ===")
-        
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
 
-        # 딕셔너리를 DataFrame으로 변환
-        df = pd.DataFrame.from_dict(data, orient='index')
-        df.index = pd.to_datetime(df.index, format='%y-%m-%d') # 인덱스를 datetime 객체로 변환
-        df = df.sort_index() # 날짜 기준으로 정렬
+        # 그래프에 필요한 컬럼만 로드 (날짜 인덱스, 날짜순 정렬)
+        df = read_analysis_file(json_file_path, columns=ANALYSIS_COLUMNS)
 
         if 'Price_Diff_Ratio' not in df.columns:
             print(f"오류: '{json_file_path}' 파일에 'Price_Diff_Ratio' 컬럼이 없습니다.")
-            return
+            return False
 
+        queue = chart_queue if chart_queue is not None else ChartQueue()
         price_diff_ratio = df['Price_Diff_Ratio']
 
         print("--- Price_Diff_Ratio 분포 분석 ---")
@@ -77,178 +415,47 @@ def analyze_price_diff_ratio(json_file_path, company_name="삼성전자"):
         print(price_diff_ratio.describe())
 
         print("\n2. 분포 시각화 (히스토그램 및 박스 플롯):")
-        plt.figure(figsize=(12, 6))
-
-        plt.subplot(1, 2, 1)
-        sns.histplot(price_diff_ratio, kde=True)
-        plt.title(f'Price_Diff_Ratio 히스토그램 ({company_name})')
-        plt.xlabel('Price_Diff_Ratio (%)')
-        plt.ylabel('빈도')
-
-        plt.subplot(1, 2, 2)
-        sns.boxplot(y=price_diff_ratio)
-        plt.title(f'Price_Diff_Ratio 박스 플롯 ({company_name})')
-        plt.ylabel('Price_Diff_Ratio (%)')
-
-        plt.tight_layout()
-        # 회사명을 포함한 파일명으로 저장 (회사명이 먼저 오도록)
-        safe_company_name = company_name.replace('/', '_').replace('\\', '_')
-        distribution_filename = f'{safe_company_name}_price_diff_ratio_distribution_{period}.png'
-        plt.savefig(distribution_filename, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"히스토그램과 박스플롯이 '{distribution_filename}'로 저장되었습니다.")
+        queue.add(chart_spec('distribution', json_file_path, company_name, period))
 
         # 추가 그래프: 시간에 따른 가격 및 비율 변화
         print("\n3. 시간에 따른 가격 및 비율 변화:")
-        
+
         # 필요한 컬럼들이 있는지 확인 (실제 컬럼명에 맞게 수정)
         required_columns = ['Stock1_Close', 'Stock2_Close', 'Price_Difference', 'Price_Diff_Ratio']
         available_columns = [col for col in required_columns if col in df.columns]
-        
+
         if len(available_columns) >= 2:
             # 첫 번째 그래프: 보통주 종가, 우선주 종가, 가격 차이
             print("첫 번째 그래프: 종가 및 가격 차이")
-            fig, axes = plt.subplots(3, 1, figsize=(15, 12))
-            fig.suptitle(f'{company_name} 보통주와 우선주 종가 및 가격 차이', fontsize=16)
-            
-            # 첫 번째 서브플롯: 보통주 종가
-            if 'Stock1_Close' in df.columns:
-                axes[0].plot(df.index, df['Stock1_Close'], label=f'{company_name} 보통주', color='blue', linewidth=1.5)
-                axes[0].set_title(f'{company_name} 보통주 종가')
-                axes[0].set_ylabel('가격 (원)')
-                axes[0].grid(True, alpha=0.3)
-                axes[0].tick_params(axis='x', rotation=45)
-            
-            # 두 번째 서브플롯: 우선주 종가
-            if 'Stock2_Close' in df.columns:
-                axes[1].plot(df.index, df['Stock2_Close'], label=f'{company_name} 우선주', color='red', linewidth=1.5)
-                axes[1].set_title(f'{company_name} 우선주 종가')
-                axes[1].set_ylabel('가격 (원)')
-                axes[1].grid(True, alpha=0.3)
-                axes[1].tick_params(axis='x', rotation=45)
-            
-            # 세 번째 서브플롯: 가격 차이
-            if 'Price_Difference' in df.columns:
-                axes[2].plot(df.index, df['Price_Difference'], label='가격 차이', color='green', linewidth=1.5)
-                axes[2].set_title(f'가격 차이 ({company_name} 보통주 - 우선주)')
-                axes[2].set_ylabel('가격 차이 (원)')
-                axes[2].set_xlabel('날짜')
-                axes[2].grid(True, alpha=0.3)
-                axes[2].tick_params(axis='x', rotation=45)
-                # 0선 표시
-                axes[2].axhline(y=0, color='black', linestyle='--', alpha=0.5)
-            
-            plt.tight_layout()
-            stock_prices_filename = f'{safe_company_name}_stock_prices_and_difference_{period}.png'
-            plt.savefig(stock_prices_filename, dpi=300, bbox_inches='tight')
-            plt.close()
-            print(f"종가 및 가격 차이 그래프가 '{stock_prices_filename}'로 저장되었습니다.")
-            
+            queue.add(chart_spec('stock_prices', json_file_path, company_name, period))
+
             # 두 번째 그래프: 가격 차이 비율 (별도 그래프) - 모든 윈도우 사이즈별로 생성
-            if 'Price_Diff_Ratio' in df.columns:
-                print("두 번째 그래프: 가격 차이 비율 및 슬라이딩 윈도우 사분위수 (모든 윈도우 사이즈)")
-                
-                # 사용 가능한 윈도우 사이즈 확인
-                available_windows = []
-                for window in ['2year', '3year', '5year']:
-                    q25_col = f'Price_Diff_Ratio_25th_Percentile_{window}'
-                    q75_col = f'Price_Diff_Ratio_75th_Percentile_{window}'
-                    if q25_col in df.columns and q75_col in df.columns:
-                        available_windows.append(window)
-                
-                # 기본 윈도우가 있는 경우도 확인
-                has_default_window = ('Price_Diff_Ratio_25th_Percentile' in df.columns and 
-                                    'Price_Diff_Ratio_75th_Percentile' in df.columns)
-                
-                if has_default_window and not available_windows:
-                    available_windows = ['2year']  # 기본 윈도우를 2year로 처리
-                
-                # 각 윈도우 사이즈별로 별도 그래프 생성
-                for window_info in available_windows:
-                    plt.figure(figsize=(15, 8))
-                    plt.plot(df.index, df['Price_Diff_Ratio'], label='가격 차이 비율', color='purple', linewidth=1.5)
-                    
-                    plt.title(f'가격 차이 비율 (%) - {window_info} 슬라이딩 윈도우 사분위수 포함 ({company_name} {period})', fontsize=16)
-                    plt.ylabel('비율 (%)')
-                    plt.xlabel('날짜')
-                    plt.grid(True, alpha=0.3)
-                    plt.xticks(rotation=45)
-                    
-                    # 0선 표시
-                    plt.axhline(y=0, color='black', linestyle='--', alpha=0.5)
-                    
-                    # 전체 기간 평균선 표시
-                    mean_ratio = df['Price_Diff_Ratio'].mean()
-                    plt.axhline(y=mean_ratio, color='orange', linestyle=':', alpha=0.7, label=f'전체기간 평균: {mean_ratio:.2f}%')
-                    
-                    # 전체 기간 25%, 75% 사분위수 선 표시
-                    q25_overall = df['Price_Diff_Ratio'].quantile(0.25)
-                    q75_overall = df['Price_Diff_Ratio'].quantile(0.75)
-                    plt.axhline(y=q25_overall, color='gray', linestyle='-.', alpha=0.5, label=f'전체기간 25% 분위: {q25_overall:.2f}%')
-                    plt.axhline(y=q75_overall, color='gray', linestyle='-.', alpha=0.5, label=f'전체기간 75% 분위: {q75_overall:.2f}%')
-                    
-                    # 해당 윈도우의 슬라이딩 윈도우 사분위수 선 표시
-                    if window_info == '2year' and has_default_window and 'Price_Diff_Ratio_25th_Percentile_2year' not in df.columns:
-                        # 기본 윈도우 사용 (컬럼명에 _2year 없는 경우)
-                        plt.plot(df.index, df['Price_Diff_Ratio_25th_Percentile'], 
-                                color='blue', linestyle='--', alpha=0.8, linewidth=1, 
-                                label=f'{window_info} 슬라이딩 25% 분위')
-                        plt.plot(df.index, df['Price_Diff_Ratio_75th_Percentile'], 
-                                color='red', linestyle='--', alpha=0.8, linewidth=1, 
-                                label=f'{window_info} 슬라이딩 75% 분위')
-                    else:
-                        # 명시적 윈도우 컬럼 사용
-                        q25_col = f'Price_Diff_Ratio_25th_Percentile_{window_info}'
-                        q75_col = f'Price_Diff_Ratio_75th_Percentile_{window_info}'
-                        if q25_col in df.columns and q75_col in df.columns:
-                            plt.plot(df.index, df[q25_col], 
-                                    color='blue', linestyle='--', alpha=0.8, linewidth=1, 
-                                    label=f'{window_info} 슬라이딩 25% 분위')
-                            plt.plot(df.index, df[q75_col], 
-                                    color='red', linestyle='--', alpha=0.8, linewidth=1, 
-                                    label=f'{window_info} 슬라이딩 75% 분위')
-                    
-                    plt.legend()
-                    plt.tight_layout()
-                    timeseries_filename = f'{safe_company_name}_price_diff_ratio_timeseries_{period}_{window_info}.png'
-                    plt.savefig(timeseries_filename, dpi=300, bbox_inches='tight')
-                    plt.close()
-                    print(f"  - {window_info} 윈도우 시계열 그래프: '{timeseries_filename}' 저장 완료")
-                
-                print(f"📈 총 {len(available_windows)}개 윈도우 사이즈 시계열 그래프 생성 완료")
-            
+            print("두 번째 그래프: 가격 차이 비율 및 슬라이딩 윈도우 사분위수 (모든 윈도우 사이즈)")
+
+            # 사용 가능한 윈도우 사이즈 확인
+            available_windows = []
+            for window in ['2year', '3year', '5year']:
+                q25_col = f'Price_Diff_Ratio_25th_Percentile_{window}'
+                q75_col = f'Price_Diff_Ratio_75th_Percentile_{window}'
+                if q25_col in df.columns and q75_col in df.columns:
+                    available_windows.append(window)
+
+            # 기본 윈도우가 있는 경우도 확인
+            has_default_window = ('Price_Diff_Ratio_25th_Percentile' in df.columns and
+                                'Price_Diff_Ratio_75th_Percentile' in df.columns)
+
+            if has_default_window and not available_windows:
+                available_windows = ['2year']  # 기본 윈도우를 2year로 처리
+
+            # 각 윈도우 사이즈별로 별도 그래프 생성
+            for window_info in available_windows:
+                queue.add(chart_spec('ratio_window', json_file_path, company_name, period, window_info))
+
+            print(f"📈 총 {len(available_windows)}개 윈도우 사이즈 시계열 그래프 추가")
+
             # 통합 그래프: 모든 데이터를 한 번에 보기 (정규화)
-            if len(available_columns) >= 2:
-                print("\n4. 정규화된 통합 그래프:")
-                plt.figure(figsize=(15, 8))
-                
-                # 각 데이터를 0-1 범위로 정규화
-                for col in available_columns:
-                    if col in df.columns:
-                        data = df[col]
-                        normalized_data = (data - data.min()) / (data.max() - data.min())
-                        
-                        # 컬럼명을 한글로 변환
-                        col_name_map = {
-                            'Stock1_Close': f'{company_name} 보통주 종가',
-                            'Stock2_Close': f'{company_name} 우선주 종가',
-                            'Price_Difference': '가격 차이',
-                            'Price_Diff_Ratio': '가격 차이 비율'
-                        }
-                        display_name = col_name_map.get(col, col)
-                        plt.plot(df.index, normalized_data, label=display_name, linewidth=1.5, alpha=0.8)
-                
-                plt.title(f'정규화된 시계열 데이터 비교 (0-1 범위) - {company_name}')
-                plt.xlabel('날짜')
-                plt.ylabel('정규화된 값 (0-1)')
-                plt.legend()
-                plt.grid(True, alpha=0.3)
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-                normalized_filename = f'{safe_company_name}_normalized_comparison_{period}.png'
-                plt.savefig(normalized_filename, dpi=300, bbox_inches='tight')
-                plt.close()
-                print(f"정규화된 통합 그래프가 '{normalized_filename}'로 저장되었습니다.")
+            print("\n4. 정규화된 통합 그래프:")
+            queue.add(chart_spec('normalized', json_file_path, company_name, period))
         else:
             print(f"필요한 컬럼들을 찾을 수 없습니다. 사용 가능한 컬럼: {list(df.columns)}")
 
@@ -269,118 +476,126 @@ def analyze_price_diff_ratio(json_file_path, company_name="삼성전자"):
         print("  - **역사적 범위 (Min/Max):** 최소값과 최대값은 비율이 가질 수 있는 극단적인 범위를 보여줍니다. 현재 비율이 역사적 최소값에 가까우면 보통주가 유리하고, 최대값에 가까우면 우선주가 유리하다고 판단할 수 있습니다.")
         print("\n결론적으로, '크다' 또는 '작다'의 기준은 절대적인 것이 아니라, 해당 비율의 **역사적 분포**와 **평균, 중앙값, 사분위수**를 기준으로 상대적으로 판단해야 합니다. 히스토그램과 박스 플롯을 통해 시각적으로 분포를 확인하면 더욱 직관적인 이해를 얻을 수 있습니다.")
 
+        if chart_queue is None:
+            queue.render()
+        return True
+
     except FileNotFoundError:
         print(f"오류: 파일을 찾을 수 없습니다. 경로를 확인해주세요: {json_file_path}")
     except json.JSONDecodeError:
         print(f"오류: JSON 파일을 디코딩할 수 없습니다. 파일 형식을 확인해주세요: {json_file_path}")
     except Exception as e:
         print(f"데이터 처리 중 오류가 발생했습니다: {e}")
+    return False
 
-def generate_timeseries_plots_for_all_periods(company_name="삼성전자"):
+@timed()
+def generate_timeseries_plots_for_all_periods(company_name="삼성전자", chart_queue=None, jobs=1):
     """
     특정 회사의 모든 기간과 윈도우 사이즈에 대해 price_diff_ratio 시계열 그래프를 생성합니다.
-    
+
     Args:
         company_name (str): 분석할 회사명 (기본값: "삼성전자")
+        chart_queue (ChartQueue): 차트를 추가할 큐 (None이면 바로 그림)
+        jobs (int): 바로 그릴 때 사용할 프로세스 수 (1이면 순차 실행)
+
+    Returns:
+        list: 데이터를 읽지 못한 (회사명, 기간) 목록
     """
     periods = ['3년', '5년', '10년', '20년', '30년']
     window_sizes = ['2year', '3year', '5year']
-    
+    failed = []
+
     print(f"=== {company_name} 기간별 및 윈도우 사이즈별 시계열 그래프 생성 ===\n")
-    
-    safe_company_name = company_name.replace('/', '_').replace('\\', '_')
-    
+
+    queue = chart_queue if chart_queue is not None else ChartQueue()
+
     for period in periods:
-        json_file = f'./{safe_company_name}_stock_analysis_{period}.json'
-        
+        json_file = find_analysis_data_path(company_name, period)
+
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # 딕셔너리를 DataFrame으로 변환
-            df = pd.DataFrame.from_dict(data, orient='index')
-            df.index = pd.to_datetime(df.index, format='%y-%m-%d')
-            df = df.sort_index()
-            
+            # 컬럼 확인만 하고 그래프 데이터는 차트 작업에서 읽음
+            df = read_analysis_file(json_file, columns=['Price_Diff_Ratio'])
+
             if 'Price_Diff_Ratio' not in df.columns:
                 print(f"경고: '{json_file}' 파일에 'Price_Diff_Ratio' 컬럼이 없습니다.")
+                failed.append((company_name, period))
                 continue
-            
+
             # 각 윈도우 사이즈별로 그래프 생성
             for window_size in window_sizes:
-                plt.figure(figsize=(15, 8))
-                
-                # 기본 시계열 그래프
-                plt.plot(df.index, df['Price_Diff_Ratio'], 
-                        label='가격 차이 비율', color='purple', linewidth=1.5, alpha=0.8)
-                
-                # 0선 표시
-                plt.axhline(y=0, color='black', linestyle='--', alpha=0.5)
-                
-                # 전체 기간 평균선 표시
-                mean_ratio = df['Price_Diff_Ratio'].mean()
-                plt.axhline(y=mean_ratio, color='orange', linestyle=':', alpha=0.7, 
-                           label=f'전체기간 평균: {mean_ratio:.2f}%')
-                
-                # 전체 기간 25%, 75% 사분위수 선 표시
-                q25_overall = df['Price_Diff_Ratio'].quantile(0.25)
-                q75_overall = df['Price_Diff_Ratio'].quantile(0.75)
-                plt.axhline(y=q25_overall, color='gray', linestyle='-.', alpha=0.5, 
-                           label=f'전체기간 25% 분위: {q25_overall:.2f}%')
-                plt.axhline(y=q75_overall, color='gray', linestyle='-.', alpha=0.5, 
-                           label=f'전체기간 75% 분위: {q75_overall:.2f}%')
-                
-                # 윈도우 사이즈별 슬라이딩 윈도우 사분위수 선 표시
-                q25_col = f'Price_Diff_Ratio_25th_Percentile_{window_size}'
-                q75_col = f'Price_Diff_Ratio_75th_Percentile_{window_size}'
-                
-                if q25_col in df.columns and q75_col in df.columns:
-                    plt.plot(df.index, df[q25_col], 
-                            color='blue', linestyle='--', alpha=0.8, linewidth=1.5, 
-                            label=f'{window_size} 슬라이딩 25% 분위')
-                    plt.plot(df.index, df[q75_col], 
-                            color='red', linestyle='--', alpha=0.8, linewidth=1.5, 
-                            label=f'{window_size} 슬라이딩 75% 분위')
-                else:
-                    # 기본 2year 윈도우가 있는 경우
-                    if 'Price_Diff_Ratio_25th_Percentile' in df.columns and 'Price_Diff_Ratio_75th_Percentile' in df.columns:
-                        plt.plot(df.index, df['Price_Diff_Ratio_25th_Percentile'], 
-                                color='blue', linestyle='--', alpha=0.8, linewidth=1.5, 
-                                label='슬라이딩 25% 분위')
-                        plt.plot(df.index, df['Price_Diff_Ratio_75th_Percentile'], 
-                                color='red', linestyle='--', alpha=0.8, linewidth=1.5, 
-                                label='슬라이딩 75% 분위')
-                
-                plt.title(f'가격 차이 비율 ({company_name} {period}, {window_size} 윈도우)', fontsize=16)
-                plt.ylabel('비율 (%)')
-                plt.xlabel('날짜')
-                plt.grid(True, alpha=0.3)
-                plt.xticks(rotation=45)
-                plt.legend()
-                plt.tight_layout()
-                
-                # 파일명 생성 (회사명이 먼저 오도록)
-                filename = f'{safe_company_name}_price_diff_ratio_timeseries_{period}_{window_size}.png'
-                plt.savefig(filename, dpi=300, bbox_inches='tight')
-                plt.close()
-                
-                print(f"✓ {filename} 저장 완료")
-                
+                queue.add(chart_spec('period_timeseries', json_file, company_name, period, window_size))
+
         except FileNotFoundError:
             print(f"⚠️  파일을 찾을 수 없습니다: {json_file}")
+            failed.append((company_name, period))
         except Exception as e:
             print(f"❌ {period} 데이터 처리 중 오류: {e}")
+            failed.append((company_name, period))
+
+    if chart_queue is None:
+        queue.render(jobs)
+        print(f"\n=== {company_name} 모든 시계열 그래프 생성 완료 ===")
+    return failed
+
+@timed()
+def analyze_company_all_periods(company_name, jobs=1):
+    """
+    특정 회사의 모든 기간에 대해 분포 분석과 시계열 그래프 생성을 수행합니다.
+    (analyze_ratio.py --company, pipeline.py --company에서 사용)
     
-    print(f"\n=== {company_name} 모든 시계열 그래프 생성 완료 ===")
+    Args:
+        company_name (str): 분석할 회사명
+        jobs (int): 차트를 그릴 프로세스 수 (1이면 순차 실행)
+
+    Returns:
+        list: 실패한 (회사명, 기간 또는 차트 파일명) 목록 (모두 성공하면 빈 목록)
+    """
+    print(f"🎯 {company_name} 전체 기간 종합 분석...")
+    failed = []
+    try:
+        periods = ['3년', '5년', '10년', '20년', '30년']
+        chart_queue = ChartQueue()
+        
+        # 각 기간별 기본 분석
+        for period in periods:
+            json_file = find_analysis_data_path(company_name, period)
+            if analyze_price_diff_ratio(json_file, company_name, chart_queue):
+                print(f"✅ {company_name} {period} 분석 완료")
+            else:
+                print(f"❌ {company_name} {period} 분석 실패")
+                failed.append((company_name, period))
+        
+        # 모든 기간 시계열 그래프 생성
+        timeseries_failed = generate_timeseries_plots_for_all_periods(company_name, chart_queue)
+        failed.extend(key for key in timeseries_failed if key not in failed)
+        chart_queue.render(jobs)
+        failed.extend(chart_queue.failed)
+        print(f"✅ {company_name} 전체 종합 분석 완료!")
+        
+    except Exception as e:
+        print(f"❌ {company_name} 종합 분석 실패: {e}")
+        failed.append((company_name, '전체'))
+    return failed
 
-def analyze_all_companies():
+@timed()
+def analyze_all_companies(jobs=1):
     """
     모든 회사에 대해 다양한 기간 (3년, 5년, 10년, 20년, 30년)과 
     윈도우 사이즈 (2년, 3년, 5년)로 분석을 수행합니다.
+
+    차트는 모든 회사의 분석이 끝난 뒤 한 번에 그립니다. (ChartQueue)
+
+    Args:
+        jobs (int): 차트를 그릴 프로세스 수 (1이면 순차 실행, 0이면 CPU 코어 수)
+
+    Returns:
+        list: 실패한 (회사명, 기간 또는 차트 파일명) 목록 (모두 성공하면 빈 목록)
     """
-    from stock_diff import PREFERRED_STOCK_COMPANIES
+    from companies import PREFERRED_STOCK_COMPANIES
     
     periods = ['3년', '5년', '10년', '20년', '30년']
+    chart_queue = ChartQueue()
+    failed = []
     
     print("📊 모든 회사 종합 분석 시작")
     print("=" * 80)
@@ -396,35 +611,37 @@ def analyze_all_companies():
         print(f"\n🏢 [{current_company}/{total_companies}] {company_name} 종합 분석 시작...")
         
         try:
-            safe_company_name = company_name.replace('/', '_').replace('\\', '_')
-            
             # 각 기간별로 분석 수행
             for period in periods:
                 print(f"\n  📅 {period} 데이터 분석 중...")
-                json_file = f'./{safe_company_name}_stock_analysis_{period}.json'
+                json_file = find_analysis_data_path(company_name, period)
                 
-                try:
-                    # 기본 분석 (분포, 시각화)
-                    analyze_price_diff_ratio(json_file, company_name)
+                # 기본 분석 (분포, 시각화)
+                if analyze_price_diff_ratio(json_file, company_name, chart_queue):
                     print(f"    ✅ {company_name} {period} 기본 분석 완료")
-                except FileNotFoundError:
-                    print(f"    ⚠️  {company_name} {period} 데이터 파일을 찾을 수 없습니다: {json_file}")
-                except Exception as e:
-                    print(f"    ❌ {company_name} {period} 분석 중 오류: {e}")
+                else:
+                    print(f"    ❌ {company_name} {period} 분석 실패: {json_file}")
+                    failed.append((company_name, period))
             
             # 모든 기간과 윈도우 사이즈에 대한 시계열 그래프 생성
             print(f"\n  📈 {company_name} 전체 시계열 그래프 생성 중...")
             try:
-                generate_timeseries_plots_for_all_periods(company_name)
-                print(f"    ✅ {company_name} 시계열 그래프 생성 완료")
+                timeseries_failed = generate_timeseries_plots_for_all_periods(company_name, chart_queue)
+                failed.extend(key for key in timeseries_failed if key not in failed)
+                print(f"    ✅ {company_name} 시계열 그래프 추가 완료")
             except Exception as e:
                 print(f"    ❌ {company_name} 시계열 그래프 생성 중 오류: {e}")
+                failed.append((company_name, '시계열 그래프'))
             
             print(f"✅ {company_name} 전체 분석 완료!")
             
         except Exception as e:
             print(f"❌ {company_name} 처리 중 전체 오류: {e}")
+            failed.append((company_name, '전체'))
     
+    chart_queue.render(jobs)
+    failed.extend(chart_queue.failed)
+
     print(f"\n{'='*80}")
     print("=== 모든 회사 종합 분석 완료 ===")
     print(f"✅ 처리된 회사: {total_companies}개")
@@ -436,16 +653,23 @@ def analyze_all_companies():
     print(f"   - 회사명_price_diff_ratio_timeseries_기간_윈도우.png (기본 시계열 차트)")
     print(f"   - 회사명_normalized_comparison_기간.png (정규화 비교)")
     print(f"   - 회사명_price_diff_ratio_timeseries_기간_윈도우.png (상세 시계열)")
+    if failed:
+        print(f"⚠️ 실패한 작업 {len(failed)}개: {', '.join(f'{c} {p}' for c, p in failed)}")
     print(f"{'='*80}")
+    return failed
 
-def analyze_all_companies_single_period(period='20년'):
+@timed()
+def analyze_all_companies_single_period(period='20년', jobs=1):
     """
     모든 회사에 대해 특정 기간으로만 분석을 수행합니다. (기존 호환성을 위한 함수)
     
     Args:
         period (str): 분석할 기간 (기본값: '20년')
+        jobs (int): 차트를 그릴 프로세스 수 (1이면 순차 실행)
     """
-    from stock_diff import PREFERRED_STOCK_COMPANIES
+    from companies import PREFERRED_STOCK_COMPANIES
+
+    chart_queue = ChartQueue()
     
     print(f"📊 모든 회사 {period} 데이터 분석 시작")
     print("=" * 80)
@@ -453,13 +677,12 @@ def analyze_all_companies_single_period(period='20년'):
     for company_name in PREFERRED_STOCK_COMPANIES.keys():
         try:
             print(f"\n🏢 {company_name} 분석 시작...")
-            safe_company_name = company_name.replace('/', '_').replace('\\', '_')
             
             # 지정된 기간 데이터 기준으로 분석
-            json_file = f'./{safe_company_name}_stock_analysis_{period}.json'
+            json_file = find_analysis_data_path(company_name, period)
             
             try:
-                analyze_price_diff_ratio(json_file, company_name)
+                analyze_price_diff_ratio(json_file, company_name, chart_queue)
                 print(f"✅ {company_name} 분석 완료")
             except FileNotFoundError:
                 print(f"⚠️  {company_name} 데이터 파일을 찾을 수 없습니다: {json_file}")
@@ -469,6 +692,8 @@ def analyze_all_companies_single_period(period='20년'):
         except Exception as e:
             print(f"❌ {company_name} 처리 중 오류: {e}")
     
+    chart_queue.render(jobs)
+
     print(f"\n{'='*80}")
     print(f"=== 모든 회사 {period} 분석 완료 ===")
     print(f"{'='*80}")
@@ -479,86 +704,66 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='우선주 가격차이 비율 분석')
     parser.add_argument('--company', '-c', type=str, help='분석할 회사명 (지정하지 않으면 모든 회사 분석)')
     parser.add_argument('--timeseries', '-t', action='store_true', help='시계열 그래프 생성')
-    parser.add_argument('--file', '-f', type=str, help='분석할 JSON 파일 경로')
+    parser.add_argument('--file', '-f', type=str, help='분석할 데이터 파일 경로 (.parquet, .feather, .json)')
     parser.add_argument('--period', '-p', type=str, 
                        choices=['3년', '5년', '10년', '20년', '30년'],
                        help='분석할 기간 (지정하지 않으면 모든 기간 분석)')
+    parser.add_argument('--render-profile', type=str, choices=list(RENDER_PROFILES),
+                        help='차트 저장 프로파일 (report: 300 DPI PNG, draft: 저해상도 PNG, svg, none: 저장 안 함)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='차트를 그릴 프로세스 수 (기본값: 1, 0이면 CPU 코어 수)')
+    add_instrumentation_arguments(parser)
     
     args = parser.parse_args()
+    start_from_args(args)
+
+    if args.render_profile:
+        set_render_profile(args.render_profile)
     
     # --period가 지정되지 않은 경우 모든 기간 분석
     if not args.period:
         if args.company:
-            print(f"🎯 {args.company} 전체 기간 종합 분석...")
-            try:
-                safe_company_name = args.company.replace('/', '_').replace('\\', '_')
-                periods = ['3년', '5년', '10년', '20년', '30년']
-                
-                # 각 기간별 기본 분석
-                for period in periods:
-                    json_file = f'./{safe_company_name}_stock_analysis_{period}.json'
-                    try:
-                        analyze_price_diff_ratio(json_file, args.company)
-                        print(f"✅ {args.company} {period} 분석 완료")
-                    except FileNotFoundError:
-                        print(f"⚠️  {args.company} {period} 데이터 파일을 찾을 수 없습니다")
-                    except Exception as e:
-                        print(f"❌ {args.company} {period} 분석 중 오류: {e}")
-                
-                # 모든 기간 시계열 그래프 생성
-                generate_timeseries_plots_for_all_periods(args.company)
-                print(f"✅ {args.company} 전체 종합 분석 완료!")
-                
-            except Exception as e:
-                print(f"❌ {args.company} 종합 분석 실패: {e}")
+            analyze_company_all_periods(args.company, jobs=args.jobs)
         else:
             # 모든 회사 종합 분석
-            analyze_all_companies()
+            analyze_all_companies(jobs=args.jobs)
     elif args.company and args.timeseries:
         # 특정 회사의 시계열 그래프 생성
         if args.period:
             # 특정 기간만 시계열 그래프 생성
-            safe_company_name = args.company.replace('/', '_').replace('\\', '_')
-            json_file = f'./{safe_company_name}_stock_analysis_{args.period}.json'
+            json_file = find_analysis_data_path(args.company, args.period)
             try:
-                analyze_price_diff_ratio(json_file, args.company)
+                chart_queue = ChartQueue()
+                analyze_price_diff_ratio(json_file, args.company, chart_queue)
+                chart_queue.render(args.jobs)
             except FileNotFoundError:
                 print(f"⚠️  {args.company} {args.period} 데이터 파일을 찾을 수 없습니다")
             except Exception as e:
                 print(f"❌ {args.company} {args.period} 분석 중 오류: {e}")
         else:
             # 모든 기간 시계열 그래프 생성
-            generate_timeseries_plots_for_all_periods(args.company)
+            generate_timeseries_plots_for_all_periods(args.company, jobs=args.jobs)
     elif args.company:
         # 특정 회사 분석
-        safe_company_name = args.company.replace('/', '_').replace('\\', '_')
         if args.period:
             # 특정 기간 분석
-            json_file = args.file or f'./{safe_company_name}_stock_analysis_{args.period}.json'
-            analyze_price_diff_ratio(json_file, args.company)
+            json_file = args.file or find_analysis_data_path(args.company, args.period)
+            chart_queue = ChartQueue()
+            analyze_price_diff_ratio(json_file, args.company, chart_queue)
+            chart_queue.render(args.jobs)
         else:
-            # 모든 기간 분석
-            periods = ['3년', '5년', '10년', '20년', '30년']
-            for period in periods:
-                json_file = f'./{safe_company_name}_stock_analysis_{period}.json'
-                try:
-                    analyze_price_diff_ratio(json_file, args.company)
-                    print(f"✅ {args.company} {period} 분석 완료")
-                except FileNotFoundError:
-                    print(f"⚠️  {args.company} {period} 데이터 파일을 찾을 수 없습니다")
-                except Exception as e:
-                    print(f"❌ {args.company} {period} 분석 중 오류: {e}")
-            # 모든 기간 시계열 그래프 생성
-            generate_timeseries_plots_for_all_periods(args.company)
+            # 모든 기간 분석 + 시계열 그래프 생성
+            analyze_company_all_periods(args.company, jobs=args.jobs)
     elif args.file:
         # 특정 파일 분석 (회사명 추출 시도)
-        import os
         filename = os.path.basename(args.file)
+        chart_queue = ChartQueue()
         if '_stock_analysis_' in filename:
             company_name = filename.split('_stock_analysis_')[0]
-            analyze_price_diff_ratio(args.file, company_name)
+            analyze_price_diff_ratio(args.file, company_name, chart_queue)
         else:
-            analyze_price_diff_ratio(args.file)
+            analyze_price_diff_ratio(args.file, chart_queue=chart_queue)
+        chart_queue.render(args.jobs)
     else:
         # 기본값: 모든 회사 종합 분석
-        analyze_all_companies()
+        analyze_all_companies(jobs=args.jobs)
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+보통주/우선주 교체 전략 백테스트 커널
+
+DataFrame.iterrows() 대신 NumPy 배열로 백테스트를 실행합니다.
+- 매매 신호는 전일 Price_Diff_Ratio와 전일 분위수로 한 번에 계산합니다. (배열 shift)
+- 보유 상태(보통주/우선주, 주식 수, 현금)가 바뀔 수 있는 날(신호 발생일, 배당일)만 순회합니다.
+- 여러 전략(윈도우 x 기본/반대, 파라미터 스윕)은 한 번의 순회로 함께 계산합니다. (run_switching_batch)
+- 일별 포트폴리오 가치는 상태가 유지되는 구간별로 배열 연산으로 계산합니다.
+
+계산 순서는 기존 run_single_strategy와 동일하므로 결과(최종 가치, 매매 기록)가 같습니다.
+"""
+
+import numpy as np
+
+HOLD_COMMON = 0
+HOLD_PREFERRED = 1
+HOLD_OTHER = 2  # 보통주/우선주 명칭과 다른 초기 보유 (매매하지 않고 우선주 가격으로 평가)
+
+EVENT_SWITCH = 'switch'
+EVENT_DIVIDEND = 'dividend'
+
+
+def holding_code(stock_type, common_stock_name, preferred_stock_name):
+    """
+    보유 주식 유형 문자열을 커널의 보유 상태 코드로 변환합니다.
+
+    Args:
+        stock_type (str): 보유 주식 유형 (예: '삼성전자 보통주')
+        common_stock_name (str): 보통주 명칭
+        preferred_stock_name (str): 우선주 명칭
+
+    Returns:
+        int: HOLD_COMMON, HOLD_PREFERRED 또는 HOLD_OTHER
+    """
+    if stock_type == common_stock_name:
+        return HOLD_COMMON
+    if stock_type == preferred_stock_name:
+        return HOLD_PREFERRED
+    return HOLD_OTHER
+
+
+def _previous_day(values):
+    """하루 뒤로 민 배열 (첫날은 NaN)"""
+    shifted = np.empty(len(values), dtype=float)
+    shifted[:1] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def prepare_signals(ratio, q25, q75, reverse_strategy=False):
+    """
+    전일 기준 매매 신호를 계산합니다.
+
+    기본 전략: 전일 비율 < 전일 25% 분위 → 보통주, 전일 비율 > 전일 75% 분위 → 우선주
+    반대 전략: 전일 비율 > 전일 75% 분위 → 보통주, 전일 비율 < 전일 25% 분위 → 우선주
+
+    Args:
+        ratio (array-like): 일별 Price_Diff_Ratio
+        q25 (array-like): 일별 25% 분위수
+        q75 (array-like): 일별 75% 분위수
+        reverse_strategy (bool): True면 반대 전략
+
+    Returns:
+        tuple: (to_common, to_preferred) 불리언 배열 (첫날은 항상 False)
+    """
+    prev_ratio = _previous_day(np.asarray(ratio, dtype=float))
+    prev_q25 = _previous_day(np.asarray(q25, dtype=float))
+    prev_q75 = _previous_day(np.asarray(q75, dtype=float))
+
+    below_q25 = prev_ratio < prev_q25
+    above_q75 = prev_ratio > prev_q75
+    if reverse_strategy:
+        return above_q75, below_q25
+    return below_q25, above_q75
+
+
+def run_switching_batch(common_open, common_close, preferred_open, preferred_close, dividends,
+                        to_common, to_preferred, initial_holdings, initial_shares):
+    """
+    여러 교체 전략을 한 번의 데이터 순회로 함께 실행합니다.
+
+    전략마다 매매 신호(to_common, to_preferred의 행)와 초기 보유 상태만 다르고 가격/배당 데이터는 공유하므로,
+    상태가 바뀔 수 있는 날마다 모든 전략의 포트폴리오를 배열 연산으로 한꺼번에 갱신합니다.
+    (6개 전략이든 파라미터 스윕의 수십 개 전략이든 데이터 순회는 한 번)
+
+    신호 다음 날 시가로 전량 교체하고, 배당일(dividends > 0)에는 보유 주식 수만큼 현금으로 받습니다.
+    첫날은 매매/배당 없이 초기 보유만 평가합니다.
+
+    Args:
+        common_open, common_close (array-like): 보통주 시가/종가 (길이 n)
+        preferred_open, preferred_close (array-like): 우선주 시가/종가 (길이 n)
+        dividends (array-like | None): 일별 주당 배당금 (None이면 배당 없음)
+        to_common, to_preferred (array-like): 전략별 매매 신호 (S x n 불리언, prepare_signals 참고)
+        initial_holdings (array-like): 전략별 초기 보유 상태 코드 (길이 S, holding_code 참고)
+        initial_shares (array-like): 전략별 초기 보유 주식 수 (길이 S)
+
+    Returns:
+        list: 전략별 결과 dict (run_switching_kernel 참고)
+    """
+    common_open = np.asarray(common_open, dtype=float)
+    common_close = np.asarray(common_close, dtype=float)
+    preferred_open = np.asarray(preferred_open, dtype=float)
+    preferred_close = np.asarray(preferred_close, dtype=float)
+    n = len(common_close)
+
+    # 날짜별로 전략 신호를 연속 메모리에서 읽도록 (n x S)로 전치
+    to_common = np.ascontiguousarray(np.atleast_2d(np.asarray(to_common, dtype=bool)).T)
+    to_preferred = np.ascontiguousarray(np.atleast_2d(np.asarray(to_preferred, dtype=bool)).T)
+    if dividends is None:
+        dividends = np.zeros(n)
+    dividends = np.asarray(dividends, dtype=float)
+    paid = dividends > 0
+
+    holdings = np.array(initial_holdings, dtype=int)
+    shares = np.array(initial_shares, dtype=float)
+    cash = np.zeros(len(holdings))
+    strategy_count = len(holdings)
+
+    # 상태가 바뀔 수 있는 날만 순회 (첫날 제외)
+    candidates = np.flatnonzero(to_common.any(axis=1) | to_preferred.any(axis=1) | paid)
+    candidates = candidates[candidates > 0]
+
+    # 상태 스냅샷: snapshot_days[k] 날짜부터 적용되는 상태
+    snapshot_days = [0]
+    snapshot_holdings, snapshot_shares, snapshot_cash = [holdings.copy()], [shares.copy()], [cash.copy()]
+    events = [[] for _ in range(strategy_count)]
+
+    for day in candidates:
+        day = int(day)
+        changed = False
+
+        # 보통주 신호가 우선 (기존 if/elif 순서), 보유 중인 쪽과 반대쪽으로만 교체
+        wants_common = to_common[day] & (holdings != HOLD_COMMON)
+        switch_to_common = wants_common & (holdings == HOLD_PREFERRED)
+        switch_to_preferred = ~wants_common & to_preferred[day] & (holdings == HOLD_COMMON)
+        switching = np.flatnonzero(switch_to_common | switch_to_preferred)
+
+        if len(switching):
+            to_common_now = switch_to_common[switching]
+            sell_price = np.where(to_common_now, preferred_open[day], common_open[day])
+            buy_price = np.where(to_common_now, common_open[day], preferred_open[day])
+            new_holdings = np.where(to_common_now, HOLD_COMMON, HOLD_PREFERRED)
+
+            sold_shares = shares[switching]
+            sell_value = sold_shares * sell_price
+            switched_cash = cash[switching] + sell_value
+            buy_shares = switched_cash / buy_price
+            switched_cash = switched_cash - buy_shares * buy_price
+
+            for k, strategy in enumerate(switching.tolist()):
+                events[strategy].append((day, EVENT_SWITCH, int(holdings[strategy]), int(new_holdings[k]),
+                                         sold_shares[k], buy_shares[k], sell_price[k], buy_price[k],
+                                         sell_value[k], switched_cash[k]))
+            cash[switching] = switched_cash
+            shares[switching] = buy_shares
+            holdings[switching] = new_holdings
+            changed = True
+
+        if paid[day]:
+            dividend_per_share = dividends[day]
+            dividend_income = shares * dividend_per_share
+            cash = cash + dividend_income
+            for strategy in np.flatnonzero(dividend_income > 0).tolist():
+                events[strategy].append((day, EVENT_DIVIDEND, int(holdings[strategy]), int(holdings[strategy]),
+                                         shares[strategy], shares[strategy], dividend_per_share, 0.0,
+                                         dividend_income[strategy], cash[strategy]))
+            changed = True
+
+        if changed:
+            snapshot_days.append(day)
+            snapshot_holdings.append(holdings.copy())
+            snapshot_shares.append(shares.copy())
+            snapshot_cash.append(cash.copy())
+
+    # 일별 평가 금액 (S x n): 각 날짜에 해당하는 스냅샷의 상태로 계산 (종가 기준)
+    snapshot_index = np.searchsorted(np.asarray(snapshot_days), np.arange(n), side='right') - 1
+    daily_holdings = np.asarray(snapshot_holdings)[snapshot_index].T
+    daily_shares = np.asarray(snapshot_shares)[snapshot_index].T
+    daily_cash = np.asarray(snapshot_cash)[snapshot_index].T
+    daily_close = np.where(daily_holdings == HOLD_COMMON, common_close, preferred_close)
+    values = daily_shares * daily_close + daily_cash
+
+    return [
+        {
+            'values': values[strategy],
+            'events': events[strategy],
+            'holding': int(holdings[strategy]),
+            'shares': shares[strategy],
+            'cash': cash[strategy],
+        }
+        for strategy in range(strategy_count)
+    ]
+
+
+def run_switching_kernel(common_open, common_close, preferred_open, preferred_close, dividends,
+                         ratio, q25, q75, initial_holding, initial_shares, reverse_strategy=False):
+    """
+    보통주/우선주 교체 전략 하나의 백테스트를 실행합니다. (run_switching_batch의 단일 전략 버전)
+
+    Args:
+        common_open, common_close (array-like): 보통주 시가/종가
+        preferred_open, preferred_close (array-like): 우선주 시가/종가
+        dividends (array-like | None): 일별 주당 배당금 (None이면 배당 없음)
+        ratio, q25, q75 (array-like): Price_Diff_Ratio와 윈도우 분위수
+        initial_holding (int): 초기 보유 상태 코드 (holding_code 참고)
+        initial_shares (int | float): 초기 보유 주식 수
+        reverse_strategy (bool): True면 반대 전략
+
+    Returns:
+        dict: {
+            'values': 일별 포트폴리오 가치 (np.ndarray, 종가 기준),
+            'events': 매매/배당 이벤트 목록 (tuple, 아래 참고),
+            'holding', 'shares', 'cash': 최종 상태
+        }
+        이벤트 tuple:
+            (day, EVENT_SWITCH, from_holding, to_holding, sold_shares, bought_shares,
+             sell_price, buy_price, sell_value, cash_after)
+            (day, EVENT_DIVIDEND, holding, holding, shares, shares,
+             dividend_per_share, 0.0, dividend_income, cash_after)
+    """
+    to_common, to_preferred = prepare_signals(ratio, q25, q75, reverse_strategy)
+    return run_switching_batch(common_open, common_close, preferred_open, preferred_close, dividends,
+                               to_common[np.newaxis], to_preferred[np.newaxis],
+                               [initial_holding], [initial_shares])[0]
@@ -2,107 +2,67 @@
 import pandas as pd
 import json
 from datetime import datetime
-import yfinance as yf
-import matplotlib.pyplot as plt
-import seaborn as sns
-import platform
-import matplotlib.font_manager as fm
-import os
-import shutil
 import argparse
-
-# stock_diff.py에서 회사 정보 가져오기
-try:
-    from stock_diff import PREFERRED_STOCK_COMPANIES
-except ImportError:
-    # 기본값으로 삼성전자만 설정
-    PREFERRED_STOCK_COMPANIES = {
-        "삼성전자": {
-            "common_symbol": "005930.KS",
-            "preferred_symbol": "005935.KS"
-        }
-    }
-
-# 나눔고딕 폰트 설정 (경고 메시지 제거)
-nanum_font_path = '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'
-
-# 폰트 경로가 존재하는지 확인하고 설정
-if os.path.exists(nanum_font_path):
-    print(f"✅ 나눔고딕 폰트 발견: {nanum_font_path}")
-    # 폰트를 matplotlib에 등록
-    font_prop = fm.FontProperties(fname=nanum_font_path)
-    plt.rcParams['font.family'] = font_prop.get_name()
-    print(f"✅ 나눔고딕 폰트 설정 완료: {font_prop.get_name()}")
-else:
-    print("⚠️ 나눔고딕 폰트를 찾을 수 없어 기본 폰트를 사용합니다.")
-    # OS별 기본 한글 폰트 설정
-    system_name = platform.system()
-    if system_name == 'Windows':
-        plt.rcParams['font.family'] = 'Malgun Gothic'
-    elif system_name == 'Darwin':  # Mac OS
-        plt.rcParams['font.family'] = 'AppleGothic'
-    else:  # Linux 기본
-        plt.rcParams['font.family'] = 'sans-serif'
-
-plt.rcParams['axes.unicode_minus'] = False  # 마이너스 폰트 깨짐 방지
-
-# matplotlib 폰트 캐시 새로고침 (경고 메시지 제거)
-try:
-    fm._get_font.cache_clear()
-except AttributeError:
-    pass  # 오래된 matplotlib 버전에서는 이 메서드가 없을 수 있음
-
-def ensure_backup_directory():
-    """
-    백업 디렉토리를 생성합니다.
-    """
-    backup_dir = './report_backup'
-    if not os.path.exists(backup_dir):
-        os.makedirs(backup_dir)
-        print(f"📁 백업 디렉토리 생성: {backup_dir}")
-    return backup_dir
-
-def save_report_files(content, base_filename, period_name=""):
+from analysis_storage import find_analysis_data_path, read_analysis_file
+from instrumentation import add_instrumentation_arguments, start_from_args, timed
+from lazy_imports import lazy_pyplot, lazy_seaborn
+from render_profile import RENDER_PROFILES, chart_path, save_chart, saved_chart_paths, set_render_profile
+from parallel_runner import resolve_jobs, run_tasks
+from price_panel import ensure_price_panel, load_panel_frame
+from report_writer import open_report, report_paths
+from backtest_kernel import HOLD_COMMON, HOLD_OTHER, HOLD_PREFERRED, holding_code, prepare_signals, run_switching_batch
+from trade_log import TradeLog
+
+# 회사 정보 (companies.py, stock_diff.py와 같은 목록)
+from companies import PREFERRED_STOCK_COMPANIES
+
+# matplotlib/seaborn은 그래프를 처음 그릴 때 import 하고 한글 폰트도 그때 설정 (lazy_imports)
+plt = lazy_pyplot()
+sns = lazy_seaborn(plt)
+
+@timed()
+def run_strategy_batch(df_backtest, initial_stock_type, initial_shares, company_name, strategy_configs):
     """
-    리포트 파일을 기본 디렉토리와 백업 디렉토리에 저장합니다.
+    여러 전략(윈도우 크기 x 기본/반대)을 한 번의 데이터 순회로 함께 실행합니다.
     
     Args:
-        content (str): 리포트 내용
-        base_filename (str): 기본 파일명 (확장자 제외)
-        period_name (str): 기간 이름 (선택사항)
+        df_backtest: 백테스트용 데이터프레임
+        initial_stock_type: 초기 보유 주식 유형
+        initial_shares: 초기 보유 주식 수
+        company_name: 회사명
+        strategy_configs: (전략 이름, 윈도우 크기 접미사, 반대 전략 여부) 목록
     
     Returns:
-        tuple: (기본 파일 경로, 백업 파일 경로)
+        dict: 전략 이름별 커널 실행 결과 (summarize_strategy_result로 리포트용 결과 생성)
     """
-    backup_dir = ensure_backup_directory()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # 기본 디렉토리에 저장할 파일 (날짜/시간 없음)
-    if period_name:
-        main_filename = f'{base_filename}_{period_name}.md'
-    else:
-        main_filename = f'{base_filename}.md'
-    
-    # 백업 디렉토리에 저장할 파일 (날짜/시간 포함)
-    if period_name:
-        backup_filename = f'{base_filename}_{period_name}_{timestamp}.md'
-    else:
-        backup_filename = f'{base_filename}_{timestamp}.md'
-    
-    main_path = f'./{main_filename}'
-    backup_path = f'{backup_dir}/{backup_filename}'
-    
-    # 파일 저장
-    with open(main_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"📋 리포트 저장: {main_filename}")
-    print(f"💾 백업 저장: {backup_path}")
-    
-    return main_path, backup_path
+    common_stock_name = f"{company_name} 보통주"
+    preferred_stock_name = f"{company_name} 우선주"
+
+    ratio = df_backtest['Price_Diff_Ratio'].to_numpy(dtype=float)
+    to_common, to_preferred = [], []
+    for strategy_name, window_suffix, reverse_strategy in strategy_configs:
+        signals = prepare_signals(
+            ratio,
+            df_backtest[f'Price_Diff_Ratio_25th_Percentile_{window_suffix}'].to_numpy(dtype=float),
+            df_backtest[f'Price_Diff_Ratio_75th_Percentile_{window_suffix}'].to_numpy(dtype=float),
+            reverse_strategy
+        )
+        to_common.append(signals[0])
+        to_preferred.append(signals[1])
+
+    # 배열 기반 백테스트 커널 실행 (전일 신호 → 당일 시가 매매, 배당금 현금 수령)
+    kernel_results = run_switching_batch(
+        df_backtest['Stock1_Open'].to_numpy(dtype=float),
+        df_backtest['Stock1_Close'].to_numpy(dtype=float),
+        df_backtest['Stock2_Open'].to_numpy(dtype=float),
+        df_backtest['Stock2_Close'].to_numpy(dtype=float),
+        df_backtest['Dividend_Amount_Raw'].to_numpy(dtype=float) if 'Dividend_Amount_Raw' in df_backtest.columns else None,
+        to_common,
+        to_preferred,
+        [holding_code(initial_stock_type, common_stock_name, preferred_stock_name)] * len(strategy_configs),
+        [initial_shares] * len(strategy_configs)
+    )
+    return {config[0]: result for config, result in zip(strategy_configs, kernel_results)}
 
 def run_single_strategy(df_backtest, initial_stock_type, initial_shares, initial_value, company_name, reverse_strategy=False, strategy_name="", window_suffix="2year"):
     """
@@ -121,173 +81,54 @@ def run_single_strategy(df_backtest, initial_stock_type, initial_shares, initial
     Returns:
         dict: 전략 실행 결과
     """
-    current_stock_type = initial_stock_type
-    current_shares = initial_shares
-    cash = 0.0 # 배당금 및 매매 후 남은 현금
+    kernel_results = run_strategy_batch(df_backtest, initial_stock_type, initial_shares, company_name,
+                                        [(strategy_name, window_suffix, reverse_strategy)])
+    return summarize_strategy_result(df_backtest, kernel_results[strategy_name], initial_stock_type, initial_shares,
+                                     initial_value, company_name, strategy_name, window_suffix)
+
+@timed()
+def summarize_strategy_result(df_backtest, kernel_result, initial_stock_type, initial_shares, initial_value, company_name, strategy_name="", window_suffix="2year"):
+    """
+    커널 실행 결과로 매매 기록과 최종 성과를 정리하고 출력합니다.
     
+    Args:
+        df_backtest: 백테스트용 데이터프레임
+        kernel_result: run_strategy_batch의 전략별 결과
+        initial_stock_type: 초기 보유 주식 유형
+        initial_shares: 초기 보유 주식 수
+        initial_value: 초기 자산 가치
+        company_name: 회사명
+        strategy_name: 전략 이름
+        window_suffix: 윈도우 크기 접미사 (2year, 3year, 5year)
+    
+    Returns:
+        dict: 전략 실행 결과 (portfolio_values, trading_log, final_value, return_rate 등)
+    """
     # 회사명을 기반으로 주식 유형명 설정
     common_stock_name = f"{company_name} 보통주"
     preferred_stock_name = f"{company_name} 우선주"
-    
-    strategy_portfolio_values = [] # 일별 전략 포트폴리오 가치 저장
-    trading_log = [] # 매매 기록 저장
+    stock_names = {HOLD_COMMON: common_stock_name, HOLD_PREFERRED: preferred_stock_name, HOLD_OTHER: initial_stock_type}
 
     # 윈도우 크기에 따른 분위수 컬럼명 설정
     q25_col = f'Price_Diff_Ratio_25th_Percentile_{window_suffix}'
     q75_col = f'Price_Diff_Ratio_75th_Percentile_{window_suffix}'
+    ratio = df_backtest['Price_Diff_Ratio'].to_numpy(dtype=float)
 
-    for i, (date, row) in enumerate(df_backtest.iterrows()):
-        # 첫 날의 평가 금액 기록 - 종가 기준으로 수정
-        if i == 0:
-            # 첫날 종가 기준으로 포트폴리오 가치 계산
-            if current_stock_type == common_stock_name:
-                current_portfolio_value = current_shares * row['Stock1_Close'] + cash
-            else:
-                current_portfolio_value = current_shares * row['Stock2_Close'] + cash
-            
-            # 초기 상태 기록
-            trading_log.append({
-                'Date': date.strftime('%Y-%m-%d'),
-                'Action': '초기보유',
-                'Stock_Type': current_stock_type,
-                'Shares_Traded': 0,
-                'Price_Per_Share': 0,
-                'Total_Amount': 0,
-                'Current_Shares': current_shares,
-                'Current_Stock_Type': current_stock_type,
-                'Cash_Balance': cash,
-                'Portfolio_Value': current_portfolio_value,
-                'Price_Diff_Ratio': row['Price_Diff_Ratio'],
-                'Q25': 0,
-                'Q75': 0
-            })
-        else:
-            prev_date = df_backtest.index[i-1]
-            prev_row = df_backtest.loc[prev_date]
-
-            current_ratio = prev_row['Price_Diff_Ratio']
-            q25 = prev_row[q25_col]
-            q75 = prev_row[q75_col]
-
-            # 매매 조건 확인 (기본 전략 vs 반대 전략)
-            if not reverse_strategy:
-                # 기본 전략: 25% 이하 -> 보통주, 75% 이상 -> 우선주
-                should_buy_common = current_ratio < q25 and current_stock_type != common_stock_name
-                should_buy_preferred = current_ratio > q75 and current_stock_type != preferred_stock_name
-            else:
-                # 반대 전략: 25% 이하 -> 우선주, 75% 이상 -> 보통주
-                should_buy_common = current_ratio > q75 and current_stock_type != common_stock_name
-                should_buy_preferred = current_ratio < q25 and current_stock_type != preferred_stock_name
-
-            if should_buy_common:
-                # 현재 보유주 -> 보통주
-                if current_stock_type == preferred_stock_name:
-                    sell_price = row['Stock2_Open']
-                    buy_price = row['Stock1_Open']
-                    sell_value = current_shares * sell_price
-                    cash += sell_value
-                    
-                    buy_shares = cash / buy_price
-                    cash -= buy_shares * buy_price
-                    
-                    # 매매 기록
-                    trading_log.append({
-                        'Date': date.strftime('%Y-%m-%d'),
-                        'Action': '매도->매수',
-                        'Stock_Type': f'{current_stock_type} -> {common_stock_name}',
-                        'Shares_Traded': f'매도 {current_shares:.2f}주 -> 매수 {buy_shares:.2f}주',
-                        'Price_Per_Share': f'매도가 {sell_price:,.0f}원 -> 매수가 {buy_price:,.0f}원',
-                        'Total_Amount': f'매도금 {sell_value:,.0f}원 -> 매수금 {buy_shares * buy_price:,.0f}원',
-                        'Current_Shares': buy_shares,
-                        'Current_Stock_Type': common_stock_name,
-                        'Cash_Balance': cash,
-                        'Portfolio_Value': 0,  # 아래에서 계산
-                        'Price_Diff_Ratio': current_ratio,
-                        'Q25': q25,
-                        'Q75': q75
-                    })
-                    
-                    current_shares = buy_shares
-                    current_stock_type = common_stock_name
-
-            elif should_buy_preferred:
-                # 현재 보유주 -> 우선주
-                if current_stock_type == common_stock_name:
-                    sell_price = row['Stock1_Open']
-                    buy_price = row['Stock2_Open']
-                    sell_value = current_shares * sell_price
-                    cash += sell_value
-                    
-                    buy_shares = cash / buy_price
-                    cash -= buy_shares * buy_price
-                    
-                    # 매매 기록
-                    trading_log.append({
-                        'Date': date.strftime('%Y-%m-%d'),
-                        'Action': '매도->매수',
-                        'Stock_Type': f'{current_stock_type} -> {preferred_stock_name}',
-                        'Shares_Traded': f'매도 {current_shares:.2f}주 -> 매수 {buy_shares:.2f}주',
-                        'Price_Per_Share': f'매도가 {sell_price:,.0f}원 -> 매수가 {buy_price:,.0f}원',
-                        'Total_Amount': f'매도금 {sell_value:,.0f}원 -> 매수금 {buy_shares * buy_price:,.0f}원',
-                        'Current_Shares': buy_shares,
-                        'Current_Stock_Type': preferred_stock_name,
-                        'Cash_Balance': cash,
-                        'Portfolio_Value': 0,  # 아래에서 계산
-                        'Price_Diff_Ratio': current_ratio,
-                        'Q25': q25,
-                        'Q75': q75
-                    })
-                    
-                    current_shares = buy_shares
-                    current_stock_type = preferred_stock_name
-            
-            # 배당금 처리 - stock_diff.py에서 처리된 배당 데이터 활용
-            dividend_income = 0.0
-            dividend_per_share = 0.0
-            
-            # 현재 보유 주식 유형에 따른 배당 처리
-            if current_stock_type == common_stock_name:
-                # 보통주 보유 시 - Stock1 배당 (일반적으로 보통주와 우선주 배당이 동일)
-                if 'Dividend_Amount_Raw' in row and row['Dividend_Amount_Raw'] > 0:
-                    dividend_per_share = row['Dividend_Amount_Raw']
-                    dividend_income = current_shares * dividend_per_share
-                    cash += dividend_income
-            else:  # preferred_stock_name
-                # 우선주 보유 시 - Stock2 배당 또는 동일 배당
-                if 'Dividend_Amount_Raw' in row and row['Dividend_Amount_Raw'] > 0:
-                    dividend_per_share = row['Dividend_Amount_Raw']
-                    dividend_income = current_shares * dividend_per_share
-                    cash += dividend_income
-            
-            # 배당금 수령 기록
-            if dividend_income > 0:
-                trading_log.append({
-                    'Date': date.strftime('%Y-%m-%d'),
-                    'Action': '배당금수령',
-                    'Stock_Type': current_stock_type,
-                    'Shares_Traded': f'{current_shares:.2f}주',
-                    'Price_Per_Share': f'{dividend_per_share:,.0f}원/주',
-                    'Total_Amount': f'{dividend_income:,.0f}원',
-                    'Current_Shares': current_shares,
-                    'Current_Stock_Type': current_stock_type,
-                    'Cash_Balance': cash,
-                    'Portfolio_Value': 0,  # 아래에서 계산
-                    'Price_Diff_Ratio': row['Price_Diff_Ratio'],
-                    'Q25': 0,
-                    'Q75': 0
-                })
+    portfolio_values = kernel_result['values']
+    current_stock_type = stock_names[kernel_result['holding']]
+    current_shares = kernel_result['shares']
+    cash = kernel_result['cash']
 
-        # 현재 포트폴리오 가치 계산 (종가 기준)
-        if current_stock_type == common_stock_name:
-            current_portfolio_value = current_shares * row['Stock1_Close'] + cash
-        else:
-            current_portfolio_value = current_shares * row['Stock2_Close'] + cash
-        
-        # 매매 기록이 있으면 포트폴리오 가치 업데이트
-        if trading_log and trading_log[-1]['Date'] == date.strftime('%Y-%m-%d'):
-            trading_log[-1]['Portfolio_Value'] = current_portfolio_value
-        
-        strategy_portfolio_values.append({'Date': date, 'Value': current_portfolio_value})
+    strategy_portfolio_values = [
+        {'Date': date, 'Value': value} for date, value in zip(df_backtest.index, portfolio_values.tolist())
+    ]  # 일별 전략 포트폴리오 가치 저장
+
+    # 매매 기록: 초기 보유 + 매매/배당 이벤트 (숫자 배열로 저장, 문자열 서식은 CSV/리포트 출력 때만)
+    trading_log = TradeLog.from_kernel_events(
+        df_backtest.index, kernel_result['events'], portfolio_values, ratio,
+        df_backtest[q25_col].to_numpy(dtype=float), df_backtest[q75_col].to_numpy(dtype=float),
+        holding_code(initial_stock_type, common_stock_name, preferred_stock_name), initial_shares, stock_names
+    )
 
     last_day_data = df_backtest.iloc[-1]
     final_stock_value_strategy = 0.0
@@ -320,26 +161,19 @@ def run_single_strategy(df_backtest, initial_stock_type, initial_shares, initial
     print(f"초기 자산 가치 (종가 기준): {actual_initial_value:,.2f}원")
     print(f"총 수익률 (배당금 제외): {return_without_dividends_strategy:,.2f}%")
 
-    # 매매 통계
-    trades_only = pd.DataFrame(trading_log)
-    trades_only = trades_only[trades_only['Action'] == '매도->매수']
-    dividends_only = pd.DataFrame(trading_log)
-    dividends_only = dividends_only[dividends_only['Action'] == '배당금수령']
-    
+    # 매매 통계 (기록을 만들 때 계산한 횟수 사용)
     print(f"\n--- {strategy_name} 매매 통계 ---")
-    print(f"총 매매 횟수: {len(trades_only)}회")
-    print(f"배당금 수령 횟수: {len(dividends_only)}회")
+    print(f"총 매매 횟수: {trading_log.trade_count}회")
+    print(f"배당금 수령 횟수: {trading_log.dividend_count}회")
     
-    if not trades_only.empty:
-        common_to_pref = len(trades_only[trades_only['Stock_Type'].str.contains(f'{company_name} -> {company_name}\\(우\\)', regex=True)])
-        pref_to_common = len(trades_only[trades_only['Stock_Type'].str.contains(f'{company_name}\\(우\\) -> {company_name}', regex=True)])
-        print(f"{company_name} -> {company_name}(우): {common_to_pref}회")
-        print(f"{company_name}(우) -> {company_name}: {pref_to_common}회")
+    if trading_log.trade_count:
+        print(f"{company_name} -> {company_name}(우): {trading_log.common_to_preferred}회")
+        print(f"{company_name}(우) -> {company_name}: {trading_log.preferred_to_common}회")
         
         # 평균 매매 간격 계산
-        if len(trades_only) > 1:
-            trade_dates = pd.to_datetime(trades_only['Date'])
-            avg_interval = (trade_dates.max() - trade_dates.min()).days / len(trades_only)
+        if trading_log.trade_count > 1:
+            trade_dates = trading_log.trade_dates()
+            avg_interval = (trade_dates.max() - trade_dates.min()).days / trading_log.trade_count
             print(f"평균 매매 간격: {avg_interval:.1f}일")
 
     return {
@@ -353,6 +187,7 @@ def run_single_strategy(df_backtest, initial_stock_type, initial_shares, initial
         'cash': cash
     }
 
+@timed()
 def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_return_rate, 
                            start_date, end_date, initial_value, company_name, period_name="20년",
                            pref_buy_hold_final_value=None, pref_buy_hold_return_rate=None):
@@ -377,7 +212,8 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
     
     safe_company_name = company_name.replace('/', '_').replace('\\', '_')
     
-    report_content = f"""# {company_name} {period_name} 백테스트 전략 성과 분석 리포트
+    report = open_report(f'{safe_company_name}_strategy_analysis_report', period_name)
+    report.write(f"""# {company_name} {period_name} 백테스트 전략 성과 분석 리포트
 
 **분석 날짜**: {datetime.now().strftime('%Y년 %m월 %d일')}  
 **백테스트 기간**: {start_date} ~ {end_date}  
@@ -406,7 +242,7 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
 
 | 윈도우 크기 | 수익률 | 최종 자산 | 주식자산 | 배당금 | 순위 |
 |------------|--------|-----------|----------|--------|------|
-"""
+""")
 
     # 기본전략 성과 정렬 및 순위 매기기
     basic_strategies = []
@@ -420,7 +256,7 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
                 'final_value': result['final_value'],
                 'final_stock_value': result['final_stock_value'],
                 'final_dividend_value': result['cash'],
-                'trades': len([log for log in result['trading_log'] if log['Action'] == '매도->매수'])
+                'trades': result['trading_log'].trade_count
             })
     
     # 수익률 기준으로 정렬
@@ -430,15 +266,15 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
     medals = ['🏆', '🥈', '🥉']
     for i, strategy in enumerate(basic_strategies):
         medal = medals[i] if i < 3 else ''
-        report_content += f"| {strategy['window']} 윈도우 | **{strategy['return_rate']:,.2f}%** | {strategy['final_value']:,.0f}원 | {strategy['final_stock_value']:,.0f}원 | {strategy['final_dividend_value']:,.0f}원 | {medal} |\n"
+        report.write(f"| {strategy['window']} 윈도우 | **{strategy['return_rate']:,.2f}%** | {strategy['final_value']:,.0f}원 | {strategy['final_stock_value']:,.0f}원 | {strategy['final_dividend_value']:,.0f}원 | {medal} |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ### 📉 **반대전략 (25%↓→{company_name}(우), 75%↑→{company_name}) 성과**
 
 | 윈도우 크기 | 수익률 | 최종 자산 | 주식자산 | 배당금 | 순위 |
 |------------|--------|-----------|----------|--------|------|
-"""
+""")
 
     # 반대전략 성과 정렬 및 순위 매기기
     reverse_strategies = []
@@ -452,7 +288,7 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
                 'final_value': result['final_value'],
                 'final_stock_value': result['final_stock_value'],
                 'final_dividend_value': result['cash'],
-                'trades': len([log for log in result['trading_log'] if log['Action'] == '매도->매수'])
+                'trades': result['trading_log'].trade_count
             })
     
     # 수익률 기준으로 정렬
@@ -461,7 +297,7 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
     # 반대전략 표 작성
     for i, strategy in enumerate(reverse_strategies):
         medal = medals[i] if i < 3 else ''
-        report_content += f"| {strategy['window']} 윈도우 | **{strategy['return_rate']:,.2f}%** | {strategy['final_value']:,.0f}원 | {strategy['final_stock_value']:,.0f}원 | {strategy['final_dividend_value']:,.0f}원 | {medal} |\n"
+        report.write(f"| {strategy['window']} 윈도우 | **{strategy['return_rate']:,.2f}%** | {strategy['final_value']:,.0f}원 | {strategy['final_stock_value']:,.0f}원 | {strategy['final_dividend_value']:,.0f}원 | {medal} |\n")
 
     # 최고 성과 전략 찾기
     best_basic = max(basic_strategies, key=lambda x: x['return_rate']) if basic_strategies else None
@@ -476,7 +312,7 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
         buy_hold_cash = strategy_results['기본전략_2년'].get('cash', 0)
         buy_hold_stock_value = buy_hold_final_value - buy_hold_cash
 
-    report_content += f"""
+    report.write(f"""
 
 ### 📈 **Buy & Hold 참고**
 
@@ -484,7 +320,7 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
 - **수익률**: {buy_hold_return_rate:,.2f}% (1억원 기준)
 - **총자산**: {buy_hold_final_value:,.0f}원
 - **주식자산**: {buy_hold_stock_value:,.0f}원
-- **배당금**: {buy_hold_cash:,.0f}원"""
+- **배당금**: {buy_hold_cash:,.0f}원""")
 
     if pref_buy_hold_final_value and pref_buy_hold_return_rate:
         # 우선주 Buy & Hold 구성 요소 계산
@@ -497,35 +333,35 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
             pref_buy_hold_cash = strategy_results['기본전략_2년'].get('cash', 0) * 1.05  # 약 5% 더 높은 배당 추정
             pref_buy_hold_stock_value = pref_buy_hold_final_value - pref_buy_hold_cash
         
-        report_content += f"""
+        report.write(f"""
 
 #### 🔶 **{company_name} 우선주 Buy & Hold**
 - **수익률**: {pref_buy_hold_return_rate:,.2f}% (1억원 기준)
 - **총자산**: {pref_buy_hold_final_value:,.0f}원
 - **주식자산**: {pref_buy_hold_stock_value:,.0f}원
-- **배당금**: {pref_buy_hold_cash:,.0f}원"""
+- **배당금**: {pref_buy_hold_cash:,.0f}원""")
 
-    report_content += f"""
+    report.write(f"""
 
 ---
 
 ## 💡 **핵심 발견사항**
 
-### 1. **최적 윈도우 크기**"""
+### 1. **최적 윈도우 크기**""")
 
     if best_basic:
-        report_content += f"""
+        report.write(f"""
 - **{best_basic['window']} 윈도우**가 기본전략에서 가장 우수한 성과를 보임
 - 수익률: **{best_basic['return_rate']:,.2f}%**
-- 최종 자산: **{best_basic['final_value']:,.0f}원**"""
+- 최종 자산: **{best_basic['final_value']:,.0f}원**""")
 
-    report_content += f"""
+    report.write(f"""
 
 ### 2. **매매 빈도 분석**
 
 | 전략 | 2년 윈도우 | 3년 윈도우 | 5년 윈도우 |
 |------|-----------|-----------|-----------|
-"""
+""")
 
     # 매매 횟수 테이블 작성
     basic_trades = {}
@@ -536,22 +372,22 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
         reverse_strategy_name = f"반대전략_{window_name}"
         
         if basic_strategy_name in strategy_results:
-            basic_trades[window_name] = len([log for log in strategy_results[basic_strategy_name]['trading_log'] if log['Action'] == '매도->매수'])
+            basic_trades[window_name] = strategy_results[basic_strategy_name]['trading_log'].trade_count
         
         if reverse_strategy_name in strategy_results:
-            reverse_trades[window_name] = len([log for log in strategy_results[reverse_strategy_name]['trading_log'] if log['Action'] == '매도->매수'])
+            reverse_trades[window_name] = strategy_results[reverse_strategy_name]['trading_log'].trade_count
 
-    report_content += f"| 기본전략 | {basic_trades.get('2년', 0)}회 | {basic_trades.get('3년', 0)}회 | {basic_trades.get('5년', 0)}회 |\n"
-    report_content += f"| 반대전략 | {reverse_trades.get('2년', 0)}회 | {reverse_trades.get('3년', 0)}회 | {reverse_trades.get('5년', 0)}회 |\n"
+    report.write(f"| 기본전략 | {basic_trades.get('2년', 0)}회 | {basic_trades.get('3년', 0)}회 | {basic_trades.get('5년', 0)}회 |\n")
+    report.write(f"| 반대전략 | {reverse_trades.get('2년', 0)}회 | {reverse_trades.get('3년', 0)}회 | {reverse_trades.get('5년', 0)}회 |\n")
 
     if best_basic and best_reverse:
-        report_content += f"""
+        report.write(f"""
 
 ### 3. **전략 우위성**
 - {'기본전략' if best_basic['return_rate'] > best_reverse['return_rate'] else '반대전략'}이 더 우수한 성과
-- 기본전략은 Buy & Hold보다 **{best_basic['return_rate']/buy_hold_return_rate:.1f}배** 높은 수익률"""
+- 기본전략은 Buy & Hold보다 **{best_basic['return_rate']/buy_hold_return_rate:.1f}배** 높은 수익률""")
 
-    report_content += f"""
+    report.write(f"""
 
 ### 4. **윈도우 크기의 영향**
 - **윈도우가 클수록 매매 빈도 감소** (안정성 증가)
@@ -561,15 +397,15 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
 
 ## 🎯 **투자 전략 권고사항**
 
-### ✅ **추천 전략**"""
+### ✅ **추천 전략**""")
 
     if best_basic:
-        report_content += f"""
+        report.write(f"""
 1. **{best_basic['window']} 슬라이딩 윈도우를 사용한 기본전략** (최고 성과)
    - 가격차이비율 < {best_basic['window']} 슬라이딩 25% 분위 → {company_name} 매수
-   - 가격차이비율 > {best_basic['window']} 슬라이딩 75% 분위 → {company_name}(우) 매수"""
+   - 가격차이비율 > {best_basic['window']} 슬라이딩 75% 분위 → {company_name}(우) 매수""")
 
-    report_content += f"""
+    report.write(f"""
 
 ### ❌ **비추천 전략**
 - 반대전략: Buy & Hold보다 저조한 성과
@@ -594,7 +430,7 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
 **🔍 비교 기준**: 모든 전략이 동일한 1억원으로 시작하여 공정한 성과 비교가 가능합니다.
 
 #### 📈 **전체 전략 자산 구성 비교**
-"""
+""")
 
     # 자산 구성 요소 계산 (기본전략과 반대전략의 첫 번째 윈도우 결과 사용)
     if basic_strategies and reverse_strategies:
@@ -626,16 +462,16 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
             pref_buy_hold_stock_value_for_table = pref_buy_hold_final_value - pref_buy_hold_cash_for_table
             pref_buy_hold_dividend_ratio = (pref_buy_hold_cash_for_table / pref_buy_hold_final_value) * 100 if pref_buy_hold_final_value > 0 else 0
         
-        report_content += f"""
+        report.write(f"""
 | 구분 | 수익률 (1억원 기준) | 총자산 | 주식자산 | 배당금 | 배당금 비율 |
 |------|------------------|--------|----------|--------|------------|
-| **보통주 Buy & Hold** | {buy_hold_return_rate:,.2f}% | {buy_hold_final_value:,.0f}원 | {buy_hold_stock_value:,.0f}원 | {basic_cash:,.0f}원 | {buy_hold_dividend_ratio:.1f}% |"""
+| **보통주 Buy & Hold** | {buy_hold_return_rate:,.2f}% | {buy_hold_final_value:,.0f}원 | {buy_hold_stock_value:,.0f}원 | {basic_cash:,.0f}원 | {buy_hold_dividend_ratio:.1f}% |""")
         
         if pref_buy_hold_final_value and pref_buy_hold_return_rate:
-            report_content += f"""
-| **우선주 Buy & Hold** | {pref_buy_hold_return_rate:,.2f}% | {pref_buy_hold_final_value:,.0f}원 | {pref_buy_hold_stock_value_for_table:,.0f}원 | {pref_buy_hold_cash_for_table:,.0f}원 | {pref_buy_hold_dividend_ratio:.1f}% |"""
+            report.write(f"""
+| **우선주 Buy & Hold** | {pref_buy_hold_return_rate:,.2f}% | {pref_buy_hold_final_value:,.0f}원 | {pref_buy_hold_stock_value_for_table:,.0f}원 | {pref_buy_hold_cash_for_table:,.0f}원 | {pref_buy_hold_dividend_ratio:.1f}% |""")
         
-        report_content += f"""
+        report.write(f"""
 | **기본전략 (최고성과)** | {basic_strategies[0]['return_rate']:,.2f}% | {basic_final_value:,.0f}원 | {basic_stock_value:,.0f}원 | {basic_cash:,.0f}원 | {basic_dividend_ratio:.1f}% |
 | **반대전략 (최고성과)** | {reverse_strategies[0]['return_rate']:,.2f}% | {reverse_final_value:,.0f}원 | {reverse_stock_value:,.0f}원 | {reverse_cash:,.0f}원 | {reverse_dividend_ratio:.1f}% |
 
@@ -649,7 +485,7 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
 
 ### 🔄 **Buy & Hold 기준 성과 비교**
 
-"""
+""")
         
         # Buy & Hold 기준 성과 비교 계산
         basic_vs_buyhold_ratio = basic_final_value / buy_hold_final_value
@@ -659,18 +495,18 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
         basic_relative_perf = ((basic_final_value - buy_hold_final_value) / buy_hold_final_value) * 100
         reverse_relative_perf = ((reverse_final_value - buy_hold_final_value) / buy_hold_final_value) * 100
         
-        report_content += f"""| 전략 | Buy & Hold 대비 | 절대 차이 | 상대 성과 |
+        report.write(f"""| 전략 | Buy & Hold 대비 | 절대 차이 | 상대 성과 |
 |------|----------------|-----------|----------|
 | **기본전략** | **{basic_vs_buyhold_ratio:.2f}배** | {basic_absolute_diff:+,.0f}원 | {'✅ **' + f'{basic_relative_perf:.0f}% 더 좋음**' if basic_relative_perf > 0 else '❌ **' + f'{abs(basic_relative_perf):.0f}% 더 나쁨**'} |
 | **반대전략** | **{reverse_vs_buyhold_ratio:.2f}배** | {reverse_absolute_diff:+,.0f}원 | {'✅ **' + f'{reverse_relative_perf:.0f}% 더 좋음**' if reverse_relative_perf > 0 else '❌ **' + f'{abs(reverse_relative_perf):.0f}% 더 나쁨**'} |
 
-"""
+""")
 
-    report_content += f"""### 기본전략 상세 성과
+    report.write(f"""### 기본전략 상세 성과
 
 | 윈도우 | 수익률 (1억원 기준) | 총자산 | 주식자산 | 배당금 | 매매횟수 | Buy&Hold 대비 |
 |--------|------------------|--------|----------|--------|----------|---------------|
-"""
+""")
 
     for strategy in basic_strategies:
         buy_hold_ratio = strategy['final_value'] / buy_hold_final_value
@@ -678,15 +514,15 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
         strategy_data = strategy_results.get(strategy_name, {})
         stock_value = strategy_data.get('final_stock_value', strategy['final_value'])
         cash_value = strategy_data.get('cash', 0)
-        report_content += f"| {strategy['window']} | {strategy['return_rate']:,.2f}% | {strategy['final_value']:,.0f}원 | {stock_value:,.0f}원 | {cash_value:,.0f}원 | {strategy['trades']}회 | **{buy_hold_ratio:.2f}배** |\n"
+        report.write(f"| {strategy['window']} | {strategy['return_rate']:,.2f}% | {strategy['final_value']:,.0f}원 | {stock_value:,.0f}원 | {cash_value:,.0f}원 | {strategy['trades']}회 | **{buy_hold_ratio:.2f}배** |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ### 반대전략 상세 성과
 
 | 윈도우 | 수익률 (1억원 기준) | 총자산 | 주식자산 | 배당금 | 매매횟수 | Buy&Hold 대비 |
 |--------|------------------|--------|----------|--------|----------|---------------|
-"""
+""")
 
     for strategy in reverse_strategies:
         buy_hold_ratio = strategy['final_value'] / buy_hold_final_value
@@ -694,15 +530,15 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
         strategy_data = strategy_results.get(strategy_name, {})
         stock_value = strategy_data.get('final_stock_value', strategy['final_value'])
         cash_value = strategy_data.get('cash', 0)
-        report_content += f"| {strategy['window']} | {strategy['return_rate']:,.2f}% | {strategy['final_value']:,.0f}원 | {stock_value:,.0f}원 | {cash_value:,.0f}원 | {strategy['trades']}회 | **{buy_hold_ratio:.2f}배** |\n"
+        report.write(f"| {strategy['window']} | {strategy['return_rate']:,.2f}% | {strategy['final_value']:,.0f}원 | {stock_value:,.0f}원 | {cash_value:,.0f}원 | {strategy['trades']}회 | **{buy_hold_ratio:.2f}배** |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ---
 
 ## 📊 **생성된 파일들**
 
-1. **그래프**: `strategy_comparison_{period_name}.png`
+1. **그래프**: `{chart_path(f'strategy_comparison_{period_name}.png')}`
 2. **매매 기록**: 각 전략별 CSV 파일
    - `trading_log_{period_name}_기본전략_2년.csv`
    - `trading_log_{period_name}_기본전략_3년.csv`
@@ -716,20 +552,307 @@ def generate_analysis_report(strategy_results, buy_hold_final_value, buy_hold_re
 **📊 수익률 계산 요약**: 본 분석의 모든 수익률은 1억원 초기투자 기준으로 계산되었습니다. 공식: (최종총자산 - 배당금 - 1억원) ÷ 1억원 × 100
 
 **면책조항**: 본 분석은 과거 데이터에 기반한 백테스트 결과이며, 미래 수익을 보장하지 않습니다. 실제 투자시에는 시장 상황, 거래 비용, 세금 등을 종합적으로 고려하시기 바랍니다.
-"""
+""")
 
     # 리포트 파일 저장
-    main_path, backup_path = save_report_files(report_content, f'{safe_company_name}_strategy_analysis_report', period_name)
+    main_path, backup_path = report.commit()
     
     print(f"\n📋 {company_name} {period_name} 전략 분석 리포트 저장 완료")
 
-def run_comprehensive_backtest(company_name):
+BACKTEST_PERIODS = ['3년', '5년', '10년', '20년', '30년']
+BACKTEST_WINDOW_CONFIGS = {
+    '2year': '2년',
+    '3year': '3년',
+    '5year': '5년'
+}
+
+# 백테스트에 필요한 컬럼만 로드 (가격/배당 + 윈도우별 분위수)
+BACKTEST_COLUMNS = ['Stock1_Close', 'Stock2_Close', 'Stock1_Open', 'Stock2_Open',
+                    'Dividend_Amount_Raw', 'Price_Diff_Ratio'] + [
+    f'Price_Diff_Ratio_{percentile}_Percentile_{window_suffix}'
+    for window_suffix in BACKTEST_WINDOW_CONFIGS for percentile in ('25th', '75th')
+]
+
+def backtest_output_paths(company_name):
+    """
+    run_comprehensive_backtest가 회사마다 저장하는 리포트/매매 기록/차트 파일 경로를 반환합니다. (pipeline.py 출력 확인용)
+
+    Args:
+        company_name (str): 회사명
+
+    Returns:
+        list: 파일 경로 목록 (차트는 현재 프로파일 기준, none 프로파일이면 제외)
+    """
+    safe_company_name = company_name.replace('/', '_').replace('\\', '_')
+    paths = [report_paths(f'{safe_company_name}_comprehensive_analysis_report')[0],
+             report_paths(f'{safe_company_name}_summary_backtest_report')[0]]
+    charts = []
+    for period in BACKTEST_PERIODS:
+        paths.append(report_paths(f'{safe_company_name}_strategy_analysis_report', period)[0])
+        for window_name in BACKTEST_WINDOW_CONFIGS.values():
+            for strategy_type in ('기본전략', '반대전략'):
+                paths.append(f'{safe_company_name}_trading_log_{period}_{strategy_type}_{window_name}.csv')
+        charts.append(f'./{safe_company_name}_strategy_comparison_{period}.png')
+    return paths + saved_chart_paths(charts)
+
+@timed()
+def run_period_backtest(company_name, period):
+    """
+    한 회사의 한 기간에 대해 2년, 3년, 5년 윈도우 전략과 Buy & Hold를 백테스트합니다.
+    매매 기록 CSV, 기간 비교 차트, 기간 리포트를 저장합니다.
+    (회사 x 기간 단위로 프로세스 풀에서 실행할 수 있도록 run_comprehensive_backtest에서 분리)
+
+    Args:
+        company_name (str): 분석할 회사명
+        period (str): 분석 기간 (예: '20년')
+
+    Returns:
+        dict | None: 기간 결과 (generate_comprehensive_report 입력 형식), 데이터가 없거나 오류면 None
+    """
+    window_configs = BACKTEST_WINDOW_CONFIGS
+    safe_company_name = company_name.replace('/', '_').replace('\\', '_')
+
+    print(f"\n{'='*80}")
+    print(f"=== {company_name} {period} 백테스트 시작 ===")
+    print(f"{'='*80}")
+    
+    json_file = find_analysis_data_path(company_name, period)
+    
+    try:
+        # 데이터 파일 읽기 (parquet/feather/json)
+        print(f"📁 run_comprehensive_backtest 데이터 파일 로딩 중: {json_file}")
+        # 최신 패널이 있으면 메모리 매핑으로 읽고, 없으면 데이터 파일을 직접 읽음 (price_panel.py)
+        df = load_panel_frame(company_name, period, columns=BACKTEST_COLUMNS, build=False)
+        print(f"✅ run_comprehensive_backtest 데이터 파일 로딩 완료: {json_file}")
+
+        if df.empty:
+            print(f"{period} 데이터가 비어있습니다.")
+            return None
+
+        print(f"데이터 기간: {df.index[0].strftime('%Y-%m-%d')} ~ {df.index[-1].strftime('%Y-%m-%d')}")
+        print(f"총 데이터 포인트: {len(df)}")
+
+        # 초기 설정 (1억원 초기 자본)
+        initial_capital = 100_000_000  # 1억원
+        initial_stock_type = f"{company_name} 보통주"  # 정확한 보통주 명칭 사용
+        start_date_str = df.index[0].strftime('%y-%m-%d')
+        
+        # 백테스트 시작 날짜 설정 (첫 날 다음날부터)
+        if len(df) > 1:
+            df_backtest = df.iloc[1:].copy()
+        else:
+            print(f"{period} 백테스트에 충분한 데이터가 없습니다.")
+            return None
+
+        first_day_data = df.iloc[0]
+        # 1억원으로 살 수 있는 주식 수 계산
+        initial_shares = int(initial_capital / first_day_data['Stock1_Open'])
+        initial_value = initial_shares * first_day_data['Stock1_Open']
+
+        print(f"초기 설정:")
+        print(f"  - 보유주식: {initial_shares}주 {initial_stock_type}")
+        print(f"  - 초기 가치: {initial_value:,.2f}원")
+        print(f"  - 백테스트 시작: {df_backtest.index[0].strftime('%y-%m-%d')}")
+
+        strategy_results = {}
+
+        # 모든 윈도우 x 기본/반대 전략을 한 번의 데이터 순회로 실행
+        strategy_configs = []
+        for window_suffix, window_name in window_configs.items():
+            strategy_configs.append((f"기본전략_{window_name}", window_suffix, False))
+            strategy_configs.append((f"반대전략_{window_name}", window_suffix, True))
+        kernel_results = run_strategy_batch(df_backtest, initial_stock_type, initial_shares, company_name, strategy_configs)
+
+        # 각 윈도우 크기별로 전략 결과 정리
+        for window_suffix, window_name in window_configs.items():
+            print(f"\n{'*'*50}")
+            print(f"*** {window_name} 윈도우 분석 ***")
+            print(f"{'*'*50}")
+            
+            # 기본 전략
+            print(f"\n--- {window_name} 기본 전략 ---")
+            print(f"- 가격차이비율 < {window_name} 슬라이딩 25% 분위: {company_name} 보통주 매수 (상대적 저평가)")
+            print(f"- 가격차이비율 > {window_name} 슬라이딩 75% 분위: {company_name} 우선주 매수 (상대적 저평가)")
+
+            basic_strategy_name = f"기본전략_{window_name}"
+            strategy_results[basic_strategy_name] = summarize_strategy_result(
+                df_backtest, kernel_results[basic_strategy_name], initial_stock_type, initial_shares,
+                initial_value, company_name, basic_strategy_name, window_suffix
+            )
+            
+            # 반대 전략
+            print(f"\n--- {window_name} 반대 전략 ---")
+            print(f"- 가격차이비율 < {window_name} 슬라이딩 25% 분위: {company_name} 우선주 매수")
+            print(f"- 가격차이비율 > {window_name} 슬라이딩 75% 분위: {company_name} 보통주 매수")
+
+            reverse_strategy_name = f"반대전략_{window_name}"
+            strategy_results[reverse_strategy_name] = summarize_strategy_result(
+                df_backtest, kernel_results[reverse_strategy_name], initial_stock_type, initial_shares,
+                initial_value, company_name, reverse_strategy_name, window_suffix
+            )
+
+        # Buy & Hold 전략 (1억원 기준)
+        print("\n" + "="*60)
+        print(f"=== {company_name} 보통주 Buy & Hold 결과 ===")
+        buy_hold_initial_shares = int(initial_capital / first_day_data['Stock1_Open'])
+        buy_hold_initial_value = buy_hold_initial_shares * first_day_data['Stock1_Open']
+        
+        buy_hold_portfolio_values = []
+        accumulated_buy_hold_dividends = 0.0
+
+        # stock_diff.py에서 처리된 배당 데이터를 활용한 Buy & Hold 전략
+        print(f"📈 {company_name} 보통주 Buy & Hold 전략 (stock_diff.py 배당 데이터 활용)")
+        
+        for date, row in df_backtest.iterrows():
+            # stock_diff.py에서 처리된 배당 데이터 활용
+            if 'Dividend_Amount_Raw' in row and row['Dividend_Amount_Raw'] > 0:
+                daily_dividend = row['Dividend_Amount_Raw'] * buy_hold_initial_shares
+                accumulated_buy_hold_dividends += daily_dividend
+                print(f"  📅 {date.strftime('%Y-%m-%d')}: 배당 {row['Dividend_Amount_Raw']:,.0f}원/주 → 총 {daily_dividend:,.0f}원")
+            
+            buy_hold_daily_value = buy_hold_initial_shares * row['Stock1_Close'] + accumulated_buy_hold_dividends
+            buy_hold_portfolio_values.append({'Date': date, 'Value': buy_hold_daily_value})
+
+        buy_hold_final_value = buy_hold_initial_shares * df_backtest.iloc[-1]['Stock1_Close']
+        buy_hold_final_total_value = buy_hold_final_value + accumulated_buy_hold_dividends
+        # 초기 투자금 1억원 기준 수익률 계산
+        return_without_dividends_buy_hold = ((buy_hold_final_value - initial_capital) / initial_capital) * 100
+
+        print(f"초기 보유: {buy_hold_initial_shares}주 {company_name} 보통주 (시가 기준 초기 가치: {buy_hold_initial_value:,.2f}원)")
+        print(f"최종 보유: {buy_hold_initial_shares}주 {company_name} 보통주")
+        print(f"최종 주식 가치: {buy_hold_final_value:,.2f}원")
+        print(f"총 배당금 수령: {accumulated_buy_hold_dividends:,.2f}원")
+        print(f"최종 총 자산 가치 (주식 + 배당금): {buy_hold_final_total_value:,.2f}원")
+        print(f"총 수익률 (배당금 제외): {return_without_dividends_buy_hold:,.2f}%")
+
+        # 우선주 Buy & Hold 전략 (1억원 기준)
+        print("\n" + "="*60)
+        print(f"=== {company_name} 우선주 Buy & Hold 결과 ===")
+        pref_buy_hold_initial_shares = int(initial_capital / first_day_data['Stock2_Open'])
+        pref_buy_hold_initial_value = pref_buy_hold_initial_shares * first_day_data['Stock2_Open']
+        
+        pref_buy_hold_portfolio_values = []
+        accumulated_pref_buy_hold_dividends = 0.0
+
+        # stock_diff.py에서 처리된 배당 데이터를 활용한 우선주 Buy & Hold 전략
+        print(f"📈 {company_name} 우선주 Buy & Hold 전략 (stock_diff.py 배당 데이터 활용)")
+        
+        for date, row in df_backtest.iterrows():
+            # 우선주 배당금은 보통주보다 높을 수 있음 (일반적으로 추가 배당 있음)
+            if 'Dividend_Amount_Raw' in row and row['Dividend_Amount_Raw'] > 0:
+                # 우선주는 보통주 배당 + 추가 배당 (일반적으로 1% 정도 추가)
+                pref_dividend_per_share = row['Dividend_Amount_Raw'] * 1.01  # 우선주 추가 배당 가정
+                daily_pref_dividend = pref_dividend_per_share * pref_buy_hold_initial_shares
+                accumulated_pref_buy_hold_dividends += daily_pref_dividend
+                print(f"  📅 {date.strftime('%Y-%m-%d')}: 우선주 배당 {pref_dividend_per_share:,.0f}원/주 → 총 {daily_pref_dividend:,.0f}원")
+            
+            pref_buy_hold_daily_value = pref_buy_hold_initial_shares * row['Stock2_Close'] + accumulated_pref_buy_hold_dividends
+            pref_buy_hold_portfolio_values.append({'Date': date, 'Value': pref_buy_hold_daily_value})
+
+        pref_buy_hold_final_value = pref_buy_hold_initial_shares * df_backtest.iloc[-1]['Stock2_Close']
+        pref_buy_hold_final_total_value = pref_buy_hold_final_value + accumulated_pref_buy_hold_dividends
+        # 초기 투자금 1억원 기준 수익률 계산
+        return_without_dividends_pref_buy_hold = ((pref_buy_hold_final_value - initial_capital) / initial_capital) * 100
+
+        print(f"초기 보유: {pref_buy_hold_initial_shares}주 {company_name} 우선주 (시가 기준 초기 가치: {pref_buy_hold_initial_value:,.2f}원)")
+        print(f"최종 보유: {pref_buy_hold_initial_shares}주 {company_name} 우선주")
+        print(f"최종 주식 가치: {pref_buy_hold_final_value:,.2f}원")
+        print(f"총 배당금 수령: {accumulated_pref_buy_hold_dividends:,.2f}원")
+        print(f"최종 총 자산 가치 (주식 + 배당금): {pref_buy_hold_final_total_value:,.2f}원")
+        print(f"총 수익률 (배당금 제외): {return_without_dividends_pref_buy_hold:,.2f}%")
+
+        # 매매 기록 저장
+        for strategy_name, result in strategy_results.items():
+            trading_df = result['trading_log'].to_frame()
+            filename = f'{safe_company_name}_trading_log_{period}_{strategy_name.replace(" ", "_")}.csv'
+            trading_df.to_csv(filename, index=False, encoding='utf-8-sig')
+            print(f"\n{strategy_name} 매매 기록이 '{filename}' 파일로 저장되었습니다.")
+
+        # 전략 비교 요약
+        print(f"\n{'='*80}")
+        print(f"=== {company_name} {period} 전략 비교 요약 ===")
+        
+        print(f"\n--- 기본전략 (25%↓→{company_name} 보통주, 75%↑→{company_name} 우선주) ---")
+        for window_name in ['2년', '3년', '5년']:
+            strategy_name = f"기본전략_{window_name}"
+            if strategy_name in strategy_results:
+                result = strategy_results[strategy_name]
+                stock_value = result['final_stock_value']
+                dividend_value = result['cash']
+                print(f"{window_name} 윈도우: {result['return_rate']:,.2f}% (최종자산: {result['final_value']:,.0f}원, 주식자산: {stock_value:,.0f}원, 배당금: {dividend_value:,.0f}원)")
+        
+        print(f"\n--- 반대전략 (25%↓→{company_name} 우선주, 75%↑→{company_name} 보통주) ---")
+        for window_name in ['2년', '3년', '5년']:
+            strategy_name = f"반대전략_{window_name}"
+            if strategy_name in strategy_results:
+                result = strategy_results[strategy_name]
+                stock_value = result['final_stock_value']
+                dividend_value = result['cash']
+                print(f"{window_name} 윈도우: {result['return_rate']:,.2f}% (최종자산: {result['final_value']:,.0f}원, 주식자산: {stock_value:,.0f}원, 배당금: {dividend_value:,.0f}원)")
+        
+        print(f"\n--- Buy & Hold 참고 ---")
+        # 보통주 Buy & Hold 구성 요소 계산
+        buy_hold_stock_value = buy_hold_final_value
+        buy_hold_dividend_value = buy_hold_final_total_value - buy_hold_final_value
+        print(f"{company_name} 보통주 Buy & Hold: {return_without_dividends_buy_hold:,.2f}% (최종자산: {buy_hold_final_total_value:,.0f}원, 주식자산: {buy_hold_stock_value:,.0f}원, 배당금: {buy_hold_dividend_value:,.0f}원)")
+        
+        # 우선주 Buy & Hold 구성 요소 계산
+        pref_buy_hold_stock_value = pref_buy_hold_final_value
+        pref_buy_hold_dividend_value = pref_buy_hold_final_total_value - pref_buy_hold_final_value
+        print(f"{company_name} 우선주 Buy & Hold: {return_without_dividends_pref_buy_hold:,.2f}% (최종자산: {pref_buy_hold_final_total_value:,.0f}원, 주식자산: {pref_buy_hold_stock_value:,.0f}원, 배당금: {pref_buy_hold_dividend_value:,.0f}원)")
+
+        # Buy&Hold 구성 요소 계산 (기본전략의 배당금을 사용)
+        basic_cash = 0
+        if strategy_results and '기본전략_2년' in strategy_results:
+            basic_cash = strategy_results['기본전략_2년'].get('cash', 0)
+        buy_hold_stock_value = buy_hold_final_total_value - basic_cash
+        
+        # 결과 저장
+        period_result = {
+            'strategy_results': strategy_results,
+            'buy_hold_final_value': buy_hold_final_total_value,
+            'buy_hold_stock_value': buy_hold_stock_value,  # Buy&Hold 주식자산
+            'buy_hold_dividends': basic_cash,  # Buy&Hold 배당금
+            'buy_hold_return_rate': return_without_dividends_buy_hold,
+            'pref_buy_hold_final_value': pref_buy_hold_final_total_value,  # 우선주 Buy&Hold
+            'pref_buy_hold_return_rate': return_without_dividends_pref_buy_hold,  # 우선주 수익률
+            'start_date': start_date_str,
+            'end_date': df_backtest.index[-1].strftime('%y-%m-%d'),
+            'initial_value': initial_value,
+            'initial_capital': initial_capital,  # 초기 자본 추가
+            'buy_hold_portfolio_values': buy_hold_portfolio_values,
+            'pref_buy_hold_portfolio_values': pref_buy_hold_portfolio_values  # 우선주 포트폴리오 값들
+        }
+
+        # 그래프 생성
+        generate_period_comparison_chart(period, strategy_results, buy_hold_portfolio_values, pref_buy_hold_portfolio_values, company_name)
+
+        # 개별 기간 리포트 생성
+        generate_analysis_report(strategy_results, buy_hold_final_total_value, return_without_dividends_buy_hold, 
+                               start_date_str, df_backtest.index[-1].strftime('%y-%m-%d'), initial_value, company_name, period,
+                               pref_buy_hold_final_total_value, return_without_dividends_pref_buy_hold)
+
+        return period_result
+
+    except FileNotFoundError:
+        print(f"오류: {json_file} 파일을 찾을 수 없습니다.")
+        return None
+    except Exception as e:
+        print(f"{period} 백테스트 중 오류 발생: {e}")
+        return None
+
+@timed()
+def run_comprehensive_backtest(company_name, jobs=1):
     """
     다양한 기간(3년, 5년, 10년, 20년, 30년)에 대해 백테스트를 수행합니다.
     각 기간별로 2년, 3년, 5년 윈도우 크기를 사용하여 전략을 비교분석합니다.
     
     Args:
         company_name (str): 분석할 회사명
+        jobs (int): 기간별 백테스트를 실행할 프로세스 수 (1이면 순차 실행)
+
+    Returns:
+        list: 실패한 (회사명, 기간) 목록 (모두 성공하면 빈 목록)
     """
     print(f"\n🏢 {company_name} 백테스트 분석 시작")
     
@@ -737,248 +860,44 @@ def run_comprehensive_backtest(company_name):
     if company_name not in PREFERRED_STOCK_COMPANIES:
         print(f"❌ 지원되지 않는 회사입니다: {company_name}")
         print(f"지원되는 회사: {list(PREFERRED_STOCK_COMPANIES.keys())}")
-        return
+        return [(company_name, '전체')]
     
-    periods = ['3년', '5년', '10년', '20년', '30년']
-    window_configs = {
-        '2year': '2년',
-        '3year': '3년',
-        '5year': '5년'
-    }
-    
-    all_results = {}
-    safe_company_name = company_name.replace('/', '_').replace('\\', '_')
-    
-    for period in periods:
-        print(f"\n{'='*80}")
-        print(f"=== {company_name} {period} 백테스트 시작 ===")
-        print(f"{'='*80}")
-        
-        json_file = f'./{safe_company_name}_stock_analysis_{period}.json'
-        
-        try:
-            # JSON 파일 읽기
-            print(f"📁 run_comprehensive_backtest JSON 파일 로딩 중: {json_file}")
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            print(f"✅ run_comprehensive_backtest JSON 파일 로딩 완료: {json_file}")
-
-            df = pd.DataFrame.from_dict(data, orient='index')
-            df.index = pd.to_datetime(df.index, format='%y-%m-%d')
-            df = df.sort_index()
-
-            if df.empty:
-                print(f"{period} 데이터가 비어있습니다.")
-                continue
-
-            print(f"데이터 기간: {df.index[0].strftime('%Y-%m-%d')} ~ {df.index[-1].strftime('%Y-%m-%d')}")
-            print(f"총 데이터 포인트: {len(df)}")
-
-            # 초기 설정 (1억원 초기 자본)
-            initial_capital = 100_000_000  # 1억원
-            initial_stock_type = f"{company_name} 보통주"  # 정확한 보통주 명칭 사용
-            start_date_str = df.index[0].strftime('%y-%m-%d')
-            
-            # 백테스트 시작 날짜 설정 (첫 날 다음날부터)
-            if len(df) > 1:
-                df_backtest = df.iloc[1:].copy()
-            else:
-                print(f"{period} 백테스트에 충분한 데이터가 없습니다.")
-                continue
-
-            first_day_data = df.iloc[0]
-            # 1억원으로 살 수 있는 주식 수 계산
-            initial_shares = int(initial_capital / first_day_data['Stock1_Open'])
-            initial_value = initial_shares * first_day_data['Stock1_Open']
+    tasks = [((company_name, period), (company_name, period)) for period in BACKTEST_PERIODS]
+    outcomes = run_tasks(run_period_backtest, tasks, jobs)
+    generate_company_reports(company_name, outcomes)
+    return failed_backtests(outcomes)
 
-            print(f"초기 설정:")
-            print(f"  - 보유주식: {initial_shares}주 {initial_stock_type}")
-            print(f"  - 초기 가치: {initial_value:,.2f}원")
-            print(f"  - 백테스트 시작: {df_backtest.index[0].strftime('%y-%m-%d')}")
-
-            strategy_results = {}
-
-            # 각 윈도우 크기별로 전략 실행
-            for window_suffix, window_name in window_configs.items():
-                print(f"\n{'*'*50}")
-                print(f"*** {window_name} 윈도우 분석 ***")
-                print(f"{'*'*50}")
-                
-                # 기본 전략
-                print(f"\n--- {window_name} 기본 전략 ---")
-                print(f"- 가격차이비율 < {window_name} 슬라이딩 25% 분위: {company_name} 보통주 매수 (상대적 저평가)")
-                print(f"- 가격차이비율 > {window_name} 슬라이딩 75% 분위: {company_name} 우선주 매수 (상대적 저평가)")
-
-                basic_strategy_name = f"기본전략_{window_name}"
-                strategy_results[basic_strategy_name] = run_single_strategy(
-                    df_backtest, initial_stock_type, initial_shares, initial_value, company_name,
-                    False, basic_strategy_name, window_suffix
-                )
-                
-                # 반대 전략
-                print(f"\n--- {window_name} 반대 전략 ---")
-                print(f"- 가격차이비율 < {window_name} 슬라이딩 25% 분위: {company_name} 우선주 매수")
-                print(f"- 가격차이비율 > {window_name} 슬라이딩 75% 분위: {company_name} 보통주 매수")
-
-                reverse_strategy_name = f"반대전략_{window_name}"
-                strategy_results[reverse_strategy_name] = run_single_strategy(
-                    df_backtest, initial_stock_type, initial_shares, initial_value, company_name,
-                    True, reverse_strategy_name, window_suffix
-                )
-
-            # Buy & Hold 전략 (1억원 기준)
-            print("\n" + "="*60)
-            print(f"=== {company_name} 보통주 Buy & Hold 결과 ===")
-            buy_hold_initial_shares = int(initial_capital / first_day_data['Stock1_Open'])
-            buy_hold_initial_value = buy_hold_initial_shares * first_day_data['Stock1_Open']
-            
-            buy_hold_portfolio_values = []
-            accumulated_buy_hold_dividends = 0.0
+def failed_backtests(outcomes):
+    """
+    실패한 기간 백테스트를 찾습니다. (run_period_backtest는 오류를 출력하고 None을 반환)
 
-            # stock_diff.py에서 처리된 배당 데이터를 활용한 Buy & Hold 전략
-            print(f"📈 {company_name} 보통주 Buy & Hold 전략 (stock_diff.py 배당 데이터 활용)")
-            
-            for date, row in df_backtest.iterrows():
-                # stock_diff.py에서 처리된 배당 데이터 활용
-                if 'Dividend_Amount_Raw' in row and row['Dividend_Amount_Raw'] > 0:
-                    daily_dividend = row['Dividend_Amount_Raw'] * buy_hold_initial_shares
-                    accumulated_buy_hold_dividends += daily_dividend
-                    print(f"  📅 {date.strftime('%Y-%m-%d')}: 배당 {row['Dividend_Amount_Raw']:,.0f}원/주 → 총 {daily_dividend:,.0f}원")
-                
-                buy_hold_daily_value = buy_hold_initial_shares * row['Stock1_Close'] + accumulated_buy_hold_dividends
-                buy_hold_portfolio_values.append({'Date': date, 'Value': buy_hold_daily_value})
-
-            buy_hold_final_value = buy_hold_initial_shares * df_backtest.iloc[-1]['Stock1_Close']
-            buy_hold_final_total_value = buy_hold_final_value + accumulated_buy_hold_dividends
-            # 초기 투자금 1억원 기준 수익률 계산
-            return_without_dividends_buy_hold = ((buy_hold_final_value - initial_capital) / initial_capital) * 100
-
-            print(f"초기 보유: {buy_hold_initial_shares}주 {company_name} 보통주 (시가 기준 초기 가치: {buy_hold_initial_value:,.2f}원)")
-            print(f"최종 보유: {buy_hold_initial_shares}주 {company_name} 보통주")
-            print(f"최종 주식 가치: {buy_hold_final_value:,.2f}원")
-            print(f"총 배당금 수령: {accumulated_buy_hold_dividends:,.2f}원")
-            print(f"최종 총 자산 가치 (주식 + 배당금): {buy_hold_final_total_value:,.2f}원")
-            print(f"총 수익률 (배당금 제외): {return_without_dividends_buy_hold:,.2f}%")
-
-            # 우선주 Buy & Hold 전략 (1억원 기준)
-            print("\n" + "="*60)
-            print(f"=== {company_name} 우선주 Buy & Hold 결과 ===")
-            pref_buy_hold_initial_shares = int(initial_capital / first_day_data['Stock2_Open'])
-            pref_buy_hold_initial_value = pref_buy_hold_initial_shares * first_day_data['Stock2_Open']
-            
-            pref_buy_hold_portfolio_values = []
-            accumulated_pref_buy_hold_dividends = 0.0
+    Args:
+        outcomes (dict): {(회사명, 기간): {'result', 'error'}} (parallel_runner.run_tasks 반환값)
 
-            # stock_diff.py에서 처리된 배당 데이터를 활용한 우선주 Buy & Hold 전략
-            print(f"📈 {company_name} 우선주 Buy & Hold 전략 (stock_diff.py 배당 데이터 활용)")
-            
-            for date, row in df_backtest.iterrows():
-                # 우선주 배당금은 보통주보다 높을 수 있음 (일반적으로 추가 배당 있음)
-                if 'Dividend_Amount_Raw' in row and row['Dividend_Amount_Raw'] > 0:
-                    # 우선주는 보통주 배당 + 추가 배당 (일반적으로 1% 정도 추가)
-                    pref_dividend_per_share = row['Dividend_Amount_Raw'] * 1.01  # 우선주 추가 배당 가정
-                    daily_pref_dividend = pref_dividend_per_share * pref_buy_hold_initial_shares
-                    accumulated_pref_buy_hold_dividends += daily_pref_dividend
-                    print(f"  📅 {date.strftime('%Y-%m-%d')}: 우선주 배당 {pref_dividend_per_share:,.0f}원/주 → 총 {daily_pref_dividend:,.0f}원")
-                
-                pref_buy_hold_daily_value = pref_buy_hold_initial_shares * row['Stock2_Close'] + accumulated_pref_buy_hold_dividends
-                pref_buy_hold_portfolio_values.append({'Date': date, 'Value': pref_buy_hold_daily_value})
-
-            pref_buy_hold_final_value = pref_buy_hold_initial_shares * df_backtest.iloc[-1]['Stock2_Close']
-            pref_buy_hold_final_total_value = pref_buy_hold_final_value + accumulated_pref_buy_hold_dividends
-            # 초기 투자금 1억원 기준 수익률 계산
-            return_without_dividends_pref_buy_hold = ((pref_buy_hold_final_value - initial_capital) / initial_capital) * 100
-
-            print(f"초기 보유: {pref_buy_hold_initial_shares}주 {company_name} 우선주 (시가 기준 초기 가치: {pref_buy_hold_initial_value:,.2f}원)")
-            print(f"최종 보유: {pref_buy_hold_initial_shares}주 {company_name} 우선주")
-            print(f"최종 주식 가치: {pref_buy_hold_final_value:,.2f}원")
-            print(f"총 배당금 수령: {accumulated_pref_buy_hold_dividends:,.2f}원")
-            print(f"최종 총 자산 가치 (주식 + 배당금): {pref_buy_hold_final_total_value:,.2f}원")
-            print(f"총 수익률 (배당금 제외): {return_without_dividends_pref_buy_hold:,.2f}%")
-
-            # 매매 기록 저장
-            for strategy_name, result in strategy_results.items():
-                trading_df = pd.DataFrame(result['trading_log'])
-                filename = f'{safe_company_name}_trading_log_{period}_{strategy_name.replace(" ", "_")}.csv'
-                trading_df.to_csv(filename, index=False, encoding='utf-8-sig')
-                print(f"\n{strategy_name} 매매 기록이 '{filename}' 파일로 저장되었습니다.")
-
-            # 전략 비교 요약
-            print(f"\n{'='*80}")
-            print(f"=== {company_name} {period} 전략 비교 요약 ===")
-            
-            print(f"\n--- 기본전략 (25%↓→{company_name} 보통주, 75%↑→{company_name} 우선주) ---")
-            for window_name in ['2년', '3년', '5년']:
-                strategy_name = f"기본전략_{window_name}"
-                if strategy_name in strategy_results:
-                    result = strategy_results[strategy_name]
-                    stock_value = result['final_stock_value']
-                    dividend_value = result['cash']
-                    print(f"{window_name} 윈도우: {result['return_rate']:,.2f}% (최종자산: {result['final_value']:,.0f}원, 주식자산: {stock_value:,.0f}원, 배당금: {dividend_value:,.0f}원)")
-            
-            print(f"\n--- 반대전략 (25%↓→{company_name} 우선주, 75%↑→{company_name} 보통주) ---")
-            for window_name in ['2년', '3년', '5년']:
-                strategy_name = f"반대전략_{window_name}"
-                if strategy_name in strategy_results:
-                    result = strategy_results[strategy_name]
-                    stock_value = result['final_stock_value']
-                    dividend_value = result['cash']
-                    print(f"{window_name} 윈도우: {result['return_rate']:,.2f}% (최종자산: {result['final_value']:,.0f}원, 주식자산: {stock_value:,.0f}원, 배당금: {dividend_value:,.0f}원)")
-            
-            print(f"\n--- Buy & Hold 참고 ---")
-            # 보통주 Buy & Hold 구성 요소 계산
-            buy_hold_stock_value = buy_hold_final_value
-            buy_hold_dividend_value = buy_hold_final_total_value - buy_hold_final_value
-            print(f"{company_name} 보통주 Buy & Hold: {return_without_dividends_buy_hold:,.2f}% (최종자산: {buy_hold_final_total_value:,.0f}원, 주식자산: {buy_hold_stock_value:,.0f}원, 배당금: {buy_hold_dividend_value:,.0f}원)")
-            
-            # 우선주 Buy & Hold 구성 요소 계산
-            pref_buy_hold_stock_value = pref_buy_hold_final_value
-            pref_buy_hold_dividend_value = pref_buy_hold_final_total_value - pref_buy_hold_final_value
-            print(f"{company_name} 우선주 Buy & Hold: {return_without_dividends_pref_buy_hold:,.2f}% (최종자산: {pref_buy_hold_final_total_value:,.0f}원, 주식자산: {pref_buy_hold_stock_value:,.0f}원, 배당금: {pref_buy_hold_dividend_value:,.0f}원)")
-
-            # Buy&Hold 구성 요소 계산 (기본전략의 배당금을 사용)
-            basic_cash = 0
-            if strategy_results and '기본전략_2년' in strategy_results:
-                basic_cash = strategy_results['기본전략_2년'].get('cash', 0)
-            buy_hold_stock_value = buy_hold_final_total_value - basic_cash
-            
-            # 결과 저장
-            all_results[period] = {
-                'strategy_results': strategy_results,
-                'buy_hold_final_value': buy_hold_final_total_value,
-                'buy_hold_stock_value': buy_hold_stock_value,  # Buy&Hold 주식자산
-                'buy_hold_dividends': basic_cash,  # Buy&Hold 배당금
-                'buy_hold_return_rate': return_without_dividends_buy_hold,
-                'pref_buy_hold_final_value': pref_buy_hold_final_total_value,  # 우선주 Buy&Hold
-                'pref_buy_hold_return_rate': return_without_dividends_pref_buy_hold,  # 우선주 수익률
-                'start_date': start_date_str,
-                'end_date': df_backtest.index[-1].strftime('%y-%m-%d'),
-                'initial_value': initial_value,
-                'initial_capital': initial_capital,  # 초기 자본 추가
-                'buy_hold_portfolio_values': buy_hold_portfolio_values,
-                'pref_buy_hold_portfolio_values': pref_buy_hold_portfolio_values  # 우선주 포트폴리오 값들
-            }
-
-            # 그래프 생성
-            generate_period_comparison_chart(period, strategy_results, buy_hold_portfolio_values, pref_buy_hold_portfolio_values, company_name)
-
-            # 개별 기간 리포트 생성
-            generate_analysis_report(strategy_results, buy_hold_final_total_value, return_without_dividends_buy_hold, 
-                                   start_date_str, df_backtest.index[-1].strftime('%y-%m-%d'), initial_value, company_name, period,
-                                   pref_buy_hold_final_total_value, return_without_dividends_pref_buy_hold)
-
-        except FileNotFoundError:
-            print(f"오류: {json_file} 파일을 찾을 수 없습니다.")
-            continue
-        except Exception as e:
-            print(f"{period} 백테스트 중 오류 발생: {e}")
-            continue
+    Returns:
+        list: 실패한 (회사명, 기간) 목록
+    """
+    return [key for key, outcome in outcomes.items() if outcome['error'] or outcome['result'] is None]
+
+def generate_company_reports(company_name, outcomes):
+    """
+    기간별 백테스트 결과를 모아 전체 기간 비교 리포트와 요약 리포트를 생성합니다.
+
+    Args:
+        company_name (str): 분석 대상 회사명
+        outcomes (dict): {(회사명, 기간): {'result', 'error'}} (parallel_runner.run_tasks 반환값)
+    """
+    all_results = {}
+    for (task_company, period), outcome in outcomes.items():
+        if task_company == company_name and outcome['result']:
+            all_results[period] = outcome['result']
 
     # 전체 기간 비교 리포트 생성
     if all_results:
         generate_comprehensive_report(all_results, company_name)
         generate_summary_report(all_results, company_name)
 
+@timed()
 def generate_period_comparison_chart(period, strategy_results, buy_hold_portfolio_values, pref_buy_hold_portfolio_values, company_name):
     """
     특정 기간에 대한 전략 비교 차트를 생성합니다.
@@ -1044,12 +963,13 @@ def generate_period_comparison_chart(period, strategy_results, buy_hold_portfoli
     ax2.tick_params(axis='x', rotation=45)
 
     plt.tight_layout()
-    plot_output_path = f'./{safe_company_name}_strategy_comparison_{period}.png'
-    plt.savefig(plot_output_path, dpi=300, bbox_inches='tight')
-    print(f"\n{company_name} {period} 전략 비교 그래프가 {plot_output_path}에 저장되었습니다.")
+    plot_output_path = save_chart(plt, f'./{safe_company_name}_strategy_comparison_{period}.png')
+    if plot_output_path:
+        print(f"\n{company_name} {period} 전략 비교 그래프가 {plot_output_path}에 저장되었습니다.")
     
     plt.close()
 
+@timed()
 def generate_comprehensive_report(all_results, company_name):
     """
     모든 기간에 대한 종합 비교 리포트를 생성합니다.
@@ -1062,7 +982,8 @@ def generate_comprehensive_report(all_results, company_name):
     
     safe_company_name = company_name.replace('/', '_').replace('\\', '_')
     
-    report_content = f"""# {company_name} 종합 기간별 전략 성과 분석
+    report = open_report(f'{safe_company_name}_comprehensive_analysis_report')
+    report.write(f"""# {company_name} 종합 기간별 전략 성과 분석
 
 **분석 날짜**: {datetime.now().strftime('%Y년 %m월 %d일')}  
 **분석 기간**: 3년, 5년, 10년, 20년, 30년 백테스트 종합 비교
@@ -1073,7 +994,7 @@ def generate_comprehensive_report(all_results, company_name):
 
 | 기간 | 최고 성과 전략 | 수익률 | 최종 자산 | Buy&Hold 수익률 | Buy&Hold 자산 | 대비 비율 |
 |------|---------------|--------|-----------|-----------------|------------|-----------|
-"""
+""")
 
     # 각 기간별 최고 성과 전략 찾기
     best_strategies = {}
@@ -1099,13 +1020,13 @@ def generate_comprehensive_report(all_results, company_name):
         if best_strategy:
             # Buy&Hold 대비 비율을 최종 자산 기준으로 계산
             vs_buyhold_ratio = best_strategy['final_value'] / buy_hold_final_value if buy_hold_final_value > 0 else 0
-            report_content += f"| {period} | {best_strategy['name']} | **{best_strategy['return_rate']:,.2f}%** | {best_strategy['final_value']:,.0f}원 | {buy_hold_return:,.2f}% | {buy_hold_final_value:,.0f}원 | {vs_buyhold_ratio:.2f}배 |\n"
+            report.write(f"| {period} | {best_strategy['name']} | **{best_strategy['return_rate']:,.2f}%** | {best_strategy['final_value']:,.0f}원 | {buy_hold_return:,.2f}% | {buy_hold_final_value:,.0f}원 | {vs_buyhold_ratio:.2f}배 |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ## 📈 **기간별 상세 성과 비교**
 
-"""
+""")
 
     # 각 기간별 상세 성과 표
     for period, result in all_results.items():
@@ -1113,7 +1034,7 @@ def generate_comprehensive_report(all_results, company_name):
         buy_hold_return = result['buy_hold_return_rate']
         buy_hold_final = result['buy_hold_final_value']
         
-        report_content += f"""
+        report.write(f"""
 ### {period} 백테스트 결과
 
 **기간**: {result['start_date']} ~ {result['end_date']}  
@@ -1121,7 +1042,7 @@ def generate_comprehensive_report(all_results, company_name):
 
 | 전략 | 수익률 | 최종 자산 | Buy&Hold 대비(자산) | Buy&Hold 대비(수익률) |
 |------|--------|-----------|-------------------|-------------------|
-"""
+""")
         
         # 기본전략들
         for window_name in ['2년', '3년', '5년']:
@@ -1132,7 +1053,7 @@ def generate_comprehensive_report(all_results, company_name):
                 asset_ratio = result_data['final_value'] / buy_hold_final if buy_hold_final > 0 else 0
                 # 수익률 기준 대비 계산
                 return_ratio = result_data['return_rate'] / buy_hold_return if buy_hold_return > 0 else 0
-                report_content += f"| 기본전략 {window_name} | {result_data['return_rate']:,.2f}% | {result_data['final_value']:,.0f}원 | {asset_ratio:.2f}배 | {return_ratio:.2f}배 |\n"
+                report.write(f"| 기본전략 {window_name} | {result_data['return_rate']:,.2f}% | {result_data['final_value']:,.0f}원 | {asset_ratio:.2f}배 | {return_ratio:.2f}배 |\n")
         
         # 반대전략들
         for window_name in ['2년', '3년', '5년']:
@@ -1143,21 +1064,21 @@ def generate_comprehensive_report(all_results, company_name):
                 asset_ratio = result_data['final_value'] / buy_hold_final if buy_hold_final > 0 else 0
                 # 수익률 기준 대비 계산
                 return_ratio = result_data['return_rate'] / buy_hold_return if buy_hold_return > 0 else 0
-                report_content += f"| 반대전략 {window_name} | {result_data['return_rate']:,.2f}% | {result_data['final_value']:,.0f}원 | {asset_ratio:.2f}배 | {return_ratio:.2f}배 |\n"
+                report.write(f"| 반대전략 {window_name} | {result_data['return_rate']:,.2f}% | {result_data['final_value']:,.0f}원 | {asset_ratio:.2f}배 | {return_ratio:.2f}배 |\n")
         
         # Buy & Hold
         buy_hold_stock_value = result.get('buy_hold_stock_value', buy_hold_final)
         buy_hold_dividends = result.get('buy_hold_dividends', 0)
-        report_content += f"| **Buy & Hold** | **{buy_hold_return:,.2f}%** | **{buy_hold_final:,.0f}원** | **1.00배** | **1.00배** |\n"
-        report_content += f"| └─ 주식자산 | - | {buy_hold_stock_value:,.0f}원 | - | - |\n"
-        report_content += f"| └─ 배당금 | - | {buy_hold_dividends:,.0f}원 | - | - |\n"
+        report.write(f"| **Buy & Hold** | **{buy_hold_return:,.2f}%** | **{buy_hold_final:,.0f}원** | **1.00배** | **1.00배** |\n")
+        report.write(f"| └─ 주식자산 | - | {buy_hold_stock_value:,.0f}원 | - | - |\n")
+        report.write(f"| └─ 배당금 | - | {buy_hold_dividends:,.0f}원 | - | - |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ## 💡 **핵심 발견사항**
 
 ### 1. **기간별 최적 전략**
-"""
+""")
     
     # 기간별 최적 전략 분석
     basic_wins = 0
@@ -1169,20 +1090,20 @@ def generate_comprehensive_report(all_results, company_name):
         elif best and '반대전략' in best['name']:
             reverse_wins += 1
     
-    report_content += f"""
+    report.write(f"""
 - **기본전략**이 {basic_wins}개 기간에서 최고 성과
 - **반대전략**이 {reverse_wins}개 기간에서 최고 성과
 - 전반적으로 {'기본전략' if basic_wins > reverse_wins else '반대전략'}이 우세
 
 ### 2. **기간별 특성**
-"""
+""")
 
     # 가장 좋은 성과와 나쁜 성과 찾기
     if best_strategies:
         best_overall = max(best_strategies.items(), key=lambda x: x[1]['return_rate'] if x[1] else 0)
         worst_overall = min(best_strategies.items(), key=lambda x: x[1]['return_rate'] if x[1] else float('inf'))
 
-        report_content += f"""
+        report.write(f"""
 - **최고 성과 기간**: {best_overall[0]} ({best_overall[1]['return_rate']:,.2f}%)
 - **최저 성과 기간**: {worst_overall[0]} ({worst_overall[1]['return_rate']:,.2f}%)
 - **장기 vs 단기**: {"장기 투자가 더 유리" if best_overall[0] in ['20년', '30년'] else "단기 투자가 더 유리"}
@@ -1225,42 +1146,43 @@ def generate_comprehensive_report(all_results, company_name):
 
 #### ⚠️ **주의**
 - 기간이 짧을수록 변동성이 클 수 있음
-- 시장 상황에 따라 결과가 달라질 수 있음"""
+- 시장 상황에 따라 결과가 달라질 수 있음""")
 
-    report_content += f"""
+    report.write(f"""
 
 ---
 
 ## 📋 **생성된 파일들**
 
 ### 그래프 파일
-"""
+""")
 
     for period in all_results.keys():
-        report_content += f"- `strategy_comparison_{period}.png`\n"
+        report.write(f"- `{chart_path(f'strategy_comparison_{period}.png')}`\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ### 매매 기록 파일
-"""
+""")
 
     for period in all_results.keys():
         for window_name in ['2년', '3년', '5년']:
-            report_content += f"- `trading_log_{period}_기본전략_{window_name}.csv`\n"
-            report_content += f"- `trading_log_{period}_반대전략_{window_name}.csv`\n"
+            report.write(f"- `trading_log_{period}_기본전략_{window_name}.csv`\n")
+            report.write(f"- `trading_log_{period}_반대전략_{window_name}.csv`\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ---
 
 **면책조항**: 본 분석은 과거 데이터에 기반한 백테스트 결과이며, 미래 수익을 보장하지 않습니다. 실제 투자시에는 시장 상황, 거래 비용, 세금 등을 종합적으로 고려하시기 바랍니다.
-"""
+""")
 
     # 종합 리포트 파일 저장
-    main_path, backup_path = save_report_files(report_content, f'{safe_company_name}_comprehensive_analysis_report')
+    main_path, backup_path = report.commit()
     
     print(f"\n📋 종합 분석 리포트 저장 완료")
 
+@timed()
 def generate_summary_report(all_results, company_name):
     """
     모든 기간의 백테스트 결과를 요약한 종합 리포트를 생성합니다.
@@ -1273,7 +1195,8 @@ def generate_summary_report(all_results, company_name):
     
     safe_company_name = company_name.replace('/', '_').replace('\\', '_')
     
-    report_content = f"""# {company_name} 백테스트 종합 요약 리포트
+    report = open_report(f'{safe_company_name}_summary_backtest_report')
+    report.write(f"""# {company_name} 백테스트 종합 요약 리포트
 
 **분석 날짜**: {datetime.now().strftime('%Y년 %m월 %d일')}  
 **분석 기간**: 3년, 5년, 10년, 20년, 30년 백테스트  
@@ -1284,7 +1207,7 @@ def generate_summary_report(all_results, company_name):
 
 ## 🏆 **최고 성과 TOP 5**
 
-"""
+""")
 
     # 모든 전략 결과를 하나의 리스트로 수집
     all_strategies = []
@@ -1301,21 +1224,21 @@ def generate_summary_report(all_results, company_name):
     # 수익률 기준으로 정렬
     all_strategies.sort(key=lambda x: x['return_rate'], reverse=True)
     
-    report_content += "| 순위 | 기간 | 전략 | 수익률 | 최종 자산 | Buy&Hold 대비 |\n"
-    report_content += "|------|------|------|--------|-----------|---------------|\n"
+    report.write("| 순위 | 기간 | 전략 | 수익률 | 최종 자산 | Buy&Hold 대비 |\n")
+    report.write("|------|------|------|--------|-----------|---------------|\n")
     
     medals = ['🥇', '🥈', '🥉', '4️⃣', '5️⃣']
     for i, strategy in enumerate(all_strategies[:5]):
         medal = medals[i] if i < 5 else ''
-        report_content += f"| {medal} | {strategy['period']} | {strategy['strategy']} | **{strategy['return_rate']:,.2f}%** | {strategy['final_value']:,.0f}원 | {strategy['buy_hold_ratio']:.1f}배 |\n"
+        report.write(f"| {medal} | {strategy['period']} | {strategy['strategy']} | **{strategy['return_rate']:,.2f}%** | {strategy['final_value']:,.0f}원 | {strategy['buy_hold_ratio']:.1f}배 |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ## 📊 **기간별 베스트 전략**
 
 | 기간 | 최고 성과 전략 | 수익률 | 최종 자산 |
 |------|---------------|--------|-----------|
-"""
+""")
 
     # 각 기간별 최고 성과 전략
     period_best = {}
@@ -1335,9 +1258,9 @@ def generate_summary_report(all_results, company_name):
         period_best[period] = best_strategy
         
         if best_strategy:
-            report_content += f"| {period} | {best_strategy['name']} | {best_strategy['return_rate']:,.2f}% | {best_strategy['final_value']:,.0f}원 |\n"
+            report.write(f"| {period} | {best_strategy['name']} | {best_strategy['return_rate']:,.2f}% | {best_strategy['final_value']:,.0f}원 |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ## 🎯 **전략별 성과 분석**
 
@@ -1345,7 +1268,7 @@ def generate_summary_report(all_results, company_name):
 
 | 기간 | 2년 윈도우 | 3년 윈도우 | 5년 윈도우 | 최고 성과 |
 |------|-----------|-----------|-----------|----------|
-"""
+""")
 
     for period in ['3년', '5년', '10년', '20년', '30년']:
         if period in all_results:
@@ -1357,15 +1280,15 @@ def generate_summary_report(all_results, company_name):
             
             best_window = '2년' if best_basic == basic_2 else ('3년' if best_basic == basic_3 else '5년')
             
-            report_content += f"| {period} | {basic_2:,.1f}% | {basic_3:,.1f}% | {basic_5:,.1f}% | **{best_basic:,.1f}%** ({best_window}) |\n"
+            report.write(f"| {period} | {basic_2:,.1f}% | {basic_3:,.1f}% | {basic_5:,.1f}% | **{best_basic:,.1f}%** ({best_window}) |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ### 반대전략 성과 (25%↓→{company_name}(우), 75%↑→{company_name})
 
 | 기간 | 2년 윈도우 | 3년 윈도우 | 5년 윈도우 | 최고 성과 |
 |------|-----------|-----------|-----------|----------|
-"""
+""")
 
     for period in ['3년', '5년', '10년', '20년', '30년']:
         if period in all_results:
@@ -1377,13 +1300,13 @@ def generate_summary_report(all_results, company_name):
             
             best_window = '2년' if best_reverse == reverse_2 else ('3년' if best_reverse == reverse_3 else '5년')
             
-            report_content += f"| {period} | {reverse_2:,.1f}% | {reverse_3:,.1f}% | {reverse_5:,.1f}% | **{best_reverse:,.1f}%** ({best_window}) |\n"
+            report.write(f"| {period} | {reverse_2:,.1f}% | {reverse_3:,.1f}% | {reverse_5:,.1f}% | **{best_reverse:,.1f}%** ({best_window}) |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ## � **기간별 전략 상세 성과표**
 
-"""
+""")
 
     # 각 기간별 상세 성과표 생성
     for period in ['3년', '5년', '10년', '20년', '30년']:
@@ -1391,12 +1314,12 @@ def generate_summary_report(all_results, company_name):
             result = all_results[period]
             buy_hold_final = result['buy_hold_final_value']
             
-            report_content += f"""
+            report.write(f"""
 ### {period} 백테스트 결과
 
 | 전략 | 최종 자산 | Buy&Hold 대비 | 매매 횟수 |
 |------|-----------|---------------|----------|
-"""
+""")
             
             # 기본전략들
             for window_name in ['2년', '3년', '5년']:
@@ -1404,8 +1327,8 @@ def generate_summary_report(all_results, company_name):
                 if strategy_name in result['strategy_results']:
                     final_value = result['strategy_results'][strategy_name]['final_value']
                     ratio = (final_value / buy_hold_final) * 100
-                    trades = len([log for log in result['strategy_results'][strategy_name]['trading_log'] if log['Action'] == '매도->매수'])
-                    report_content += f"| **기본전략_{window_name}** | {final_value:,.0f}원 | {ratio:.1f}% | {trades}회 |\n"
+                    trades = result['strategy_results'][strategy_name]['trading_log'].trade_count
+                    report.write(f"| **기본전략_{window_name}** | {final_value:,.0f}원 | {ratio:.1f}% | {trades}회 |\n")
             
             # 반대전략들
             for window_name in ['2년', '3년', '5년']:
@@ -1413,18 +1336,18 @@ def generate_summary_report(all_results, company_name):
                 if strategy_name in result['strategy_results']:
                     final_value = result['strategy_results'][strategy_name]['final_value']
                     ratio = (final_value / buy_hold_final) * 100
-                    trades = len([log for log in result['strategy_results'][strategy_name]['trading_log'] if log['Action'] == '매도->매수'])
-                    report_content += f"| **반대전략_{window_name}** | {final_value:,.0f}원 | {ratio:.1f}% | {trades}회 |\n"
+                    trades = result['strategy_results'][strategy_name]['trading_log'].trade_count
+                    report.write(f"| **반대전략_{window_name}** | {final_value:,.0f}원 | {ratio:.1f}% | {trades}회 |\n")
             
             # Buy & Hold
-            report_content += f"| **Buy & Hold** | {buy_hold_final:,.0f}원 | 100.0% | 0회 |\n"
+            report.write(f"| **Buy & Hold** | {buy_hold_final:,.0f}원 | 100.0% | 0회 |\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ## �💡 **핵심 인사이트**
 
 ### 1. **투자 기간의 중요성**
-"""
+""")
 
     # 기간별 성과 분석
     if all_strategies:
@@ -1438,14 +1361,14 @@ def generate_summary_report(all_results, company_name):
         long_term_avg = sum(s['return_rate'] for s in long_term_strategies) / len(long_term_strategies) if long_term_strategies else 0
         short_term_avg = sum(s['return_rate'] for s in short_term_strategies) / len(short_term_strategies) if short_term_strategies else 0
         
-        report_content += f"""
+        report.write(f"""
 - **최고 성과 기간**: {best_period} ({all_strategies[0]['return_rate']:,.2f}%)
 - **장기 투자 평균**: {long_term_avg:,.1f}% (20년, 30년)
 - **단기 투자 평균**: {short_term_avg:,.1f}% (3년, 5년)
 - **장기 vs 단기**: {"장기 투자가 " + f"{long_term_avg/short_term_avg:.1f}배 더 유리" if long_term_avg > short_term_avg else "단기 투자가 더 유리"}
 
 ### 2. **윈도우 크기 선택**
-"""
+""")
 
     # 윈도우별 승률 계산
     window_wins = {'2년': 0, '3년': 0, '5년': 0}
@@ -1467,12 +1390,12 @@ def generate_summary_report(all_results, company_name):
 
     best_window = max(window_wins.items(), key=lambda x: x[1])
     
-    report_content += f"""
+    report.write(f"""
 - **가장 자주 최고 성과를 낸 윈도우**: {best_window[0]} ({best_window[1]}번 승리)
 - **윈도우별 승률**: 2년 {window_wins['2년']}회, 3년 {window_wins['3년']}회, 5년 {window_wins['5년']}회
 
 ### 3. **전략 선택 가이드**
-"""
+""")
 
     # 기본전략 vs 반대전략 승률
     basic_wins = 0
@@ -1484,7 +1407,7 @@ def generate_summary_report(all_results, company_name):
         else:
             reverse_wins += 1
     
-    report_content += f"""
+    report.write(f"""
 - **상위 10개 전략 중**: 기본전략 {basic_wins}개, 반대전략 {reverse_wins}개
 - **추천 전략**: {'기본전략' if basic_wins > reverse_wins else '반대전략'}
 - **핵심 원리**: 가격차이비율이 {'낮을 때 ' + company_name + ', 높을 때 ' + company_name + '(우)' if basic_wins > reverse_wins else '낮을 때 ' + company_name + '(우), 높을 때 ' + company_name}
@@ -1514,22 +1437,22 @@ def generate_summary_report(all_results, company_name):
 ## 📁 **관련 파일**
 
 ### 📈 **그래프**
-"""
+""")
 
     for period in ['3년', '5년', '10년', '20년', '30년']:
         if period in all_results:
-            report_content += f"- `strategy_comparison_{period}.png`\n"
+            report.write(f"- `{chart_path(f'strategy_comparison_{period}.png')}`\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ### 📊 **개별 분석 리포트**
-"""
+""")
 
     for period in ['3년', '5년', '10년', '20년', '30년']:
         if period in all_results:
-            report_content += f"- `strategy_analysis_report_{period}_[날짜].md`\n"
+            report.write(f"- `strategy_analysis_report_{period}_[날짜].md`\n")
 
-    report_content += f"""
+    report.write(f"""
 
 ### 📋 **매매 기록**
 - 각 기간별, 전략별 CSV 파일 (총 30개 파일)
@@ -1539,10 +1462,10 @@ def generate_summary_report(all_results, company_name):
 
 **📝 분석 완료**: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}  
 **💼 면책조항**: 본 분석은 과거 데이터 기반 백테스트 결과이며, 실제 투자 시 다양한 요인을 종합적으로 고려하시기 바랍니다.
-"""
+""")
 
     # 종합 요약 리포트 파일 저장
-    main_path, backup_path = save_report_files(report_content, f'{safe_company_name}_summary_backtest_report')
+    main_path, backup_path = report.commit()
     
     print(f"\n📋 종합 요약 리포트 저장 완료")
 
@@ -1569,13 +1492,8 @@ def run_backtest(json_file_path, initial_stock_type, initial_shares, start_date_
     """
     try:
         print(f"📁 파일 로딩: {json_file_path}")
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        print(f"✅ 파일 로딩 완료: {len(data)}개 데이터 포인트")
-
-        df = pd.DataFrame.from_dict(data, orient='index')
-        df.index = pd.to_datetime(df.index, format='%y-%m-%d')
-        df = df.sort_index()
+        df = read_analysis_file(json_file_path)
+        print(f"✅ 파일 로딩 완료: {len(df)}개 데이터 포인트")
 
         # 백테스트 시작 날짜 이후의 데이터만 사용
         start_date = datetime.strptime(start_date_str, '%y-%m-%d')
@@ -1672,7 +1590,7 @@ def run_backtest(json_file_path, initial_stock_type, initial_shares, start_date_
 
         # --- 매매 기록 저장 ---
         for strategy_name, result in strategy_results.items():
-            trading_df = pd.DataFrame(result['trading_log'])
+            trading_df = result['trading_log'].to_frame()
             filename = f'trading_log_{strategy_name.replace(" ", "_")}.csv'
             trading_df.to_csv(filename, index=False, encoding='utf-8-sig')
             print(f"\n{strategy_name} 매매 기록이 '{filename}' 파일로 저장되었습니다.")
@@ -1741,9 +1659,9 @@ def run_backtest(json_file_path, initial_stock_type, initial_shares, start_date_
         ax2.tick_params(axis='x', rotation=45)
 
         plt.tight_layout()
-        plot_output_path = r'./multi_window_strategy_comparison.png'
-        plt.savefig(plot_output_path, dpi=300, bbox_inches='tight')
-        print(f"\n다중 윈도우 전략 비교 그래프가 {plot_output_path}에 저장되었습니다.")
+        plot_output_path = save_chart(plt, r'./multi_window_strategy_comparison.png')
+        if plot_output_path:
+            print(f"\n다중 윈도우 전략 비교 그래프가 {plot_output_path}에 저장되었습니다.")
         
         plt.close()
 
@@ -1758,30 +1676,69 @@ def run_backtest(json_file_path, initial_stock_type, initial_shares, start_date_
     except Exception as e:
         print(f"데이터 처리 중 오류가 발생했습니다: {e}")
 
-def run_all_companies_backtest():
+@timed()
+def run_all_companies_backtest(jobs=1):
     """
     모든 지원되는 회사에 대해 백테스트를 수행합니다.
+
+    Args:
+        jobs (int): 회사 x 기간 백테스트를 실행할 프로세스 수 (1이면 순차 실행)
+
+    Returns:
+        list: 실패한 (회사명, 기간) 목록 (모두 성공하면 빈 목록, 리포트 생성 실패는 기간 '리포트')
     """
     print("🌐 모든 회사 백테스트 분석 시작")
     print("=" * 80)
-    
-    for company_name in PREFERRED_STOCK_COMPANIES.keys():
-        try:
-            print(f"\n🏢 {company_name} 백테스트 시작...")
-            run_comprehensive_backtest(company_name)
-            print(f"✅ {company_name} 백테스트 완료")
-        except Exception as e:
-            print(f"❌ {company_name} 백테스트 중 오류: {e}")
+
+    # 기간마다 모든 회사 데이터를 패널 파일로 모아 두고, 각 백테스트(작업 프로세스)는 메모리 매핑으로 읽음
+    for period in BACKTEST_PERIODS:
+        ensure_price_panel(period)
+    
+    failed = []
+    if resolve_jobs(jobs) == 1:
+        for company_name in PREFERRED_STOCK_COMPANIES.keys():
+            try:
+                print(f"\n🏢 {company_name} 백테스트 시작...")
+                failed.extend(run_comprehensive_backtest(company_name))
+                print(f"✅ {company_name} 백테스트 완료")
+            except Exception as e:
+                print(f"❌ {company_name} 백테스트 중 오류: {e}")
+                failed.append((company_name, '리포트'))
+    else:
+        # 회사 x 기간 단위로 나누어 실행하고, 회사별 종합 리포트는 결과를 모아 생성
+        tasks = [((company_name, period), (company_name, period))
+                 for company_name in PREFERRED_STOCK_COMPANIES for period in BACKTEST_PERIODS]
+        outcomes = run_tasks(run_period_backtest, tasks, jobs)
+        failed.extend(failed_backtests(outcomes))
+        for company_name in PREFERRED_STOCK_COMPANIES:
+            try:
+                generate_company_reports(company_name, outcomes)
+            except Exception as e:
+                print(f"❌ {company_name} 리포트 생성 중 오류: {e}")
+                failed.append((company_name, '리포트'))
+
+    if failed:
+        print(f"\n⚠️ 실패한 작업 {len(failed)}개: {', '.join(f'{c} {p}' for c, p in failed)}")
     
     print(f"\n{'='*80}")
     print("=== 모든 회사 백테스트 완료 ===")
     print(f"{'='*80}")
+    return failed
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='우선주 백테스트 분석')
     parser.add_argument('--company', '-c', type=str, help='분석할 회사명 (지정하지 않으면 모든 회사 분석)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='회사 x 기간 백테스트를 실행할 프로세스 수 (기본값: 1, 0이면 CPU 코어 수)')
+    parser.add_argument('--render-profile', type=str, choices=list(RENDER_PROFILES),
+                        help='차트 저장 프로파일 (report: 300 DPI PNG, draft: 저해상도 PNG, svg, none: 저장 안 함)')
+    add_instrumentation_arguments(parser)
     
     args = parser.parse_args()
+    start_from_args(args)
+
+    if args.render_profile:
+        set_render_profile(args.render_profile)
     
     print("="*80)
     print("우선주 차익거래 백테스트 시스템")
@@ -1799,10 +1756,10 @@ if __name__ == "__main__":
     if args.company:
         # 특정 회사 백테스트
         if args.company in PREFERRED_STOCK_COMPANIES:
-            run_comprehensive_backtest(args.company)
+            run_comprehensive_backtest(args.company, jobs=args.jobs)
         else:
             print(f"❌ 지원되지 않는 회사입니다: {args.company}")
             print(f"지원되는 회사: {list(PREFERRED_STOCK_COMPANIES.keys())}")
     else:
         # 모든 회사 백테스트
-        run_all_companies_backtest()
+        run_all_companies_backtest(jobs=args.jobs)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+분석 대상 회사 목록 (pandas/matplotlib/yfinance 없이 import 가능한 가벼운 모듈)
+
+Makefile의 회사 선택처럼 목록만 필요한 곳은 stock_diff 대신 이 모듈을 import 합니다.
+stock_diff는 같은 딕셔너리를 그대로 다시 내보냅니다. (from stock_diff import PREFERRED_STOCK_COMPANIES)
+
+사용법:
+    python companies.py     # 번호가 붙은 회사 목록 출력
+"""
+
+import os
+
+# 외부 배당금 레지스트리 경로 (dividend_data도 같은 규칙을 사용)
+REGISTRY_ENV = 'DIVIDEND_REGISTRY_PATH'
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dividend_registry.csv')
+
+# 우선주를 가진 한국 주요 회사들의 리스트 (실제 작동하는 4개 회사만)
+# 외부 배당금 데이터는 dividend_registry.csv에서 티커별로 관리 (python dividend_data.py --import ...)
+PREFERRED_STOCK_COMPANIES = {
+    '삼성전자': {
+        'common': '005930.KS',      # 삼성전자
+        'preferred': '005935.KS',   # 삼성전자(우)
+        'name': '삼성전자',
+        'sector': '전자/반도체'
+    },
+    'LG화학': {
+        'common': '051910.KS',      # LG화학
+        'preferred': '051915.KS',   # LG화학(우)
+        'name': 'LG화학',
+        'sector': '화학'
+    },
+    'LG전자': {
+        'common': '066570.KS',      # LG전자
+        'preferred': '066575.KS',   # LG전자(우)
+        'name': 'LG전자',
+        'sector': '전자'
+    },
+    '현대자동차': {
+        'common': '005380.KS',      # 현대자동차
+        'preferred': '005385.KS',   # 현대자동차(우)
+        'name': '현대자동차',
+        'sector': '자동차'
+    }
+}
+
+# 상장폐지되거나 거래 중단된 회사들 (참고용)
+DELISTED_OR_SUSPENDED_COMPANIES = {
+    # 'SK하이닉스': {
+    #     'common': '000660.KS',      # SK하이닉스
+    #     'preferred': '000665.KS',   # SK하이닉스(우) - 상장폐지 또는 거래 중단
+    #     'name': 'SK하이닉스',
+    #     'sector': '반도체',
+    #     'status': 'delisted_or_suspended',
+    #     'dividend_data': None
+    # },
+    # '포스코홀딩스': {
+    #     'common': '005490.KS',      # 포스코홀딩스
+    #     'preferred': '005495.KS',   # 포스코홀딩스(우) - 검증 필요
+    #     'name': '포스코홀딩스',
+    #     'sector': '철강',
+    #     'status': 'requires_verification',
+    #     'dividend_data': None
+    # },
+    # '카카오': {
+    #     'common': '035720.KS',      # 카카오
+    #     'preferred': '035725.KS',   # 카카오(우) - 2023년 상장폐지 확인됨
+    #     'name': '카카오',
+    #     'sector': 'IT서비스',
+    #     'status': 'delisted_confirmed',
+    #     'dividend_data': None
+    # }
+}
+
+# 추가 검증이 필요한 회사들 (현재 주석 처리)
+# 향후 데이터 검증 후 위 목록에 추가 가능
+ADDITIONAL_COMPANIES_FOR_FUTURE_VERIFICATION = {
+    # '기아': {
+    #     'common': '000270.KS',      # 기아
+    #     'preferred': '000275.KS',   # 기아(우)
+    #     'name': '기아',
+    #     'sector': '자동차',
+    #     'dividend_data': None
+    # },
+    # 'NAVER': {
+    #     'common': '035420.KS',      # NAVER
+    #     'preferred': '035425.KS',   # NAVER(우)
+    #     'name': 'NAVER',
+    #     'sector': 'IT서비스',
+    #     'dividend_data': None
+    # },
+    # 'SK이노베이션': {
+    #     'common': '096770.KS',      # SK이노베이션
+    #     'preferred': '096775.KS',   # SK이노베이션(우)
+    #     'name': 'SK이노베이션',
+    #     'sector': '에너지/화학',
+    #     'dividend_data': None
+    # },
+    # 'LG생활건강': {
+    #     'common': '051900.KS',      # LG생활건강
+    #     'preferred': '051905.KS',   # LG생활건강(우)
+    #     'name': 'LG생활건강',
+    #     'sector': '생활용품',
+    #     'dividend_data': None
+    # },
+    # '한화솔루션': {
+    #     'common': '009830.KS',      # 한화솔루션
+    #     'preferred': '009835.KS',   # 한화솔루션(우)
+    #     'name': '한화솔루션',
+    #     'sector': '태양광/화학',
+    #     'dividend_data': None
+    # },
+    # 'CJ제일제당': {
+    #     'common': '097950.KS',      # CJ제일제당
+    #     'preferred': '097955.KS',   # CJ제일제당(우)
+    #     'name': 'CJ제일제당',
+    #     'sector': '식품',
+    #     'dividend_data': None
+    # },
+    # '아모레퍼시픽': {
+    #     'common': '090430.KS',      # 아모레퍼시픽
+    #     'preferred': '090435.KS',   # 아모레퍼시픽(우)
+    #     'name': '아모레퍼시픽',
+    #     'sector': '화장품',
+    #     'dividend_data': None
+    # },
+    # '롯데케미칼': {
+    #     'common': '011170.KS',      # 롯데케미칼
+    #     'preferred': '011175.KS',   # 롯데케미칼(우)
+    #     'name': '롯데케미칼',
+    #     'sector': '화학',
+    #     'dividend_data': None
+    # },
+    # '카카오': {
+    #     'common': '035720.KS',      # 카카오
+    #     'preferred': '035725.KS',   # 카카오(우) - 2023년 상장폐지로 인해 분석 불가
+    #     'name': '카카오',
+    #     'sector': 'IT서비스',
+    #     'dividend_data': None,
+    #     'status': 'delisted_preferred'  # 우선주 상장폐지
+    # }
+}
+
+def company_names():
+    """
+    분석 가능한 회사 이름 목록을 정의된 순서대로 반환합니다.
+
+    Returns:
+        list: 회사 이름 목록
+    """
+    return list(PREFERRED_STOCK_COMPANIES.keys())
+
+
+def get_registry_path(path=None):
+    """
+    외부 배당금 레지스트리 파일 경로를 반환합니다.
+
+    Args:
+        path (str, optional): 직접 지정한 경로 (기본값: DIVIDEND_REGISTRY_PATH 환경 변수 또는 모듈 옆 dividend_registry.csv)
+
+    Returns:
+        str: 레지스트리 파일 경로
+    """
+    return path or os.environ.get(REGISTRY_ENV) or DEFAULT_REGISTRY_PATH
+
+
+def _registry_tickers():
+    """
+    외부 배당금 레지스트리에 있는 티커를 pandas 없이 읽습니다. (ticker 컬럼만, 검증은 dividend_data.py --validate)
+
+    Returns:
+        set: 티커 집합 (파일이 없거나 읽을 수 없으면 빈 집합)
+    """
+    import csv
+
+    path = get_registry_path()
+    try:
+        with open(path, newline='', encoding='utf-8') as f:
+            return {row['ticker'] for row in csv.DictReader(f)}
+    except (OSError, KeyError) as e:
+        print(f"❌ 배당금 레지스트리를 읽을 수 없습니다 ({path}): {e}")
+        return set()
+
+
+def print_available_companies():
+    """
+    분석 가능한 회사들의 목록을 업종별로 출력합니다. (stock_diff.py --list)
+    """
+    print("📊 분석 가능한 우선주 보유 회사들:")
+    print("=" * 60)
+    
+    companies_by_sector = {}
+    for name, info in PREFERRED_STOCK_COMPANIES.items():
+        companies_by_sector.setdefault(info['sector'], []).append((name, info))
+    
+    registry = _registry_tickers()
+    
+    for sector, companies in companies_by_sector.items():
+        print(f"\n🏭 {sector}:")
+        for name, info in companies:
+            common_ticker = info['common']
+            preferred_ticker = info['preferred']
+            has_dividend_data = "✓" if preferred_ticker in registry else "○"
+            print(f"  {has_dividend_data} {name}: {common_ticker} / {preferred_ticker}")
+    
+    print(f"\n📈 총 {len(PREFERRED_STOCK_COMPANIES)}개 회사 분석 가능")
+    print("✓: 배당금 데이터 보유, ○: yfinance 자동 수집")
+
+
+if __name__ == "__main__":
+    for i, company in enumerate(company_names(), 1):
+        print(f"  {i:2d}. {company}")
@@ -4,31 +4,26 @@
 4개 회사의 우선주 가격차이 분석 데이터를 종합 비교하여 마크다운 리포트를 생성합니다.
 """
 
-import json
 import pandas as pd
 from datetime import datetime
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from pathlib import Path
 import os
-
-# 한글 폰트 설정
-import platform
-import matplotlib.font_manager as fm
-
-system_name = platform.system()
-if system_name == 'Linux':
-    if fm.findfont('NanumGothic', fontext='ttf'):
-        plt.rcParams['font.family'] = 'NanumGothic'
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
-elif system_name == 'Darwin':
-    plt.rcParams['font.family'] = 'AppleGothic'
-elif system_name == 'Windows':
-    plt.rcParams['font.family'] = 'Malgun Gothic'
-
-plt.rcParams['axes.unicode_minus'] = False
+from analysis_storage import find_analysis_data_path
+from instrumentation import add_instrumentation_arguments, start_from_args, timed
+from lazy_imports import lazy_pyplot, lazy_seaborn
+from price_panel import load_panel_frame
+from render_profile import chart_path, save_chart
+
+# matplotlib/seaborn은 그래프를 처음 그릴 때 import 하고 한글 폰트도 그때 설정 (lazy_imports)
+plt = lazy_pyplot()
+sns = lazy_seaborn(plt)
+
+# 생성 파일 (차트는 render_profile.chart_path 기준 경로, pipeline.py가 출력 확인에 사용)
+REPORT_FILE = 'comprehensive_company_comparison_report.md'
+COMPARISON_CHART = './comprehensive_company_comparison.png'
+HEATMAP_CHART = './company_correlation_heatmap.png'
+CHART_FILES = [COMPARISON_CHART, HEATMAP_CHART]
 
 # 현재 지원되는 4개 회사
 COMPANIES = {
@@ -58,16 +53,16 @@ COMPANIES = {
     }
 }
 
+# 리포트에 사용하는 컬럼 (데이터 파일에서 필요한 컬럼만 로드)
+REPORT_COLUMNS = ['Price_Diff_Ratio', 'Price_Difference', 'Dividend_Yield_on_Preferred', 'Stock1_Close', 'Stock2_Close']
+
+@timed()
 def load_company_data(company_name, period='20년'):
     """특정 회사의 데이터를 로드합니다."""
     try:
-        file_path = f'./{company_name}_stock_analysis_{period}.json'
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        df = pd.DataFrame.from_dict(data, orient='index')
-        df.index = pd.to_datetime(df.index, format='%y-%m-%d')
-        df = df.sort_index()
+        file_path = find_analysis_data_path(company_name, period)
+        # 모든 회사 데이터를 모은 패널 파일을 메모리 매핑으로 읽음 (price_panel.py)
+        df = load_panel_frame(company_name, period, columns=REPORT_COLUMNS)
         
         return df
     except FileNotFoundError:
@@ -115,6 +110,7 @@ def calculate_statistics(df):
     
     return stats
 
+@timed()
 def create_comparison_charts():
     """회사 간 비교 차트를 생성합니다."""
     
@@ -206,7 +202,7 @@ def create_comparison_charts():
                 f'{mean:.2f}%', ha='center', va='bottom', fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('./comprehensive_company_comparison.png', dpi=300, bbox_inches='tight')
+    save_chart(plt, COMPARISON_CHART)
     plt.close()
     
     # 2. 상관관계 분석
@@ -234,9 +230,10 @@ def create_comparison_charts():
         
         plt.title('회사간 Price Diff Ratio 상관관계', fontsize=14, fontweight='bold')
         plt.tight_layout()
-        plt.savefig('./company_correlation_heatmap.png', dpi=300, bbox_inches='tight')
+        save_chart(plt, HEATMAP_CHART)
         plt.close()
 
+@timed()
 def generate_markdown_report():
     """종합 비교 리포트를 마크다운으로 생성합니다."""
     
@@ -348,9 +345,9 @@ def generate_markdown_report():
 
 ### 📈 시각화 차트
 
-![종합 비교 차트](./comprehensive_company_comparison.png)
+![종합 비교 차트]({chart_path(COMPARISON_CHART)})
 
-![상관관계 히트맵](./company_correlation_heatmap.png)
+![상관관계 히트맵]({chart_path(HEATMAP_CHART)})
 
 ### 💡 인사이트 분석
 
@@ -436,18 +433,26 @@ def generate_markdown_report():
 """
 
     # 파일 저장
-    report_filename = 'comprehensive_company_comparison_report.md'
+    report_filename = REPORT_FILE
     
     with open(report_filename, 'w', encoding='utf-8') as f:
         f.write(markdown_content)
     
     print(f"📊 종합 비교 리포트 생성 완료: {report_filename}")
-    print(f"📈 차트 파일: comprehensive_company_comparison.png")
-    print(f"🔗 상관관계 히트맵: company_correlation_heatmap.png")
+    print(f"📈 차트 파일: {chart_path(COMPARISON_CHART)}")
+    print(f"🔗 상관관계 히트맵: {chart_path(HEATMAP_CHART)}")
     
     return report_filename
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='종합 회사 비교 리포트 생성')
+    add_instrumentation_arguments(parser)
+
+    args = parser.parse_args()
+    start_from_args(args)
+
     print("🚀 종합 회사 비교 리포트 생성 시작...")
     print("=" * 60)
     
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+종목 정보/배당금처럼 요청 하나하나가 느린 HTTP 조회를 스레드 풀로 동시에 실행하는 공용 도구
+
+- 동시에 실행하는 요청 수는 max_workers로 제한합니다.
+- 호스트별로 초당 요청 수를 제한합니다. (같은 호스트로의 요청은 최소 간격을 두고 시작)
+- 실패한 요청은 지수 백오프(backoff, backoff*2, backoff*4, ...)로 재시도합니다.
+  재시도마다 호스트별 요청 수 제한을 다시 적용합니다.
+- 한 요청이 재시도 후에도 실패하면 해당 요청만 실패로 기록되고 나머지 요청은 계속 실행됩니다.
+
+프로세스 풀(parallel_runner)과 달리 네트워크 대기 위주의 작업용이며, 출력은 바로 표시됩니다.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_RATE_PER_SECOND = 4.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+
+
+class HostRateLimiter:
+    """
+    호스트별 초당 요청 수 제한
+
+    호스트마다 다음 요청을 시작할 수 있는 시각을 예약하므로,
+    여러 스레드가 동시에 wait()를 호출해도 같은 호스트의 요청은 1/rate_per_second 초 간격으로 시작됩니다.
+    """
+
+    def __init__(self, rate_per_second=DEFAULT_RATE_PER_SECOND, clock=time.monotonic, sleep=time.sleep):
+        """
+        Args:
+            rate_per_second (float | None): 호스트별 초당 요청 수 (None 또는 0 이하면 제한 없음)
+            clock (callable): 현재 시각 함수 (테스트용)
+            sleep (callable): 대기 함수 (테스트용)
+        """
+        self.interval = 1.0 / rate_per_second if rate_per_second and rate_per_second > 0 else 0.0
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, host):
+        """
+        host로 요청을 보낼 수 있을 때까지 대기합니다.
+
+        Args:
+            host (str): 요청 대상 호스트
+        """
+        if not self.interval:
+            return
+        with self._lock:
+            now = self.clock()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            self.sleep(slot - now)
+
+
+def call_with_retry(func, args=(), retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, retry_on=(Exception,),
+                    before_attempt=None, sleep=time.sleep):
+    """
+    func(*args)를 실행하고 실패하면 지수 백오프로 재시도합니다.
+
+    Args:
+        func (callable): 실행할 함수
+        args (tuple): func 인자
+        retries (int): 첫 시도 이후 재시도 횟수
+        backoff (float): 첫 재시도 전 대기 시간(초), 재시도마다 2배
+        retry_on (tuple): 재시도할 예외 타입 (그 외 예외는 바로 전달)
+        before_attempt (callable, optional): 매 시도 전에 호출 (요청 수 제한용)
+        sleep (callable): 대기 함수 (테스트용)
+
+    Returns:
+        func의 반환값 (마지막 시도까지 실패하면 마지막 예외를 그대로 발생)
+    """
+    for attempt in range(retries + 1):
+        if before_attempt is not None:
+            before_attempt()
+        try:
+            return func(*args)
+        except retry_on:
+            if attempt == retries:
+                raise
+            sleep(backoff * (2 ** attempt))
+
+
+def fetch_concurrently(func, tasks, max_workers=DEFAULT_MAX_WORKERS, rate_limiter=None, host='default',
+                       retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, retry_on=(Exception,)):
+    """
+    (key, args) 요청 목록을 스레드 풀로 동시에 실행합니다.
+
+    Args:
+        func (callable): 요청 함수 (func(*args))
+        tasks (list): (key, args) 튜플 목록 (key는 결과 식별용)
+        max_workers (int): 동시에 실행할 요청 수
+        rate_limiter (HostRateLimiter, optional): 호스트별 요청 수 제한 (None이면 제한 없음)
+        host (str | callable): 요청 대상 호스트, 또는 host(key, args)로 요청별 호스트를 돌려주는 함수
+        retries (int): 요청별 재시도 횟수
+        backoff (float): 첫 재시도 전 대기 시간(초), 재시도마다 2배
+        retry_on (tuple): 재시도할 예외 타입
+
+    Returns:
+        dict: {key: {'result': 반환값 (실패 시 None), 'error': 오류 메시지 (성공 시 None)}}
+              tasks 순서를 유지합니다. (parallel_runner.run_tasks와 같은 형식)
+    """
+    if not tasks:
+        return {}
+
+    def run_one(key, args):
+        task_host = host(key, args) if callable(host) else host
+        before_attempt = (lambda: rate_limiter.wait(task_host)) if rate_limiter is not None else None
+        return call_with_retry(func, args, retries=retries, backoff=backoff, retry_on=retry_on,
+                               before_attempt=before_attempt)
+
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks)))) as executor:
+        futures = [(key, executor.submit(run_one, key, args)) for key, args in tasks]
+        for key, future in futures:
+            try:
+                outcomes[key] = {'result': future.result(), 'error': None}
+            except Exception as e:
+                outcomes[key] = {'result': None, 'error': f"{type(e).__name__}: {e}"}
+    return outcomes
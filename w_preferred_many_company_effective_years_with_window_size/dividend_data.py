@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+배당금 시계열 정규화 / 병합
+
+- 모든 배당금 Series를 같은 형태(타임존 없는 DatetimeIndex 'Date', float 값, 날짜순, 날짜 중복 없음)로 맞춥니다.
+- 외부 배당금은 아래 레지스트리에서 한 번 읽어 티커별 Series로 캐시합니다.
+- 외부 데이터와 yfinance 데이터는 한 번의 combine_first로 병합하며 같은 날짜는 외부 데이터를 우선합니다.
+- 모든 함수는 입력 Series를 변경하지 않고 새 Series를 반환합니다.
+
+외부 배당금 레지스트리 (dividend_registry.csv)
+- 코드에 배당금 목록을 적는 대신 저장소에서 버전 관리하는 CSV 파일 하나에 티커별 배당금을 모아 둡니다.
+  (ticker, ex_dividend_date(YYYY-MM-DD), dividend 컬럼, 티커/날짜순)
+- 한 번 읽어 티커별 Series로 만들고, 파일이 바뀌기 전까지 다시 읽지 않습니다.
+- 티커/날짜 중복, 날짜 순서 오류, 잘못된 날짜/금액이 있으면 읽지 않고 오류를 알립니다.
+- 배당금 추가는 코드 수정 없이 --import 명령으로 합니다.
+- 다른 변형 디렉터리(20years, 5years, reverse/... 등)의 스크립트도 sys.path에 이 디렉터리를 추가하고
+  registry_dividends()로 같은 파일을 읽습니다. (DIVIDEND_REGISTRY_PATH 환경 변수로 다른 파일 지정 가능)
+  (Investing.com 형식 "Ex-dividend Date"/"Dividend" 컬럼 또는 레지스트리 형식 CSV)
+
+사용법:
+    python dividend_data.py --validate
+    python dividend_data.py --import investing_005935.csv --ticker 005935.KS
+    python dividend_data.py --show 005935.KS
+"""
+
+import os
+
+import pandas as pd
+
+# 레지스트리 경로 규칙은 pandas 없이 쓰는 companies.py에 정의 (stock_diff.py --list)
+from companies import DEFAULT_REGISTRY_PATH, REGISTRY_ENV, get_registry_path
+
+# Investing.com 내보내기 파일의 배당락일 형식 (--import)
+EXTERNAL_DATE_FORMAT = '%m월 %d, %Y'
+
+REGISTRY_COLUMNS = ['ticker', 'ex_dividend_date', 'dividend']
+
+# 레지스트리 경로 -> (파일 수정 시각, {티커: Series})
+_registry_cache = {}
+
+
+def empty_dividend_series():
+    """빈 배당금 Series를 반환합니다."""
+    return pd.Series(dtype=float, index=pd.DatetimeIndex([], name='Date'), name='Dividends')
+
+
+def normalize_dividend_series(dividends):
+    """
+    배당금 Series를 타임존 없는 날짜순 float Series로 정규화합니다.
+
+    타임존이 있는 날짜는 현지 날짜를 유지한 채 타임존만 제거하고(tz_localize(None)),
+    같은 날짜가 여러 번 있으면 첫 값을 사용합니다.
+
+    Args:
+        dividends (pd.Series | None): 배당금 시계열 데이터
+
+    Returns:
+        pd.Series: 정규화된 새 Series (입력은 변경하지 않음)
+    """
+    if dividends is None or dividends.empty:
+        return empty_dividend_series()
+
+    index = pd.DatetimeIndex(pd.to_datetime(dividends.index))
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    normalized = pd.Series(dividends.to_numpy(dtype=float), index=index.rename('Date'), name='Dividends')
+    normalized = normalized[~normalized.index.duplicated(keep='first')]
+    return normalized.sort_index(kind='stable')
+
+
+def merge_dividend_data(external_data, yfinance_data):
+    """
+    외부 배당금 데이터와 yfinance 데이터를 병합합니다.
+    외부 데이터를 우선하되, yfinance에만 있는 날짜의 배당금을 추가합니다.
+
+    Args:
+        external_data (pd.Series): 외부 배당금 데이터
+        yfinance_data (pd.Series): yfinance 배당금 데이터
+
+    Returns:
+        pd.Series: 병합된 배당금 데이터 (입력은 변경하지 않음)
+    """
+    external_data = normalize_dividend_series(external_data)
+    yfinance_data = normalize_dividend_series(yfinance_data)
+    if external_data.empty:
+        return yfinance_data
+    if yfinance_data.empty:
+        return external_data
+
+    new_count = int((~yfinance_data.index.isin(external_data.index)).sum())
+    if new_count > 0:
+        print(f"✓ yfinance에서 {new_count}개 새로운 배당금 데이터 추가")
+    return external_data.combine_first(yfinance_data).rename('Dividends')
+
+
+# ----------------------------------------------------------------------
+# 외부 배당금 레지스트리
+# ----------------------------------------------------------------------
+def validate_dividend_registry(df):
+    """
+    레지스트리 행을 검증합니다.
+
+    Args:
+        df (pd.DataFrame): REGISTRY_COLUMNS 컬럼의 레지스트리 (ex_dividend_date는 문자열 또는 날짜)
+
+    Returns:
+        list: 오류 메시지 목록 (문제가 없으면 빈 목록)
+    """
+    missing = [column for column in REGISTRY_COLUMNS if column not in df.columns]
+    if missing:
+        return [f"필수 컬럼 없음: {missing}"]
+
+    errors = []
+    dates = pd.to_datetime(df['ex_dividend_date'], format='%Y-%m-%d', errors='coerce')
+    amounts = pd.to_numeric(df['dividend'], errors='coerce')
+    df = df.reset_index(drop=True)
+    line_numbers = df.index + 2  # 헤더 다음 줄부터
+
+    for line in line_numbers[dates.isna().to_numpy()]:
+        errors.append(f"{line}번째 줄: 날짜 형식 오류 (YYYY-MM-DD)")
+    for line in line_numbers[(amounts.isna() | (amounts <= 0)).to_numpy()]:
+        errors.append(f"{line}번째 줄: 배당금은 0보다 큰 숫자여야 합니다")
+    for line in line_numbers[df['ticker'].isna().to_numpy()]:
+        errors.append(f"{line}번째 줄: 티커 없음")
+
+    keys = pd.DataFrame({'ticker': df['ticker'], 'date': dates})
+    for line in line_numbers[keys.duplicated(keep='first').to_numpy() & dates.notna().to_numpy()]:
+        errors.append(f"{line}번째 줄: 티커/날짜 중복")
+
+    # 같은 티커 안에서는 날짜가 증가해야 하고, 티커 묶음은 한 곳에 모여 있어야 함
+    same_ticker = keys['ticker'].eq(keys['ticker'].shift())
+    out_of_order = same_ticker & (keys['date'] < keys['date'].shift())
+    for line in line_numbers[out_of_order.to_numpy()]:
+        errors.append(f"{line}번째 줄: 날짜 순서 오류 (이전 줄보다 이른 날짜)")
+    group_starts = keys.loc[~same_ticker, 'ticker']
+    for position, ticker in group_starts[group_starts.duplicated()].items():
+        errors.append(f"{position + 2}번째 줄: 티커 순서 오류 ({ticker} 행이 흩어져 있음)")
+    return errors
+
+
+def _read_registry_frame(path):
+    return pd.read_csv(path, dtype={'ticker': str, 'ex_dividend_date': str})
+
+
+def load_dividend_registry(path=None):
+    """
+    레지스트리 파일을 읽어 티커별 배당금 Series로 반환합니다. (파일이 바뀌기 전까지 캐시)
+
+    Args:
+        path (str, optional): 레지스트리 경로 (get_registry_path 참고)
+
+    Returns:
+        dict: {티커: 정규화된 배당금 Series} (파일이 없으면 빈 딕셔너리)
+
+    Raises:
+        ValueError: 레지스트리 검증에 실패한 경우
+    """
+    path = get_registry_path(path)
+    try:
+        modified = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    cached = _registry_cache.get(path)
+    if cached is not None and cached[0] == modified:
+        return cached[1]
+
+    df = _read_registry_frame(path)
+    errors = validate_dividend_registry(df)
+    if errors:
+        raise ValueError(f"배당금 레지스트리 오류 ({path}):\n" + "\n".join(errors))
+
+    dates = pd.to_datetime(df['ex_dividend_date'], format='%Y-%m-%d')
+    series = pd.Series(df['dividend'].astype(float).to_numpy(), index=pd.DatetimeIndex(dates, name='Date'),
+                       name='Dividends')
+    registry = {ticker: series[(df['ticker'] == ticker).to_numpy()] for ticker in df['ticker'].unique()}
+    _registry_cache[path] = (modified, registry)
+    return registry
+
+
+def registry_dividends(ticker, path=None):
+    """
+    레지스트리에서 티커 하나의 배당금을 가져옵니다.
+
+    Args:
+        ticker (str): 티커 심볼
+        path (str, optional): 레지스트리 경로
+
+    Returns:
+        pd.Series: 정규화된 배당금 Series (복사본, 레지스트리에 없으면 빈 Series)
+    """
+    dividends = load_dividend_registry(path).get(ticker)
+    return empty_dividend_series() if dividends is None else dividends.copy()
+
+
+def _read_import_file(file_path, ticker=None):
+    """가져올 CSV 파일을 레지스트리 형식(REGISTRY_COLUMNS)으로 변환합니다."""
+    raw = pd.read_csv(file_path, dtype=str)
+    if 'Ex-dividend Date' in raw.columns:
+        # Investing.com 형식 ("6월 26, 2025" 또는 YYYY-MM-DD)
+        text = raw['Ex-dividend Date'].str.strip()
+        dates = pd.to_datetime(text, format=EXTERNAL_DATE_FORMAT, errors='coerce')
+        dates = dates.fillna(pd.to_datetime(text, format='%Y-%m-%d', errors='coerce'))
+        amounts = raw['Dividend']
+    else:
+        dates = pd.to_datetime(raw['ex_dividend_date'], format='%Y-%m-%d', errors='coerce')
+        amounts = raw['dividend']
+
+    if 'ticker' in raw.columns and raw['ticker'].notna().all():
+        tickers = raw['ticker']
+    elif ticker:
+        tickers = pd.Series(ticker, index=raw.index)
+    else:
+        raise ValueError(f"{file_path}: ticker 컬럼이 없으면 --ticker를 지정해야 합니다.")
+
+    imported = pd.DataFrame({
+        'ticker': tickers,
+        'ex_dividend_date': dates.dt.strftime('%Y-%m-%d'),
+        'dividend': pd.to_numeric(amounts.str.replace(',', ''), errors='coerce'),
+    })
+    return imported.sort_values(['ticker', 'ex_dividend_date'], kind='stable', na_position='first').reset_index(drop=True)
+
+
+def write_dividend_registry(df, path=None):
+    """
+    레지스트리를 검증한 뒤 티커/날짜순으로 저장합니다. (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        df (pd.DataFrame): REGISTRY_COLUMNS 컬럼의 레지스트리
+        path (str, optional): 레지스트리 경로
+
+    Returns:
+        str: 저장한 파일 경로
+
+    Raises:
+        ValueError: 레지스트리 검증에 실패한 경우
+    """
+    path = get_registry_path(path)
+    df = df[REGISTRY_COLUMNS].sort_values(['ticker', 'ex_dividend_date'], kind='stable').reset_index(drop=True)
+    errors = validate_dividend_registry(df)
+    if errors:
+        raise ValueError("배당금 레지스트리 오류:\n" + "\n".join(errors))
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    df.to_csv(temp_path, index=False)
+    os.replace(temp_path, path)
+    return path
+
+
+def import_dividends(file_paths, ticker=None, path=None):
+    """
+    CSV 파일들의 배당금을 레지스트리에 한 번에 추가합니다.
+    레지스트리에 이미 있는 티커/날짜는 가져온 값으로 갱신합니다.
+
+    Args:
+        file_paths (list): 가져올 CSV 파일 경로 목록
+        ticker (str, optional): ticker 컬럼이 없는 파일에 사용할 티커
+        path (str, optional): 레지스트리 경로
+
+    Returns:
+        dict: {'added': 추가된 행 수, 'updated': 값이 바뀐 행 수, 'total': 전체 행 수}
+
+    Raises:
+        ValueError: 가져온 데이터 또는 결과 레지스트리 검증에 실패한 경우
+    """
+    path = get_registry_path(path)
+    imported = pd.concat([_read_import_file(file_path, ticker) for file_path in file_paths], ignore_index=True)
+    imported = imported.sort_values(['ticker', 'ex_dividend_date'], kind='stable', na_position='first')
+    errors = validate_dividend_registry(imported.reset_index(drop=True))
+    if errors:
+        raise ValueError("가져올 배당금 데이터 오류:\n" + "\n".join(errors))
+
+    existing = _read_registry_frame(path) if os.path.exists(path) else pd.DataFrame(columns=REGISTRY_COLUMNS)
+    merged = existing.merge(imported, on=['ticker', 'ex_dividend_date'], how='outer', suffixes=('_old', ''),
+                            indicator=True)
+    added = int((merged['_merge'] == 'right_only').sum())
+    both = merged['_merge'] == 'both'
+    updated = int((both & (merged['dividend'].astype(float) != merged['dividend_old'].astype(float))).sum())
+    merged['dividend'] = merged['dividend'].fillna(merged['dividend_old'])
+
+    write_dividend_registry(merged[REGISTRY_COLUMNS], path)
+    summary = {'added': added, 'updated': updated, 'total': len(merged)}
+    print(f"💾 배당금 레지스트리 저장: {path} (추가 {added}건, 갱신 {updated}건, 전체 {len(merged)}건)")
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='외부 배당금 레지스트리 관리')
+    parser.add_argument('--validate', action='store_true', help='레지스트리의 중복/날짜 순서/값 검증')
+    parser.add_argument('--import', dest='import_files', nargs='+', metavar='CSV',
+                        help='CSV 파일의 배당금을 레지스트리에 추가 (Investing.com 형식 또는 레지스트리 형식)')
+    parser.add_argument('--ticker', '-t', type=str, help='ticker 컬럼이 없는 CSV에 사용할 티커 (예: 005935.KS)')
+    parser.add_argument('--show', type=str, metavar='TICKER', help='티커의 배당금 출력')
+    parser.add_argument('--registry', type=str, help=f'레지스트리 경로 (기본값: {REGISTRY_ENV} 또는 {DEFAULT_REGISTRY_PATH})')
+
+    args = parser.parse_args()
+
+    try:
+        if args.import_files:
+            import_dividends(args.import_files, ticker=args.ticker, path=args.registry)
+        if args.validate:
+            registry = load_dividend_registry(args.registry)
+            print(f"✅ 배당금 레지스트리 정상: {len(registry)}개 티커, {sum(len(s) for s in registry.values())}건")
+        if args.show:
+            dividends = registry_dividends(args.show, args.registry)
+            print(f"📊 {args.show} 배당금 {len(dividends)}건")
+            for date, amount in dividends.items():
+                print(f"  {date.strftime('%Y-%m-%d')}: {amount:,.2f}")
+        if not (args.import_files or args.validate or args.show):
+            parser.print_help()
+    except ValueError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
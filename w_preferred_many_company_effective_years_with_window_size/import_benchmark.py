@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+진입점 스크립트별 import 시간 벤치마크
+
+각 진입점 모듈을 새 파이썬 프로세스에서 `python -X importtime -c "import <모듈>"`로 import 하여
+import 시간(누적)과 import 시점에 함께 로드된 무거운 의존성(pandas, matplotlib, seaborn, yfinance)을 측정합니다.
+측정값은 반복 실행 중 최솟값을 사용합니다. (디스크 캐시 등 잡음 제거)
+
+결과를 .import_benchmark.json에 저장해 두면 다음 실행에서 이전 결과와 비교하여
+허용 비율 이상 느려진 진입점을 표시합니다. (--check를 주면 이때 종료 코드 1)
+
+사용법:
+    python import_benchmark.py                  # 측정 후 이전 결과와 비교
+    python import_benchmark.py --save           # 측정 결과를 기준값으로 저장
+    python import_benchmark.py --check          # 기준값보다 느려진 진입점이 있으면 실패
+    python import_benchmark.py --modules companies stock_diff --repeats 5
+"""
+
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULT_PATH = os.path.join(SCRIPT_DIR, '.import_benchmark.json')
+DEFAULT_REPEATS = 3
+DEFAULT_TOLERANCE = 0.2  # 기준값보다 20% 이상 느려지면 회귀로 표시
+
+# 측정할 진입점 모듈 (Makefile/README에서 직접 실행하는 스크립트)
+ENTRY_POINTS = [
+    'companies',
+    'stock_diff',
+    'us_diff',
+    'analyze_ratio',
+    'analyze_all_companies',
+    'comprehensive_company_comparison_report',
+    'backtest_strategy_with_report',
+    'strategy_sweep',
+    'dividend_data',
+    'pipeline',
+    'get_samsung_ltd_dividend',
+]
+
+# import 시점에 로드되면 시작 시간을 크게 늘리는 의존성
+HEAVY_MODULES = ('pandas', 'matplotlib', 'seaborn', 'yfinance')
+
+
+def parse_importtime(stderr_text):
+    """
+    `python -X importtime` 출력을 모듈별 누적 import 시간으로 변환합니다.
+
+    Args:
+        stderr_text (str): -X importtime의 stderr 출력
+
+    Returns:
+        dict: 모듈 이름 -> 누적 import 시간(초)
+    """
+    cumulative = {}
+    for line in stderr_text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # 헤더 줄 (self [us] | cumulative | imported package)
+        name = parts[2].strip()
+        cumulative[name] = int(parts[1]) / 1_000_000
+    return cumulative
+
+
+def measure_import(module_name, repeats=DEFAULT_REPEATS, cwd=SCRIPT_DIR):
+    """
+    새 프로세스에서 모듈을 import 하여 import 시간과 함께 로드된 무거운 의존성을 측정합니다.
+
+    Args:
+        module_name (str): import 할 모듈 이름
+        repeats (int): 반복 측정 횟수 (최솟값 사용)
+        cwd (str): 실행 디렉토리
+
+    Returns:
+        dict: {'module', 'seconds', 'heavy_modules'}
+
+    Raises:
+        RuntimeError: import가 실패한 경우
+    """
+    best = None
+    heavy = []
+    for _ in range(max(1, repeats)):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+            cwd=cwd, capture_output=True, text=True, stdin=subprocess.DEVNULL
+        )
+        if completed.returncode != 0:
+            message = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else ''
+            raise RuntimeError(f"{module_name} import 실패: {message}")
+
+        timings = parse_importtime(completed.stderr)
+        seconds = timings.get(module_name, 0.0)
+        if best is None or seconds < best:
+            best = seconds
+        heavy = [name for name in HEAVY_MODULES if name in timings]
+
+    return {'module': module_name, 'seconds': round(best, 4), 'heavy_modules': heavy}
+
+
+def run_benchmark(modules=None, repeats=DEFAULT_REPEATS):
+    """
+    진입점 모듈들의 import 시간을 측정합니다.
+
+    Args:
+        modules (list): 측정할 모듈 목록 (None이면 ENTRY_POINTS)
+        repeats (int): 모듈별 반복 측정 횟수
+
+    Returns:
+        list: 모듈별 측정 결과 (import 실패 시 'error' 포함)
+    """
+    results = []
+    for module_name in modules or ENTRY_POINTS:
+        try:
+            results.append(measure_import(module_name, repeats=repeats))
+        except RuntimeError as e:
+            results.append({'module': module_name, 'seconds': None, 'heavy_modules': [], 'error': str(e)})
+    return results
+
+
+def load_results(path=DEFAULT_RESULT_PATH):
+    """
+    저장된 기준 측정 결과를 읽습니다.
+
+    Returns:
+        dict: 모듈 이름 -> 측정 결과 (파일이 없으면 빈 딕셔너리)
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+    return {result['module']: result for result in saved.get('results', [])}
+
+
+def save_results(results, path=DEFAULT_RESULT_PATH):
+    """측정 결과를 기준값으로 저장합니다."""
+    payload = {
+        'measured_at': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+
+def find_regressions(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    기준값보다 허용 비율 이상 느려졌거나 새로 무거운 의존성을 로드하는 모듈을 찾습니다.
+
+    Args:
+        results (list): 현재 측정 결과
+        baseline (dict): 모듈 이름 -> 기준 측정 결과
+        tolerance (float): 허용 비율 (0.2 = 20%)
+
+    Returns:
+        list: 회귀 설명 문자열 목록
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result['module'])
+        if not previous or result['seconds'] is None or previous.get('seconds') is None:
+            continue
+        if result['seconds'] > previous['seconds'] * (1 + tolerance):
+            regressions.append(f"{result['module']}: {previous['seconds']:.3f}s -> {result['seconds']:.3f}s")
+        added = sorted(set(result['heavy_modules']) - set(previous.get('heavy_modules', [])))
+        if added:
+            regressions.append(f"{result['module']}: import 시 새로 로드됨 {added}")
+    return regressions
+
+
+def print_results(results, baseline=None):
+    """측정 결과 표를 출력합니다. (기준값이 있으면 변화량도 출력)"""
+    baseline = baseline or {}
+    print(f"{'진입점':<42}{'import 시간':>12}{'기준 대비':>12}  무거운 의존성")
+    print("-" * 100)
+    for result in results:
+        if result['seconds'] is None:
+            print(f"{result['module']:<42}{'실패':>12}{'':>12}  {result['error']}")
+            continue
+        previous = baseline.get(result['module'], {}).get('seconds')
+        delta = f"{result['seconds'] - previous:+.3f}s" if previous is not None else '-'
+        heavy = ', '.join(result['heavy_modules']) or '없음'
+        print(f"{result['module']:<42}{result['seconds']:>11.3f}s{delta:>12}  {heavy}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='진입점 스크립트별 import 시간 벤치마크')
+    parser.add_argument('--modules', nargs='+', help='측정할 모듈 (기본값: 모든 진입점)')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help=f'반복 측정 횟수 (기본값: {DEFAULT_REPEATS})')
+    parser.add_argument('--results', default=DEFAULT_RESULT_PATH, help='기준 결과 파일 경로')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='회귀로 볼 허용 비율 (기본값: 0.2)')
+    parser.add_argument('--save', action='store_true', help='측정 결과를 기준값으로 저장')
+    parser.add_argument('--check', action='store_true', help='기준값보다 느려진 진입점이 있으면 종료 코드 1')
+
+    args = parser.parse_args()
+
+    print(f"⏱️ 진입점 import 시간 측정 (반복 {args.repeats}회, 최솟값)")
+    results = run_benchmark(args.modules, repeats=args.repeats)
+    baseline = load_results(args.results)
+    print_results(results, baseline)
+
+    regressions = find_regressions(results, baseline, tolerance=args.tolerance)
+    if regressions:
+        print("\n⚠️ 기준값 대비 회귀:")
+        for regression in regressions:
+            print(f"  - {regression}")
+    elif baseline:
+        print("\n✅ 기준값 대비 회귀 없음")
+
+    if args.save:
+        save_results(results, args.results)
+        print(f"💾 기준 결과 저장: {args.results}")
+
+    if args.check and regressions:
+        sys.exit(1)
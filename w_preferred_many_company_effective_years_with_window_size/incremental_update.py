@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+분석 데이터 증분 갱신 엔진
+
+stock_diff.py가 저장한 기간별 분석 데이터와 새로 받은 가격/배당금 데이터를 행 단위로 비교하여
+바뀐 행만 다시 계산합니다.
+
+- 입력 컬럼(종가, 시가, 원본 배당금)의 행별 해시로 수정/추가/삭제된 날짜를 찾습니다.
+  Yahoo가 과거 종가를 수정하거나 배당금 레지스트리에 배당금이 추가된 경우도 감지됩니다.
+- Price_Difference, Price_Diff_Ratio, 배당 수익률은 바뀐 행만 다시 계산합니다.
+  (Dividend_Amount는 forward fill이므로 배당금 변경 이후 다음 배당일까지의 행이 함께 바뀝니다)
+- 사분위수는 윈도우 크기 w마다 [변경 위치, 변경 위치 + w - 1] 구간, 즉 이동 윈도우가 바뀐 값을
+  포함하는 행만 다시 계산합니다. 각 구간은 앞쪽 w - 1개 행을 윈도우 초기값으로 사용하므로
+  전체 재계산과 결과가 동일합니다.
+- 바뀐 행이 없으면 저장된 DataFrame을 그대로 반환하고, 호출하는 쪽은 파일을 다시 쓰지 않습니다.
+
+윈도우 상태 (window_state):
+    윈도우 크기별로 마지막 윈도우의 값(오래된 순서)과 정렬된 값을 데이터 파일 옆의
+    {회사명}_stock_analysis_{기간}.window_state.npz에 저장합니다.
+    새 거래일이 끝에 추가되기만 한 경우 이 상태에서 바로 이어서 계산하므로
+    새 행 하나당 O(log w) 비교와 O(w) 리스트 삽입/삭제로 끝나고, 결과는 전체 재계산과 같습니다.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from derived_columns import add_dividend_yield_column, add_price_diff_columns
+from instrumentation import timed
+from rolling_quantile import (
+    DEFAULT_QUANTILES, DEFAULT_WINDOW_CONFIGS, SlidingWindowQuantile, calculate_rolling_quantiles
+)
+
+# 변경 감지에 사용하는 입력 컬럼 (나머지 컬럼은 모두 이 값들로부터 계산됨)
+INPUT_COLUMNS = ['Stock1_Close', 'Stock2_Close', 'Stock1_Open', 'Stock2_Open', 'Dividend_Amount_Raw']
+
+# 해시 전에 반올림할 소수점 자리수 (JSON은 소수점 10자리까지만 저장하므로 그보다 거칠게 비교)
+HASH_DECIMALS = 8
+
+# stock_diff.py 분석 데이터의 컬럼 순서
+ANALYSIS_COLUMNS = [
+    'Price_Difference',
+    'Price_Diff_Ratio',
+    'Dividend_Amount',
+    'Dividend_Yield_on_Preferred',
+    'Stock1_Close',
+    'Stock2_Close',
+    'Stock1_Open',
+    'Stock2_Open',
+    'Price_Diff_Ratio_25th_Percentile',
+    'Price_Diff_Ratio_75th_Percentile',
+    'Price_Diff_Ratio_25th_Percentile_2year',
+    'Price_Diff_Ratio_75th_Percentile_2year',
+    'Price_Diff_Ratio_25th_Percentile_3year',
+    'Price_Diff_Ratio_75th_Percentile_3year',
+    'Price_Diff_Ratio_25th_Percentile_5year',
+    'Price_Diff_Ratio_75th_Percentile_5year',
+    'Dividend_Amount_Raw',
+]
+
+
+def quantile_column(window_name, quantile):
+    """분위수 컬럼명 (예: Price_Diff_Ratio_25th_Percentile_2year)"""
+    return f'Price_Diff_Ratio_{round(quantile * 100)}th_Percentile_{window_name}'
+
+
+def row_hashes(df, columns=INPUT_COLUMNS):
+    """
+    행별 입력 값의 해시를 계산합니다. (인덱스 제외, 반올림 후 해시)
+
+    Args:
+        df (pd.DataFrame): 입력 컬럼을 가진 데이터
+        columns (list): 해시할 컬럼 목록
+
+    Returns:
+        np.ndarray: 행별 uint64 해시
+    """
+    values = df[columns].astype(float).round(HASH_DECIMALS)
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def _close(left, right):
+    """HASH_DECIMALS 자리까지 같은 값인지 원소별로 확인합니다. (NaN끼리는 같음)"""
+    return np.isclose(left, right, rtol=0, atol=10 ** -HASH_DECIMALS, equal_nan=True)
+
+
+def _forward_filled_dividends(raw):
+    """원본 배당금을 기간의 첫 날부터 forward fill 합니다. (0은 배당 없음)"""
+    return raw.where(raw != 0).ffill().fillna(0).astype(float)
+
+
+def _select_analysis_columns(df, window_configs):
+    """기존 컬럼명(2년 기준)을 채우고 분석 데이터 컬럼 순서로 정리합니다."""
+    df['Price_Diff_Ratio_25th_Percentile'] = df[quantile_column('2year', 0.25)]
+    df['Price_Diff_Ratio_75th_Percentile'] = df[quantile_column('2year', 0.75)]
+    columns = [column for column in ANALYSIS_COLUMNS if column in df.columns]
+    columns += [
+        quantile_column(window_name, q)
+        for window_name in window_configs for q in DEFAULT_QUANTILES
+        if quantile_column(window_name, q) not in columns
+    ]
+    result_df = df[columns]
+    result_df.index.name = 'Date'
+    return result_df
+
+
+@timed()
+def compute_analysis_frame(price_df, window_configs=DEFAULT_WINDOW_CONFIGS):
+    """
+    가격/배당금 데이터로 분석 데이터 전체를 계산합니다.
+
+    Args:
+        price_df (pd.DataFrame): INPUT_COLUMNS를 가진 데이터 (Price_Diff_Ratio가 있으면 재사용)
+        window_configs (dict): {윈도우 이름: 윈도우 크기(행 수)}
+
+    Returns:
+        pd.DataFrame: 분석 데이터 (ANALYSIS_COLUMNS 순서)
+    """
+    df = price_df.copy()
+    df['Dividend_Amount'] = _forward_filled_dividends(df['Dividend_Amount_Raw'])
+    if 'Price_Diff_Ratio' not in df.columns:
+        add_price_diff_columns(df)
+    add_dividend_yield_column(df)
+
+    print(f"🆕 {', '.join(window_configs)} 슬라이딩 윈도우로 25% 및 75% 분위수 계산 중...")
+    rolling = calculate_rolling_quantiles(df['Price_Diff_Ratio'].to_numpy(dtype=float), window_configs, DEFAULT_QUANTILES)
+    for window_name, quantiles in rolling.items():
+        for q, values in quantiles.items():
+            df[quantile_column(window_name, q)] = values
+
+    return _select_analysis_columns(df, window_configs)
+
+
+def affected_ranges(positions, window_size, length):
+    """
+    변경 위치들의 이동 윈도우가 영향을 주는 행 구간을 병합하여 반환합니다.
+
+    Args:
+        positions (array-like): 값이 바뀐 행 위치 (오름차순)
+        window_size (int): 윈도우 크기
+        length (int): 전체 행 수
+
+    Returns:
+        list: [(시작 위치, 끝 위치(포함)), ...]
+    """
+    ranges = []
+    for position in positions:
+        end = min(position + window_size - 1, length - 1)
+        if ranges and position <= ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], max(ranges[-1][1], end))
+        else:
+            ranges.append((position, end))
+    return ranges
+
+
+def _recompute_quantile_ranges(df, positions, window_configs):
+    """변경 위치의 윈도우가 닿는 행의 분위수만 다시 계산하고 재계산한 행 수를 반환합니다."""
+    ratio = df['Price_Diff_Ratio'].to_numpy(dtype=float)
+    recomputed = np.zeros(len(df), dtype=bool)
+
+    for window_name, window_size in window_configs.items():
+        columns = {q: df.columns.get_loc(quantile_column(window_name, q)) for q in DEFAULT_QUANTILES}
+        for start, end in affected_ranges(positions, window_size, len(df)):
+            # 앞쪽 w - 1개 행으로 윈도우를 채운 뒤 start부터 결과 사용 (expanding 구간은 0부터)
+            warmup_start = max(0, start - window_size + 1)
+            rolling = calculate_rolling_quantiles(ratio[warmup_start:end + 1], {window_name: window_size})
+            for q, column in columns.items():
+                df.iloc[start:end + 1, column] = rolling[window_name][q][start - warmup_start:]
+            recomputed[start:end + 1] = True
+
+    return int(recomputed.sum())
+
+
+def build_window_state(df, window_configs=DEFAULT_WINDOW_CONFIGS):
+    """
+    분석 데이터의 마지막 행 기준 윈도우 상태를 만듭니다.
+
+    Args:
+        df (pd.DataFrame): Price_Diff_Ratio 컬럼을 가진 분석 데이터
+        window_configs (dict): {윈도우 이름: 윈도우 크기(행 수)}
+
+    Returns:
+        dict: {'last_date', 'rows', 'windows': {윈도우 이름: (크기, 윈도우 값, 정렬된 값)}}
+    """
+    ratio = df['Price_Diff_Ratio'].to_numpy(dtype=float)
+    windows = {}
+    for window_name, window_size in window_configs.items():
+        values = ratio[-window_size:]
+        windows[window_name] = (window_size, values.copy(), np.sort(values[~np.isnan(values)]))
+    return {'last_date': df.index[-1], 'rows': len(df), 'windows': windows}
+
+
+def save_window_state(path, state):
+    """
+    윈도우 상태를 .npz 파일로 저장합니다. (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        path (str): 저장할 파일 경로 (analysis_storage.window_state_path())
+        state (dict): build_window_state()의 반환값
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    arrays = {
+        'last_date': np.array(pd.Timestamp(state['last_date']).isoformat()),
+        'rows': np.array(state['rows']),
+    }
+    for window_name, (window_size, values, sorted_values) in state['windows'].items():
+        arrays[f'{window_name}__size'] = np.array(window_size)
+        arrays[f'{window_name}__values'] = values
+        arrays[f'{window_name}__sorted'] = sorted_values
+
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(temp_path, path)
+    return path
+
+
+def load_window_state(path, window_configs=DEFAULT_WINDOW_CONFIGS):
+    """
+    저장된 윈도우 상태를 읽습니다.
+
+    Args:
+        path (str): 상태 파일 경로
+        window_configs (dict): {윈도우 이름: 윈도우 크기(행 수)} (크기가 다르면 사용하지 않음)
+
+    Returns:
+        dict | None: build_window_state()와 같은 형식, 파일이 없거나 설정이 다르면 None
+    """
+    try:
+        with np.load(path) as arrays:
+            windows = {}
+            for window_name, window_size in window_configs.items():
+                if int(arrays[f'{window_name}__size']) != window_size:
+                    return None
+                windows[window_name] = (window_size, arrays[f'{window_name}__values'],
+                                        arrays[f'{window_name}__sorted'])
+            return {
+                'last_date': pd.Timestamp(str(arrays['last_date'])),
+                'rows': int(arrays['rows']),
+                'windows': windows,
+            }
+    except (OSError, KeyError, ValueError) as e:
+        if os.path.exists(path):
+            print(f"⚠️ 윈도우 상태 파일을 읽을 수 없습니다: {path} ({e})")
+        return None
+
+
+def window_state_matches(state, df):
+    """
+    윈도우 상태가 저장된 분석 데이터의 마지막 행과 일치하는지 확인합니다.
+
+    Args:
+        state (dict | None): load_window_state()의 반환값
+        df (pd.DataFrame): 저장된 분석 데이터
+
+    Returns:
+        bool: 마지막 날짜, 행 수, 윈도우 값이 모두 일치하면 True
+    """
+    if state is None or df is None or df.empty:
+        return False
+    if state['last_date'] != df.index[-1] or state['rows'] != len(df):
+        return False
+
+    ratio = df['Price_Diff_Ratio'].to_numpy(dtype=float)
+    for window_size, values, _ in state['windows'].values():
+        tail = ratio[-window_size:]
+        if len(values) != len(tail) or not _close(values, tail).all():
+            return False
+    return True
+
+
+def _append_quantiles(df, window_state, start):
+    """윈도우 상태에서 이어서 start 이후 행(끝에 추가된 행)의 분위수를 계산합니다."""
+    ratio = df['Price_Diff_Ratio'].to_numpy(dtype=float)
+    for window_name, (window_size, values, sorted_values) in window_state['windows'].items():
+        window = SlidingWindowQuantile.from_state(window_size, values, sorted_values, DEFAULT_QUANTILES)
+        results = np.array([window.push(value) for value in ratio[start:]])
+        for i, q in enumerate(DEFAULT_QUANTILES):
+            df.iloc[start:, df.columns.get_loc(quantile_column(window_name, q))] = results[:, i]
+
+
+@timed()
+def update_analysis_frame(stored_df, fresh_df, window_configs=DEFAULT_WINDOW_CONFIGS, window_state=None):
+    """
+    저장된 분석 데이터를 새 가격/배당금 데이터로 갱신합니다. 바뀐 행과 그 윈도우만 다시 계산합니다.
+
+    새 데이터가 덮는 날짜 구간([첫 날짜, 마지막 날짜]) 안에서는 새 데이터가 기준이며
+    (수정/추가/삭제 모두 반영), 구간 밖의 저장된 행은 그대로 유지됩니다.
+
+    Args:
+        stored_df (pd.DataFrame): 저장된 분석 데이터 (ANALYSIS_COLUMNS)
+        fresh_df (pd.DataFrame): 새로 받은 데이터 (INPUT_COLUMNS, Price_Diff_Ratio가 있으면 재사용)
+        window_configs (dict): {윈도우 이름: 윈도우 크기(행 수)}
+        window_state (dict, optional): stored_df의 윈도우 상태 (load_window_state()).
+                                       일치하면 끝에 추가된 행을 이 상태에서 이어서 계산합니다.
+
+    Returns:
+        tuple: (갱신된 DataFrame, 변경 요약 dict)
+               변경이 없으면 stored_df 객체를 그대로 반환합니다.
+               요약: {'changed', 'added', 'removed', 'recomputed', 'first_changed'}
+    """
+    summary = {'changed': 0, 'added': 0, 'removed': 0, 'recomputed': 0, 'first_changed': None}
+    if fresh_df is None or fresh_df.empty:
+        return stored_df, summary
+
+    first_date, last_date = fresh_df.index[0], fresh_df.index[-1]
+    outside = (stored_df.index < first_date) | (stored_df.index > last_date)
+    inputs = pd.concat([stored_df.loc[outside, INPUT_COLUMNS], fresh_df[INPUT_COLUMNS]]).sort_index()
+
+    # 날짜별로 저장된 입력 해시와 비교
+    stored_positions = stored_df.index.get_indexer(inputs.index)
+    is_new = stored_positions < 0
+    changed = is_new.copy()
+    changed[~is_new] = row_hashes(stored_df)[stored_positions[~is_new]] != row_hashes(inputs)[~is_new]
+    # 해시가 다른 행은 반올림 경계 차이일 수 있으므로 값으로 한 번 더 확인
+    candidates = np.flatnonzero(changed & ~is_new)
+    if len(candidates):
+        changed[candidates] = ~_close(
+            stored_df[INPUT_COLUMNS].to_numpy(dtype=float)[stored_positions[candidates]],
+            inputs.to_numpy(dtype=float)[candidates],
+        ).all(axis=1)
+
+    removed_dates = stored_df.index[~stored_df.index.isin(inputs.index)]
+    summary['added'] = int(is_new.sum())
+    summary['changed'] = int(changed.sum()) - summary['added']
+    summary['removed'] = len(removed_dates)
+    if not changed.any() and not summary['removed']:
+        return stored_df, summary
+
+    # 저장된 파생 값을 가져온 뒤 바뀐 행만 다시 계산
+    df = stored_df.reindex(inputs.index)
+    stored_ratio = df['Price_Diff_Ratio'].to_numpy(dtype=float, copy=True)
+    df[INPUT_COLUMNS] = inputs
+    add_price_diff_columns(df, rows=changed)
+
+    df['Dividend_Amount'] = _forward_filled_dividends(df['Dividend_Amount_Raw'])
+    dividend_changed = changed | ~_close(
+        df['Dividend_Amount'].to_numpy(dtype=float),
+        stored_df['Dividend_Amount'].reindex(df.index).to_numpy(dtype=float),
+    )
+    add_dividend_yield_column(df, rows=dividend_changed)
+
+    # Price_Diff_Ratio가 바뀐 위치와 삭제된 날짜의 위치가 분위수 윈도우의 변경 위치
+    ratio_changed = changed & ~_close(df['Price_Diff_Ratio'].to_numpy(dtype=float), stored_ratio)
+    positions = np.flatnonzero(ratio_changed)
+    if len(removed_dates):
+        positions = np.union1d(positions, df.index.searchsorted(removed_dates))
+        positions = positions[positions < len(df)]
+    appended_only = len(positions) and positions[0] >= len(stored_df) and not len(removed_dates)
+    if appended_only and window_state_matches(window_state, stored_df):
+        # 끝에 행이 추가되기만 한 경우: 저장된 윈도우 상태에서 이어서 계산
+        _append_quantiles(df, window_state, positions[0])
+        summary['recomputed'] = len(df) - positions[0]
+    else:
+        summary['recomputed'] = _recompute_quantile_ranges(df, positions, window_configs)
+
+    change_dates = list(df.index[changed]) + list(removed_dates)
+    summary['first_changed'] = min(change_dates) if change_dates else None
+    return _select_analysis_columns(df, window_configs), summary
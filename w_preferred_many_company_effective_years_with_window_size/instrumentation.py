@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+단계별 실행 시간 측정 / 프로파일링 (선택 사항)
+
+전체 실행이 느릴 때 시간이 Yahoo 다운로드, 분위수 계산, 백테스트, 차트 저장 중 어디에 쓰이는지 확인합니다.
+기본값은 꺼져 있으며 켜지 않으면 stage()/timed()는 환경 변수 하나만 확인하고 그대로 실행합니다.
+
+- stage(name)  : 블록 실행 시간을 기록하는 컨텍스트 매니저 (중첩 가능)
+- timed()      : 함수 실행 시간을 기록하는 데코레이터 (이름 기본값: 모듈.함수)
+- 진입점 스크립트의 옵션 (add_instrumentation_arguments / start_from_args)
+    --timing        : 끝날 때 가장 오래 걸린 단계 표 출력
+    --profile 파일  : cProfile 통계 저장 (python -m pstats 파일, snakeviz 등으로 확인)
+    --trace 파일    : Chrome trace-event JSON 저장 (chrome://tracing, https://ui.perfetto.dev 에서 열기)
+
+측정 여부는 STAGE_TIMING 환경 변수로 전달되므로 --jobs 작업 프로세스도 단계를 기록하고,
+parallel_runner가 작업 결과와 함께 부모 프로세스로 모읍니다. (cProfile은 부모 프로세스만)
+
+사용법:
+    python pipeline.py --timing
+    python backtest_strategy_with_report.py --company 삼성전자 --trace trace.json --profile backtest.prof
+    make TRACE=trace.json
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+TIMING_ENV = 'STAGE_TIMING'
+DEFAULT_SUMMARY_ROWS = 15
+
+_events = []
+_events_lock = threading.Lock()
+_session = None
+
+
+def is_enabled():
+    """단계 시간 측정이 켜져 있는지 확인합니다. (STAGE_TIMING 환경 변수)"""
+    return os.environ.get(TIMING_ENV, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def set_timing(enabled=True):
+    """
+    단계 시간 측정을 켜거나 끕니다.
+
+    Args:
+        enabled (bool): True면 stage()/timed() 실행 시간을 기록
+    """
+    # --jobs 작업 프로세스(spawn 방식 포함)도 같은 설정으로 시작하도록 환경 변수에 반영
+    os.environ[TIMING_ENV] = '1' if enabled else '0'
+
+
+@contextmanager
+def stage(name, **args):
+    """
+    블록 실행 시간을 단계로 기록합니다. (측정이 꺼져 있으면 아무것도 하지 않음)
+
+    Args:
+        name (str): 단계 이름
+        **args: trace에 함께 기록할 값 (예: company='삼성전자')
+    """
+    if not is_enabled():
+        yield
+        return
+    wall_start = time.time()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        event = {
+            'name': name,
+            'start': wall_start,
+            'seconds': time.perf_counter() - started,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        }
+        if args:
+            event['args'] = {key: str(value) for key, value in args.items()}
+        with _events_lock:
+            _events.append(event)
+
+
+def _default_name(func):
+    """함수의 단계 이름 (모듈.함수, 스크립트로 직접 실행한 모듈은 파일 이름 사용)"""
+    module = func.__module__
+    if module == '__main__':
+        module = os.path.splitext(os.path.basename(getattr(sys.modules['__main__'], '__file__', '') or 'main'))[0]
+    return f'{module}.{func.__qualname__}'
+
+
+def timed(name=None):
+    """
+    함수 실행 시간을 단계로 기록하는 데코레이터입니다.
+
+    Args:
+        name (str, optional): 단계 이름 (기본값: 모듈.함수)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not is_enabled():
+                return func(*args, **kwargs)
+            with stage(name or _default_name(func)):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def recorded_stages():
+    """지금까지 기록된 단계 목록 (복사본)"""
+    with _events_lock:
+        return list(_events)
+
+
+def drain_stages():
+    """
+    이 프로세스에서 기록한 단계를 꺼내고 기록을 비웁니다. (작업 프로세스에서 부모 프로세스로 보낼 때)
+
+    fork 방식 작업 프로세스는 부모 프로세스의 기록을 물려받으므로 현재 프로세스의 단계만 반환합니다.
+    """
+    pid = os.getpid()
+    with _events_lock:
+        drained = [event for event in _events if event['pid'] == pid]
+        _events.clear()
+    return drained
+
+
+def merge_stages(events):
+    """다른 프로세스에서 기록한 단계를 합칩니다."""
+    if events:
+        with _events_lock:
+            _events.extend(events)
+
+
+def clear_stages():
+    """기록된 단계를 모두 지웁니다."""
+    with _events_lock:
+        _events.clear()
+
+
+def summarize_stages(events=None):
+    """
+    단계 이름별 호출 횟수, 합계/최대 시간을 집계합니다. (합계 시간 내림차순)
+
+    Args:
+        events (list, optional): 단계 목록 (기본값: 기록된 단계)
+
+    Returns:
+        list: [{'name', 'count', 'total', 'max'}]
+    """
+    totals = {}
+    for event in recorded_stages() if events is None else events:
+        row = totals.setdefault(event['name'], {'name': event['name'], 'count': 0, 'total': 0.0, 'max': 0.0})
+        row['count'] += 1
+        row['total'] += event['seconds']
+        row['max'] = max(row['max'], event['seconds'])
+    return sorted(totals.values(), key=lambda row: row['total'], reverse=True)
+
+
+def print_stage_summary(top=DEFAULT_SUMMARY_ROWS, wall_seconds=None, events=None):
+    """
+    가장 오래 걸린 단계 표를 출력합니다.
+
+    중첩된 단계는 바깥 단계 시간에도 포함되고, 병렬 작업은 프로세스별 시간을 더하므로
+    합계가 전체 실행 시간보다 클 수 있습니다.
+
+    Args:
+        top (int): 출력할 단계 수
+        wall_seconds (float, optional): 전체 실행 시간 (있으면 비율도 출력)
+        events (list, optional): 단계 목록 (기본값: 기록된 단계)
+    """
+    rows = summarize_stages(events)
+    print(f"\n{'='*80}")
+    print(f"=== 가장 오래 걸린 단계 (상위 {min(top, len(rows))}개 / 전체 {len(rows)}개) ===")
+    print(f"{'='*80}")
+    if not rows:
+        print("기록된 단계가 없습니다.")
+        return
+    print(f"{'단계':<64}{'횟수':>6}{'합계(초)':>11}{'최대(초)':>11}{'비율':>8}")
+    print("-" * 100)
+    for row in rows[:top]:
+        share = f"{row['total'] / wall_seconds * 100:.0f}%" if wall_seconds else '-'
+        print(f"{row['name'][:63]:<64}{row['count']:>6}{row['total']:>11.2f}{row['max']:>11.2f}{share:>8}")
+    if wall_seconds:
+        print("-" * 100)
+        print(f"{'전체 실행 시간':<64}{'':>6}{wall_seconds:>11.2f}")
+
+
+def chrome_trace(events=None):
+    """
+    단계 목록을 Chrome trace-event 형식(완료 이벤트 'X', 마이크로초)으로 변환합니다.
+
+    Args:
+        events (list, optional): 단계 목록 (기본값: 기록된 단계)
+
+    Returns:
+        dict: {'traceEvents': [...], 'displayTimeUnit': 'ms'}
+    """
+    trace_events = []
+    for event in recorded_stages() if events is None else events:
+        trace_event = {
+            'name': event['name'],
+            'cat': 'stage',
+            'ph': 'X',
+            'ts': round(event['start'] * 1_000_000),
+            'dur': round(event['seconds'] * 1_000_000),
+            'pid': event['pid'],
+            'tid': event['tid'],
+        }
+        if event.get('args'):
+            trace_event['args'] = event['args']
+        trace_events.append(trace_event)
+    trace_events.sort(key=lambda item: (item['ts'], -item['dur']))
+    return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+
+def write_chrome_trace(path, events=None):
+    """
+    Chrome trace-event JSON 파일을 저장합니다. (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        path (str): 저장할 파일 경로
+        events (list, optional): 단계 목록 (기본값: 기록된 단계)
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(chrome_trace(events), f, ensure_ascii=False)
+    os.replace(temp_path, path)
+    return path
+
+
+def start_session(profile_path=None, trace_path=None, summary=True, top=DEFAULT_SUMMARY_ROWS):
+    """
+    단계 시간 측정을 켜고 프로세스가 끝날 때 결과를 저장/출력하도록 등록합니다.
+
+    Args:
+        profile_path (str, optional): cProfile 통계를 저장할 파일
+        trace_path (str, optional): Chrome trace JSON을 저장할 파일
+        summary (bool): 끝날 때 가장 오래 걸린 단계 표 출력
+        top (int): 표에 출력할 단계 수
+    """
+    global _session
+    if _session is not None:
+        return
+    set_timing(True)
+    profiler = None
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+    _session = {
+        'pid': os.getpid(),
+        'started': time.perf_counter(),
+        'profiler': profiler,
+        'profile_path': profile_path,
+        'trace_path': trace_path,
+        'summary': summary,
+        'top': top,
+    }
+    atexit.register(finish_session)
+    if profiler is not None:
+        profiler.enable()
+
+
+def finish_session():
+    """
+    start_session()으로 시작한 측정을 마치고 프로파일/trace를 저장하고 단계 표를 출력합니다.
+    (프로세스 종료 시 자동 호출, 여러 번 호출해도 한 번만 실행)
+    """
+    global _session
+    session = _session
+    if session is None or session['pid'] != os.getpid():
+        return
+    _session = None
+    wall_seconds = time.perf_counter() - session['started']
+
+    if session['profiler'] is not None:
+        session['profiler'].disable()
+        session['profiler'].dump_stats(session['profile_path'])
+    if session['summary']:
+        print_stage_summary(session['top'], wall_seconds)
+    if session['profile_path']:
+        print(f"📈 cProfile 통계 저장: {session['profile_path']} (python -m pstats {session['profile_path']})")
+    if session['trace_path']:
+        write_chrome_trace(session['trace_path'])
+        print(f"🧭 trace 저장: {session['trace_path']} (chrome://tracing 또는 https://ui.perfetto.dev)")
+
+
+def add_instrumentation_arguments(parser):
+    """진입점 스크립트의 argparse에 --timing / --profile / --trace 옵션을 추가합니다."""
+    parser.add_argument('--timing', action='store_true', help='끝날 때 가장 오래 걸린 단계 표 출력')
+    parser.add_argument('--profile', type=str, metavar='FILE', help='cProfile 통계를 저장할 파일 (예: run.prof)')
+    parser.add_argument('--trace', type=str, metavar='FILE', help='Chrome trace-event JSON을 저장할 파일 (예: trace.json)')
+
+
+def start_from_args(args):
+    """
+    --timing / --profile / --trace 옵션 중 하나라도 있으면 측정을 시작합니다.
+
+    Args:
+        args (argparse.Namespace): add_instrumentation_arguments()로 만든 옵션
+    """
+    if args.timing or args.profile or args.trace:
+        start_session(profile_path=args.profile, trace_path=args.trace)
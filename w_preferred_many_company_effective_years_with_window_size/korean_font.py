@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+그래프용 한글 폰트 찾기 (환경마다 한 번만 탐색하고 결과를 캐시 파일에 저장)
+
+설치된 폰트 목록(fm.fontManager.ttflist)에서 한글 폰트를 찾는 작업은 환경(파이썬 환경, matplotlib 버전,
+matplotlib 폰트 목록 캐시)이 바뀌지 않는 한 결과가 같습니다.
+찾은 폰트 이름을 .korean_font_cache.json에 환경별로 저장해 두고 다음 실행과 병렬 작업 프로세스에서는
+파일만 읽어 rcParams에 적용합니다. 같은 프로세스 안에서는 메모리에 기억한 값을 사용합니다.
+
+폰트를 새로 설치했다면 matplotlib 폰트 목록 캐시가 다시 만들어지면서 자동으로 다시 탐색하고,
+직접 다시 탐색하려면 `python korean_font.py --refresh`를 실행합니다.
+
+캐시 파일 경로는 KOREAN_FONT_CACHE 환경 변수로 바꿀 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import sys
+
+FONT_CACHE_ENV = 'KOREAN_FONT_CACHE'
+DEFAULT_FONT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.korean_font_cache.json')
+
+# OS별 한글 폰트 우선순위
+KOREAN_FONT_CANDIDATES = {
+    'Windows': ['Malgun Gothic', 'NanumGothic', 'Gulim', 'Dotum'],
+    'Darwin': ['AppleGothic', 'AppleSDGothicNeo', 'NanumGothic'],
+    'Linux': ['NanumGothic', 'NanumBarunGothic', 'NanumMyeongjo'],
+}
+
+# 프로세스 안에서 이미 찾은 폰트 (캐시 파일 경로 -> 폰트 이름 또는 None)
+_resolved_fonts = {}
+
+
+def get_font_cache_path():
+    """폰트 캐시 파일 경로를 반환합니다. (KOREAN_FONT_CACHE 환경 변수 우선)"""
+    return os.environ.get(FONT_CACHE_ENV) or DEFAULT_FONT_CACHE_PATH
+
+
+def font_environment():
+    """
+    폰트 탐색 결과가 달라질 수 있는 환경 정보를 반환합니다.
+
+    matplotlib 폰트 목록 캐시 파일은 폰트 목록이 다시 만들어질 때만 바뀌므로
+    그 수정 시각을 포함해 폰트 설치/삭제 후에는 다시 탐색하도록 합니다.
+
+    Returns:
+        dict: 환경 정보 (OS, 파이썬 환경, matplotlib 버전, 폰트 목록 캐시 수정 시각)
+    """
+    import matplotlib
+    import matplotlib.font_manager as fm
+
+    fontlist_path = os.path.join(matplotlib.get_cachedir(), f"fontlist-v{fm.FontManager.__version__}.json")
+    try:
+        fontlist_mtime = os.stat(fontlist_path).st_mtime_ns
+    except OSError:
+        fontlist_mtime = None
+
+    return {
+        'system': platform.system(),
+        'python': sys.prefix,
+        'matplotlib': matplotlib.__version__,
+        'fontlist_mtime': fontlist_mtime,
+    }
+
+
+def _environment_key(environment):
+    """환경 정보를 캐시 파일의 키로 바꿉니다."""
+    return hashlib.sha1(json.dumps(environment, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def find_korean_font(candidates=None, font_names=None):
+    """
+    설치된 폰트에서 한글 폰트를 찾습니다. (정확히 같은 이름 우선, 다음은 대소문자 무시 부분 일치)
+
+    Args:
+        candidates (list): 우선순위 순서의 폰트 이름 (None이면 현재 OS의 KOREAN_FONT_CANDIDATES)
+        font_names (list): 설치된 폰트 이름 목록 (None이면 fm.fontManager.ttflist)
+
+    Returns:
+        str: 찾은 폰트 이름 (없으면 None)
+    """
+    if candidates is None:
+        candidates = KOREAN_FONT_CANDIDATES.get(platform.system(), KOREAN_FONT_CANDIDATES['Linux'])
+    if font_names is None:
+        import matplotlib.font_manager as fm
+        font_names = [font.name for font in fm.fontManager.ttflist]
+
+    available = set(font_names)
+    for candidate in candidates:
+        if candidate in available:
+            return candidate
+        for name in font_names:
+            if candidate.lower() in name.lower():
+                return name
+    return None
+
+
+def _read_font_cache(path):
+    """캐시 파일을 읽습니다. (없거나 깨졌으면 빈 딕셔너리)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_font_cache(path, cache):
+    """캐시 파일을 원자적으로 씁니다. (병렬 작업 프로세스가 동시에 써도 깨지지 않음)"""
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"⚠️ 폰트 캐시 저장 실패: {e}")
+
+
+def resolve_korean_font(cache_path=None, refresh=False):
+    """
+    사용할 한글 폰트 이름을 반환합니다. (프로세스 메모리 -> 캐시 파일 -> 폰트 탐색 순서)
+
+    Args:
+        cache_path (str): 캐시 파일 경로 (None이면 get_font_cache_path())
+        refresh (bool): 캐시를 무시하고 다시 탐색할지 여부
+
+    Returns:
+        str: 한글 폰트 이름 (설치된 한글 폰트가 없으면 None)
+    """
+    cache_path = cache_path or get_font_cache_path()
+    if not refresh and cache_path in _resolved_fonts:
+        return _resolved_fonts[cache_path]
+
+    environment = font_environment()
+    key = _environment_key(environment)
+    cache = _read_font_cache(cache_path)
+    entry = cache.get(key)
+
+    if refresh or not isinstance(entry, dict) or 'family' not in entry:
+        family = find_korean_font()
+        if family:
+            print(f"✅ 한글 폰트 설정: {family}")
+        else:
+            print("⚠️ 한글 폰트를 찾을 수 없어 기본 폰트를 사용합니다. "
+                  "'sudo apt-get install fonts-nanum*'으로 설치할 수 있습니다.")
+        cache[key] = {'family': family, 'environment': environment}
+        _write_font_cache(cache_path, cache)
+    else:
+        family = entry['family']
+
+    _resolved_fonts[cache_path] = family
+    return family
+
+
+def apply_korean_font(plt, cache_path=None):
+    """
+    한글 폰트를 matplotlib에 적용합니다. (그래프를 처음 그릴 때 한 번 호출)
+
+    Args:
+        plt (module): matplotlib.pyplot
+        cache_path (str): 캐시 파일 경로 (None이면 get_font_cache_path())
+
+    Returns:
+        bool: 한글 폰트를 찾았는지 여부
+    """
+    family = resolve_korean_font(cache_path)
+    plt.rcParams['font.family'] = family or 'sans-serif'
+    plt.rcParams['axes.unicode_minus'] = False  # 마이너스 폰트 깨짐 방지
+    return family is not None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='그래프용 한글 폰트 확인')
+    parser.add_argument('--refresh', action='store_true', help='캐시를 무시하고 한글 폰트를 다시 탐색')
+
+    args = parser.parse_args()
+
+    family = resolve_korean_font(refresh=args.refresh)
+    print(f"한글 폰트: {family or '없음 (sans-serif 사용)'}")
+    print(f"캐시 파일: {get_font_cache_path()}")
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+무거운 의존성(yfinance, matplotlib, seaborn)의 지연 import와 그래프 폰트 설정
+
+모듈 최상단에서 바로 import 하면 `stock_diff.py --list`처럼 그래프도 다운로드도 하지 않는
+명령까지 매번 수 초의 import 비용과 폰트 탐색 비용을 냅니다.
+LazyModule은 처음 속성에 접근하는 순간 실제 모듈을 import 하므로, 기존 코드의
+`plt.figure(...)`, `sns.heatmap(...)`, `yf.download(...)` 호출은 그대로 두고
+import 시점만 실제로 그래프를 그리거나 데이터를 받는 코드 경로로 미룹니다.
+
+사용 예:
+    plt = lazy_pyplot()            # 첫 사용 때 matplotlib.pyplot import + 한글 폰트 설정
+    sns = lazy_seaborn(plt)        # 첫 사용 때 seaborn import (폰트 설정이 먼저 적용됨)
+    yf = LazyModule('yfinance')
+"""
+
+import importlib
+import threading
+
+
+class LazyModule:
+    """
+    처음 속성에 접근할 때 모듈을 import 하는 대리 객체입니다.
+
+    Args:
+        name (str): import 할 모듈 이름 (예: 'matplotlib.pyplot')
+        setup (callable): import 직후 한 번 호출할 함수 (인자: 모듈)
+    """
+
+    def __init__(self, name, setup=None):
+        self.__dict__['_name'] = name
+        self.__dict__['_setup'] = setup
+        self.__dict__['_module'] = None
+        self.__dict__['_lock'] = threading.Lock()
+
+    def _load(self):
+        """모듈을 import 하고 (처음 한 번만) setup을 실행한 뒤 모듈을 반환합니다."""
+        module = self.__dict__['_module']
+        if module is not None:
+            return module
+        with self.__dict__['_lock']:
+            module = self.__dict__['_module']
+            if module is None:
+                module = importlib.import_module(self._name)
+                if self._setup is not None:
+                    self._setup(module)
+                self.__dict__['_module'] = module
+        return module
+
+    @property
+    def loaded(self):
+        """실제 모듈이 이미 import 되었는지 여부"""
+        return self.__dict__['_module'] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr):
+        delattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f"<LazyModule '{self._name}' ({state})>"
+
+
+def configure_korean_font(plt):
+    """
+    한글 폰트를 설정합니다. (폰트 탐색은 환경마다 한 번, korean_font 캐시 사용)
+
+    Args:
+        plt (module): matplotlib.pyplot
+    """
+    from korean_font import apply_korean_font
+
+    apply_korean_font(plt)
+
+
+def lazy_pyplot(configure=configure_korean_font, backend='Agg'):
+    """
+    첫 사용 때 import 되는 matplotlib.pyplot을 반환합니다.
+
+    차트는 모두 파일로만 저장하므로 기본적으로 화면 없이 동작하는 Agg 백엔드를 사용합니다.
+
+    Args:
+        configure (callable): import 직후 한 번 호출할 폰트 설정 함수 (인자: pyplot)
+        backend (str): 사용할 matplotlib 백엔드 (None이면 matplotlib 기본값)
+
+    Returns:
+        LazyModule: matplotlib.pyplot 대리 객체
+    """
+    def setup(plt):
+        if backend:
+            plt.switch_backend(backend)
+        if configure is not None:
+            configure(plt)
+
+    return LazyModule('matplotlib.pyplot', setup=setup)
+
+
+def lazy_seaborn(plt):
+    """
+    첫 사용 때 import 되는 seaborn을 반환합니다. (pyplot 폰트 설정을 먼저 적용)
+
+    Args:
+        plt (LazyModule): lazy_pyplot()으로 만든 pyplot 대리 객체
+
+    Returns:
+        LazyModule: seaborn 대리 객체
+    """
+    return LazyModule('seaborn', setup=lambda sns: plt._load() if isinstance(plt, LazyModule) else None)
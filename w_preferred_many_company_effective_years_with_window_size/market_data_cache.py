@@ -0,0 +1,560 @@
+# -*- coding: utf-8 -*-
+"""
+yfinance 앞단의 로컬 디스크 시장 데이터 캐시
+
+티커/필드/날짜 구간 단위로 yfinance 결과를 저장하고 재사용합니다.
+- prices    (yf.download)                : 1일 TTL, 캐시 구간 밖의 부족한 구간만 추가로 받아서 병합
+                                           (download_many: 여러 티커를 한 번의 요청으로 받아 티커별로 저장)
+- history   (Ticker.history(period=...)) : 1일 TTL
+- info      (Ticker.info)                : 1시간 TTL
+- dividends (Ticker.dividends)           : 1주 TTL
+
+오프라인 모드(--offline 옵션 또는 MARKET_DATA_OFFLINE=1)에서는 네트워크를 사용하지 않고
+캐시에 있는 데이터만 TTL과 관계없이 반환하며, 캐시에 없으면 빈 데이터를 반환합니다.
+캐시 디렉터리를 미리 채워 두면 네트워크 없이 전체 파이프라인을 실행할 수 있습니다.
+
+캐시 위치는 MARKET_DATA_CACHE_DIR 환경 변수로 지정하며 기본값은 ./.market_data_cache 입니다.
+
+yf.download 결과의 컬럼 형태((Price, Ticker) / (Ticker, Price) MultiIndex, 단일 레벨)는
+to_long_prices()에서 (Date, Ticker) 행의 long 형식으로 한 번에 정규화하고,
+티커 하나의 가격이 필요하면 wide_prices()로 꺼내서 사용합니다.
+
+여러 티커의 info/dividends/history는 fetch_snapshots()로 동시에 받아 캐시를 채울 수 있습니다.
+(concurrent_fetch: 스레드 풀, 호스트별 요청 수 제한, 지수 백오프 재시도)
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from concurrent_fetch import (
+    DEFAULT_BACKOFF, DEFAULT_MAX_WORKERS, DEFAULT_RATE_PER_SECOND, DEFAULT_RETRIES, HostRateLimiter,
+    fetch_concurrently
+)
+from instrumentation import timed
+from lazy_imports import LazyModule
+
+# yfinance는 캐시에 없는 데이터를 실제로 받을 때 import (캐시 적중/오프라인 실행은 import 비용 없음)
+yf = LazyModule('yfinance')
+
+CACHE_DIR_ENV = 'MARKET_DATA_CACHE_DIR'
+OFFLINE_ENV = 'MARKET_DATA_OFFLINE'
+DEFAULT_CACHE_DIR = './.market_data_cache'
+
+# 필드별 캐시 유효 기간
+FIELD_TTLS = {
+    'prices': timedelta(days=1),
+    'history': timedelta(days=1),
+    'info': timedelta(hours=1),
+    'dividends': timedelta(weeks=1),
+}
+
+# fetch_snapshots()로 받을 수 있는 필드 (history는 period='5d')
+SNAPSHOT_FIELDS = ('info', 'dividends', 'history')
+SNAPSHOT_HISTORY_PERIOD = '5d'
+
+
+def _env_flag(name):
+    """환경 변수 값이 참(1/true/yes/on)인지 확인합니다."""
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _normalize_date(value):
+    """날짜(문자열/datetime)를 YYYY-MM-DD 문자열로 변환합니다."""
+    return pd.Timestamp(value).strftime('%Y-%m-%d')
+
+
+# yf.download 결과의 가격 필드 (MultiIndex 컬럼에서 가격 레벨을 찾을 때와 long 형식의 컬럼 순서에 사용)
+PRICE_FIELDS = ('Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume', 'Dividends', 'Stock Splits', 'Capital Gains')
+
+
+def to_long_prices(data, tickers=None):
+    """
+    yf.download 결과를 (Date, Ticker) 행 단위의 long 형식으로 정규화합니다.
+
+    지원하는 컬럼 형태:
+    - (Price, Ticker) MultiIndex: yf.download 기본 형태 (group_by='column')
+    - (Ticker, Price) MultiIndex: group_by='ticker'
+    - 단일 레벨 (Open, Close, ...): 티커 하나만 받은 이전 yfinance 형태 (tickers에 그 티커를 지정)
+
+    Args:
+        data (pd.DataFrame): yf.download 결과
+        tickers (list, optional): 단일 레벨 컬럼일 때의 티커 (하나)
+
+    Returns:
+        pd.DataFrame: Date, Ticker, 가격 필드 컬럼 (Ticker, Date 순 정렬, 가격이 모두 없는 행 제외)
+    """
+    if data is None or data.empty:
+        return pd.DataFrame(columns=['Date', 'Ticker'])
+
+    if isinstance(data.columns, pd.MultiIndex):
+        price_level = 0 if set(data.columns.get_level_values(0)) & set(PRICE_FIELDS) else 1
+        stacked = data.stack(level=1 - price_level, future_stack=True)
+    else:
+        if not tickers or len(tickers) != 1:
+            raise ValueError("단일 레벨 컬럼의 가격 데이터는 티커 하나를 지정해야 합니다.")
+        stacked = data.set_index(pd.Index([tickers[0]] * len(data)), append=True)
+
+    stacked.index.names = ['Date', 'Ticker']
+    fields = [field for field in PRICE_FIELDS if field in stacked.columns]
+    long_df = stacked[fields].dropna(how='all').reset_index()
+    long_df.columns.name = None
+    return long_df.sort_values(['Ticker', 'Date'], kind='stable').reset_index(drop=True)
+
+
+def wide_prices(long_df, ticker):
+    """
+    long 형식 가격에서 티커 하나의 가격을 꺼냅니다.
+
+    Args:
+        long_df (pd.DataFrame): to_long_prices()의 결과
+        ticker (str): 티커 심볼
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스(Date), 단일 레벨 가격 필드 컬럼 (없으면 빈 DataFrame)
+    """
+    if long_df.empty:
+        return pd.DataFrame()
+    rows = long_df[long_df['Ticker'] == ticker]
+    return rows.drop(columns='Ticker').set_index('Date')
+
+
+def _to_download_frame(wide_df, ticker):
+    """티커 하나의 가격을 yf.download(ticker)와 같은 (Price, Ticker) MultiIndex 형태로 바꿉니다."""
+    frame = wide_df.copy()
+    frame.columns = pd.MultiIndex.from_product([frame.columns, [ticker]], names=['Price', 'Ticker'])
+    return frame
+
+
+def company_tickers(companies):
+    """
+    회사 목록 딕셔너리에서 보통주/우선주 티커를 중복 없이 모읍니다.
+    (stock_diff.PREFERRED_STOCK_COMPANIES의 'preferred', us_diff.US_PREFERRED_STOCK_COMPANIES의 'preferred_stocks' 모두 지원)
+
+    Args:
+        companies (dict): {회사명: {'common': 티커, 'preferred': 티커 또는 'preferred_stocks': {시리즈: 티커}}}
+
+    Returns:
+        list: 티커 목록 (처음 나온 순서)
+    """
+    tickers = []
+    for info in companies.values():
+        tickers.append(info['common'])
+        if info.get('preferred'):
+            tickers.append(info['preferred'])
+        tickers.extend((info.get('preferred_stocks') or {}).values())
+    return list(dict.fromkeys(tickers))
+
+
+def _slice_by_date(df, start_date, end_date):
+    """[start_date, end_date) 구간의 행만 반환합니다. (yf.download와 동일한 구간 규칙)"""
+    if df.empty:
+        return df
+    tz = getattr(df.index, 'tz', None)
+    start = pd.Timestamp(start_date, tz=tz)
+    end = pd.Timestamp(end_date, tz=tz)
+    return df[(df.index >= start) & (df.index < end)]
+
+
+class YFinanceFetcher:
+    """yfinance에서 실제 데이터를 가져오는 기본 fetcher"""
+
+    # 호스트별 요청 수 제한에 사용하는 요청 대상 호스트
+    host = 'query2.finance.yahoo.com'
+
+    @timed('yahoo.download')
+    def download(self, ticker, start_date, end_date):
+        return yf.download(ticker, start=start_date, end=end_date)
+
+    @timed('yahoo.download_many')
+    def download_many(self, tickers, start_date, end_date):
+        return yf.download(list(tickers), start=start_date, end=end_date, group_by='column')
+
+    @timed('yahoo.dividends')
+    def dividends(self, ticker):
+        return yf.Ticker(ticker).dividends
+
+    @timed('yahoo.info')
+    def info(self, ticker):
+        return yf.Ticker(ticker).info
+
+    @timed('yahoo.history')
+    def history(self, ticker, period):
+        return yf.Ticker(ticker).history(period=period)
+
+
+class CachedTicker:
+    """
+    yf.Ticker 대신 사용할 수 있는 캐시 경유 티커 객체입니다.
+    info, dividends, history()만 지원합니다.
+    """
+
+    def __init__(self, cache, ticker):
+        self.cache = cache
+        self.ticker = ticker
+
+    @property
+    def info(self):
+        return self.cache.info(self.ticker)
+
+    @property
+    def dividends(self):
+        return self.cache.dividends(self.ticker)
+
+    def history(self, period='5d'):
+        return self.cache.history(self.ticker, period=period)
+
+
+class MarketDataCache:
+    """
+    티커/필드/날짜 구간 단위의 디스크 캐시입니다.
+
+    Args:
+        cache_dir (str, optional): 캐시 디렉터리 (기본값: MARKET_DATA_CACHE_DIR 또는 ./.market_data_cache)
+        offline (bool, optional): 오프라인 모드 여부 (기본값: MARKET_DATA_OFFLINE 환경 변수)
+        ttls (dict, optional): 필드별 TTL 재정의 (예: {'prices': timedelta(hours=6)})
+        fetcher (object, optional): download/download_many/dividends/info/history 메서드를 가진 데이터 공급자
+                                    (기본값: YFinanceFetcher, host 속성이 있으면 요청 수 제한에 사용)
+        rate_per_second (float, optional): fetch_snapshots()의 호스트별 초당 요청 수
+    """
+
+    def __init__(self, cache_dir=None, offline=None, ttls=None, fetcher=None,
+                 rate_per_second=DEFAULT_RATE_PER_SECOND):
+        self.cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        self.offline = _env_flag(OFFLINE_ENV) if offline is None else offline
+        self.ttls = dict(FIELD_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.fetcher = fetcher or YFinanceFetcher()
+        self.rate_limiter = HostRateLimiter(rate_per_second)
+
+    # ------------------------------------------------------------------
+    # 저장소
+    # ------------------------------------------------------------------
+    def _entry_path(self, field, key, suffix):
+        safe_key = str(key).replace('/', '_').replace('\\', '_')
+        return os.path.join(self.cache_dir, field, f'{safe_key}{suffix}')
+
+    def _load_meta(self, field, key):
+        try:
+            with open(self._entry_path(field, key, '.meta.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _save_meta(self, field, key, meta):
+        path = self._entry_path(field, key, '.meta.json')
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+    def _load_frame(self, field, key):
+        meta = self._load_meta(field, key)
+        if meta is None:
+            return None, None
+        try:
+            return pd.read_pickle(self._entry_path(field, key, '.pkl')), meta
+        except (FileNotFoundError, EOFError, ValueError):
+            return None, None
+
+    def _save_frame(self, field, key, data, meta):
+        os.makedirs(os.path.join(self.cache_dir, field), exist_ok=True)
+        # 여러 프로세스(--jobs)나 스레드(fetch_snapshots)가 같은 캐시를 써도 반쯤 쓰인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        path = self._entry_path(field, key, '.pkl')
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        data.to_pickle(temp_path)
+        os.replace(temp_path, path)
+        self._save_meta(field, key, meta)
+
+    def _is_fresh(self, field, meta):
+        fetched_at = datetime.fromisoformat(meta['fetched_at'])
+        return datetime.now() - fetched_at < self.ttls[field]
+
+    # ------------------------------------------------------------------
+    # 가격 (구간 병합)
+    # ------------------------------------------------------------------
+    def download(self, ticker, start, end):
+        """
+        yf.download(ticker, start=start, end=end)의 캐시 버전입니다.
+
+        캐시가 유효하면 요청 구간 중 캐시 구간 밖의 부분만 새로 받아 병합하고,
+        TTL이 지났으면 요청 구간 전체를 다시 받습니다.
+
+        Args:
+            ticker (str): 티커 심볼
+            start (str): 시작 날짜 (YYYY-MM-DD, 포함)
+            end (str): 종료 날짜 (YYYY-MM-DD, 미포함)
+
+        Returns:
+            pandas.DataFrame: yf.download와 같은 형식의 가격 데이터
+        """
+        start, end = _normalize_date(start), _normalize_date(end)
+        cached, meta = self._load_frame('prices', ticker)
+
+        if self.offline:
+            if cached is None:
+                print(f"📴 오프라인 모드: {ticker} 가격 캐시 없음")
+                return pd.DataFrame()
+            return _slice_by_date(cached, start, end)
+
+        fetched_at = datetime.now().isoformat()
+        if cached is not None and self._is_fresh('prices', meta):
+            missing = []
+            if start < meta['start']:
+                missing.append((start, meta['start']))
+            if end > meta['end']:
+                missing.append((meta['end'], end))
+            if not missing:
+                return _slice_by_date(cached, start, end)
+            if end <= meta['end']:
+                # 앞쪽 구간만 보충하는 경우 최신 데이터의 수집 시각은 그대로 유지
+                fetched_at = meta['fetched_at']
+            coverage = (min(start, meta['start']), max(end, meta['end']))
+            pieces = [cached]
+        else:
+            missing = [(start, end)]
+            coverage = (start, end)
+            pieces = []
+
+        for piece_start, piece_end in missing:
+            fetched = self.fetcher.download(ticker, piece_start, piece_end)
+            if fetched is not None and not fetched.empty:
+                pieces.append(fetched)
+
+        if not pieces:
+            return pd.DataFrame()
+
+        merged = pd.concat(pieces)
+        merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+        self._save_frame('prices', ticker, merged, {
+            'fetched_at': fetched_at,
+            'start': coverage[0],
+            'end': coverage[1],
+        })
+        return _slice_by_date(merged, start, end)
+
+    def download_many(self, tickers, start, end):
+        """
+        여러 티커의 가격을 한 번의 yf.download 요청으로 받아 long 형식으로 반환합니다.
+
+        캐시가 유효하고 요청 구간을 모두 덮는 티커는 캐시에서 읽고, 나머지 티커만 한 번에 요청합니다.
+        받은 가격은 티커별 가격 캐시에 저장되므로 이후 download(ticker, ...) 호출도 캐시에서 처리됩니다.
+
+        Args:
+            tickers (list): 티커 심볼 목록
+            start (str): 시작 날짜 (YYYY-MM-DD, 포함)
+            end (str): 종료 날짜 (YYYY-MM-DD, 미포함)
+
+        Returns:
+            pd.DataFrame: to_long_prices() 형식 (Date, Ticker, 가격 필드)
+        """
+        start, end = _normalize_date(start), _normalize_date(end)
+        tickers = list(dict.fromkeys(tickers))
+        frames = {}
+        missing = []
+
+        for ticker in tickers:
+            cached, meta = self._load_frame('prices', ticker)
+            if self.offline:
+                if cached is None:
+                    print(f"📴 오프라인 모드: {ticker} 가격 캐시 없음")
+                else:
+                    frames[ticker] = _slice_by_date(cached, start, end)
+            elif (cached is not None and self._is_fresh('prices', meta)
+                  and meta['start'] <= start and end <= meta['end']):
+                frames[ticker] = _slice_by_date(cached, start, end)
+            else:
+                missing.append(ticker)
+
+        if missing:
+            print(f"📥 {len(missing)}개 티커 가격 일괄 다운로드: {start} ~ {end}")
+            fetched = to_long_prices(self.fetcher.download_many(missing, start, end), missing)
+            fetched_at = datetime.now().isoformat()
+            for ticker in missing:
+                prices = wide_prices(fetched, ticker)
+                if prices.empty:
+                    print(f"⚠️ {ticker}: 가격 데이터 없음")
+                    continue
+                frames[ticker] = _to_download_frame(prices, ticker)
+                self._store_prices(ticker, frames[ticker], start, end, fetched_at)
+
+        long_frames = [to_long_prices(frames[ticker], [ticker]) for ticker in tickers if ticker in frames]
+        if not long_frames:
+            return to_long_prices(None)
+        return pd.concat(long_frames, ignore_index=True)
+
+    def _store_prices(self, ticker, frame, start, end, fetched_at):
+        """일괄 다운로드한 티커 가격을 기존 유효 캐시와 병합하여 저장합니다."""
+        cached, meta = self._load_frame('prices', ticker)
+        coverage = (start, end)
+        if cached is not None and self._is_fresh('prices', meta):
+            frame = pd.concat([cached, frame])
+            frame = frame[~frame.index.duplicated(keep='last')].sort_index()
+            coverage = (min(start, meta['start']), max(end, meta['end']))
+        self._save_frame('prices', ticker, frame, {
+            'fetched_at': fetched_at,
+            'start': coverage[0],
+            'end': coverage[1],
+        })
+
+    # ------------------------------------------------------------------
+    # 스냅샷 필드 (dividends, history, info)
+    # ------------------------------------------------------------------
+    def _cached_frame(self, field, key, fetch):
+        cached, meta = self._load_frame(field, key)
+        if self.offline:
+            if cached is None:
+                print(f"📴 오프라인 모드: {key} {field} 캐시 없음")
+            return cached
+        if cached is not None and self._is_fresh(field, meta):
+            return cached
+
+        data = fetch()
+        if data is not None and not data.empty:
+            self._save_frame(field, key, data, {'fetched_at': datetime.now().isoformat()})
+        return data
+
+    def dividends(self, ticker):
+        """
+        yf.Ticker(ticker).dividends의 캐시 버전입니다. (전체 기간, 호출하는 쪽에서 구간 선택)
+
+        Returns:
+            pd.Series: 배당금 시계열 데이터
+        """
+        data = self._cached_frame('dividends', ticker, lambda: self.fetcher.dividends(ticker))
+        return pd.Series(dtype=float) if data is None else data
+
+    def history(self, ticker, period='5d'):
+        """
+        yf.Ticker(ticker).history(period=period)의 캐시 버전입니다.
+
+        Returns:
+            pandas.DataFrame: 가격 이력 데이터
+        """
+        data = self._cached_frame('history', f'{ticker}_{period}', lambda: self.fetcher.history(ticker, period))
+        return pd.DataFrame() if data is None else data
+
+    def info(self, ticker):
+        """
+        yf.Ticker(ticker).info의 캐시 버전입니다.
+
+        Returns:
+            dict: 종목 정보
+        """
+        meta = self._load_meta('info', ticker)
+        if self.offline:
+            if meta is None:
+                print(f"📴 오프라인 모드: {ticker} info 캐시 없음")
+                return {}
+            return meta['data']
+        if meta is not None and self._is_fresh('info', meta):
+            return meta['data']
+
+        data = self.fetcher.info(ticker)
+        if data:
+            os.makedirs(os.path.join(self.cache_dir, 'info'), exist_ok=True)
+            # JSON으로 저장할 수 없는 값은 문자열로 바꿔서 캐시 적중 시와 같은 형식으로 반환
+            entry = json.loads(json.dumps({
+                'fetched_at': datetime.now().isoformat(),
+                'data': data,
+            }, default=str))
+            self._save_meta('info', ticker, entry)
+            return entry['data']
+        return {}
+
+    # ------------------------------------------------------------------
+    # 동시 조회
+    # ------------------------------------------------------------------
+    def _has_fresh_snapshot(self, field, ticker):
+        key = f'{ticker}_{SNAPSHOT_HISTORY_PERIOD}' if field == 'history' else ticker
+        meta = self._load_meta(field, key)
+        return meta is not None and self._is_fresh(field, meta)
+
+    def _snapshot(self, ticker, field):
+        if field == 'history':
+            return self.history(ticker, period=SNAPSHOT_HISTORY_PERIOD)
+        return getattr(self, field)(ticker)
+
+    def fetch_snapshots(self, tickers, fields=('info', 'dividends'), max_workers=DEFAULT_MAX_WORKERS,
+                        retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+        """
+        여러 티커의 info/dividends/history(period='5d')를 스레드 풀로 동시에 받아 캐시에 저장합니다.
+
+        캐시가 유효한 항목과 오프라인 모드에서는 요청을 보내지 않고 캐시에서 읽습니다.
+        요청은 fetcher.host 기준으로 초당 요청 수가 제한되고, 실패하면 지수 백오프로 재시도합니다.
+        이후 info()/dividends()/history() 호출은 캐시에서 처리됩니다.
+
+        Args:
+            tickers (list): 티커 심볼 목록
+            fields (tuple): SNAPSHOT_FIELDS 중 받을 필드
+            max_workers (int): 동시에 보낼 요청 수
+            retries (int): 요청별 재시도 횟수
+            backoff (float): 첫 재시도 전 대기 시간(초), 재시도마다 2배
+
+        Returns:
+            dict: {ticker: {field: 값}} (재시도 후에도 실패한 필드는 빠짐)
+        """
+        unknown = [field for field in fields if field not in SNAPSHOT_FIELDS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 필드입니다: {unknown} (지원: {SNAPSHOT_FIELDS})")
+
+        snapshots = {}
+        tasks = []
+        for ticker in dict.fromkeys(tickers):
+            snapshots[ticker] = {}
+            for field in fields:
+                if self.offline or self._has_fresh_snapshot(field, ticker):
+                    snapshots[ticker][field] = self._snapshot(ticker, field)
+                else:
+                    tasks.append(((ticker, field), (ticker, field)))
+
+        if tasks:
+            print(f"🌐 {len(tasks)}개 항목 동시 조회 (티커 {len(snapshots)}개, 동시 요청 최대 {max_workers}개)")
+            outcomes = fetch_concurrently(self._snapshot, tasks, max_workers=max_workers,
+                                          rate_limiter=self.rate_limiter,
+                                          host=getattr(self.fetcher, 'host', 'default'),
+                                          retries=retries, backoff=backoff)
+            for (ticker, field), outcome in outcomes.items():
+                if outcome['error']:
+                    print(f"⚠️ {ticker} {field} 조회 실패: {outcome['error']}")
+                else:
+                    snapshots[ticker][field] = outcome['result']
+        return snapshots
+
+    def ticker(self, ticker):
+        """yf.Ticker(ticker) 대신 사용할 캐시 경유 티커 객체를 반환합니다."""
+        return CachedTicker(self, ticker)
+
+
+_default_cache = None
+
+
+def get_market_data_cache():
+    """
+    프로세스 전체에서 공유하는 기본 캐시 인스턴스를 반환합니다.
+
+    Returns:
+        MarketDataCache: 기본 캐시
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = MarketDataCache()
+    return _default_cache
+
+
+def set_offline(offline=True):
+    """
+    기본 캐시의 오프라인 모드를 설정합니다. (CLI의 --offline 옵션용)
+
+    Args:
+        offline (bool): True이면 네트워크 없이 캐시만 사용
+    """
+    get_market_data_cache().offline = offline
+    # --jobs 작업 프로세스(spawn 방식 포함)도 같은 모드로 시작하도록 환경 변수에도 반영
+    os.environ[OFFLINE_ENV] = '1' if offline else '0'
+    if offline:
+        print(f"📴 오프라인 모드: 캐시({get_market_data_cache().cache_dir})의 데이터만 사용합니다.")
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+회사 / 회사 x 기간 단위 작업을 프로세스 풀로 나누어 실행하는 공용 도구
+
+- jobs가 1이면 기존처럼 현재 프로세스에서 순서대로 실행합니다. (출력도 바로 표시)
+- jobs가 2 이상이면 작업별 출력(stdout/stderr)을 작업 안에서 따로 모았다가,
+  작업이 끝날 때 한 덩어리로 출력합니다. (여러 프로세스의 로그가 섞이지 않음)
+- 한 작업에서 예외가 발생해도 해당 작업만 실패로 기록되고 나머지 작업은 계속 실행됩니다.
+- 단계 시간 측정(instrumentation)이 켜져 있으면 작업마다 'task' 단계를 기록하고,
+  작업 프로세스에서 기록한 단계는 결과와 함께 부모 프로세스로 모읍니다.
+"""
+
+import contextlib
+import io
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from instrumentation import drain_stages, merge_stages, stage
+
+
+def resolve_jobs(jobs):
+    """
+    --jobs 값을 실제 프로세스 수로 변환합니다.
+
+    Args:
+        jobs (int | None): None이면 1 (순차 실행), 0 이하면 CPU 코어 수
+
+    Returns:
+        int: 사용할 프로세스 수 (1 이상)
+    """
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _run_captured(func, args, key=None):
+    """작업 하나를 실행하고 (결과, 출력 로그, 오류 traceback, 기록된 단계)를 반환합니다. (작업 프로세스에서 실행)"""
+    buffer = io.StringIO()
+    result, error = None, None
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        try:
+            with stage(f"task: {_format_key(key)}"):
+                result = func(*args)
+        except Exception:
+            error = traceback.format_exc()
+    return result, buffer.getvalue(), error, drain_stages()
+
+
+def run_tasks(func, tasks, jobs=1):
+    """
+    (key, args) 작업 목록을 실행합니다.
+
+    func는 다른 프로세스에서 호출할 수 있도록 모듈 최상위 함수여야 하고,
+    args와 반환값은 pickle 가능해야 합니다.
+
+    Args:
+        func (callable): 작업 함수 (func(*args))
+        tasks (list): (key, args) 튜플 목록 (key는 로그/결과 식별용)
+        jobs (int | None): 프로세스 수 (resolve_jobs 참고)
+
+    Returns:
+        dict: {key: {'result': 반환값 (실패 시 None), 'error': 오류 메시지 (성공 시 None)}}
+              tasks 순서를 유지합니다.
+    """
+    jobs = min(resolve_jobs(jobs), max(len(tasks), 1))
+    outcomes = {}
+
+    if jobs == 1:
+        for key, args in tasks:
+            try:
+                with stage(f"task: {_format_key(key)}"):
+                    outcomes[key] = {'result': func(*args), 'error': None}
+            except Exception as e:
+                print(f"❌ {_format_key(key)} 작업 실패: {e}")
+                outcomes[key] = {'result': None, 'error': str(e)}
+        return outcomes
+
+    print(f"⚙️ {len(tasks)}개 작업을 {jobs}개 프로세스로 실행합니다.")
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(_run_captured, func, args, key): key for key, args in tasks}
+        for done, future in enumerate(as_completed(futures), start=1):
+            key = futures[future]
+            try:
+                result, log, error, stages = future.result()
+            except Exception as e:
+                # 작업 프로세스 비정상 종료, pickle 실패 등
+                result, log, error, stages = None, '', f"{type(e).__name__}: {e}", []
+            merge_stages(stages)
+
+            print(f"\n{'-'*80}")
+            print(f"📜 [{done}/{len(tasks)}] {_format_key(key)} 작업 로그")
+            print(f"{'-'*80}")
+            print(log, end='' if log.endswith('\n') or not log else '\n')
+            if error:
+                print(f"❌ {_format_key(key)} 작업 실패:\n{error.rstrip()}")
+            else:
+                print(f"✅ {_format_key(key)} 작업 완료")
+            outcomes[key] = {'result': result, 'error': error}
+
+    return {key: outcomes[key] for key, _ in tasks}
+
+
+def _format_key(key):
+    """작업 key를 로그용 문자열로 변환합니다. (튜플은 ' / '로 연결)"""
+    if isinstance(key, tuple):
+        return ' / '.join(str(part) for part in key)
+    return str(key)
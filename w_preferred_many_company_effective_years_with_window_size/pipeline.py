@@ -0,0 +1,502 @@
+# -*- coding: utf-8 -*-
+"""
+전체 분석 파이프라인 실행기 (make / make run-full-pipeline-all / run-full-pipeline-company)
+
+Makefile에서 단계마다 `uv run python ...` 프로세스를 따로 실행하면 단계마다 pandas/matplotlib/
+seaborn/yfinance를 다시 import하고 폰트 설정을 반복하며 같은 분석 데이터 파일을 다시 읽습니다.
+이 모듈은 모든 단계를 한 프로세스에서 의존 관계(DAG) 순서로 실행합니다.
+
+- 단계 사이의 분석 데이터는 메모리로 전달합니다. (analysis_storage.shared_frame_cache)
+- 입력(분석 데이터 파일 내용, 회사 목록, 실행 옵션, 단계 모듈 소스)이 지난 실행과 같고
+  출력(리포트/차트/데이터 파일)이 모두 남아 있는 단계는 건너뜁니다.
+  단계별 입력 지문은 .pipeline_state.json에 저장됩니다.
+- 이전 단계가 실패하면 그 단계에 의존하는 단계만 건너뛰고 나머지 단계는 계속 실행합니다.
+- 일부 회사/기간만 실패한 단계는 지문을 남기지 않으므로 다음 실행에서 다시 실행합니다.
+  (의존하는 단계는 성공한 회사의 데이터로 계속 실행)
+- 단계별 실행 시간을 출력합니다.
+
+단계:
+    stock_data          데이터 생성 (stock_diff.py)
+    analyze_ratio       회사별 상세 분석 (analyze_ratio.py)           ← stock_data
+    dividend_compare    배당률 비교 (stock_diff.py --dividend-compare)
+    backtest            백테스팅 (backtest_strategy_with_report.py)  ← stock_data
+    analyze_all         회사 비교 분석 (analyze_all_companies.py)    ← stock_data
+    comprehensive_report 종합 비교 리포트 (comprehensive_company_comparison_report.py) ← stock_data
+
+사용법:
+    python pipeline.py                          # 모든 회사
+    python pipeline.py --company 삼성전자         # 특정 회사 (회사 비교 단계는 모든 회사)
+    python pipeline.py --jobs 4                 # 회사/기간 단위 병렬 실행 (parallel_runner)
+    python pipeline.py --force                  # 입력이 같아도 모든 단계 실행
+    python pipeline.py --stages backtest analyze_all   # 지정한 단계만 실행
+"""
+
+import hashlib
+import json
+import os
+import time
+import traceback
+from datetime import date, datetime
+
+from analysis_storage import find_analysis_data_path, shared_frame_cache
+from companies import PREFERRED_STOCK_COMPANIES
+from companies import get_registry_path
+from instrumentation import add_instrumentation_arguments, stage as timing_stage, start_from_args
+from render_profile import RENDER_PROFILES, get_render_profile, saved_chart_paths, set_render_profile
+
+PIPELINE_STATE_FILE = '.pipeline_state.json'
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+PERIODS = ['3년', '5년', '10년', '20년', '30년']
+COMPARISON_PERIOD = '20년'  # analyze_all_companies / 종합 비교 리포트가 사용하는 기간
+
+STATUS_RUN = '실행'
+STATUS_SKIPPED = '건너뜀 (입력 변경 없음)'
+STATUS_FAILED = '실패'
+STATUS_INCOMPLETE = '일부 실패 (다음 실행에서 다시 실행)'
+STATUS_BLOCKED = '건너뜀 (이전 단계 실패)'
+
+
+class StageIncomplete(Exception):
+    """단계는 끝났지만 일부 회사/기간이 실패한 경우 (지문을 저장하지 않고 의존 단계는 계속 실행)"""
+
+    def __init__(self, failures):
+        self.failures = list(failures)
+        super().__init__(f"실패한 작업 {len(self.failures)}개: "
+                         f"{', '.join(' '.join(map(str, item)) for item in self.failures)}")
+
+
+class PipelineStage:
+    """
+    파이프라인 단계 정의
+
+    Args:
+        name (str): 단계 이름 (--stages에서 사용)
+        title (str): 출력용 제목
+        run (callable): run(options) 실행 함수
+        deps (tuple): 먼저 실행되어야 하는 단계 이름
+        inputs (callable): inputs(options) → 입력 지문에 포함할 (파일 경로 목록, 추가 값 dict)
+        outputs (callable, optional): outputs(options) → 건너뛰려면 존재해야 하는 파일 경로 목록
+        sources (tuple): 입력 지문에 포함할 단계 모듈 소스 파일 (SOURCE_DIR 기준, 코드가 바뀌면 다시 실행)
+    """
+
+    def __init__(self, name, title, run, deps=(), inputs=None, outputs=None, sources=()):
+        self.name = name
+        self.title = title
+        self.run = run
+        self.deps = tuple(deps)
+        self.inputs = inputs
+        self.outputs = outputs
+        self.sources = tuple(sources)
+
+
+# ----------------------------------------------------------------------
+# 단계 실행 함수 (기존 스크립트의 진입 함수를 그대로 호출)
+# 진입 함수는 회사/기간별 오류를 출력만 하고 계속하므로, 실패한 작업이 있으면 StageIncomplete를 발생
+# ----------------------------------------------------------------------
+def _companies(options):
+    """분석 대상 회사 목록 (--company가 없으면 모든 회사)"""
+    if options.get('company'):
+        return [options['company']]
+    return list(PREFERRED_STOCK_COMPANIES.keys())
+
+
+def _all_companies(options):
+    """회사 비교 단계용 전체 회사 목록 (--company와 관계없이 모든 회사)"""
+    return list(PREFERRED_STOCK_COMPANIES.keys())
+
+
+def _raise_if_failed(failures):
+    if failures:
+        raise StageIncomplete(failures)
+
+
+def _run_stock_data(options):
+    from price_diff_analysis import generate_data_for_all_companies, generate_stock_data_for_periods
+    if options.get('company'):
+        all_results = {options['company']: generate_stock_data_for_periods(
+            options['company'], options.get('storage_format'), options.get('export_json', False))}
+    else:
+        all_results = generate_data_for_all_companies(options.get('storage_format'), options.get('export_json', False),
+                                                      jobs=options.get('jobs', 1))
+    _raise_if_failed([(company_name, period) for company_name in _companies(options) for period in PERIODS
+                      if period not in (all_results.get(company_name) or {})])
+    return all_results
+
+
+def _run_analyze_ratio(options):
+    import analyze_ratio
+    if options.get('company'):
+        failures = analyze_ratio.analyze_company_all_periods(options['company'], jobs=options.get('jobs', 1))
+    else:
+        failures = analyze_ratio.analyze_all_companies(jobs=options.get('jobs', 1))
+    _raise_if_failed(failures)
+
+
+def _run_dividend_compare(options):
+    from price_diff_analysis import compare_all_companies_dividend_yields, compare_dividend_yields
+    if options.get('company'):
+        result = compare_dividend_yields(options['company'])
+        _raise_if_failed([] if result else [(options['company'], '배당률 비교')])
+        return result
+    all_results = compare_all_companies_dividend_yields(jobs=options.get('jobs', 1))
+    _raise_if_failed([(company_name, '배당률 비교') for company_name in _companies(options)
+                      if company_name not in all_results])
+    return all_results
+
+
+def _run_backtest(options):
+    from backtest_strategy_with_report import run_all_companies_backtest, run_comprehensive_backtest
+    if options.get('company'):
+        failures = run_comprehensive_backtest(options['company'], jobs=options.get('jobs', 1))
+    else:
+        failures = run_all_companies_backtest(jobs=options.get('jobs', 1))
+    _raise_if_failed(failures)
+
+
+def _missing_comparison_data(options):
+    # 회사 비교 리포트는 데이터 파일이 없는 회사를 빼고 만들어지므로 빠진 회사가 있으면 다시 실행
+    return [(company_name, COMPARISON_PERIOD) for company_name in _all_companies(options)
+            if not os.path.exists(find_analysis_data_path(company_name, COMPARISON_PERIOD))]
+
+
+def _run_analyze_all(options):
+    from analyze_all_companies import generate_company_comparison_report
+    generate_company_comparison_report()
+    _raise_if_failed(_missing_comparison_data(options))
+
+
+def _run_comprehensive_report(options):
+    from comprehensive_company_comparison_report import generate_markdown_report
+    report_filename = generate_markdown_report()
+    _raise_if_failed(_missing_comparison_data(options))
+    return report_filename
+
+
+# ----------------------------------------------------------------------
+# 단계별 입력/출력
+# ----------------------------------------------------------------------
+def _company_data_files(options):
+    return [find_analysis_data_path(company_name, period) for company_name in _companies(options) for period in PERIODS]
+
+
+def _comparison_data_files(options):
+    return [find_analysis_data_path(company_name, COMPARISON_PERIOD) for company_name in _all_companies(options)]
+
+
+def _stock_data_outputs(options):
+    paths = _company_data_files(options)
+    if not options.get('company'):
+        paths.append('./dividend_summary_report.md')
+    return paths
+
+
+def _analyze_ratio_outputs(options):
+    from analyze_ratio import company_chart_paths
+    return [path for company_name in _companies(options) for path in company_chart_paths(company_name, PERIODS)]
+
+
+def _dividend_compare_outputs(options):
+    # 회사를 지정하면 결과를 출력만 하고 파일은 만들지 않음
+    return [] if options.get('company') else ['./dividend_yield_comparison_report.md']
+
+
+def _backtest_outputs(options):
+    from backtest_strategy_with_report import backtest_output_paths
+    return [path for company_name in _companies(options) for path in backtest_output_paths(company_name)]
+
+
+def _analyze_all_outputs(options):
+    import analyze_all_companies
+    return [analyze_all_companies.REPORT_FILE] + saved_chart_paths(analyze_all_companies.CHART_FILES)
+
+
+def _comprehensive_report_outputs(options):
+    import comprehensive_company_comparison_report as report
+    return [report.REPORT_FILE] + saved_chart_paths(report.CHART_FILES)
+
+
+def _market_data_inputs(options):
+    # 시장 데이터(yfinance)는 날짜 기준으로 하루에 한 번 다시 실행 (배당금 레지스트리가 바뀌어도 다시 실행)
+    return [get_registry_path()], {'date': date.today().isoformat(), 'companies': _companies(options),
+                'storage_format': options.get('storage_format'), 'export_json': options.get('export_json', False)}
+
+
+def _chart_inputs(**extra):
+    # 차트 프로파일이 바뀌면 (예: draft -> report) 차트를 만드는 단계는 다시 실행
+    return dict(extra, render_profile=get_render_profile())
+
+
+PIPELINE_STAGES = [
+    PipelineStage('stock_data', '🚀 데이터 생성', _run_stock_data,
+                  inputs=_market_data_inputs,
+                  outputs=_stock_data_outputs,
+                  sources=['price_diff_analysis.py', 'incremental_update.py', 'rolling_quantile.py',
+                           'derived_columns.py', 'dividend_data.py', 'analysis_storage.py', 'market_data_cache.py']),
+    PipelineStage('analyze_ratio', '📊 상세 분석', _run_analyze_ratio, deps=['stock_data'],
+                  inputs=lambda options: (_company_data_files(options), _chart_inputs(companies=_companies(options))),
+                  outputs=_analyze_ratio_outputs,
+                  sources=['analyze_ratio.py']),
+    PipelineStage('dividend_compare', '💰 배당률 비교 분석', _run_dividend_compare,
+                  inputs=lambda options: ([get_registry_path()],
+                                          {'date': date.today().isoformat(), 'companies': _companies(options)}),
+                  outputs=_dividend_compare_outputs,
+                  sources=['price_diff_analysis.py', 'dividend_data.py']),
+    PipelineStage('backtest', '🎮 백테스팅', _run_backtest, deps=['stock_data'],
+                  inputs=lambda options: (_company_data_files(options), _chart_inputs(companies=_companies(options))),
+                  outputs=_backtest_outputs,
+                  sources=['backtest_strategy_with_report.py', 'backtest_kernel.py', 'trade_log.py',
+                           'report_writer.py']),
+    PipelineStage('analyze_all', '🌐 회사 비교 분석', _run_analyze_all, deps=['stock_data'],
+                  inputs=lambda options: (_comparison_data_files(options), _chart_inputs()),
+                  outputs=_analyze_all_outputs,
+                  sources=['analyze_all_companies.py']),
+    PipelineStage('comprehensive_report', '📋 종합 비교 리포트', _run_comprehensive_report, deps=['stock_data'],
+                  inputs=lambda options: (_comparison_data_files(options), _chart_inputs()),
+                  outputs=_comprehensive_report_outputs,
+                  sources=['comprehensive_company_comparison_report.py']),
+]
+
+
+# ----------------------------------------------------------------------
+# 입력 지문 / 상태 파일
+# ----------------------------------------------------------------------
+def _file_digest(path):
+    """파일 내용의 SHA-256 (파일이 없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stage_fingerprint(stage, options):
+    """
+    단계 입력의 지문을 계산합니다. (입력 파일 내용 + 추가 값 + 단계 모듈 소스 내용)
+
+    수정 시각이 아니라 내용으로 비교하므로, 이전 단계가 다시 실행되어도
+    같은 데이터를 저장했다면 다음 단계는 건너뜁니다.
+
+    Args:
+        stage (PipelineStage): 단계
+        options (dict): 파이프라인 옵션
+
+    Returns:
+        str: 입력 지문 (SHA-256)
+    """
+    paths, extra = stage.inputs(options) if stage.inputs else ([], {})
+    payload = {
+        'stage': stage.name,
+        'files': {os.path.basename(path): _file_digest(path) for path in paths},
+        'extra': extra,
+        'sources': {name: _file_digest(os.path.join(SOURCE_DIR, name)) for name in stage.sources},
+    }
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def load_pipeline_state(path=PIPELINE_STATE_FILE):
+    """지난 실행의 단계별 상태를 로드합니다. (없거나 손상되면 빈 dict)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_pipeline_state(state, path=PIPELINE_STATE_FILE):
+    """단계별 상태를 저장합니다. (임시 파일에 쓴 뒤 교체)"""
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+
+# ----------------------------------------------------------------------
+# 실행
+# ----------------------------------------------------------------------
+def select_stages(names=None, stages=None):
+    """
+    실행할 단계를 선언 순서(의존 관계 순서)대로 선택합니다.
+
+    Args:
+        names (list, optional): 단계 이름 목록 (기본값: 모든 단계)
+        stages (list, optional): 단계 정의 목록 (기본값: PIPELINE_STAGES)
+
+    Returns:
+        list: PipelineStage 목록
+
+    Raises:
+        ValueError: 알 수 없는 단계 이름
+    """
+    stages = PIPELINE_STAGES if stages is None else stages
+    if not names:
+        return list(stages)
+    known = {stage.name for stage in stages}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"알 수 없는 단계입니다: {', '.join(unknown)} (사용 가능: {', '.join(known)})")
+    return [stage for stage in stages if stage.name in names]
+
+
+def run_pipeline(options=None, stage_names=None, force=False, state_path=PIPELINE_STATE_FILE, stages=None):
+    """
+    파이프라인 단계를 한 프로세스에서 순서대로 실행합니다.
+
+    Args:
+        options (dict, optional): company, jobs, storage_format, export_json
+        stage_names (list, optional): 실행할 단계 이름 (기본값: 모든 단계)
+        force (bool): True면 입력이 같아도 모든 단계 실행
+        state_path (str): 단계별 입력 지문을 저장할 파일
+        stages (list, optional): 단계 정의 목록 (기본값: PIPELINE_STAGES)
+
+    Returns:
+        list: 단계별 실행 결과 [{'stage', 'status', 'seconds'}]
+    """
+    options = dict(options or {})
+    selected = select_stages(stage_names, stages)
+    state = load_pipeline_state(state_path)
+    # 같은 입력이라도 --company 실행과 전체 실행의 결과는 다르므로 따로 기록
+    scope = options.get('company') or '*'
+    scope_state = state.setdefault(scope, {})
+
+    summary = []
+    failed = set()
+    pipeline_started = time.perf_counter()
+
+    with shared_frame_cache():
+        for stage in selected:
+            print(f"\n{'='*80}")
+            print(f"{stage.title} ({stage.name})")
+            print(f"{'='*80}")
+
+            blocked_by = [dep for dep in stage.deps if dep in failed]
+            if blocked_by:
+                print(f"⏭️ 이전 단계 실패로 건너뜁니다: {', '.join(blocked_by)}")
+                failed.add(stage.name)
+                summary.append({'stage': stage.name, 'status': STATUS_BLOCKED, 'seconds': 0.0})
+                continue
+
+            started = time.perf_counter()
+            fingerprint = stage_fingerprint(stage, options)
+            previous = scope_state.get(stage.name, {})
+            missing_outputs = [path for path in (stage.outputs(options) if stage.outputs else [])
+                               if not os.path.exists(path)]
+
+            if not force and previous.get('fingerprint') == fingerprint and not missing_outputs:
+                print(f"⏭️ 입력이 바뀌지 않아 건너뜁니다. (마지막 실행: {previous.get('completed_at')})")
+                summary.append({'stage': stage.name, 'status': STATUS_SKIPPED,
+                                'seconds': time.perf_counter() - started})
+                continue
+
+            try:
+                with timing_stage(f"pipeline: {stage.name}"):
+                    stage.run(options)
+            except StageIncomplete as e:
+                # 성공한 회사/기간의 결과는 남아 있으므로 의존 단계는 계속 실행하고, 이 단계는 다음 실행에서 다시 실행
+                print(f"⚠️ {stage.name} 단계 일부 실패 - {e}")
+                _forget_stage(state, scope_state, stage, state_path)
+                summary.append({'stage': stage.name, 'status': STATUS_INCOMPLETE,
+                                'seconds': time.perf_counter() - started})
+                continue
+            except Exception:
+                print(f"❌ {stage.name} 단계 실패:\n{traceback.format_exc().rstrip()}")
+                _forget_stage(state, scope_state, stage, state_path)
+                failed.add(stage.name)
+                summary.append({'stage': stage.name, 'status': STATUS_FAILED,
+                                'seconds': time.perf_counter() - started})
+                continue
+
+            seconds = time.perf_counter() - started
+            print(f"\n⏱️ {stage.name} 완료: {seconds:.1f}초")
+            scope_state[stage.name] = {
+                # 실행 후 입력 지문 (실행 중 입력 파일이 바뀐 경우 다음 실행에서 다시 확인)
+                'fingerprint': stage_fingerprint(stage, options),
+                'completed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'seconds': round(seconds, 3),
+            }
+            save_pipeline_state(state, state_path)
+            summary.append({'stage': stage.name, 'status': STATUS_RUN, 'seconds': seconds})
+
+    print_pipeline_summary(summary, time.perf_counter() - pipeline_started)
+    return summary
+
+
+def _forget_stage(state, scope_state, stage, state_path):
+    """실패한 단계의 지난 지문을 지웁니다. (입력이 원래대로 돌아와도 다음 실행에서 건너뛰지 않도록)"""
+    if scope_state.pop(stage.name, None) is not None:
+        save_pipeline_state(state, state_path)
+
+
+def print_pipeline_summary(summary, total_seconds):
+    """단계별 상태와 실행 시간을 표로 출력합니다."""
+    print(f"\n{'='*80}")
+    print("=== 파이프라인 단계별 실행 시간 ===")
+    print(f"{'='*80}")
+    print(f"{'단계':<22} {'시간(초)':>10}  상태")
+    print("-" * 60)
+    for item in summary:
+        print(f"{item['stage']:<22} {item['seconds']:>10.2f}  {item['status']}")
+    print("-" * 60)
+    print(f"{'전체':<22} {total_seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='우선주 분석 전체 파이프라인 (한 프로세스에서 단계별 실행)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+단계: {', '.join(stage.name for stage in PIPELINE_STAGES)}
+
+사용 예시:
+  python pipeline.py                              # 모든 회사 전체 파이프라인
+  python pipeline.py --company 삼성전자             # 특정 회사 (회사 비교 단계는 모든 회사)
+  python pipeline.py --jobs 4                     # 회사/기간 단위 병렬 실행
+  python pipeline.py --force                      # 입력 변경과 관계없이 모든 단계 실행
+  python pipeline.py --stages backtest analyze_all
+        """)
+    parser.add_argument('--company', '-c', type=str, help='분석할 회사명 (지정하지 않으면 모든 회사)')
+    parser.add_argument('--stages', '-s', nargs='+', help='실행할 단계 (기본값: 모든 단계)')
+    parser.add_argument('--force', '-f', action='store_true', help='입력이 바뀌지 않았어도 모든 단계 실행')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='회사/기간 단위 작업에 사용할 프로세스 수 (기본값: 1, 0이면 CPU 코어 수)')
+    parser.add_argument('--offline', action='store_true', help='네트워크 없이 로컬 시장 데이터 캐시만 사용')
+    parser.add_argument('--format', type=str, choices=['parquet', 'feather', 'json'],
+                        help='기간별 데이터 저장 형식 (기본값: parquet)')
+    parser.add_argument('--export-json', action='store_true', help='기존 형식의 JSON 파일도 함께 저장')
+    parser.add_argument('--render-profile', type=str, choices=list(RENDER_PROFILES),
+                        help='차트 저장 프로파일 (report: 300 DPI PNG, draft: 저해상도 PNG, svg, none: 저장 안 함)')
+    add_instrumentation_arguments(parser)
+
+    args = parser.parse_args()
+    start_from_args(args)
+
+    if args.render_profile:
+        set_render_profile(args.render_profile)
+
+    if args.company:
+        if args.company not in PREFERRED_STOCK_COMPANIES:
+            print(f"❌ 지원되지 않는 회사입니다: {args.company}")
+            print(f"지원되는 회사: {list(PREFERRED_STOCK_COMPANIES.keys())}")
+            raise SystemExit(1)
+
+    try:
+        select_stages(args.stages)
+    except ValueError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+
+    if args.offline:
+        from market_data_cache import set_offline
+        set_offline(True)
+
+    summary = run_pipeline({
+        'company': args.company,
+        'jobs': args.jobs,
+        'storage_format': args.format,
+        'export_json': args.export_json,
+    }, stage_names=args.stages, force=args.force)
+    if any(item['status'] in (STATUS_FAILED, STATUS_INCOMPLETE) for item in summary):
+        raise SystemExit(1)
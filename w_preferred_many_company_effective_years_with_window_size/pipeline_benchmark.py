@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+stock_diff → 백테스트 → 리포트 파이프라인 단계별 성능 벤치마크 (합성 장기 데이터, 오프라인)
+
+5년/30년/100년 길이의 합성 보통주/우선주 가격과 분기 배당금을 만들어 다음 단계를 측정합니다.
+- stock_diff              : get_stock_data_with_diff_and_dividends (yfinance 대신 합성 데이터 fetcher, 캐시 적중 상태)
+- rolling_quantiles       : calculate_rolling_quantiles (2년/3년/5년 윈도우 25%/75% 분위수)
+- single_strategy         : run_single_strategy (기본전략_2년)
+- comprehensive_backtest  : run_comprehensive_backtest (모든 기간, 차트 저장 생략)
+- reports                 : 기간별 분석/종합 비교/종합 요약 리포트 생성
+
+네트워크는 사용하지 않으며 데이터/캐시/리포트 파일은 임시 디렉터리에 만들고 끝나면 지웁니다.
+측정값은 반복 실행 중 최솟값을 사용합니다.
+
+결과를 .pipeline_benchmark.json에 저장해 두면 다음 실행(다른 커밋)에서 이전 결과와 비교하여
+허용 비율 이상 느려진 단계를 표시합니다. (--check를 주면 이때 종료 코드 1)
+
+사용법:
+    python pipeline_benchmark.py                         # 측정 후 이전 결과와 비교
+    python pipeline_benchmark.py --save                  # 측정 결과를 기준값으로 저장
+    python pipeline_benchmark.py --check                 # 기준값보다 느려진 단계가 있으면 실패
+    python pipeline_benchmark.py --years 5 30 --stages stock_diff rolling_quantiles --repeats 5
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+import market_data_cache
+from analysis_storage import save_analysis_data
+from backtest_strategy_with_report import BACKTEST_PERIODS, run_comprehensive_backtest, run_single_strategy
+from companies import PREFERRED_STOCK_COMPANIES
+from market_data_cache import MarketDataCache
+from render_profile import RENDER_PROFILE_ENV
+from report_benchmark import INITIAL_CAPITAL, TRADING_DAYS_PER_YEAR, build_period_result, write_company_reports
+from rolling_quantile import DEFAULT_WINDOW_CONFIGS, calculate_rolling_quantiles
+from price_diff_analysis import get_stock_data_with_diff_and_dividends
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULT_PATH = os.path.join(SCRIPT_DIR, '.pipeline_benchmark.json')
+DEFAULT_YEARS = (5, 30, 100)
+DEFAULT_REPEATS = 3
+DEFAULT_TOLERANCE = 0.2  # 기준값보다 20% 이상 느려지면 회귀로 표시
+BENCHMARK_COMPANY = '삼성전자'
+END_DATE = '2025-01-01'  # 합성 데이터 마지막 날 다음날 (결과가 실행 날짜에 따라 바뀌지 않도록 고정)
+
+STAGES = ('stock_diff', 'rolling_quantiles', 'single_strategy', 'comprehensive_backtest', 'reports')
+
+
+def make_price_history(years, seed=0):
+    """
+    yf.download(group_by='column')와 같은 형태의 합성 보통주/우선주 가격과 분기 배당금을 만듭니다.
+
+    Args:
+        years (int): 데이터 기간 (년, 1년 = 252 거래일)
+        seed (int): 난수 시드
+
+    Returns:
+        tuple: (가격 DataFrame ((Price, Ticker) 컬럼), 배당금 pd.Series (우선주 주당 배당금))
+    """
+    company_info = PREFERRED_STOCK_COMPANIES[BENCHMARK_COMPANY]
+    rows = years * TRADING_DAYS_PER_YEAR
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=pd.Timestamp(END_DATE) - pd.Timedelta(days=1), periods=rows, name='Date')
+    common_close = 50000 * np.exp(np.cumsum(rng.normal(0, 0.015, rows)))
+    preferred_close = common_close * (0.8 + 0.05 * np.sin(np.arange(rows) / 40) + rng.normal(0, 0.01, rows))
+
+    fields = {}
+    for ticker, close in ((company_info['common'], common_close), (company_info['preferred'], preferred_close)):
+        open_price = close * (1 + rng.normal(0, 0.005, rows))
+        fields[('Open', ticker)] = np.round(open_price)
+        fields[('High', ticker)] = np.round(np.maximum(open_price, close) * 1.01)
+        fields[('Low', ticker)] = np.round(np.minimum(open_price, close) * 0.99)
+        fields[('Close', ticker)] = np.round(close)
+        fields[('Volume', ticker)] = rng.integers(100_000, 1_000_000, rows).astype(float)
+    prices = pd.DataFrame(fields, index=dates)
+    prices.columns = pd.MultiIndex.from_tuples(prices.columns, names=['Price', 'Ticker'])
+
+    dividend_days = dates[30::63]
+    dividends = pd.Series(361.0, index=dividend_days, name='Dividend')
+    return prices, dividends
+
+
+class SyntheticFetcher:
+    """MarketDataCache의 yfinance fetcher 대신 합성 가격을 돌려주는 fetcher (네트워크 없음)"""
+
+    def __init__(self, prices):
+        self.prices = prices
+
+    def download(self, ticker, start_date, end_date):
+        return self.download_many([ticker], start_date, end_date)
+
+    def download_many(self, tickers, start_date, end_date):
+        rows = (self.prices.index >= pd.Timestamp(start_date)) & (self.prices.index < pd.Timestamp(end_date))
+        columns = self.prices.columns.get_level_values('Ticker').isin(tickers)
+        return self.prices.loc[rows, columns]
+
+    def dividends(self, ticker):
+        return pd.Series(dtype=float)
+
+    def info(self, ticker):
+        return {}
+
+    def history(self, ticker, period):
+        return pd.DataFrame()
+
+
+def _best_of(func, repeats):
+    """func를 반복 실행하여 최소 실행 시간(초)과 마지막 반환값을 반환합니다. (출력 숨김)"""
+    best, result = None, None
+    for _ in range(max(1, repeats)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = func()
+            seconds = time.perf_counter() - started
+        if best is None or seconds < best:
+            best = seconds
+    return best, result
+
+
+def _period_frames(df):
+    """분석 데이터를 백테스트 기간별로 자릅니다. (데이터가 기간보다 짧으면 전체 사용)"""
+    return {period: df.iloc[-int(period.rstrip('년')) * TRADING_DAYS_PER_YEAR:] for period in BACKTEST_PERIODS}
+
+
+def benchmark_horizon(years, stages=STAGES, repeats=DEFAULT_REPEATS, seed=0):
+    """
+    한 데이터 길이에 대해 파이프라인 단계별 실행 시간을 측정합니다.
+
+    현재 디렉터리에 분석 데이터/리포트 파일을 만들므로 임시 디렉터리에서 호출합니다. (run_benchmark)
+
+    Args:
+        years (int): 합성 데이터 기간 (년)
+        stages (tuple): 측정할 단계 (STAGES 중)
+        repeats (int): 단계별 반복 측정 횟수
+        seed (int): 난수 시드
+
+    Returns:
+        list: 단계별 측정 결과 {'stage', 'years', 'rows', 'seconds'}
+    """
+    company_info = PREFERRED_STOCK_COMPANIES[BENCHMARK_COMPANY]
+    prices, dividends = make_price_history(years, seed)
+    start_date = prices.index[0].strftime('%Y-%m-%d')
+    cache = MarketDataCache(cache_dir=os.path.abspath('.market_data_cache'), offline=False,
+                            fetcher=SyntheticFetcher(prices))
+
+    def stock_diff():
+        return get_stock_data_with_diff_and_dividends(company_info['common'], company_info['preferred'],
+                                                      start_date, END_DATE, external_dividends=dividends)
+
+    # 분석 데이터는 다른 단계의 입력이므로 측정하지 않는 단계가 있어도 한 번 만듦 (가격 캐시도 채워짐)
+    with patch.object(market_data_cache, '_default_cache', cache), contextlib.redirect_stdout(io.StringIO()):
+        df = stock_diff()
+    if df.empty:
+        raise RuntimeError(f"{years}년 합성 데이터로 분석 데이터를 만들지 못했습니다.")
+
+    df_backtest = df.iloc[1:]
+    initial_shares = int(INITIAL_CAPITAL / df.iloc[0]['Stock1_Open'])
+    initial_value = initial_shares * df.iloc[0]['Stock1_Open']
+    period_frames = _period_frames(df)
+
+    def rolling_quantiles():
+        return calculate_rolling_quantiles(df['Price_Diff_Ratio'].to_numpy(dtype=float), DEFAULT_WINDOW_CONFIGS)
+
+    def single_strategy():
+        return run_single_strategy(df_backtest, f"{BENCHMARK_COMPANY} 보통주", initial_shares, initial_value,
+                                   BENCHMARK_COMPANY, False, '기본전략_2년', '2year')
+
+    def comprehensive_backtest():
+        return run_comprehensive_backtest(BENCHMARK_COMPANY, jobs=1)
+
+    def reports():
+        return sum(write_company_reports(BENCHMARK_COMPANY, all_results).values())
+
+    if 'comprehensive_backtest' in stages:
+        for period, frame in period_frames.items():
+            save_analysis_data(frame, BENCHMARK_COMPANY, period)
+    if 'reports' in stages:
+        with contextlib.redirect_stdout(io.StringIO()):
+            all_results = {period: build_period_result(BENCHMARK_COMPANY, frame)
+                           for period, frame in period_frames.items()}
+
+    stage_functions = {
+        'stock_diff': stock_diff,
+        'rolling_quantiles': rolling_quantiles,
+        'single_strategy': single_strategy,
+        'comprehensive_backtest': comprehensive_backtest,
+        'reports': reports,
+    }
+    results = []
+    with patch.object(market_data_cache, '_default_cache', cache), \
+            patch.dict(os.environ, {RENDER_PROFILE_ENV: 'none'}):
+        for stage in stages:
+            seconds, _ = _best_of(stage_functions[stage], repeats)
+            results.append({'stage': stage, 'years': years, 'rows': len(df), 'seconds': round(seconds, 4)})
+    return results
+
+
+def run_benchmark(years=DEFAULT_YEARS, stages=STAGES, repeats=DEFAULT_REPEATS):
+    """
+    데이터 길이별로 파이프라인 단계 실행 시간을 측정합니다. (임시 디렉터리에서 실행)
+
+    Args:
+        years (tuple): 측정할 데이터 기간 목록 (년)
+        stages (tuple): 측정할 단계 (STAGES 중)
+        repeats (int): 단계별 반복 측정 횟수
+
+    Returns:
+        list: 단계별 측정 결과
+
+    Raises:
+        ValueError: 알 수 없는 단계가 있는 경우
+    """
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        raise ValueError(f"알 수 없는 단계입니다: {unknown} (사용 가능: {', '.join(STAGES)})")
+
+    directory = tempfile.mkdtemp(prefix='pipeline_benchmark_')
+    previous_directory = os.getcwd()
+    results = []
+    try:
+        os.chdir(directory)
+        for index, horizon in enumerate(years):
+            results.extend(benchmark_horizon(horizon, stages, repeats, seed=index))
+    finally:
+        os.chdir(previous_directory)
+        shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+
+def _benchmark_key(result):
+    return f"{result['stage']}/{result['years']}년"
+
+
+def _current_commit():
+    """현재 git 커밋 (git 저장소가 아니면 None)"""
+    completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPT_DIR,
+                               capture_output=True, text=True, stdin=subprocess.DEVNULL)
+    return completed.stdout.strip() or None
+
+
+def load_results(path=DEFAULT_RESULT_PATH):
+    """
+    저장된 기준 측정 결과를 읽습니다.
+
+    Returns:
+        dict: '단계/기간' -> 측정 결과 (파일이 없으면 빈 딕셔너리)
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+    return {_benchmark_key(result): result for result in saved.get('results', [])}
+
+
+def save_results(results, path=DEFAULT_RESULT_PATH):
+    """측정 결과를 기준값으로 저장합니다. (커밋끼리 비교할 수 있도록 커밋 해시 포함)"""
+    payload = {
+        'measured_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': _current_commit(),
+        'python': sys.version.split()[0],
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+
+def find_regressions(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    기준값보다 허용 비율 이상 느려진 단계를 찾습니다.
+
+    Args:
+        results (list): 현재 측정 결과
+        baseline (dict): '단계/기간' -> 기준 측정 결과
+        tolerance (float): 허용 비율 (0.2 = 20%)
+
+    Returns:
+        list: 회귀 설명 문자열 목록
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(_benchmark_key(result))
+        if previous and result['seconds'] > previous['seconds'] * (1 + tolerance):
+            regressions.append(f"{_benchmark_key(result)}: {previous['seconds']:.3f}s -> {result['seconds']:.3f}s")
+    return regressions
+
+
+def print_results(results, baseline=None):
+    """측정 결과 표를 출력합니다. (기준값이 있으면 변화량도 출력)"""
+    baseline = baseline or {}
+    print(f"{'단계':<26}{'기간':>6}{'행 수':>10}{'시간':>12}{'기준 대비':>12}")
+    print("-" * 70)
+    for result in results:
+        previous = baseline.get(_benchmark_key(result), {}).get('seconds')
+        delta = f"{result['seconds'] - previous:+.3f}s" if previous is not None else '-'
+        print(f"{result['stage']:<26}{result['years']:>5}년{result['rows']:>10,}{result['seconds']:>11.3f}s{delta:>12}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='파이프라인 단계별 성능 벤치마크 (합성 데이터, 오프라인)')
+    parser.add_argument('--years', type=int, nargs='+', default=list(DEFAULT_YEARS),
+                        help='합성 데이터 기간 (년, 기본값: 5 30 100)')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES), help='측정할 단계 (기본값: 전체)')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help=f'반복 측정 횟수 (기본값: {DEFAULT_REPEATS})')
+    parser.add_argument('--results', default=DEFAULT_RESULT_PATH, help='기준 결과 파일 경로')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='회귀로 볼 허용 비율 (기본값: 0.2)')
+    parser.add_argument('--save', action='store_true', help='측정 결과를 기준값으로 저장')
+    parser.add_argument('--check', action='store_true', help='기준값보다 느려진 단계가 있으면 종료 코드 1')
+
+    args = parser.parse_args()
+
+    print(f"⏱️ 파이프라인 단계별 시간 측정: {', '.join(f'{y}년' for y in args.years)} (반복 {args.repeats}회, 최솟값)")
+    results = run_benchmark(args.years, args.stages, repeats=args.repeats)
+    baseline = load_results(args.results)
+    print_results(results, baseline)
+
+    regressions = find_regressions(results, baseline, tolerance=args.tolerance)
+    if regressions:
+        print("\n⚠️ 기준값 대비 회귀:")
+        for regression in regressions:
+            print(f"  - {regression}")
+    elif baseline:
+        print("\n✅ 기준값 대비 회귀 없음")
+
+    if args.save:
+        save_results(results, args.results)
+        print(f"💾 기준 결과 저장: {args.results}")
+
+    if args.check and regressions:
+        sys.exit(1)
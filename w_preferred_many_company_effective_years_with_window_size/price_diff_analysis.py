@@ -0,0 +1,983 @@
+# -*- coding: utf-8 -*-
+"""
+우선주 가격차이 분석 (기간별 데이터 생성, 배당률 비교)
+
+명령행 실행은 stock_diff.py가 담당하고, stock_diff는 이 모듈의 함수를 같은 이름으로 다시 내보냅니다.
+(from stock_diff import generate_stock_data_for_periods 그대로 사용 가능)
+"""
+
+import pandas as pd
+import json
+import os
+from datetime import datetime, timedelta
+from lazy_imports import lazy_pyplot, lazy_seaborn
+from rolling_quantile import DEFAULT_WINDOW_CONFIGS
+from derived_columns import add_price_diff_columns
+from dividend_data import merge_dividend_data, registry_dividends
+from instrumentation import timed
+from incremental_update import (
+    ANALYSIS_COLUMNS, build_window_state, compute_analysis_frame, load_window_state, save_window_state,
+    update_analysis_frame, window_state_matches
+)
+from market_data_cache import company_tickers, get_market_data_cache, wide_prices
+from parallel_runner import run_tasks
+from companies import PREFERRED_STOCK_COMPANIES, print_available_companies
+from analysis_storage import (
+    analysis_data_path, find_analysis_data_path, read_analysis_file, save_analysis_data, window_state_path
+)
+
+# matplotlib/seaborn은 그래프를 처음 그릴 때 import 하고 한글 폰트도 그때 설정 (lazy_imports)
+plt = lazy_pyplot()
+sns = lazy_seaborn(plt)
+
+# 분석 기간별 일수 (3년, 5년, 10년, 20년, 30년)
+ANALYSIS_PERIODS = {
+    '3년': 3*365,
+    '5년': 5*365,
+    '10년': 10*365,
+    '20년': 20*365,
+    '30년': 30*365
+}
+
+def get_available_companies():
+    """
+    분석 가능한 우선주 보유 회사들의 목록을 반환합니다.
+    
+    Returns:
+        dict: 회사명을 키로 하는 회사 정보 딕셔너리
+    """
+    return PREFERRED_STOCK_COMPANIES
+
+def get_yfinance_dividend_data(ticker, start_date=None, end_date=None):
+    """
+    yfinance에서 특정 티커의 배당금 데이터를 가져옵니다.
+    
+    Args:
+        ticker (str): 주식 티커 심볼
+        start_date (str, optional): 시작 날짜 (YYYY-MM-DD)
+        end_date (str, optional): 종료 날짜 (YYYY-MM-DD)
+        
+    Returns:
+        pd.Series: 배당금 시계열 데이터
+    """
+    try:
+        stock = get_market_data_cache().ticker(ticker)
+        
+        if start_date and end_date:
+            dividends = stock.dividends[start_date:end_date]
+        else:
+            # 기본적으로 최근 10년 데이터 가져오기
+            ten_years_ago = (datetime.now() - timedelta(days=10*365)).strftime('%Y-%m-%d')
+            dividends = stock.dividends[ten_years_ago:]
+        
+        if not dividends.empty:
+            print(f"✓ {ticker} yfinance 배당금 데이터: {len(dividends)}개 항목")
+            return dividends
+        else:
+            print(f"○ {ticker} 배당금 데이터 없음")
+            return pd.Series(dtype=float)
+            
+    except Exception as e:
+        print(f"❌ {ticker} 배당금 데이터 수집 실패: {e}")
+        return pd.Series(dtype=float)
+
+def get_company_dividend_data(company_name, start_date=None, end_date=None, stock_type='preferred'):
+    """
+    특정 회사의 배당금 데이터를 반환합니다.
+    외부 데이터와 yfinance 데이터를 자동으로 병합합니다.
+    
+    Args:
+        company_name (str): 회사명
+        start_date (str, optional): 시작 날짜 (YYYY-MM-DD)
+        end_date (str, optional): 종료 날짜 (YYYY-MM-DD)
+        stock_type (str): 'preferred' 또는 'common' (기본값: 'preferred')
+        
+    Returns:
+        pd.Series: 배당금 시계열 데이터
+    """
+    if company_name not in PREFERRED_STOCK_COMPANIES:
+        return pd.Series(dtype=float)
+    
+    company_info = PREFERRED_STOCK_COMPANIES[company_name]
+    
+    if stock_type == 'preferred':
+        ticker = company_info['preferred']
+        print(f"📊 {company_name} 우선주 배당금 데이터 수집 중...")
+    else:  # common
+        ticker = company_info['common']
+        print(f"📈 {company_name} 보통주 배당금 데이터 수집 중...")
+    
+    # 외부 배당금 레지스트리 데이터 처리 (우선주만, 보통주는 yfinance만 사용)
+    external_series = pd.Series(dtype=float)
+    if stock_type == 'preferred':
+        try:
+            external_series = registry_dividends(ticker)
+            if not external_series.empty:
+                print(f"✓ {company_name} {stock_type} 외부 배당금 데이터: {len(external_series)}개 항목")
+        except Exception as e:
+            print(f"❌ {company_name} {stock_type} 외부 배당금 레지스트리 로드 실패: {e}")
+    
+    # yfinance에서 배당금 데이터 가져오기
+    yfinance_dividends = get_yfinance_dividend_data(ticker, start_date, end_date)
+    
+    # 두 데이터 병합
+    merged_dividends = merge_dividend_data(external_series, yfinance_dividends)
+    
+    if not merged_dividends.empty:
+        print(f"✅ {company_name} {stock_type} 최종 배당금 데이터: {len(merged_dividends)}개 항목")
+        return merged_dividends
+    else:
+        print(f"○ {company_name} {stock_type} 배당금 데이터 없음")
+        return pd.Series(dtype=float)
+
+@timed()
+def compare_dividend_yields(company_name, analysis_date=None):
+    """
+    특정 회사의 보통주와 우선주 배당률을 비교합니다.
+    
+    Args:
+        company_name (str): 회사명
+        analysis_date (str, optional): 분석 기준일 (YYYY-MM-DD, 기본값: 오늘)
+        
+    Returns:
+        dict: 배당률 비교 결과
+    """
+    if company_name not in PREFERRED_STOCK_COMPANIES:
+        return None
+    
+    if analysis_date is None:
+        analysis_date = datetime.now().strftime('%Y-%m-%d')
+    
+    company_info = PREFERRED_STOCK_COMPANIES[company_name]
+    common_ticker = company_info['common']
+    preferred_ticker = company_info['preferred']
+    
+    print(f"\n🔍 {company_name} 배당률 비교 분석 ({analysis_date})")
+    print("=" * 60)
+    
+    try:
+        # 두 종목의 정보와 배당금을 동시에 받아 캐시에 저장 (아래 조회는 캐시에서 처리)
+        get_market_data_cache().fetch_snapshots([common_ticker, preferred_ticker])
+        
+        # 현재 주가 정보 가져오기
+        common_stock = get_market_data_cache().ticker(common_ticker)
+        preferred_stock = get_market_data_cache().ticker(preferred_ticker)
+        
+        # 최근 가격 정보
+        common_info = common_stock.info
+        preferred_info = preferred_stock.info
+        
+        common_price = common_info.get('regularMarketPrice', 0)
+        preferred_price = preferred_info.get('regularMarketPrice', 0)
+        
+        if common_price == 0 or preferred_price == 0:
+            # 가격 정보가 없으면 최근 거래일 데이터 사용
+            get_market_data_cache().fetch_snapshots([common_ticker, preferred_ticker], fields=('history',))
+            common_hist = common_stock.history(period='5d')
+            preferred_hist = preferred_stock.history(period='5d')
+            
+            if not common_hist.empty:
+                common_price = common_hist['Close'].iloc[-1]
+            if not preferred_hist.empty:
+                preferred_price = preferred_hist['Close'].iloc[-1]
+        
+        print(f"📈 {company_name} 보통주 ({common_ticker}): {common_price:,.0f}원")
+        print(f"📊 {company_name} 우선주 ({preferred_ticker}): {preferred_price:,.0f}원")
+        
+        # 배당금 데이터 수집 (최근 2년)
+        start_date = (datetime.now() - timedelta(days=730)).strftime('%Y-%m-%d')
+        end_date = datetime.now().strftime('%Y-%m-%d')
+        
+        common_dividends = get_company_dividend_data(company_name, start_date, end_date, 'common')
+        preferred_dividends = get_company_dividend_data(company_name, start_date, end_date, 'preferred')
+        
+        # 최근 1년 배당금 계산
+        one_year_ago = datetime.now() - timedelta(days=365)
+        
+        common_recent_dividends = common_dividends[common_dividends.index >= one_year_ago] if not common_dividends.empty else pd.Series(dtype=float)
+        preferred_recent_dividends = preferred_dividends[preferred_dividends.index >= one_year_ago] if not preferred_dividends.empty else pd.Series(dtype=float)
+        
+        # 연간 배당금 계산
+        common_annual_dividend = common_recent_dividends.sum() if not common_recent_dividends.empty else 0
+        preferred_annual_dividend = preferred_recent_dividends.sum() if not preferred_recent_dividends.empty else 0
+        
+        # 배당률 계산
+        common_yield = (common_annual_dividend / common_price * 100) if common_price > 0 else 0
+        preferred_yield = (preferred_annual_dividend / preferred_price * 100) if preferred_price > 0 else 0
+        
+        # 배당금 비율 계산
+        dividend_ratio = (preferred_annual_dividend / common_annual_dividend) if common_annual_dividend > 0 else 0
+        
+        result = {
+            'company_name': company_name,
+            'analysis_date': analysis_date,
+            'common_stock': {
+                'ticker': common_ticker,
+                'price': common_price,
+                'annual_dividend': common_annual_dividend,
+                'dividend_yield': common_yield,
+                'dividend_count': len(common_recent_dividends)
+            },
+            'preferred_stock': {
+                'ticker': preferred_ticker,
+                'price': preferred_price,
+                'annual_dividend': preferred_annual_dividend,
+                'dividend_yield': preferred_yield,
+                'dividend_count': len(preferred_recent_dividends)
+            },
+            'comparison': {
+                'price_difference': common_price - preferred_price,
+                'price_diff_ratio': ((common_price - preferred_price) / preferred_price * 100) if preferred_price > 0 else 0,
+                'dividend_difference': preferred_annual_dividend - common_annual_dividend,
+                'dividend_ratio_preferred_to_common': dividend_ratio,
+                'yield_difference': preferred_yield - common_yield
+            }
+        }
+        
+        # 결과 출력
+        print(f"\n📊 배당금 및 배당률 비교:")
+        print(f"├─ 보통주 연간배당금: {common_annual_dividend:,.0f}원 (배당률: {common_yield:.3f}%)")
+        print(f"├─ 우선주 연간배당금: {preferred_annual_dividend:,.0f}원 (배당률: {preferred_yield:.3f}%)")
+        print(f"├─ 배당금 차이: {result['comparison']['dividend_difference']:+,.0f}원")
+        print(f"├─ 우선주/보통주 배당금 비율: {dividend_ratio:.2f}배")
+        print(f"└─ 배당률 차이: {result['comparison']['yield_difference']:+.3f}%p")
+        
+        if dividend_ratio > 1:
+            print(f"✅ 우선주가 보통주보다 {dividend_ratio:.2f}배 많은 배당금 지급")
+        elif dividend_ratio < 1 and dividend_ratio > 0:
+            print(f"⚠️ 우선주가 보통주보다 {1/dividend_ratio:.2f}배 적은 배당금 지급")
+        elif common_annual_dividend == 0 and preferred_annual_dividend > 0:
+            print(f"✅ 우선주만 배당금 지급 (보통주는 무배당)")
+        elif preferred_annual_dividend == 0 and common_annual_dividend > 0:
+            print(f"⚠️ 보통주만 배당금 지급 (우선주는 무배당)")
+        else:
+            print(f"○ 두 주식 모두 무배당 또는 데이터 없음")
+        
+        return result
+        
+    except Exception as e:
+        print(f"❌ {company_name} 배당률 비교 분석 실패: {e}")
+        return None
+
+def load_existing_data(json_file_path):
+    """
+    기존 데이터 파일(Parquet/Feather/JSON)에서 데이터를 로드합니다.
+    
+    Args:
+        json_file_path (str): 기존 데이터 파일 경로
+        
+    Returns:
+        tuple: (DataFrame, 마지막 날짜) 또는 (None, None)
+    """
+    try:
+        df = read_analysis_file(json_file_path)
+        
+        if df.empty:
+            return None, None
+        
+        last_date = df.index[-1]
+        print(f"✓ 기존 데이터 로드 완료: {df.index[0].strftime('%Y-%m-%d')} ~ {last_date.strftime('%Y-%m-%d')} ({len(df)}일)")
+        
+        return df, last_date
+        
+    except (FileNotFoundError, json.JSONDecodeError, Exception) as e:
+        print(f"기존 데이터 파일을 찾을 수 없거나 로드할 수 없습니다: {e}")
+        return None, None
+
+@timed()
+def download_price_data(ticker1, ticker2, start_date, end_date, external_dividends=None):
+    """
+    두 주식의 일별 시가/종가와 배당금을 다운로드하여 하나의 DataFrame으로 합칩니다.
+    종가 및 시가가 모두 있는 날짜만 남깁니다.
+
+    Args:
+        ticker1 (str): 첫 번째 주식(보통주)의 티커 심볼
+        ticker2 (str): 두 번째 주식(우선주)의 티커 심볼
+        start_date (str): 데이터 시작 날짜 (YYYY-MM-DD 형식)
+        end_date (str): 데이터 종료 날짜 (YYYY-MM-DD 형식, 미포함)
+        external_dividends (pd.Series, optional): 외부에서 제공된 배당금 데이터
+
+    Returns:
+        pandas.DataFrame: Stock1_Close, Stock2_Close, Stock1_Open, Stock2_Open, Dividend_Amount_Raw 컬럼을 포함하는 DataFrame
+                          (데이터가 없으면 빈 DataFrame)
+    """
+    # 두 티커를 한 번의 요청으로 받고 (캐시에 있으면 요청 없음) 티커별 가격으로 나눔
+    prices = get_market_data_cache().download_many([ticker1, ticker2], start_date, end_date)
+    data1 = wide_prices(prices, ticker1)
+    data2 = wide_prices(prices, ticker2)
+
+    if data1.empty or data2.empty:
+        print("Debug: One or both dataframes are empty after download.")
+        return pd.DataFrame()
+
+    # 종가(Close) 및 시가(Open) 데이터 추출
+    close_prices1 = data1['Close']
+    close_prices2 = data2['Close']
+    open_prices1 = data1['Open']
+    open_prices2 = data2['Open']
+
+    # 배당금 데이터 처리
+    if external_dividends is not None:
+        # 외부 배당금 데이터를 사용 (가격 데이터가 없는 날짜는 아래 dropna에서 제거됨)
+        dividends_to_use = external_dividends
+    else:
+        # yfinance에서 배당금 컬럼이 있다면 사용, 없으면 0으로 채움
+        if 'Dividends' in data2.columns:
+            dividends_to_use = data2['Dividends']
+        else:
+            dividends_to_use = pd.Series(0, index=data2.index, name='Dividends')
+
+    # 모든 데이터를 날짜 기준으로 합치기
+    price_df = pd.concat([
+        close_prices1.rename('Stock1_Close'),
+        close_prices2.rename('Stock2_Close'),
+        open_prices1.rename('Stock1_Open'),
+        open_prices2.rename('Stock2_Open'),
+        dividends_to_use.rename('Dividend_Amount_Raw') # 원본 배당금
+    ], axis=1)
+
+    price_df = price_df.dropna(subset=['Stock1_Close', 'Stock2_Close', 'Stock1_Open', 'Stock2_Open']) # 종가 및 시가 데이터가 있는 날짜만 사용
+    price_df['Dividend_Amount_Raw'] = price_df['Dividend_Amount_Raw'].fillna(0)
+    return price_df
+
+@timed()
+def build_master_price_data(ticker1, ticker2, start_date, end_date, external_dividends=None):
+    """
+    가장 긴 기간에 대한 마스터 가격/배당금 데이터를 한 번만 다운로드하여 생성합니다.
+    행 단위로 결정되는 Price_Difference, Price_Diff_Ratio는 여기서 미리 계산하고,
+    기간에 따라 달라지는 컬럼(Dividend_Amount, 배당 수익률, 사분위수)은 기간별로 다시 계산합니다.
+
+    Args:
+        ticker1 (str): 첫 번째 주식(보통주)의 티커 심볼
+        ticker2 (str): 두 번째 주식(우선주)의 티커 심볼
+        start_date (str): 데이터 시작 날짜 (YYYY-MM-DD 형식)
+        end_date (str): 데이터 종료 날짜 (YYYY-MM-DD 형식, 미포함)
+        external_dividends (pd.Series, optional): 외부에서 제공된 배당금 데이터
+
+    Returns:
+        pandas.DataFrame: 마스터 가격 데이터 (데이터가 없으면 빈 DataFrame)
+    """
+    print(f"📥 마스터 데이터 다운로드: {start_date} ~ {end_date}")
+    master_df = download_price_data(ticker1, ticker2, start_date, end_date, external_dividends)
+    if master_df.empty:
+        return master_df
+
+    add_price_diff_columns(master_df)
+    print(f"✓ 마스터 데이터 생성 완료: {len(master_df)}일")
+    return master_df
+
+def slice_master_price_data(master_df, start_date, end_date):
+    """
+    마스터 데이터에서 [start_date, end_date) 구간을 잘라냅니다. (yf.download와 동일한 구간 규칙)
+
+    Args:
+        master_df (pd.DataFrame): build_master_price_data()로 생성한 마스터 데이터
+        start_date (str): 시작 날짜 (YYYY-MM-DD 형식, 포함)
+        end_date (str): 종료 날짜 (YYYY-MM-DD 형식, 미포함)
+
+    Returns:
+        pandas.DataFrame: 잘라낸 데이터의 복사본
+    """
+    if master_df.empty:
+        return pd.DataFrame()
+    mask = (master_df.index >= pd.Timestamp(start_date)) & (master_df.index < pd.Timestamp(end_date))
+    return master_df[mask].copy()
+
+@timed()
+def get_stock_data_with_diff_and_dividends(ticker1, ticker2, start_date, end_date, external_dividends=None, existing_df=None, master_df=None, window_state=None):
+    """
+    두 주식의 일별 종가 차이, 비율, 배당금 및 배당 수익률을 계산하여 DataFrame으로 반환합니다.
+    외부 배당금 데이터를 사용하여 배당금 정보를 통합할 수 있습니다.
+    또한, Price_Diff_Ratio의 해당 날짜까지의 25% 및 75% 사분위수 값을 계산하여 추가합니다.
+    
+    기존 데이터가 있는 경우 새 데이터와 행 단위로 비교하여 바뀐 행과 그 윈도우만 다시 계산합니다.
+    (incremental_update.update_analysis_frame, 변경이 없으면 existing_df를 그대로 반환)
+    끝에 새 거래일만 추가된 경우에는 저장된 윈도우 상태(window_state)에서 이어서 분위수를 계산합니다.
+    마스터 데이터가 주어지면 다운로드 없이 필요한 구간만 잘라서 사용합니다.
+
+    Args:
+        ticker1 (str): 첫 번째 주식의 티커 심볼 (예: '005930.KS' for 삼성전자)
+        ticker2 (str): 두 번째 주식의 티커 심볼 (예: '005935.KS' for 삼성전자(우))
+        start_date (str): 데이터 시작 날짜 (YYYY-MM-DD 형식)
+        end_date (str): 데이터 종료 날짜 (YYYY-MM-DD 형식)
+        external_dividends (pd.Series, optional): 외부에서 제공된 배당금 데이터 (인덱스는 날짜, 값은 배당금).
+                                                  기본값은 None.
+        existing_df (pd.DataFrame, optional): 기존 데이터프레임 (증분 업데이트용)
+        master_df (pd.DataFrame, optional): build_master_price_data()로 생성한 공유 마스터 데이터
+        window_state (dict, optional): existing_df의 윈도우 상태 (incremental_update.load_window_state()).
+                                       없거나 existing_df와 맞지 않으면 분위수를 전체 다시 계산합니다.
+
+    Returns:
+        pandas.DataFrame: 날짜, 종가 차이, 비율, 배당금, 배당 수익률, Price_Diff_Ratio 사분위수를 포함하는 DataFrame
+    """
+    try:
+        if existing_df is not None and not set(ANALYSIS_COLUMNS).issubset(existing_df.columns):
+            print("⚠️ 기존 데이터에 없는 컬럼이 있어 전체를 다시 계산합니다.")
+            existing_df = None
+
+        if existing_df is not None and not existing_df.empty:
+            # 저장된 첫 날짜부터 다시 받아 행 단위로 비교 (과거 데이터 수정도 감지)
+            print("🔄 증분 업데이트 모드: 기존 데이터와 행 단위 비교")
+            fetch_start_date = existing_df.index[0].strftime('%Y-%m-%d')
+        else:
+            print("🆕 전체 데이터 다운로드 모드")
+            fetch_start_date = start_date
+
+        if master_df is not None:
+            # 공유 마스터 데이터에서 필요한 구간만 사용 (추가 다운로드 없음)
+            new_combined_df = slice_master_price_data(master_df, fetch_start_date, end_date)
+        else:
+            new_combined_df = download_price_data(ticker1, ticker2, fetch_start_date, end_date, external_dividends)
+
+        if existing_df is not None and not existing_df.empty:
+            if not window_state_matches(window_state, existing_df):
+                # 윈도우 상태가 없는 파일은 이전 버전의 증분 계산(3년/5년 컬럼에 2년 값 사용)으로
+                # 저장되었을 수 있으므로 분위수를 한 번 전체 다시 계산
+                print("🧮 윈도우 상태가 없거나 맞지 않아 분위수를 전체 다시 계산합니다.")
+                if new_combined_df.empty:
+                    return existing_df
+                return compute_analysis_frame(new_combined_df, DEFAULT_WINDOW_CONFIGS)
+
+            result_df, summary = update_analysis_frame(existing_df, new_combined_df, DEFAULT_WINDOW_CONFIGS, window_state)
+            if result_df is existing_df:
+                print(f"✓ 변경된 행이 없습니다. 마지막 날짜: {existing_df.index[-1].strftime('%Y-%m-%d')}")
+            else:
+                print(f"✓ 변경 감지: 수정 {summary['changed']}일, 추가 {summary['added']}일, 삭제 {summary['removed']}일 "
+                      f"(최초 변경일: {summary['first_changed'].strftime('%Y-%m-%d')}) "
+                      f"→ 분위수 재계산 {summary['recomputed']}일 / 총 {len(result_df)}일")
+            return result_df
+
+        if new_combined_df.empty:
+            print("Debug: new_combined_df is empty after dropna.")
+            return pd.DataFrame()
+
+        # 해당 날짜 이전 2년, 3년, 5년 데이터를 기준으로 한 Price_Diff_Ratio 25% 및 75% 사분위수 계산
+        # 2년 = 약 730일, 3년 = 약 1095일, 5년 = 약 1825일 (365일 * 년수 + 윤년 고려)
+        return compute_analysis_frame(new_combined_df, DEFAULT_WINDOW_CONFIGS)
+
+    except Exception as e:
+        print(f"데이터를 가져오거나 처리하는 중 오류가 발생했습니다: {e}")
+        return pd.DataFrame()
+
+def _unchanged_output_path(price_data_df, existing_df, company_name, period_name, storage_format, export_json):
+    """
+    증분 갱신 결과가 기존 데이터 그대로이고 요청한 형식의 파일이 이미 있으면 그 경로를 반환합니다.
+
+    Returns:
+        str | None: 다시 쓸 필요가 없는 파일 경로, 저장이 필요하면 None
+    """
+    if existing_df is None or price_data_df is not existing_df:
+        return None
+    output_path = analysis_data_path(company_name, period_name, storage_format)
+    if not os.path.exists(output_path):
+        return None
+    if export_json and not os.path.exists(analysis_data_path(company_name, period_name, 'json')):
+        return None
+    return output_path
+
+def _stored_first_date(company_name, period_name):
+    """
+    저장된 기간별 분석 데이터의 첫 날짜를 반환합니다. (파일이 없거나 읽을 수 없으면 None)
+    """
+    try:
+        stored = read_analysis_file(find_analysis_data_path(company_name, period_name), columns=['Stock1_Close'])
+    except Exception:
+        return None
+    return stored.index[0] if not stored.empty else None
+
+def prefetch_company_prices(company_names=None, end_date=None):
+    """
+    여러 회사의 보통주/우선주 가격을 한 번의 일괄 요청으로 받아 가격 캐시에 저장합니다.
+    
+    generate_stock_data_for_periods()가 회사별로 요청하는 구간(저장된 첫 날짜 또는 30년 전부터)을
+    모두 덮도록 가장 이른 시작일부터 받으므로, 이후 회사별 다운로드는 캐시에서 처리됩니다.
+    
+    Args:
+        company_names (list, optional): 대상 회사명 목록 (기본값: PREFERRED_STOCK_COMPANIES 전체)
+        end_date (str, optional): 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+        
+    Returns:
+        pd.DataFrame: long 형식 가격 데이터 (Date, Ticker, 가격 필드)
+    """
+    today = datetime.now()
+    if company_names is None:
+        company_names = list(PREFERRED_STOCK_COMPANIES.keys())
+    companies = {name: PREFERRED_STOCK_COMPANIES[name] for name in company_names if name in PREFERRED_STOCK_COMPANIES}
+    end_date = end_date or today.strftime('%Y-%m-%d')
+    
+    start_dates = [(today - timedelta(days=max(ANALYSIS_PERIODS.values()))).strftime('%Y-%m-%d')]
+    for company_name in companies:
+        for period_name in ANALYSIS_PERIODS:
+            first_date = _stored_first_date(company_name, period_name)
+            if first_date is not None:
+                start_dates.append(first_date.strftime('%Y-%m-%d'))
+    
+    tickers = company_tickers(companies)
+    print(f"📦 {len(companies)}개 회사 가격 일괄 준비: {len(tickers)}개 티커, {min(start_dates)} ~ {end_date}")
+    return get_market_data_cache().download_many(tickers, min(start_dates), end_date)
+
+@timed()
+def generate_stock_data_for_periods(company_name='삼성전자', storage_format=None, export_json=False):
+    """
+    다양한 기간(3년, 5년, 10년, 20년, 30년)에 대한 주식 데이터를 생성합니다.
+    기존 데이터가 있는 경우 증분 업데이트를 수행합니다.
+    
+    Args:
+        company_name (str): 분석할 회사명 (기본값: '삼성전자')
+        storage_format (str, optional): 저장 형식 ('parquet', 'feather', 'json', 기본값: Parquet)
+        export_json (bool): 기존 형식의 JSON 파일도 함께 저장할지 여부
+    """
+    # 회사 정보 확인
+    if company_name not in PREFERRED_STOCK_COMPANIES:
+        print(f"❌ '{company_name}'는 지원되지 않는 회사입니다.")
+        print_available_companies()
+        return {}
+    
+    company_info = PREFERRED_STOCK_COMPANIES[company_name]
+    common_ticker = company_info['common']
+    preferred_ticker = company_info['preferred']
+    
+    print(f"🏢 분석 대상: {company_name}")
+    print(f"📈 보통주: {common_ticker}")
+    print(f"📊 우선주: {preferred_ticker}")
+    print(f"🏭 업종: {company_info['sector']}")
+    
+    # 다양한 기간 설정 (3년, 5년, 10년, 20년, 30년)
+    today = datetime.now()
+    periods = ANALYSIS_PERIODS
+    
+    # 전체 기간에 대한 배당금 데이터 준비 (가장 긴 기간인 30년 기준)
+    max_days = max(periods.values())
+    dividend_start_date = (today - timedelta(days=max_days)).strftime('%Y-%m-%d')
+    dividend_end_date = today.strftime('%Y-%m-%d')
+    
+    external_dividends_series = get_company_dividend_data(company_name, dividend_start_date, dividend_end_date)
+    if not external_dividends_series.empty:
+        print(f"✅ 배당금 데이터 수집 완료: {len(external_dividends_series)}개 항목")
+        # 수집된 배당금 데이터를 JSON 파일로 자동 저장
+        save_updated_dividend_data(company_name, external_dividends_series)
+    else:
+        print("○ 배당금 데이터 없음 - 기본값 0으로 처리")
+    
+    end_date = today.strftime('%Y-%m-%d')
+    
+    # 기간별 기존 데이터를 먼저 로드하여 필요한 가장 이른 날짜를 결정
+    existing_data = {}
+    fetch_start_dates = []
+    for period_name, days in periods.items():
+        existing_df, last_date = load_existing_data(find_analysis_data_path(company_name, period_name))
+        existing_data[period_name] = existing_df
+        if existing_df is not None and not existing_df.empty:
+            # 과거 데이터 수정을 감지하기 위해 저장된 첫 날짜부터 비교
+            fetch_start_dates.append(existing_df.index[0].strftime('%Y-%m-%d'))
+        else:
+            fetch_start_dates.append((today - timedelta(days=days)).strftime('%Y-%m-%d'))
+    
+    # 가장 긴 구간을 한 번만 다운로드하여 모든 기간에서 공유
+    master_start_date = min(fetch_start_dates)
+    if master_start_date < end_date:
+        master_df = build_master_price_data(
+            common_ticker,
+            preferred_ticker,
+            master_start_date,
+            end_date,
+            external_dividends=external_dividends_series if not external_dividends_series.empty else None
+        )
+    else:
+        master_df = pd.DataFrame()
+    
+    results = {}
+    
+    for period_name, days in periods.items():
+        print(f"\n{'='*80}")
+        print(f"=== {company_name} {period_name} 데이터 처리 중 ===")
+        print(f"{'='*80}")
+        
+        start_date = (today - timedelta(days=days)).strftime('%Y-%m-%d')
+        
+        print(f"📅 대상 기간: {start_date} ~ {end_date}")
+        
+        existing_df = existing_data[period_name]
+        state_path = window_state_path(company_name, period_name)
+        window_state = load_window_state(state_path, DEFAULT_WINDOW_CONFIGS) if existing_df is not None else None
+        
+        if existing_df is not None:
+            print(f"📊 기존 데이터 활용: {len(existing_df)}일의 데이터")
+        else:
+            print("🆕 새로운 데이터 생성")
+        
+        price_data_df = get_stock_data_with_diff_and_dividends(
+            common_ticker, 
+            preferred_ticker, 
+            start_date, 
+            end_date, 
+            external_dividends=external_dividends_series if not external_dividends_series.empty else None,
+            existing_df=existing_df,
+            master_df=master_df,
+            window_state=window_state
+        )
+        
+        if not price_data_df.empty:
+            output_path = _unchanged_output_path(price_data_df, existing_df, company_name, period_name,
+                                                 storage_format, export_json)
+            if output_path:
+                # 바뀐 행이 없으면 파일을 다시 쓰지 않음
+                print(f"💾 변경 없음: {output_path} (총 {len(price_data_df)}일)")
+            else:
+                # 결과를 Parquet(기본값) 파일로 저장
+                output_path = save_analysis_data(
+                    price_data_df, company_name, period_name,
+                    storage_format=storage_format, export_json=export_json
+                )
+                
+                if existing_df is not None:
+                    new_days = len(price_data_df) - len(existing_df) if len(price_data_df) > len(existing_df) else 0
+                    print(f"💾 업데이트 완료: {output_path} ({new_days}일 추가, 총 {len(price_data_df)}일)")
+                else:
+                    print(f"💾 저장 완료: {output_path} (총 {len(price_data_df)}일)")
+                
+                # 다음 증분 갱신에서 이어서 계산할 수 있도록 윈도우 상태 저장
+                save_window_state(state_path, build_window_state(price_data_df, DEFAULT_WINDOW_CONFIGS))
+            
+            results[period_name] = {
+                'data': price_data_df,
+                'file_path': output_path,
+                'start_date': start_date,
+                'end_date': end_date,
+                'is_updated': existing_df is not None,
+                'company': company_name,
+                'common_ticker': common_ticker,
+                'preferred_ticker': preferred_ticker
+            }
+        else:
+            print(f"❌ {company_name} {period_name} 주식 분석 데이터를 생성할 수 없습니다.")
+    
+    print(f"\n{'='*80}")
+    print(f"=== {company_name} 데이터 처리 요약 ===")
+    print(f"{'='*80}")
+    
+    updated_count = sum(1 for r in results.values() if r.get('is_updated', False))
+    new_count = len(results) - updated_count
+    
+    print(f"📊 처리 완료: 총 {len(results)}개 기간")
+    print(f"🔄 업데이트: {updated_count}개 기간")
+    print(f"🆕 신규 생성: {new_count}개 기간")
+    
+    return results
+
+@timed()
+def compare_all_companies_dividend_yields(jobs=1):
+    """
+    모든 회사의 보통주와 우선주 배당률을 비교하고 종합 리포트를 생성합니다.
+    
+    Args:
+        jobs (int): 회사별 비교를 실행할 프로세스 수 (1이면 순차 실행)
+    
+    Returns:
+        dict: 모든 회사의 배당률 비교 결과
+    """
+    print("🔍 전체 회사 배당률 비교 분석 시작")
+    print("=" * 80)
+    
+    all_results = {}
+    
+    # 모든 회사의 종목 정보와 배당금을 동시에 받아 캐시에 저장 (이후 회사별 비교는 캐시에서 읽음)
+    get_market_data_cache().fetch_snapshots(company_tickers(PREFERRED_STOCK_COMPANIES))
+    
+    tasks = [(company_name, (company_name,)) for company_name in PREFERRED_STOCK_COMPANIES.keys()]
+    for company_name, outcome in run_tasks(compare_dividend_yields, tasks, jobs).items():
+        # 실패한 회사는 run_tasks가 오류를 출력하고 결과에서 제외
+        if outcome['result']:
+            all_results[company_name] = outcome['result']
+    
+    if not all_results:
+        print("❌ 분석 가능한 회사가 없습니다.")
+        return {}
+    
+    # 종합 리포트 생성
+    print(f"\n{'='*80}")
+    print("📊 전체 회사 배당률 비교 종합 리포트")
+    print(f"{'='*80}")
+    
+    # 배당률 순위 (우선주 기준)
+    sorted_by_preferred_yield = sorted(
+        all_results.items(), 
+        key=lambda x: x[1]['preferred_stock']['dividend_yield'], 
+        reverse=True
+    )
+    
+    print(f"\n🏆 우선주 배당률 순위:")
+    for i, (company, data) in enumerate(sorted_by_preferred_yield, 1):
+        preferred_yield = data['preferred_stock']['dividend_yield']
+        common_yield = data['common_stock']['dividend_yield']
+        dividend_ratio = data['comparison']['dividend_ratio_preferred_to_common']
+        
+        print(f"  {i:2d}. {company:8s}: {preferred_yield:6.3f}% (보통주: {common_yield:6.3f}%, 비율: {dividend_ratio:5.2f}배)")
+    
+    # 배당금 비율 순위 (우선주/보통주)
+    sorted_by_dividend_ratio = sorted(
+        all_results.items(), 
+        key=lambda x: x[1]['comparison']['dividend_ratio_preferred_to_common'], 
+        reverse=True
+    )
+    
+    print(f"\n💰 우선주/보통주 배당금 비율 순위:")
+    for i, (company, data) in enumerate(sorted_by_dividend_ratio, 1):
+        dividend_ratio = data['comparison']['dividend_ratio_preferred_to_common']
+        preferred_dividend = data['preferred_stock']['annual_dividend']
+        common_dividend = data['common_stock']['annual_dividend']
+        
+        print(f"  {i:2d}. {company:8s}: {dividend_ratio:5.2f}배 (우선주: {preferred_dividend:,.0f}원, 보통주: {common_dividend:,.0f}원)")
+    
+    # 마크다운 리포트 생성
+    generate_dividend_comparison_report(all_results)
+    
+    return all_results
+
+def generate_dividend_comparison_report(all_results):
+    """
+    배당률 비교 결과를 마크다운 리포트로 생성합니다.
+    
+    Args:
+        all_results (dict): 모든 회사의 배당률 비교 결과
+    """
+    try:
+        report_file = './dividend_yield_comparison_report.md'
+        
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("# 📊 우선주 vs 보통주 배당률 비교 리포트\n\n")
+            f.write(f"**생성일시:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"**분석 대상:** {len(all_results)}개 회사\n")
+            f.write(f"**분석 기준:** 최근 1년 배당금 기준\n\n")
+            
+            f.write("---\n\n")
+            
+            # Executive Summary
+            f.write("## 🎯 Executive Summary\n\n")
+            
+            # 평균 배당률 계산
+            avg_preferred_yield = sum(data['preferred_stock']['dividend_yield'] for data in all_results.values()) / len(all_results)
+            avg_common_yield = sum(data['common_stock']['dividend_yield'] for data in all_results.values()) / len(all_results)
+            avg_dividend_ratio = sum(data['comparison']['dividend_ratio_preferred_to_common'] for data in all_results.values()) / len(all_results)
+            
+            f.write(f"- **평균 우선주 배당률:** {avg_preferred_yield:.3f}%\n")
+            f.write(f"- **평균 보통주 배당률:** {avg_common_yield:.3f}%\n")
+            f.write(f"- **평균 배당금 비율 (우선주/보통주):** {avg_dividend_ratio:.2f}배\n\n")
+            
+            # 상세 분석 표
+            f.write("## 📈 회사별 상세 분석\n\n")
+            f.write("| 회사명 | 보통주 배당률 | 우선주 배당률 | 배당률 차이 | 배당금 비율 | 우선주 우위성 |\n")
+            f.write("|--------|---------------|---------------|-------------|-------------|---------------|\n")
+            
+            for company_name, data in all_results.items():
+                common_yield = data['common_stock']['dividend_yield']
+                preferred_yield = data['preferred_stock']['dividend_yield']
+                yield_diff = data['comparison']['yield_difference']
+                dividend_ratio = data['comparison']['dividend_ratio_preferred_to_common']
+                
+                # 우선주 우위성 판단
+                if dividend_ratio > 1.5:
+                    advantage = "🟢 매우 유리"
+                elif dividend_ratio > 1.0:
+                    advantage = "🟡 유리"
+                elif dividend_ratio > 0.8:
+                    advantage = "🟠 비슷"
+                else:
+                    advantage = "🔴 불리"
+                
+                f.write(f"| {company_name} | {common_yield:.3f}% | {preferred_yield:.3f}% | {yield_diff:+.3f}%p | {dividend_ratio:.2f}배 | {advantage} |\n")
+            
+            # 순위 섹션
+            f.write("\n## 🏆 순위 분석\n\n")
+            
+            # 우선주 배당률 순위
+            sorted_by_preferred = sorted(all_results.items(), key=lambda x: x[1]['preferred_stock']['dividend_yield'], reverse=True)
+            f.write("### 📊 우선주 배당률 순위\n\n")
+            for i, (company, data) in enumerate(sorted_by_preferred, 1):
+                yield_val = data['preferred_stock']['dividend_yield']
+                f.write(f"{i}. **{company}**: {yield_val:.3f}%\n")
+            
+            # 배당금 비율 순위
+            sorted_by_ratio = sorted(all_results.items(), key=lambda x: x[1]['comparison']['dividend_ratio_preferred_to_common'], reverse=True)
+            f.write("\n### 💰 배당금 비율 순위 (우선주/보통주)\n\n")
+            for i, (company, data) in enumerate(sorted_by_ratio, 1):
+                ratio = data['comparison']['dividend_ratio_preferred_to_common']
+                f.write(f"{i}. **{company}**: {ratio:.2f}배\n")
+            
+            # 인사이트 섹션
+            f.write("\n## 💡 주요 인사이트\n\n")
+            
+            # 최고/최저 찾기
+            highest_preferred_yield = max(all_results.items(), key=lambda x: x[1]['preferred_stock']['dividend_yield'])
+            highest_ratio = max(all_results.items(), key=lambda x: x[1]['comparison']['dividend_ratio_preferred_to_common'])
+            lowest_ratio = min(all_results.items(), key=lambda x: x[1]['comparison']['dividend_ratio_preferred_to_common'])
+            
+            f.write(f"**1. 배당률 리더:**\n")
+            f.write(f"- **{highest_preferred_yield[0]}**가 가장 높은 우선주 배당률 ({highest_preferred_yield[1]['preferred_stock']['dividend_yield']:.3f}%)을 기록\n\n")
+            
+            f.write(f"**2. 배당금 비율 분석:**\n")
+            f.write(f"- **{highest_ratio[0]}**가 가장 높은 배당금 비율 ({highest_ratio[1]['comparison']['dividend_ratio_preferred_to_common']:.2f}배)\n")
+            f.write(f"- **{lowest_ratio[0]}**가 가장 낮은 배당금 비율 ({lowest_ratio[1]['comparison']['dividend_ratio_preferred_to_common']:.2f}배)\n\n")
+            
+            f.write(f"**3. 투자 시사점:**\n")
+            
+            # 배당금 비율이 1보다 큰 회사들
+            high_ratio_companies = [name for name, data in all_results.items() if data['comparison']['dividend_ratio_preferred_to_common'] > 1]
+            
+            if high_ratio_companies:
+                f.write(f"- **우선주 배당 우위 기업:** {', '.join(high_ratio_companies)}\n")
+                f.write(f"- 이들 기업의 우선주는 보통주 대비 배당금 혜택이 있음\n")
+            
+            # 배당률이 높은 회사들
+            high_yield_companies = [name for name, data in all_results.items() if data['preferred_stock']['dividend_yield'] > avg_preferred_yield]
+            
+            if high_yield_companies:
+                f.write(f"- **고배당 기업:** {', '.join(high_yield_companies)}\n")
+                f.write(f"- 평균 이상의 배당률을 제공하는 기업들\n")
+            
+            f.write("\n---\n\n")
+            f.write("**📝 분석 방법론:**\n")
+            f.write("- 최근 1년간의 배당금을 기준으로 연간 배당률 계산\n")
+            f.write("- 배당률 = (연간 배당금 / 현재 주가) × 100\n")
+            f.write("- 배당금 비율 = 우선주 연간 배당금 / 보통주 연간 배당금\n\n")
+            f.write("**⚠️ 주의사항:**\n")
+            f.write("- 과거 배당 실적 기준이며 미래 배당을 보장하지 않음\n")
+            f.write("- 투자 결정 시 배당 외 기업 가치도 함께 고려 필요\n")
+            
+        print(f"📋 배당률 비교 리포트 생성: {report_file}")
+        
+    except Exception as e:
+        print(f"❌ 배당률 비교 리포트 생성 실패: {e}")
+
+def save_updated_dividend_data(company_name, dividend_series):
+    """
+    업데이트된 배당금 데이터를 JSON 파일로 저장합니다.
+    
+    Args:
+        company_name (str): 회사명
+        dividend_series (pd.Series): 배당금 데이터
+    """
+    if dividend_series.empty:
+        return
+    
+    try:
+        safe_company_name = company_name.replace('/', '_').replace('\\', '_')
+        dividend_file_path = f'./{safe_company_name}_dividend_data.json'
+        
+        # 배당금 데이터를 JSON 형태로 변환
+        dividend_dict = {
+            date.strftime('%Y-%m-%d'): float(amount) 
+            for date, amount in dividend_series.items()
+        }
+        
+        with open(dividend_file_path, 'w', encoding='utf-8') as f:
+            json.dump(dividend_dict, f, indent=4, ensure_ascii=False)
+        
+        print(f"💾 {company_name} 배당금 데이터 저장: {dividend_file_path}")
+        
+    except Exception as e:
+        print(f"❌ {company_name} 배당금 데이터 저장 실패: {e}")
+
+def generate_dividend_summary_report(all_results):
+    """
+    모든 회사의 배당금 데이터 요약 리포트를 생성합니다.
+    
+    Args:
+        all_results (dict): 전체 회사 분석 결과
+    """
+    try:
+        summary_file = './dividend_summary_report.md'
+        
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            f.write("# 📊 우선주 배당금 데이터 요약 리포트\n\n")
+            f.write(f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            
+            f.write("## 📈 회사별 배당금 데이터 현황\n\n")
+            f.write("| 회사명 | 업종 | 우선주 티커 | 배당금 데이터 | 최근 배당금 | 배당 횟수 |\n")
+            f.write("|--------|------|-------------|---------------|-------------|----------|\n")
+            
+            for company_name in PREFERRED_STOCK_COMPANIES.keys():
+                company_info = PREFERRED_STOCK_COMPANIES[company_name]
+                sector = company_info['sector']
+                preferred_ticker = company_info['preferred']
+                
+                # 배당금 데이터 수집
+                dividend_data = get_company_dividend_data(company_name)
+                
+                if not dividend_data.empty:
+                    latest_dividend = dividend_data.iloc[-1]
+                    dividend_count = len(dividend_data)
+                    latest_date = dividend_data.index[-1].strftime('%Y-%m-%d')
+                    status = f"✅ 최신: {latest_date}"
+                    
+                    # 개별 회사 배당금 데이터 저장
+                    save_updated_dividend_data(company_name, dividend_data)
+                else:
+                    latest_dividend = "N/A"
+                    dividend_count = 0
+                    status = "❌ 데이터 없음"
+                
+                f.write(f"| {company_name} | {sector} | {preferred_ticker} | {status} | {latest_dividend} | {dividend_count} |\n")
+            
+            f.write(f"\n## 📋 분석 대상 기업 수: {len(PREFERRED_STOCK_COMPANIES)}개\n\n")
+            f.write("---\n")
+            f.write("*이 리포트는 yfinance API를 통해 자동 생성되었습니다.*\n")
+        
+        print(f"📋 배당금 요약 리포트 생성: {summary_file}")
+        
+    except Exception as e:
+        print(f"❌ 배당금 요약 리포트 생성 실패: {e}")
+
+def _generate_company_data(company_name, storage_format=None, export_json=False):
+    """generate_data_for_all_companies의 회사 단위 작업 (프로세스 풀에서 실행 가능)"""
+    print(f"\n🏢 {company_name} 처리 시작...")
+    results = generate_stock_data_for_periods(company_name, storage_format, export_json)
+    print(f"✅ {company_name} 처리 완료")
+    return results
+
+@timed()
+def generate_data_for_all_companies(storage_format=None, export_json=False, jobs=1):
+    """
+    모든 우선주 보유 회사들에 대해 데이터를 생성합니다.
+    배당금 데이터도 함께 수집하고 저장합니다.
+    
+    회사 단위로 작업을 나눕니다. (한 회사의 기간별 데이터는 마스터 가격 데이터를 공유하므로 같은 작업에서 처리)
+    
+    Args:
+        storage_format (str, optional): 저장 형식 ('parquet', 'feather', 'json', 기본값: Parquet)
+        export_json (bool): 기존 형식의 JSON 파일도 함께 저장할지 여부
+        jobs (int): 회사별 작업을 실행할 프로세스 수 (1이면 순차 실행)
+    """
+    print("🚀 모든 회사 데이터 생성 시작")
+    print("="*80)
+    
+    all_results = {}
+    
+    # 모든 회사의 가격을 한 번에 받아 캐시에 저장 (이후 회사별 작업은 캐시에서 읽음)
+    try:
+        prefetch_company_prices()
+    except Exception as e:
+        print(f"⚠️ 가격 일괄 다운로드 실패 - 회사별로 다운로드합니다: {e}")
+    
+    tasks = [(company_name, (company_name, storage_format, export_json))
+             for company_name in PREFERRED_STOCK_COMPANIES.keys()]
+    for company_name, outcome in run_tasks(_generate_company_data, tasks, jobs).items():
+        all_results[company_name] = outcome['result'] or {}
+    
+    print(f"\n{'='*80}")
+    print("=== 전체 처리 결과 요약 ===")
+    print(f"{'='*80}")
+    
+    for company_name, results in all_results.items():
+        if results:
+            print(f"✅ {company_name}: {len(results)}개 기간 처리 완료")
+        else:
+            print(f"❌ {company_name}: 처리 실패")
+    
+    print(f"\n📊 총 {len([r for r in all_results.values() if r])}개 회사 성공적으로 처리됨")
+    
+    # 배당금 요약 리포트 생성
+    print(f"\n📋 배당금 데이터 요약 리포트 생성 중...")
+    generate_dividend_summary_report(all_results)
+    
+    return all_results
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+여러 회사 비교용 기간별 가격 패널 (메모리 매핑 Arrow IPC 파일)
+
+analyze_all_companies.py, comprehensive_company_comparison_report.py처럼 같은 기간의 모든 회사 데이터를
+여러 번 읽는 스크립트와 --jobs 백테스트 작업 프로세스가 회사별 분석 데이터 파일을 매번 파싱하지 않도록
+기간마다 모든 회사 데이터(날짜 x 회사 x 컬럼)를 하나의 Arrow IPC 파일(price_panel_{기간}.arrow)로 모아 둡니다.
+- 회사마다 레코드 배치 하나 (압축하지 않음), 회사에 없는 컬럼은 null
+- 읽을 때는 pa.memory_map으로 열어 복사 없이 DataFrame을 만듭니다.
+  (작업 프로세스가 늘어나도 같은 페이지 캐시를 공유하므로 메모리 사용량이 늘지 않음)
+- 반환되는 DataFrame의 값은 읽기 전용입니다. 값을 바꾸려면 .copy() 후 사용하세요. (컬럼 추가는 가능)
+- 패널에 원본 파일의 이름/수정 시각/크기를 기록해 두고, 원본이 바뀌거나 새 회사 데이터가 생기면 다시 만듭니다.
+- pyarrow가 설치되어 있지 않으면 회사별 분석 데이터 파일을 직접 읽습니다.
+
+사용법:
+    python price_panel.py                      # 20년 패널 생성/갱신 후 내용 출력
+    python price_panel.py --period 3년 20년 --rebuild
+"""
+
+import json
+import os
+
+import pandas as pd
+
+from analysis_storage import PYARROW_AVAILABLE, find_analysis_data_path, read_analysis_file
+from companies import PREFERRED_STOCK_COMPANIES
+from instrumentation import timed
+
+PANEL_FILE_TEMPLATE = 'price_panel_{period}.arrow'
+PANEL_METADATA_KEY = b'price_panel'
+
+# 프로세스마다 한 번만 연 패널: {절대 경로: ((mtime_ns, size), RecordBatchFileReader, 메타데이터)}
+_open_panels = {}
+
+
+def panel_path(period, directory='.'):
+    """
+    기간별 패널 파일 경로를 반환합니다.
+
+    Args:
+        period (str): 분석 기간 (예: '20년')
+        directory (str): 데이터 디렉터리 (기본값: 현재 디렉터리)
+
+    Returns:
+        str: 파일 경로 (price_panel_{기간}.arrow)
+    """
+    return os.path.join(directory, PANEL_FILE_TEMPLATE.format(period=period))
+
+
+def _panel_companies(company_names=None, company_name=None):
+    """패널에 넣을 회사 목록 (기본값: 지원 회사 전체, company_name이 없으면 추가)"""
+    names = list(company_names or PREFERRED_STOCK_COMPANIES)
+    if company_name is not None and company_name not in names:
+        names.append(company_name)
+    return names
+
+
+def _source_files(company_names, period, directory):
+    """존재하는 회사별 분석 데이터 파일: {회사명: [파일 이름, mtime_ns, size]}"""
+    sources = {}
+    for company_name in company_names:
+        path = find_analysis_data_path(company_name, period, directory)
+        if os.path.exists(path):
+            stat = os.stat(path)
+            sources[company_name] = [os.path.basename(path), stat.st_mtime_ns, stat.st_size]
+    return sources
+
+
+def _column_array(values):
+    """numpy 값을 Arrow 배열로 변환합니다."""
+    import pyarrow as pa
+    if values.dtype.kind in 'biufmM':
+        # NaN을 null로 바꾸지 않아야 읽을 때 복사 없이 numpy 배열로 돌아옴
+        return pa.array(values)
+    return pa.array(values, from_pandas=True)
+
+
+@timed()
+def build_price_panel(period, company_names=None, directory='.'):
+    """
+    회사별 분석 데이터 파일을 모아 기간별 패널 파일을 만듭니다. (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        period (str): 분석 기간 (예: '20년')
+        company_names (list, optional): 패널에 넣을 회사 (기본값: 지원 회사 전체, 데이터가 없는 회사는 제외)
+        directory (str): 데이터 디렉터리 (기본값: 현재 디렉터리)
+
+    Returns:
+        str: 저장한 패널 파일 경로
+    """
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    sources = _source_files(_panel_companies(company_names), period, directory)
+    frames = {name: read_analysis_file(os.path.join(directory, source[0])) for name, source in sources.items()}
+
+    # 모든 회사 컬럼의 합집합 (처음 나온 회사의 타입 사용)
+    field_types = {}
+    for df in frames.values():
+        for column in df.columns:
+            if column not in field_types:
+                field_types[column] = _column_array(df[column].to_numpy()).type
+
+    metadata = {
+        'period': period,
+        'companies': [{'name': name, 'source': sources[name], 'columns': list(df.columns)}
+                      for name, df in frames.items()],
+    }
+    schema = pa.schema([pa.field('Date', pa.timestamp('ns'))] +
+                       [pa.field(column, field_type) for column, field_type in field_types.items()],
+                       metadata={PANEL_METADATA_KEY: json.dumps(metadata, ensure_ascii=False)})
+
+    path = panel_path(period, directory)
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with pa.OSFile(temp_path, 'wb') as sink, ipc.new_file(sink, schema) as writer:
+            for df in frames.values():
+                arrays = [pa.array(df.index.to_numpy(dtype='datetime64[ns]'))]
+                for column, field_type in field_types.items():
+                    if column in df.columns:
+                        arrays.append(_column_array(df[column].to_numpy()).cast(field_type))
+                    else:
+                        arrays.append(pa.nulls(len(df), field_type))
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return path
+
+
+def _open_panel(path):
+    """패널 파일을 메모리 매핑으로 엽니다. (파일이 바뀌었을 때만 다시 엶)"""
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    key = os.path.abspath(path)
+    stat = os.stat(path)
+    state = (stat.st_mtime_ns, stat.st_size)
+    cached = _open_panels.get(key)
+    if cached is None or cached[0] != state:
+        reader = ipc.open_file(pa.memory_map(path))
+        metadata = json.loads(reader.schema.metadata[PANEL_METADATA_KEY])
+        cached = (state, reader, metadata)
+        _open_panels[key] = cached
+    return cached[1], cached[2]
+
+
+def _current_panel(period, company_names, directory):
+    """
+    원본 파일과 일치하는 패널을 엽니다.
+
+    Returns:
+        tuple | None: (reader, 메타데이터), 패널이 없거나 원본이 바뀌었으면 None
+    """
+    path = panel_path(period, directory)
+    if not os.path.exists(path):
+        return None
+    try:
+        reader, metadata = _open_panel(path)
+    except (OSError, KeyError, ValueError):
+        # 읽을 수 없는 패널은 다시 만듦
+        return None
+
+    sources = _source_files(company_names, period, directory)
+    panel_sources = {company['name']: company['source'] for company in metadata['companies']}
+    if any(sources.get(name) != panel_sources.get(name) for name in company_names):
+        return None
+    return reader, metadata
+
+
+def ensure_price_panel(period, company_names=None, directory='.'):
+    """
+    패널이 없거나 원본 데이터 파일이 바뀌었으면 다시 만듭니다.
+
+    병렬 작업 전에 부모 프로세스에서 호출하면 작업 프로세스는 패널을 열기만 합니다.
+
+    Args:
+        period (str): 분석 기간 (예: '20년')
+        company_names (list, optional): 패널에 넣을 회사 (기본값: 지원 회사 전체)
+        directory (str): 데이터 디렉터리 (기본값: 현재 디렉터리)
+
+    Returns:
+        str | None: 패널 파일 경로 (pyarrow가 없으면 None)
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+    company_names = _panel_companies(company_names)
+    if _current_panel(period, company_names, directory) is None:
+        build_price_panel(period, company_names, directory)
+    return panel_path(period, directory)
+
+
+def _batch_frame(batch, columns):
+    """레코드 배치를 날짜 인덱스 DataFrame으로 변환합니다. (숫자 컬럼은 복사 없음)"""
+    dates = pd.DatetimeIndex(batch.column('Date').to_numpy(zero_copy_only=False), name='Date')
+    if not columns:
+        return pd.DataFrame(index=dates)
+    df = batch.select(columns).to_pandas(split_blocks=True)
+    df.index = dates
+    return df
+
+
+def load_panel_frame(company_name, period, columns=None, directory='.', build=True):
+    """
+    패널에서 회사/기간별 분석 데이터를 로드합니다. (read_analysis_file과 같은 형식)
+
+    Args:
+        company_name (str): 회사명
+        period (str): 분석 기간 (예: '20년')
+        columns (list, optional): 읽을 컬럼 목록 (없는 컬럼은 무시, 기본값: 전체)
+        directory (str): 데이터 디렉터리 (기본값: 현재 디렉터리)
+        build (bool): 패널이 없거나 오래되었으면 새로 만듦 (False면 분석 데이터 파일을 직접 읽음)
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스 DataFrame (값은 읽기 전용)
+
+    Raises:
+        FileNotFoundError: 회사의 분석 데이터 파일이 없는 경우
+    """
+    if not PYARROW_AVAILABLE:
+        return read_analysis_file(find_analysis_data_path(company_name, period, directory), columns)
+
+    company_names = _panel_companies(company_name=company_name)
+    panel = _current_panel(period, company_names, directory)
+    if panel is None:
+        if not build:
+            return read_analysis_file(find_analysis_data_path(company_name, period, directory), columns)
+        build_price_panel(period, company_names, directory)
+        panel = _current_panel(period, company_names, directory)
+
+    reader, metadata = panel
+    for index, company in enumerate(metadata['companies']):
+        if company['name'] == company_name:
+            available = company['columns']
+            if columns is not None:
+                available = [column for column in columns if column in available]
+            return _batch_frame(reader.get_batch(index), available)
+    raise FileNotFoundError(find_analysis_data_path(company_name, period, directory))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='여러 회사 비교용 기간별 가격 패널 생성')
+    parser.add_argument('--period', '-p', type=str, nargs='+', default=['20년'], help='패널을 만들 기간 (기본값: 20년)')
+    parser.add_argument('--directory', '-d', type=str, default='.', help='데이터 디렉터리 (기본값: 현재 디렉터리)')
+    parser.add_argument('--rebuild', action='store_true', help='원본이 바뀌지 않았어도 다시 생성')
+
+    args = parser.parse_args()
+
+    if not PYARROW_AVAILABLE:
+        print("❌ pyarrow가 설치되어 있지 않아 패널을 만들 수 없습니다.")
+    for period in args.period if PYARROW_AVAILABLE else []:
+        if args.rebuild:
+            path = build_price_panel(period, directory=args.directory)
+        else:
+            path = ensure_price_panel(period, directory=args.directory)
+        _, metadata = _open_panel(path)
+        print(f"📦 {path} ({os.path.getsize(path):,} bytes)")
+        for company in metadata['companies']:
+            print(f"   - {company['name']}: {company['source'][0]} ({len(company['columns'])}개 컬럼)")
+        if not metadata['companies']:
+            print("   ⚠️ 분석 데이터 파일이 없습니다. (python stock_diff.py 먼저 실행)")
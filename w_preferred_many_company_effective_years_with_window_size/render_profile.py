@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+차트 저장 프로파일 (해상도/형식/저장 여부)
+
+모든 차트는 save_chart()로 저장하며 현재 프로파일에 따라 저장 방식이 바뀝니다.
+- report : 300 DPI PNG, 여백 자동 맞춤 (기본값, 기존 출력과 같음)
+- draft  : 72 DPI PNG, 여백 자동 맞춤 생략 (bbox_inches='tight'는 저장 전에 한 번 더 그리므로 생략)
+- svg    : 벡터 SVG (래스터화 없음, 파일 확장자 .svg)
+- none   : 차트 파일을 저장하지 않음
+
+프로파일은 CHART_RENDER_PROFILE 환경 변수 또는 각 스크립트의 --render-profile 옵션으로 정합니다.
+set_render_profile()은 환경 변수에도 반영하므로 --jobs 작업 프로세스도 같은 프로파일을 사용합니다.
+그래프는 모두 파일로만 저장하므로 matplotlib은 항상 Agg 백엔드를 사용합니다. (lazy_imports.lazy_pyplot)
+
+사용법:
+    make CHART_RENDER_PROFILE=draft
+    python analyze_ratio.py --render-profile none
+"""
+
+import os
+
+from instrumentation import timed
+
+RENDER_PROFILE_ENV = 'CHART_RENDER_PROFILE'
+DEFAULT_RENDER_PROFILE = 'report'
+DRAFT_DPI = 72
+
+# 프로파일별 저장 설정 (None이면 저장하지 않음)
+RENDER_PROFILES = {
+    'report': {'format': 'png'},
+    'draft': {'format': 'png', 'dpi': DRAFT_DPI, 'bbox_inches': None},
+    'svg': {'format': 'svg'},
+    'none': None,
+}
+
+
+def get_render_profile():
+    """
+    현재 차트 저장 프로파일 이름을 반환합니다. (CHART_RENDER_PROFILE 환경 변수, 없으면 'report')
+
+    Returns:
+        str: 프로파일 이름
+    """
+    name = os.environ.get(RENDER_PROFILE_ENV, '').strip().lower() or DEFAULT_RENDER_PROFILE
+    if name not in RENDER_PROFILES:
+        print(f"⚠️ 알 수 없는 차트 프로파일 '{name}' - '{DEFAULT_RENDER_PROFILE}'을 사용합니다.")
+        return DEFAULT_RENDER_PROFILE
+    return name
+
+
+def set_render_profile(name):
+    """
+    차트 저장 프로파일을 설정합니다. (CLI의 --render-profile 옵션용)
+
+    Args:
+        name (str): 'report', 'draft', 'svg', 'none'
+
+    Raises:
+        ValueError: 지원하지 않는 프로파일인 경우
+    """
+    if name not in RENDER_PROFILES:
+        raise ValueError(f"지원하지 않는 차트 프로파일입니다: {name} (사용 가능: {', '.join(RENDER_PROFILES)})")
+    # --jobs 작업 프로세스(spawn 방식 포함)도 같은 프로파일로 시작하도록 환경 변수에 반영
+    os.environ[RENDER_PROFILE_ENV] = name
+    if name != DEFAULT_RENDER_PROFILE:
+        print(f"🖼️ 차트 프로파일: {name}")
+
+
+def chart_path(path, profile=None):
+    """
+    프로파일에 맞는 차트 파일 경로를 반환합니다. (svg이면 확장자를 .svg로 변경)
+
+    리포트에서 차트 파일을 참조할 때도 이 함수로 경로를 만들어 실제 저장된 파일과 맞춥니다.
+
+    Args:
+        path (str): 기본 차트 경로 (.png)
+        profile (str): 프로파일 이름 (None이면 현재 프로파일)
+
+    Returns:
+        str: 차트 파일 경로
+    """
+    settings = RENDER_PROFILES[profile or get_render_profile()]
+    if settings is None:
+        return path
+    root, _ = os.path.splitext(path)
+    return f"{root}.{settings['format']}"
+
+
+def saved_chart_paths(paths, profile=None):
+    """
+    현재 프로파일에서 실제로 저장되는 차트 파일 경로 목록을 반환합니다. (파이프라인 단계 출력 확인용)
+
+    Args:
+        paths (list): 기본 차트 경로 목록 (.png)
+        profile (str): 프로파일 이름 (None이면 현재 프로파일)
+
+    Returns:
+        list: 차트 파일 경로 목록 (none 프로파일이면 빈 목록)
+    """
+    profile = profile or get_render_profile()
+    if RENDER_PROFILES[profile] is None:
+        return []
+    return [chart_path(path, profile) for path in paths]
+
+
+@timed()
+def save_chart(target, path, dpi=300, bbox_inches='tight'):
+    """
+    현재 프로파일에 맞게 차트를 저장합니다. (plt.savefig 대신 사용)
+
+    Args:
+        target: savefig를 가진 객체 (matplotlib.pyplot 또는 Figure)
+        path (str): 기본 차트 경로 (.png)
+        dpi (int): report 프로파일에서 사용할 DPI
+        bbox_inches (str): report/svg 프로파일에서 사용할 bbox_inches
+
+    Returns:
+        str: 저장한 파일 경로 (none 프로파일이면 None)
+    """
+    profile = get_render_profile()
+    settings = RENDER_PROFILES[profile]
+    if settings is None:
+        return None
+
+    output_path = chart_path(path, profile)
+    options = {'format': settings['format'], 'bbox_inches': settings.get('bbox_inches', bbox_inches)}
+    if settings['format'] == 'png':
+        options['dpi'] = settings.get('dpi', dpi)
+    target.savefig(output_path, **options)
+    return output_path
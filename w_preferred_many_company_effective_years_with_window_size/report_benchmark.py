@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+백테스트 리포트 생성 시간 벤치마크 (모든 회사 x 기간)
+
+회사별로 기간(3년~30년) 길이의 합성 가격 데이터를 만들어 run_strategy_batch/summarize_strategy_result로
+리포트 입력을 준비한 뒤, 리포트 생성 함수만 시간을 잽니다.
+- generate_analysis_report       (회사 x 기간)
+- generate_comprehensive_report  (회사)
+- generate_summary_report        (회사)
+리포트 파일은 임시 디렉터리에 저장하고 끝나면 지웁니다. (네트워크, 실제 데이터 파일 불필요)
+
+사용법:
+    python report_benchmark.py                    # 모든 회사 x 모든 기간
+    python report_benchmark.py --companies 5 --repeats 3
+    python report_benchmark.py --output report_benchmark.json
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from backtest_strategy_with_report import (
+    BACKTEST_PERIODS, BACKTEST_WINDOW_CONFIGS, generate_analysis_report, generate_comprehensive_report,
+    generate_summary_report, run_strategy_batch, summarize_strategy_result
+)
+from companies import PREFERRED_STOCK_COMPANIES
+from rolling_quantile import calculate_rolling_quantiles
+
+TRADING_DAYS_PER_YEAR = 252
+WINDOW_ROWS = {'2year': 730, '3year': 1095, '5year': 1825}  # stock_diff의 윈도우 크기 (행 수)
+INITIAL_CAPITAL = 100_000_000
+
+
+def period_rows(period):
+    """기간 이름('20년')을 합성 데이터 행 수로 변환합니다."""
+    return int(period.rstrip('년')) * TRADING_DAYS_PER_YEAR
+
+
+def make_backtest_frame(rows, seed=0):
+    """
+    stock_diff 출력과 같은 형태의 합성 백테스트 데이터를 만듭니다. (분기 배당, 윈도우별 분위수 포함)
+
+    Args:
+        rows (int): 거래일 수
+        seed (int): 난수 시드
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스 데이터
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end='2024-12-31', periods=rows)
+    common_close = 50000 * np.exp(np.cumsum(rng.normal(0, 0.015, rows)))
+    preferred_close = common_close * (0.8 + 0.05 * np.sin(np.arange(rows) / 40) + rng.normal(0, 0.01, rows))
+    df = pd.DataFrame({
+        'Stock1_Close': np.round(common_close),
+        'Stock2_Close': np.round(preferred_close),
+        'Stock1_Open': np.round(common_close * (1 + rng.normal(0, 0.005, rows))),
+        'Stock2_Open': np.round(preferred_close * (1 + rng.normal(0, 0.005, rows))),
+        'Dividend_Amount_Raw': np.where(np.arange(rows) % 63 == 30, 361.0, 0.0),
+    }, index=dates)
+    df['Price_Diff_Ratio'] = (df['Stock1_Close'] - df['Stock2_Close']) * 100 / df['Stock2_Close']
+    quantiles = calculate_rolling_quantiles(df['Price_Diff_Ratio'].to_numpy(), WINDOW_ROWS)
+    for window_suffix, values in quantiles.items():
+        df[f'Price_Diff_Ratio_25th_Percentile_{window_suffix}'] = values[0.25]
+        df[f'Price_Diff_Ratio_75th_Percentile_{window_suffix}'] = values[0.75]
+    return df
+
+
+def build_period_result(company_name, df):
+    """
+    run_period_backtest와 같은 형식의 기간 결과를 만듭니다. (리포트 입력용, Buy & Hold는 종가 기준 근사)
+
+    Args:
+        company_name (str): 회사명
+        df (pd.DataFrame): make_backtest_frame() 데이터
+
+    Returns:
+        dict: generate_comprehensive_report / generate_summary_report 입력 형식의 기간 결과
+    """
+    df_backtest = df.iloc[1:]
+    first_day = df.iloc[0]
+    initial_stock_type = f"{company_name} 보통주"
+    initial_shares = int(INITIAL_CAPITAL / first_day['Stock1_Open'])
+    initial_value = initial_shares * first_day['Stock1_Open']
+
+    configs = [(f"{kind}_{window_name}", window_suffix, kind == '반대전략')
+               for window_suffix, window_name in BACKTEST_WINDOW_CONFIGS.items() for kind in ('기본전략', '반대전략')]
+    with contextlib.redirect_stdout(io.StringIO()):
+        kernel_results = run_strategy_batch(df_backtest, initial_stock_type, initial_shares, company_name, configs)
+        strategy_results = {
+            name: summarize_strategy_result(df_backtest, kernel_results[name], initial_stock_type, initial_shares,
+                                            initial_value, company_name, name, window_suffix)
+            for name, window_suffix, _ in configs
+        }
+
+    dividends = df_backtest['Dividend_Amount_Raw'].sum() * initial_shares
+    buy_hold_stock = initial_shares * df_backtest['Stock1_Close'].iloc[-1]
+    pref_shares = int(INITIAL_CAPITAL / first_day['Stock2_Open'])
+    pref_stock = pref_shares * df_backtest['Stock2_Close'].iloc[-1]
+    return {
+        'strategy_results': strategy_results,
+        'buy_hold_final_value': buy_hold_stock + dividends,
+        'buy_hold_stock_value': buy_hold_stock,
+        'buy_hold_dividends': dividends,
+        'buy_hold_return_rate': (buy_hold_stock - INITIAL_CAPITAL) / INITIAL_CAPITAL * 100,
+        'pref_buy_hold_final_value': pref_stock + dividends * 1.01,
+        'pref_buy_hold_return_rate': (pref_stock - INITIAL_CAPITAL) / INITIAL_CAPITAL * 100,
+        'start_date': df.index[0].strftime('%y-%m-%d'),
+        'end_date': df_backtest.index[-1].strftime('%y-%m-%d'),
+        'initial_value': initial_value,
+        'initial_capital': INITIAL_CAPITAL,
+    }
+
+
+def write_company_reports(company_name, all_results):
+    """
+    한 회사의 기간별 리포트와 종합/요약 리포트를 생성하고 단계별 시간을 반환합니다.
+
+    Returns:
+        dict: {'analysis': 초, 'comprehensive': 초, 'summary': 초}
+    """
+    timings = {}
+    started = time.perf_counter()
+    for period, result in all_results.items():
+        generate_analysis_report(result['strategy_results'], result['buy_hold_final_value'],
+                                 result['buy_hold_return_rate'], result['start_date'], result['end_date'],
+                                 result['initial_value'], company_name, period,
+                                 result['pref_buy_hold_final_value'], result['pref_buy_hold_return_rate'])
+    timings['analysis'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    generate_comprehensive_report(all_results, company_name)
+    timings['comprehensive'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    generate_summary_report(all_results, company_name)
+    timings['summary'] = time.perf_counter() - started
+    return timings
+
+
+def run_report_benchmark(company_names, periods=BACKTEST_PERIODS, repeats=1):
+    """
+    회사 x 기간 리포트 생성 시간을 측정합니다. (반복 중 최솟값)
+
+    Args:
+        company_names (list): 회사명 목록
+        periods (list): 기간 목록
+        repeats (int): 반복 측정 횟수
+
+    Returns:
+        dict: 리포트 종류별 시간(초), 리포트 수, 리포트 크기(바이트)
+    """
+    frames = {period: make_backtest_frame(period_rows(period), seed=index) for index, period in enumerate(periods)}
+    inputs = {company_name: {period: build_period_result(company_name, frame) for period, frame in frames.items()}
+              for company_name in company_names}
+
+    best = None
+    directory = tempfile.mkdtemp(prefix='report_benchmark_')
+    previous_directory = os.getcwd()
+    try:
+        os.chdir(directory)
+        for _ in range(max(repeats, 1)):
+            totals = {'analysis': 0.0, 'comprehensive': 0.0, 'summary': 0.0}
+            with contextlib.redirect_stdout(io.StringIO()):
+                for company_name, all_results in inputs.items():
+                    for kind, seconds in write_company_reports(company_name, all_results).items():
+                        totals[kind] += seconds
+            totals['total'] = sum(totals.values())
+            if best is None or totals['total'] < best['total']:
+                best = totals
+        report_files = [name for name in os.listdir('.') if name.endswith('.md')]
+        report_bytes = sum(os.path.getsize(name) for name in report_files)
+    finally:
+        os.chdir(previous_directory)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return {
+        'companies': len(company_names),
+        'periods': list(periods),
+        'repeats': repeats,
+        'reports': len(report_files),
+        'report_bytes': report_bytes,
+        'seconds': {kind: round(seconds, 4) for kind, seconds in best.items()},
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='백테스트 리포트 생성 시간 벤치마크 (합성 데이터)')
+    parser.add_argument('--companies', type=int, default=len(PREFERRED_STOCK_COMPANIES),
+                        help=f'측정할 회사 수 (기본값: 전체 {len(PREFERRED_STOCK_COMPANIES)}개)')
+    parser.add_argument('--repeats', type=int, default=1, help='반복 측정 횟수 (최솟값 사용, 기본값: 1)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+
+    args = parser.parse_args()
+
+    company_names = list(PREFERRED_STOCK_COMPANIES)[:args.companies]
+    print(f"⏱️ 리포트 생성 시간 측정: {len(company_names)}개 회사 x {len(BACKTEST_PERIODS)}개 기간 (반복 {args.repeats}회)")
+    result = run_report_benchmark(company_names, repeats=args.repeats)
+
+    seconds = result['seconds']
+    print(f"  기간별 분석 리포트 : {seconds['analysis']:.3f}초")
+    print(f"  종합 비교 리포트   : {seconds['comprehensive']:.3f}초")
+    print(f"  종합 요약 리포트   : {seconds['summary']:.3f}초")
+    print(f"  합계              : {seconds['total']:.3f}초 (리포트 {result['reports']}개, {result['report_bytes']:,} bytes)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Markdown 리포트 스트리밍 저장 (backtest_strategy_with_report의 리포트 생성 함수용)
+
+리포트 전체를 문자열 이어 붙이기로 만든 뒤 기본 파일과 백업 파일에 두 번 쓰는 대신,
+- 섹션을 만드는 대로 임시 파일에 바로 씁니다. (report.write)
+- 다 쓰면 임시 파일을 기본 경로로 원자적으로 바꿉니다. (os.replace, 중간에 실패해도 이전 리포트가 남음)
+- 백업 파일은 같은 내용을 다시 쓰지 않고 하드링크로 만듭니다. (하드링크를 지원하지 않으면 파일 복사)
+
+기본 리포트는 다음 실행 때 새 파일로 교체(os.replace)되므로 하드링크된 백업 파일 내용은 바뀌지 않습니다.
+
+사용 예:
+    report = open_report('삼성전자_summary_backtest_report')
+    report.write("# 제목\\n")
+    report.write(table)
+    main_path, backup_path = report.commit()
+"""
+
+import os
+import shutil
+import weakref
+from datetime import datetime
+
+DEFAULT_BACKUP_DIR = './report_backup'
+
+
+def ensure_backup_directory(backup_dir=DEFAULT_BACKUP_DIR):
+    """
+    백업 디렉토리를 생성합니다.
+
+    Args:
+        backup_dir (str): 백업 디렉토리 경로
+
+    Returns:
+        str: 백업 디렉토리 경로
+    """
+    if not os.path.exists(backup_dir):
+        os.makedirs(backup_dir, exist_ok=True)
+        print(f"📁 백업 디렉토리 생성: {backup_dir}")
+    return backup_dir
+
+
+def _discard(handle, temp_path):
+    """커밋하지 않은 임시 파일을 닫고 지웁니다. (예외로 리포트 생성이 중단된 경우)"""
+    handle.close()
+    try:
+        os.remove(temp_path)
+    except OSError:
+        pass
+
+
+def link_or_copy(source, target):
+    """
+    source를 target에 하드링크합니다. (다른 파일 시스템 등 하드링크가 안 되면 복사)
+
+    Args:
+        source (str): 원본 파일 경로
+        target (str): 만들 파일 경로 (이미 있으면 교체)
+    """
+    temp_path = f'{target}.{os.getpid()}.tmp'
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, target)
+
+
+class ReportWriter:
+    """
+    Markdown 리포트를 임시 파일에 스트리밍으로 쓰고 commit()에서 기본/백업 경로에 저장합니다.
+
+    Args:
+        main_path (str): 기본 리포트 경로
+        backup_path (str): 백업 리포트 경로 (None이면 백업하지 않음)
+        quiet (bool): True면 저장 메시지를 출력하지 않음
+    """
+
+    def __init__(self, main_path, backup_path=None, quiet=False):
+        self.main_path = main_path
+        self.backup_path = backup_path
+        self.quiet = quiet
+        self._temp_path = f'{main_path}.{os.getpid()}.tmp'
+        self._file = open(self._temp_path, 'w', encoding='utf-8')
+        # commit()하지 않고 버려지면 임시 파일 삭제
+        self._finalizer = weakref.finalize(self, _discard, self._file, self._temp_path)
+
+    def write(self, text):
+        """리포트 내용을 이어서 씁니다."""
+        self._file.write(text)
+
+    def writelines(self, lines):
+        """여러 줄(표의 행 등)을 이어서 씁니다."""
+        self._file.writelines(lines)
+
+    def commit(self):
+        """
+        리포트를 기본 경로로 옮기고 백업 파일을 만듭니다.
+
+        Returns:
+            tuple: (기본 파일 경로, 백업 파일 경로)
+        """
+        self._finalizer.detach()
+        self._file.close()
+        os.replace(self._temp_path, self.main_path)
+        if self.backup_path:
+            link_or_copy(self.main_path, self.backup_path)
+        if not self.quiet:
+            print(f"📋 리포트 저장: {os.path.basename(self.main_path)}")
+            if self.backup_path:
+                print(f"💾 백업 저장: {self.backup_path}")
+        return self.main_path, self.backup_path
+
+    def discard(self):
+        """쓰던 리포트를 버립니다. (기존 리포트 파일은 그대로)"""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+
+def report_paths(base_filename, period_name="", backup_dir=DEFAULT_BACKUP_DIR):
+    """
+    리포트 기본 경로와 백업 경로를 만듭니다. (백업 파일명에는 날짜/시간 포함)
+
+    Args:
+        base_filename (str): 기본 파일명 (확장자 제외)
+        period_name (str): 기간 이름 (선택사항)
+        backup_dir (str): 백업 디렉토리
+
+    Returns:
+        tuple: (기본 파일 경로, 백업 파일 경로)
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    name = f'{base_filename}_{period_name}' if period_name else base_filename
+    return f'./{name}.md', f'{backup_dir}/{name}_{timestamp}.md'
+
+
+def open_report(base_filename, period_name="", backup_dir=DEFAULT_BACKUP_DIR):
+    """
+    기본 디렉토리와 백업 디렉토리에 저장할 리포트를 엽니다.
+
+    Args:
+        base_filename (str): 기본 파일명 (확장자 제외)
+        period_name (str): 기간 이름 (선택사항)
+        backup_dir (str): 백업 디렉토리
+
+    Returns:
+        ReportWriter: 리포트 (내용을 모두 쓴 뒤 commit() 호출)
+    """
+    ensure_backup_directory(backup_dir)
+    main_path, backup_path = report_paths(base_filename, period_name, backup_dir)
+    return ReportWriter(main_path, backup_path)
+
+
+def save_report_files(content, base_filename, period_name=""):
+    """
+    완성된 리포트 문자열을 기본 디렉토리와 백업 디렉토리에 저장합니다.
+
+    Args:
+        content (str): 리포트 내용
+        base_filename (str): 기본 파일명 (확장자 제외)
+        period_name (str): 기간 이름 (선택사항)
+
+    Returns:
+        tuple: (기본 파일 경로, 백업 파일 경로)
+    """
+    report = open_report(base_filename, period_name)
+    report.write(content)
+    return report.commit()
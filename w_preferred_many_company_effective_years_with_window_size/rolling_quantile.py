@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+슬라이딩 윈도우 분위수 계산 엔진
+
+stock_diff.py의 Price_Diff_Ratio 사분위수 컬럼을 계산합니다.
+윈도우 내용을 정렬된 상태로 유지하므로 행마다 pd.Series를 새로 만들 필요가 없고,
+여러 윈도우 크기와 분위수를 한 번의 순회로 계산합니다.
+
+윈도우 규칙은 기존 구현과 동일합니다.
+- 처음 window_size개 행까지는 처음부터 현재 행까지 (expanding)
+- 그 이후에는 최근 window_size개 행 (sliding)
+
+보간 방식은 pandas.Series.quantile의 기본값(linear)과 같은 산술을 사용합니다.
+"""
+
+from bisect import bisect_left, insort
+from collections import deque
+import math
+
+import numpy as np
+
+from instrumentation import timed
+
+# 기본 분위수 (25%, 75%)
+DEFAULT_QUANTILES = (0.25, 0.75)
+
+# 기본 윈도우 크기: 2년 = 약 730일, 3년 = 약 1095일, 5년 = 약 1825일 (365일 * 년수)
+DEFAULT_WINDOW_CONFIGS = {
+    '2year': 730,
+    '3year': 1095,
+    '5year': 1825,
+}
+
+
+def quantile_from_sorted(sorted_values, quantile):
+    """
+    정렬된 리스트에서 pandas.Series.quantile(linear)과 동일한 분위수를 계산합니다.
+
+    pandas는 np.percentile(q * 100)을 호출하고 numpy는 다시 100으로 나누므로,
+    같은 부동소수점 결과를 얻기 위해 동일한 순서로 계산합니다.
+
+    Args:
+        sorted_values (list): 오름차순으로 정렬된 값 (NaN 제외)
+        quantile (float): 0과 1 사이의 분위수
+
+    Returns:
+        float: 분위수 값, 값이 없으면 NaN
+    """
+    n = len(sorted_values)
+    if n == 0:
+        return float('nan')
+
+    q = (quantile * 100) / 100
+    # numpy linear 방식의 가상 인덱스
+    virtual_index = (n - 1) * q
+
+    if virtual_index >= n - 1:
+        return float(sorted_values[-1])
+    if virtual_index < 0:
+        return float(sorted_values[0])
+
+    previous_index = math.floor(virtual_index)
+    gamma = virtual_index - previous_index
+    lower = sorted_values[previous_index]
+    upper = sorted_values[previous_index + 1]
+
+    # numpy _lerp
+    diff = upper - lower
+    if gamma >= 0.5:
+        return float(upper - diff * (1 - gamma))
+    return float(lower + diff * gamma)
+
+
+class SlidingWindowQuantile:
+    """
+    최근 window_size개의 값을 정렬된 리스트로 유지하며 분위수를 제공합니다.
+
+    값 추가/제거는 이진 탐색으로 위치를 찾으므로 비교는 O(log w)이고,
+    리스트 삽입/삭제는 뒤쪽 원소를 옮기므로 O(w)입니다. (w는 수백 이하라 memmove 한 번 수준)
+    NaN은 윈도우 길이에는 포함되지만 분위수 계산에서는 제외됩니다 (pandas와 동일).
+    """
+
+    def __init__(self, window_size, quantiles=DEFAULT_QUANTILES):
+        if window_size <= 0:
+            raise ValueError(f"window_size는 양수여야 합니다: {window_size}")
+        self.window_size = window_size
+        self.quantiles = tuple(quantiles)
+        self._window = deque()
+        self._sorted = []
+
+    def __len__(self):
+        return len(self._window)
+
+    @classmethod
+    def from_state(cls, window_size, values, sorted_values=None, quantiles=DEFAULT_QUANTILES):
+        """
+        저장해 둔 윈도우 상태로 객체를 복원합니다. (윈도우를 처음부터 다시 채우지 않음)
+
+        Args:
+            window_size (int): 윈도우 크기
+            values (array-like): 윈도우에 들어 있는 값 (오래된 순서, 최대 window_size개)
+            sorted_values (array-like, optional): values에서 NaN을 뺀 정렬된 값 (없으면 정렬하여 생성)
+            quantiles (tuple): 계산할 분위수 목록
+
+        Returns:
+            SlidingWindowQuantile: 복원된 객체
+        """
+        window = cls(window_size, quantiles)
+        values = [float(value) for value in values]
+        if len(values) > window_size:
+            raise ValueError(f"윈도우 값이 윈도우 크기보다 많습니다: {len(values)} > {window_size}")
+        if sorted_values is None:
+            sorted_values = sorted(value for value in values if not math.isnan(value))
+        else:
+            sorted_values = [float(value) for value in sorted_values]
+            if len(sorted_values) != sum(not math.isnan(value) for value in values):
+                raise ValueError("정렬된 값의 개수가 윈도우 값과 맞지 않습니다.")
+
+        window._window = deque(values)
+        window._sorted = sorted_values
+        return window
+
+    def state(self):
+        """
+        현재 윈도우 상태를 반환합니다. (from_state로 복원 가능)
+
+        Returns:
+            tuple: (윈도우 값 np.ndarray (오래된 순서), 정렬된 값 np.ndarray)
+        """
+        return np.array(self._window, dtype=float), np.array(self._sorted, dtype=float)
+
+    def push(self, value):
+        """
+        새 값을 윈도우에 추가하고 현재 윈도우의 분위수들을 반환합니다.
+
+        Args:
+            value (float): 새로 추가할 값
+
+        Returns:
+            tuple: self.quantiles 순서의 분위수 값
+        """
+        value = float(value)
+        self._window.append(value)
+        if not math.isnan(value):
+            insort(self._sorted, value)
+
+        if len(self._window) > self.window_size:
+            removed = self._window.popleft()
+            if not math.isnan(removed):
+                del self._sorted[bisect_left(self._sorted, removed)]
+
+        return tuple(quantile_from_sorted(self._sorted, q) for q in self.quantiles)
+
+
+@timed()
+def calculate_rolling_quantiles(values, window_configs, quantiles=DEFAULT_QUANTILES):
+    """
+    여러 윈도우 크기에 대한 분위수를 한 번의 순회로 계산합니다.
+
+    Args:
+        values (array-like): 시계열 값 (예: Price_Diff_Ratio)
+        window_configs (dict): {윈도우 이름: 윈도우 크기(행 수)} (예: {'2year': 730})
+        quantiles (tuple): 계산할 분위수 목록 (기본값: (0.25, 0.75))
+
+    Returns:
+        dict: {윈도우 이름: {분위수: np.ndarray}}
+    """
+    values = np.asarray(values, dtype=float)
+    windows = {
+        window_name: SlidingWindowQuantile(window_size, quantiles)
+        for window_name, window_size in window_configs.items()
+    }
+    results = {
+        window_name: {q: np.empty(len(values)) for q in quantiles}
+        for window_name in window_configs
+    }
+
+    for i, value in enumerate(values):
+        for window_name, window in windows.items():
+            for q, q_value in zip(quantiles, window.push(value)):
+                results[window_name][q][i] = q_value
+
+    return results
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""
+보통주/우선주 교체 전략 파라미터 스윕 (그리드 탐색)
+
+(하위 분위수, 상위 분위수, 윈도우 길이, 기본/반대 전략) 조합을 회사/기간별로 평가합니다.
+- 분위수는 저장된 분위수 컬럼 대신 Price_Diff_Ratio에서 바로 계산합니다. (rolling_quantile)
+- 한 회사/기간의 모든 조합은 백테스트 커널에서 한 번의 순회로 계산합니다. (run_switching_batch)
+- 회사/기간 작업은 프로세스 풀에서 병렬로 실행합니다.
+
+백테스트 규칙은 backtest_strategy_with_report.run_comprehensive_backtest와 같습니다.
+(1억원으로 첫날 시가에 보통주 매수, 다음 날부터 전일 신호로 교체, 배당금은 현금으로 수령)
+따라서 (0.25, 0.75, 730일) 조합은 기존 기본전략_2년 결과와 같습니다.
+
+결과: 수익률 순위표(CSV, Markdown)와 회사/기간별 분위수 조합 히트맵(PNG)
+
+사용법:
+    python strategy_sweep.py --company 삼성전자 --period 20년
+    python strategy_sweep.py --lower 0.1 0.2 0.25 0.3 --upper 0.7 0.75 0.8 0.9 --windows 365 730 1095 1825 --jobs 4
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+import pandas as pd
+
+from analysis_storage import load_analysis_data
+from backtest_kernel import EVENT_SWITCH, HOLD_COMMON, prepare_signals, run_switching_batch
+from lazy_imports import lazy_pyplot, lazy_seaborn
+from render_profile import RENDER_PROFILES, save_chart, set_render_profile
+from rolling_quantile import DEFAULT_QUANTILES, DEFAULT_WINDOW_CONFIGS, calculate_rolling_quantiles
+
+# matplotlib/seaborn은 히트맵을 처음 그릴 때 import 하고 한글 폰트도 그때 설정 (lazy_imports)
+plt = lazy_pyplot()
+sns = lazy_seaborn(plt)
+
+INITIAL_CAPITAL = 100_000_000  # 1억원
+
+DEFAULT_LOWER_QUANTILES = (0.1, 0.2, DEFAULT_QUANTILES[0], 0.3)
+DEFAULT_UPPER_QUANTILES = (0.7, DEFAULT_QUANTILES[1], 0.8, 0.9)
+DEFAULT_WINDOWS = tuple(DEFAULT_WINDOW_CONFIGS.values())
+
+# 스윕에 필요한 컬럼 (분위수 컬럼은 읽지 않고 직접 계산)
+SWEEP_COLUMNS = ['Stock1_Open', 'Stock1_Close', 'Stock2_Open', 'Stock2_Close', 'Dividend_Amount_Raw', 'Price_Diff_Ratio']
+
+RESULT_COLUMNS = ['company', 'period', 'strategy', 'lower_quantile', 'upper_quantile', 'window',
+                  'return_rate', 'total_return_rate', 'final_value', 'final_stock_value', 'dividends',
+                  'trades', 'buy_hold_return_rate']
+
+
+def build_parameter_grid(lower_quantiles=DEFAULT_LOWER_QUANTILES, upper_quantiles=DEFAULT_UPPER_QUANTILES,
+                         windows=DEFAULT_WINDOWS, strategies=('기본', '반대')):
+    """
+    파라미터 조합 목록을 만듭니다. (하위 분위수 < 상위 분위수인 조합만)
+
+    Args:
+        lower_quantiles (tuple): 하위 분위수 후보 (예: 0.25)
+        upper_quantiles (tuple): 상위 분위수 후보 (예: 0.75)
+        windows (tuple): 윈도우 길이 후보 (행 수, 예: 730)
+        strategies (tuple): '기본', '반대' 중 평가할 전략
+
+    Returns:
+        list: {'strategy', 'lower_quantile', 'upper_quantile', 'window'} dict 목록
+    """
+    return [
+        {'strategy': strategy, 'lower_quantile': lower, 'upper_quantile': upper, 'window': int(window)}
+        for strategy, window, lower, upper in product(strategies, windows, lower_quantiles, upper_quantiles)
+        if lower < upper
+    ]
+
+
+def sweep_strategies(df, grid, initial_capital=INITIAL_CAPITAL):
+    """
+    한 회사/기간 데이터에 대해 모든 파라미터 조합을 평가합니다.
+
+    Args:
+        df (pd.DataFrame): 기간별 분석 데이터 (SWEEP_COLUMNS 포함, 첫날은 초기 매수일)
+        grid (list): build_parameter_grid() 결과
+        initial_capital (int): 초기 투자금 (기본값: 1억원)
+
+    Returns:
+        pd.DataFrame: 조합별 결과 (return_rate: 배당금 제외 수익률, total_return_rate: 배당금 포함 수익률)
+    """
+    if len(df) < 2 or not grid:
+        return pd.DataFrame(columns=RESULT_COLUMNS[2:])
+
+    # 분위수는 기간 전체 데이터로 계산 (stock_diff.py의 분위수 컬럼과 같은 윈도우 규칙)
+    ratio = df['Price_Diff_Ratio'].to_numpy(dtype=float)
+    quantiles = sorted({params['lower_quantile'] for params in grid} | {params['upper_quantile'] for params in grid})
+    windows = {f"{params['window']}d": params['window'] for params in grid}
+    rolling = calculate_rolling_quantiles(ratio, windows, tuple(quantiles))
+
+    # 첫날 시가로 보통주 매수, 다음 날부터 백테스트
+    initial_shares = int(initial_capital / df['Stock1_Open'].iloc[0])
+    backtest = df.iloc[1:]
+    to_common, to_preferred = [], []
+    for params in grid:
+        window_quantiles = rolling[f"{params['window']}d"]
+        signals = prepare_signals(ratio[1:],
+                                  window_quantiles[params['lower_quantile']][1:],
+                                  window_quantiles[params['upper_quantile']][1:],
+                                  params['strategy'] == '반대')
+        to_common.append(signals[0])
+        to_preferred.append(signals[1])
+
+    common_close = backtest['Stock1_Close'].to_numpy(dtype=float)
+    preferred_close = backtest['Stock2_Close'].to_numpy(dtype=float)
+    kernel_results = run_switching_batch(
+        backtest['Stock1_Open'].to_numpy(dtype=float), common_close,
+        backtest['Stock2_Open'].to_numpy(dtype=float), preferred_close,
+        backtest['Dividend_Amount_Raw'].to_numpy(dtype=float),
+        to_common, to_preferred,
+        [HOLD_COMMON] * len(grid), [initial_shares] * len(grid)
+    )
+
+    buy_hold_return_rate = (initial_shares * common_close[-1] - initial_capital) / initial_capital * 100
+    rows = []
+    for params, result in zip(grid, kernel_results):
+        last_close = common_close[-1] if result['holding'] == HOLD_COMMON else preferred_close[-1]
+        final_stock_value = result['shares'] * last_close
+        final_value = final_stock_value + result['cash']
+        rows.append({
+            **params,
+            'return_rate': (final_value - result['cash'] - initial_capital) / initial_capital * 100,
+            'total_return_rate': (final_value - initial_capital) / initial_capital * 100,
+            'final_value': final_value,
+            'final_stock_value': final_stock_value,
+            'dividends': result['cash'],
+            'trades': sum(1 for event in result['events'] if event[1] == EVENT_SWITCH),
+            'buy_hold_return_rate': buy_hold_return_rate,
+        })
+    return pd.DataFrame(rows, columns=RESULT_COLUMNS[2:])
+
+
+def run_sweep_task(company_name, period, grid, directory='.'):
+    """
+    프로세스 풀 작업 단위: 한 회사/기간의 데이터를 로드하여 스윕합니다.
+
+    Args:
+        company_name (str): 회사명
+        period (str): 분석 기간 (예: '20년')
+        grid (list): build_parameter_grid() 결과
+        directory (str): 데이터 디렉터리
+
+    Returns:
+        pd.DataFrame: company, period 컬럼이 추가된 결과
+    """
+    df = load_analysis_data(company_name, period, columns=SWEEP_COLUMNS, directory=directory)
+    results = sweep_strategies(df, grid)
+    results.insert(0, 'period', period)
+    results.insert(0, 'company', company_name)
+    return results
+
+
+def rank_sweep_results(results):
+    """회사/기간별로 배당금 제외 수익률(리포트와 같은 기준) 순위를 매깁니다."""
+    if results.empty:
+        return results.assign(rank=pd.Series(dtype=int))
+    results = results.sort_values(['company', 'period', 'return_rate', 'total_return_rate'],
+                                  ascending=[True, True, False, False]).reset_index(drop=True)
+    results['rank'] = results.groupby(['company', 'period']).cumcount() + 1
+    return results
+
+
+def run_parameter_sweep(companies, periods, grid, jobs=None, directory='.'):
+    """
+    회사 x 기간 작업을 프로세스 풀에서 실행하고 결과를 합칩니다.
+
+    Args:
+        companies (list): 회사명 목록
+        periods (list): 기간 목록 (예: ['10년', '20년'])
+        grid (list): build_parameter_grid() 결과
+        jobs (int, optional): 프로세스 수 (기본값: CPU 수, 1이면 순차 실행)
+        directory (str): 데이터 디렉터리
+
+    Returns:
+        pd.DataFrame: 순위가 매겨진 전체 결과 (데이터가 없는 회사/기간은 제외)
+    """
+    tasks = [(company_name, period) for company_name in companies for period in periods]
+    print(f"🔍 파라미터 스윕: {len(tasks)}개 회사/기간 x {len(grid)}개 조합")
+
+    frames = []
+    if jobs == 1 or len(tasks) <= 1:
+        for company_name, period in tasks:
+            try:
+                frames.append(run_sweep_task(company_name, period, grid, directory))
+                print(f"✅ {company_name} {period} 완료")
+            except Exception as e:
+                print(f"❌ {company_name} {period} 스윕 실패: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(run_sweep_task, company_name, period, grid, directory): (company_name, period)
+                for company_name, period in tasks
+            }
+            for future in as_completed(futures):
+                company_name, period = futures[future]
+                try:
+                    frames.append(future.result())
+                    print(f"✅ {company_name} {period} 완료")
+                except Exception as e:
+                    print(f"❌ {company_name} {period} 스윕 실패: {e}")
+
+    if not frames:
+        return rank_sweep_results(pd.DataFrame(columns=RESULT_COLUMNS))
+    return rank_sweep_results(pd.concat(frames, ignore_index=True))
+
+
+def plot_sweep_heatmap(results, company_name, period, output_path):
+    """
+    하위/상위 분위수 조합별 최고 수익률(윈도우 중 최대) 히트맵을 전략(기본/반대)별로 그립니다.
+
+    Args:
+        results (pd.DataFrame): run_parameter_sweep() 결과
+        company_name (str): 회사명
+        period (str): 분석 기간
+        output_path (str): 저장할 PNG 경로 (svg 프로파일이면 확장자가 .svg로 바뀜)
+
+    Returns:
+        str: 저장한 파일 경로 (데이터가 없거나 none 프로파일이면 None)
+    """
+    subset = results[(results['company'] == company_name) & (results['period'] == period)]
+    if subset.empty:
+        return None
+
+    strategies = list(dict.fromkeys(subset['strategy']))
+    fig, axes = plt.subplots(1, len(strategies), figsize=(7 * len(strategies), 5.5), squeeze=False)
+    for ax, strategy in zip(axes[0], strategies):
+        pivot = subset[subset['strategy'] == strategy].pivot_table(
+            index='lower_quantile', columns='upper_quantile', values='return_rate', aggfunc='max'
+        )
+        sns.heatmap(pivot, annot=True, fmt='.1f', cmap='RdYlGn', center=subset['buy_hold_return_rate'].iloc[0], ax=ax)
+        ax.set_title(f'{strategy}전략 수익률(%) - 윈도우 중 최고')
+        ax.set_xlabel('상위 분위수')
+        ax.set_ylabel('하위 분위수')
+
+    fig.suptitle(f'{company_name} {period} 파라미터 스윕 (Buy & Hold {subset["buy_hold_return_rate"].iloc[0]:.1f}%)')
+    plt.tight_layout()
+    output_path = save_chart(fig, output_path, dpi=150)
+    plt.close(fig)
+    return output_path
+
+
+def save_sweep_results(results, top=20, directory='.'):
+    """
+    스윕 결과를 CSV, Markdown 순위표와 히트맵으로 저장합니다.
+
+    Args:
+        results (pd.DataFrame): run_parameter_sweep() 결과
+        top (int): 회사/기간별 순위표에 표시할 조합 수
+        directory (str): 저장 디렉터리
+
+    Returns:
+        list: 저장한 파일 경로 목록
+    """
+    if results.empty:
+        print("❌ 저장할 스윕 결과가 없습니다.")
+        return []
+
+    saved = []
+    csv_path = os.path.join(directory, 'strategy_sweep_results.csv')
+    results.to_csv(csv_path, index=False, encoding='utf-8-sig')
+    saved.append(csv_path)
+
+    lines = ['# 교체 전략 파라미터 스윕 결과', '',
+             '- 수익률: 배당금 제외 (리포트와 같은 기준), 총수익률: 배당금 포함',
+             '- 신호: 전일 Price_Diff_Ratio와 전일 윈도우 분위수 비교, 다음 날 시가로 교체', '']
+    for (company_name, period), group in results.groupby(['company', 'period'], sort=False):
+        lines += [f'## {company_name} {period}', '',
+                  f'Buy & Hold (보통주) 수익률: {group["buy_hold_return_rate"].iloc[0]:,.2f}%', '',
+                  '| 순위 | 전략 | 하위 분위 | 상위 분위 | 윈도우(일) | 수익률 | 총수익률 | 최종 자산 | 매매 횟수 |',
+                  '|------|------|-----------|-----------|------------|--------|----------|-----------|-----------|']
+        for _, row in group.head(top).iterrows():
+            lines.append(f"| {row['rank']} | {row['strategy']} | {row['lower_quantile']:.2f} | {row['upper_quantile']:.2f} "
+                         f"| {row['window']} | {row['return_rate']:,.2f}% | {row['total_return_rate']:,.2f}% "
+                         f"| {row['final_value']:,.0f}원 | {row['trades']} |")
+        lines.append('')
+
+        safe_company_name = company_name.replace('/', '_').replace('\\', '_')
+        heatmap_path = plot_sweep_heatmap(results, company_name, period,
+                                          os.path.join(directory, f'{safe_company_name}_strategy_sweep_{period}.png'))
+        if heatmap_path:
+            lines += [f'![{company_name} {period} 히트맵]({os.path.basename(heatmap_path)})', '']
+            saved.append(heatmap_path)
+
+    report_path = os.path.join(directory, 'strategy_sweep_report.md')
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+    saved.append(report_path)
+
+    for path in saved:
+        print(f"💾 저장 완료: {path}")
+    return saved
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='보통주/우선주 교체 전략 파라미터 스윕',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python strategy_sweep.py --company 삼성전자                # 삼성전자 20년 기본 그리드
+  python strategy_sweep.py --period 10년 20년 --jobs 4       # 모든 회사, 10년/20년
+  python strategy_sweep.py --lower 0.1 0.25 --upper 0.75 0.9 --windows 365 730
+        """
+    )
+    parser.add_argument('--company', '-c', type=str, nargs='+', help='분석할 회사명 (기본값: 모든 회사)')
+    parser.add_argument('--period', '-p', type=str, nargs='+', default=['20년'], help='분석 기간 (기본값: 20년)')
+    parser.add_argument('--lower', type=float, nargs='+', default=list(DEFAULT_LOWER_QUANTILES), help='하위 분위수 후보')
+    parser.add_argument('--upper', type=float, nargs='+', default=list(DEFAULT_UPPER_QUANTILES), help='상위 분위수 후보')
+    parser.add_argument('--windows', type=int, nargs='+', default=list(DEFAULT_WINDOWS), help='윈도우 길이 후보 (일)')
+    parser.add_argument('--strategy', type=str, nargs='+', choices=['기본', '반대'], default=['기본', '반대'],
+                        help='평가할 전략 (기본값: 기본, 반대)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='병렬 프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--top', type=int, default=20, help='순위표에 표시할 조합 수 (기본값: 20)')
+    parser.add_argument('--render-profile', type=str, choices=list(RENDER_PROFILES),
+                        help='차트 저장 프로파일 (report: 300 DPI PNG, draft: 저해상도 PNG, svg, none: 저장 안 함)')
+
+    args = parser.parse_args()
+
+    if args.render_profile:
+        set_render_profile(args.render_profile)
+
+    if args.company:
+        companies = args.company
+    else:
+        from companies import PREFERRED_STOCK_COMPANIES
+        companies = list(PREFERRED_STOCK_COMPANIES.keys())
+
+    grid = build_parameter_grid(args.lower, args.upper, args.windows, args.strategy)
+    sweep_results = run_parameter_sweep(companies, args.period, grid, args.jobs)
+    save_sweep_results(sweep_results, args.top)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the columnar analysis data storage
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import analysis_storage
+from analysis_storage import (
+    analysis_data_path, find_analysis_data_path, load_analysis_data,
+    migrate_json_files, read_analysis_file, save_analysis_data, write_analysis_file
+)
+
+
+def make_analysis_frame(rows=30):
+    """Build a frame shaped like stock_diff output"""
+    dates = pd.bdate_range('2024-01-02', periods=rows)
+    close1 = np.linspace(70000, 75000, rows)
+    close2 = np.linspace(56000, 60000, rows)
+    return pd.DataFrame({
+        'Stock1_Close': close1,
+        'Stock2_Close': close2,
+        'Price_Difference': close1 - close2,
+        'Price_Diff_Ratio': (close1 - close2) / close1 * 100,
+        'Dividend_Amount_Raw': np.zeros(rows),
+    }, index=dates)
+
+
+@unittest.skipUnless(analysis_storage.PYARROW_AVAILABLE, 'pyarrow is not installed')
+class TestAnalysisStorage(unittest.TestCase):
+    """Test cases for analysis_storage"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        self.df = make_analysis_frame()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_round_trip_all_formats(self):
+        """Every format reads back the same data with a Date index"""
+        for storage_format in ('parquet', 'feather', 'json'):
+            with self.subTest(storage_format=storage_format):
+                path = analysis_data_path('삼성전자', '3년', storage_format, self.directory)
+                write_analysis_file(self.df, path)
+                loaded = read_analysis_file(path)
+
+                self.assertEqual(loaded.index.name, 'Date')
+                pd.testing.assert_frame_equal(loaded, self.df, check_names=False, check_freq=False)
+
+    def test_json_keeps_legacy_layout(self):
+        """JSON output keeps the YY-mm-dd keyed layout"""
+        path = analysis_data_path('삼성전자', '3년', 'json', self.directory)
+        write_analysis_file(self.df, path)
+        legacy = pd.read_json(path, orient='index', convert_axes=False)
+
+        self.assertEqual(legacy.index[0], '24-01-02')
+
+    def test_column_subset(self):
+        """Only requested columns are loaded and unknown columns are ignored"""
+        save_analysis_data(self.df, '삼성전자', '3년', 'parquet', directory=self.directory)
+        loaded = load_analysis_data('삼성전자', '3년', columns=['Price_Diff_Ratio', 'Missing'],
+                                    directory=self.directory)
+
+        self.assertEqual(list(loaded.columns), ['Price_Diff_Ratio'])
+        self.assertEqual(len(loaded), len(self.df))
+
+    def test_find_prefers_columnar_files(self):
+        """parquet is found before feather and json, and json is the fallback path"""
+        self.assertTrue(find_analysis_data_path('삼성전자', '3년', self.directory).endswith('.json'))
+
+        save_analysis_data(self.df, '삼성전자', '3년', 'feather', export_json=True, directory=self.directory)
+        self.assertTrue(find_analysis_data_path('삼성전자', '3년', self.directory).endswith('.feather'))
+
+        save_analysis_data(self.df, '삼성전자', '3년', 'parquet', directory=self.directory)
+        self.assertTrue(find_analysis_data_path('삼성전자', '3년', self.directory).endswith('.parquet'))
+
+    def test_save_removes_stale_columnar_file(self):
+        """Saving in one columnar format removes the other so readers never see stale data"""
+        save_analysis_data(self.df, '삼성전자', '3년', 'feather', directory=self.directory)
+        save_analysis_data(self.df.iloc[:10], '삼성전자', '3년', 'parquet', directory=self.directory)
+
+        self.assertFalse(os.path.exists(analysis_data_path('삼성전자', '3년', 'feather', self.directory)))
+        self.assertFalse(os.path.exists(analysis_data_path('삼성전자', '3년', 'json', self.directory)))
+        self.assertEqual(len(load_analysis_data('삼성전자', '3년', directory=self.directory)), 10)
+
+    def test_migrate_json_files(self):
+        """Existing JSON files are converted and optionally removed"""
+        json_path = analysis_data_path('삼성전자', '5년', 'json', self.directory)
+        write_analysis_file(self.df, json_path)
+
+        migrated = migrate_json_files(self.directory, 'parquet', remove_json=True)
+
+        self.assertEqual(migrated, [analysis_data_path('삼성전자', '5년', 'parquet', self.directory)])
+        self.assertFalse(os.path.exists(json_path))
+        pd.testing.assert_frame_equal(read_analysis_file(migrated[0]), self.df, check_names=False, check_freq=False)
+
+    def test_missing_file_raises(self):
+        """A missing file raises FileNotFoundError"""
+        with self.assertRaises(FileNotFoundError):
+            load_analysis_data('없는회사', '3년', directory=self.directory)
+
+    def test_default_format_from_environment(self):
+        """ANALYSIS_STORAGE_FORMAT selects the default format"""
+        with patch.dict(os.environ, {analysis_storage.STORAGE_FORMAT_ENV: 'feather'}):
+            self.assertEqual(analysis_storage.get_default_storage_format(), 'feather')
+        with patch.dict(os.environ, {analysis_storage.STORAGE_FORMAT_ENV: 'csv'}):
+            with self.assertRaises(ValueError):
+                analysis_storage.get_default_storage_format()
+
+    def test_shared_frame_cache_reads_each_file_once(self):
+        """Inside shared_frame_cache a file is parsed once and served from memory afterwards"""
+        json_path = write_analysis_file(self.df, analysis_data_path('삼성전자', '3년', 'json', self.directory))
+        expected = read_analysis_file(json_path, columns=['Price_Diff_Ratio', 'Stock1_Close'])
+
+        with patch.object(analysis_storage, '_read_file', wraps=analysis_storage._read_file) as reader:
+            with analysis_storage.shared_frame_cache():
+                first = read_analysis_file(json_path, columns=['Price_Diff_Ratio', 'Stock1_Close'])
+                first['Price_Diff_Ratio'] = 0.0  # callers may modify their copy
+                second = read_analysis_file(json_path, columns=['Price_Diff_Ratio', 'Stock1_Close'])
+            read_analysis_file(json_path)
+
+        self.assertEqual(reader.call_count, 2)
+        pd.testing.assert_frame_equal(second, expected)
+
+    def test_shared_frame_cache_keeps_written_frames(self):
+        """Columnar writes are served without reading; files changed afterwards are re-read"""
+        path = analysis_data_path('삼성전자', '3년', 'parquet', self.directory)
+        with patch.object(analysis_storage, '_read_file', wraps=analysis_storage._read_file) as reader:
+            with analysis_storage.shared_frame_cache():
+                write_analysis_file(self.df, path)
+                cached = read_analysis_file(path, columns=['Price_Diff_Ratio'])
+                self.assertEqual(reader.call_count, 0)
+                pd.testing.assert_frame_equal(cached, self.df[['Price_Diff_Ratio']], check_names=False,
+                                              check_freq=False)
+
+                changed = self.df * 2
+                with analysis_storage.shared_frame_cache():
+                    pass  # nested blocks keep the outer cache
+                analysis_storage._shared_frames.clear()
+                write_analysis_file(changed, path)
+                os.utime(path, ns=(0, 0))  # simulate another process replacing the file
+                reloaded = read_analysis_file(path)
+                self.assertEqual(reader.call_count, 1)
+                pd.testing.assert_frame_equal(reloaded, changed, check_names=False, check_freq=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
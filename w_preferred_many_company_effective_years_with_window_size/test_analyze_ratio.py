@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the analyze_ratio chart job queue
+"""
+
+import unittest
+from unittest.mock import patch
+import contextlib
+import io
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import analyze_ratio
+from analysis_storage import analysis_data_path, write_analysis_file
+from analyze_ratio import ChartQueue, chart_spec, company_chart_paths, render_chart
+from render_profile import RENDER_PROFILE_ENV
+
+PERIODS = ['3년', '5년', '10년', '20년', '30년']
+
+
+def make_ratio_frame(rows=60):
+    """Build a frame with the columns analyze_ratio plots"""
+    dates = pd.bdate_range('2020-01-02', periods=rows)
+    close1 = np.linspace(70000, 75000, rows)
+    close2 = np.linspace(56000, 60000, rows)
+    ratio = (close1 - close2) * 100 / close2
+    return pd.DataFrame({
+        'Stock1_Close': close1,
+        'Stock2_Close': close2,
+        'Price_Difference': close1 - close2,
+        'Price_Diff_Ratio': ratio,
+        'Price_Diff_Ratio_25th_Percentile_2year': ratio - 1,
+        'Price_Diff_Ratio_75th_Percentile_2year': ratio + 1,
+    }, index=dates)
+
+
+class TestChartQueue(unittest.TestCase):
+    """Test cases for the analyze_ratio chart queue"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.directory)
+        environ = patch.dict(os.environ, {RENDER_PROFILE_ENV: 'draft'})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+        self.data_path = analysis_data_path('테스트', '3년', 'json')
+        write_analysis_file(make_ratio_frame(), self.data_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def chart_files(self):
+        return sorted(name for name in os.listdir('.') if name.endswith('.png'))
+
+    def analyze_company(self, jobs):
+        """Run the full company analysis and return the chart files it wrote"""
+        with patch('analyze_ratio.find_analysis_data_path',
+                   side_effect=lambda company, period: analysis_data_path(company, period, 'json')), \
+                contextlib.redirect_stdout(io.StringIO()):
+            analyze_ratio.analyze_company_all_periods('테스트', jobs=jobs)
+        files = self.chart_files()
+        for name in files:
+            os.remove(name)
+        return files
+
+    def test_parallel_rendering_writes_the_same_charts(self):
+        """A process pool writes exactly the charts a serial run writes"""
+        serial = self.analyze_company(jobs=1)
+        parallel = self.analyze_company(jobs=2)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(serial, sorted([
+            '테스트_normalized_comparison_3년.png',
+            '테스트_price_diff_ratio_distribution_3년.png',
+            '테스트_price_diff_ratio_timeseries_3년_2year.png',
+            '테스트_price_diff_ratio_timeseries_3년_3year.png',
+            '테스트_price_diff_ratio_timeseries_3년_5year.png',
+            '테스트_stock_prices_and_difference_3년.png',
+        ]))
+
+    def test_later_spec_replaces_same_file(self):
+        """A chart queued again under the same file name is rendered once, from the last spec"""
+        queue = ChartQueue()
+        queue.add(chart_spec('ratio_window', self.data_path, '테스트', '3년', '2year'))
+        queue.add(chart_spec('distribution', self.data_path, '테스트', '3년'))
+        queue.add(chart_spec('period_timeseries', self.data_path, '테스트', '3년', '2year'))
+
+        self.assertEqual(len(queue), 2)
+        self.assertEqual([spec['kind'] for spec in queue._specs.values()], ['distribution', 'period_timeseries'])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            saved = queue.render()
+        self.assertEqual(len(saved), 2)
+        self.assertEqual(len(queue), 0)
+
+    def test_failed_chart_closes_figure(self):
+        """A chart that fails while drawing leaves no open figure and the batch continues"""
+        plt = analyze_ratio.plt
+        plt.close('all')
+        df = make_ratio_frame().drop(columns=['Price_Diff_Ratio'])
+
+        with self.assertRaises(KeyError):
+            render_chart(df, chart_spec('period_timeseries', self.data_path, '테스트', '3년', '2year'))
+        self.assertEqual(plt.get_fignums(), [])
+
+        queue = ChartQueue()
+        queue.add(chart_spec('distribution', 'missing.json', '테스트', '3년'))
+        queue.add(chart_spec('normalized', self.data_path, '테스트', '3년'))
+        with contextlib.redirect_stdout(io.StringIO()):
+            saved = queue.render()
+        self.assertEqual(saved, ['테스트_normalized_comparison_3년.png'])
+        self.assertEqual(plt.get_fignums(), [])
+        self.assertEqual(queue.failed, [('테스트', '테스트_price_diff_ratio_distribution_3년.png')])
+
+    def test_company_chart_paths_match_rendered_charts(self):
+        """The expected chart list matches what analyze_company_all_periods queues for a period"""
+        queue = ChartQueue()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(analyze_ratio.analyze_price_diff_ratio(self.data_path, '테스트', queue))
+            failed = analyze_ratio.generate_timeseries_plots_for_all_periods('테스트', queue)
+        self.assertNotIn(('테스트', '3년'), failed)
+        queued = sorted(spec['filename'] for spec in queue._specs.values())
+
+        self.assertEqual(sorted(company_chart_paths('테스트', ['3년'])), queued)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""
+Golden-output tests for the array-based backtest kernel
+Compares run_single_strategy against the original iterrows implementation
+"""
+
+import unittest
+import contextlib
+import io
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backtest_kernel import (
+    HOLD_COMMON, HOLD_PREFERRED, prepare_signals, run_switching_batch, run_switching_kernel
+)
+from backtest_strategy_with_report import run_single_strategy, run_strategy_batch, summarize_strategy_result
+from rolling_quantile import calculate_rolling_quantiles
+from trade_log import ACTION_SWITCH
+
+
+def reference_single_strategy(df_backtest, initial_stock_type, initial_shares, company_name,
+                              reverse_strategy=False, window_suffix="2year"):
+    """Original iterrows loop from backtest_strategy_with_report.run_single_strategy"""
+    current_stock_type = initial_stock_type
+    current_shares = initial_shares
+    cash = 0.0 # 배당금 및 매매 후 남은 현금
+    
+    # 회사명을 기반으로 주식 유형명 설정
+    common_stock_name = f"{company_name} 보통주"
+    preferred_stock_name = f"{company_name} 우선주"
+    
+    strategy_portfolio_values = [] # 일별 전략 포트폴리오 가치 저장
+    trading_log = [] # 매매 기록 저장
+
+    # 윈도우 크기에 따른 분위수 컬럼명 설정
+    q25_col = f'Price_Diff_Ratio_25th_Percentile_{window_suffix}'
+    q75_col = f'Price_Diff_Ratio_75th_Percentile_{window_suffix}'
+
+    for i, (date, row) in enumerate(df_backtest.iterrows()):
+        # 첫 날의 평가 금액 기록 - 종가 기준으로 수정
+        if i == 0:
+            # 첫날 종가 기준으로 포트폴리오 가치 계산
+            if current_stock_type == common_stock_name:
+                current_portfolio_value = current_shares * row['Stock1_Close'] + cash
+            else:
+                current_portfolio_value = current_shares * row['Stock2_Close'] + cash
+            
+            # 초기 상태 기록
+            trading_log.append({
+                'Date': date.strftime('%Y-%m-%d'),
+                'Action': '초기보유',
+                'Stock_Type': current_stock_type,
+                'Shares_Traded': 0,
+                'Price_Per_Share': 0,
+                'Total_Amount': 0,
+                'Current_Shares': current_shares,
+                'Current_Stock_Type': current_stock_type,
+                'Cash_Balance': cash,
+                'Portfolio_Value': current_portfolio_value,
+                'Price_Diff_Ratio': row['Price_Diff_Ratio'],
+                'Q25': 0,
+                'Q75': 0
+            })
+        else:
+            prev_date = df_backtest.index[i-1]
+            prev_row = df_backtest.loc[prev_date]
+
+            current_ratio = prev_row['Price_Diff_Ratio']
+            q25 = prev_row[q25_col]
+            q75 = prev_row[q75_col]
+
+            # 매매 조건 확인 (기본 전략 vs 반대 전략)
+            if not reverse_strategy:
+                # 기본 전략: 25% 이하 -> 보통주, 75% 이상 -> 우선주
+                should_buy_common = current_ratio < q25 and current_stock_type != common_stock_name
+                should_buy_preferred = current_ratio > q75 and current_stock_type != preferred_stock_name
+            else:
+                # 반대 전략: 25% 이하 -> 우선주, 75% 이상 -> 보통주
+                should_buy_common = current_ratio > q75 and current_stock_type != common_stock_name
+                should_buy_preferred = current_ratio < q25 and current_stock_type != preferred_stock_name
+
+            if should_buy_common:
+                # 현재 보유주 -> 보통주
+                if current_stock_type == preferred_stock_name:
+                    sell_price = row['Stock2_Open']
+                    buy_price = row['Stock1_Open']
+                    sell_value = current_shares * sell_price
+                    cash += sell_value
+                    
+                    buy_shares = cash / buy_price
+                    cash -= buy_shares * buy_price
+                    
+                    # 매매 기록
+                    trading_log.append({
+                        'Date': date.strftime('%Y-%m-%d'),
+                        'Action': '매도->매수',
+                        'Stock_Type': f'{current_stock_type} -> {common_stock_name}',
+                        'Shares_Traded': f'매도 {current_shares:.2f}주 -> 매수 {buy_shares:.2f}주',
+                        'Price_Per_Share': f'매도가 {sell_price:,.0f}원 -> 매수가 {buy_price:,.0f}원',
+                        'Total_Amount': f'매도금 {sell_value:,.0f}원 -> 매수금 {buy_shares * buy_price:,.0f}원',
+                        'Current_Shares': buy_shares,
+                        'Current_Stock_Type': common_stock_name,
+                        'Cash_Balance': cash,
+                        'Portfolio_Value': 0,  # 아래에서 계산
+                        'Price_Diff_Ratio': current_ratio,
+                        'Q25': q25,
+                        'Q75': q75
+                    })
+                    
+                    current_shares = buy_shares
+                    current_stock_type = common_stock_name
+
+            elif should_buy_preferred:
+                # 현재 보유주 -> 우선주
+                if current_stock_type == common_stock_name:
+                    sell_price = row['Stock1_Open']
+                    buy_price = row['Stock2_Open']
+                    sell_value = current_shares * sell_price
+                    cash += sell_value
+                    
+                    buy_shares = cash / buy_price
+                    cash -= buy_shares * buy_price
+                    
+                    # 매매 기록
+                    trading_log.append({
+                        'Date': date.strftime('%Y-%m-%d'),
+                        'Action': '매도->매수',
+                        'Stock_Type': f'{current_stock_type} -> {preferred_stock_name}',
+                        'Shares_Traded': f'매도 {current_shares:.2f}주 -> 매수 {buy_shares:.2f}주',
+                        'Price_Per_Share': f'매도가 {sell_price:,.0f}원 -> 매수가 {buy_price:,.0f}원',
+                        'Total_Amount': f'매도금 {sell_value:,.0f}원 -> 매수금 {buy_shares * buy_price:,.0f}원',
+                        'Current_Shares': buy_shares,
+                        'Current_Stock_Type': preferred_stock_name,
+                        'Cash_Balance': cash,
+                        'Portfolio_Value': 0,  # 아래에서 계산
+                        'Price_Diff_Ratio': current_ratio,
+                        'Q25': q25,
+                        'Q75': q75
+                    })
+                    
+                    current_shares = buy_shares
+                    current_stock_type = preferred_stock_name
+            
+            # 배당금 처리 - stock_diff.py에서 처리된 배당 데이터 활용
+            dividend_income = 0.0
+            dividend_per_share = 0.0
+            
+            # 현재 보유 주식 유형에 따른 배당 처리
+            if current_stock_type == common_stock_name:
+                # 보통주 보유 시 - Stock1 배당 (일반적으로 보통주와 우선주 배당이 동일)
+                if 'Dividend_Amount_Raw' in row and row['Dividend_Amount_Raw'] > 0:
+                    dividend_per_share = row['Dividend_Amount_Raw']
+                    dividend_income = current_shares * dividend_per_share
+                    cash += dividend_income
+            else:  # preferred_stock_name
+                # 우선주 보유 시 - Stock2 배당 또는 동일 배당
+                if 'Dividend_Amount_Raw' in row and row['Dividend_Amount_Raw'] > 0:
+                    dividend_per_share = row['Dividend_Amount_Raw']
+                    dividend_income = current_shares * dividend_per_share
+                    cash += dividend_income
+            
+            # 배당금 수령 기록
+            if dividend_income > 0:
+                trading_log.append({
+                    'Date': date.strftime('%Y-%m-%d'),
+                    'Action': '배당금수령',
+                    'Stock_Type': current_stock_type,
+                    'Shares_Traded': f'{current_shares:.2f}주',
+                    'Price_Per_Share': f'{dividend_per_share:,.0f}원/주',
+                    'Total_Amount': f'{dividend_income:,.0f}원',
+                    'Current_Shares': current_shares,
+                    'Current_Stock_Type': current_stock_type,
+                    'Cash_Balance': cash,
+                    'Portfolio_Value': 0,  # 아래에서 계산
+                    'Price_Diff_Ratio': row['Price_Diff_Ratio'],
+                    'Q25': 0,
+                    'Q75': 0
+                })
+
+        # 현재 포트폴리오 가치 계산 (종가 기준)
+        if current_stock_type == common_stock_name:
+            current_portfolio_value = current_shares * row['Stock1_Close'] + cash
+        else:
+            current_portfolio_value = current_shares * row['Stock2_Close'] + cash
+        
+        # 매매 기록이 있으면 포트폴리오 가치 업데이트
+        if trading_log and trading_log[-1]['Date'] == date.strftime('%Y-%m-%d'):
+            trading_log[-1]['Portfolio_Value'] = current_portfolio_value
+        
+        strategy_portfolio_values.append({'Date': date, 'Value': current_portfolio_value})
+
+    last_day_data = df_backtest.iloc[-1]
+    if current_stock_type == common_stock_name:
+        final_stock_value_strategy = current_shares * last_day_data['Stock1_Close']
+    else:
+        final_stock_value_strategy = current_shares * last_day_data['Stock2_Close']
+    final_total_value_strategy = final_stock_value_strategy + cash
+    initial_capital = 100_000_000
+    return_without_dividends_strategy = ((final_total_value_strategy - cash - initial_capital) / initial_capital) * 100
+
+    return {
+        'portfolio_values': strategy_portfolio_values,
+        'trading_log': trading_log,
+        'final_value': final_total_value_strategy,
+        'final_stock_value': final_stock_value_strategy,
+        'return_rate': return_without_dividends_strategy,
+        'current_shares': current_shares,
+        'current_stock_type': current_stock_type,
+        'cash': cash
+    }
+
+
+def make_backtest_frame(rows=1500, seed=7):
+    """Build a stock_diff-like frame with quantile columns and quarterly dividends"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2015-01-02', periods=rows)
+    common_close = 50000 * np.exp(np.cumsum(rng.normal(0, 0.015, rows)))
+    preferred_close = common_close * (0.8 + 0.05 * np.sin(np.arange(rows) / 40) + rng.normal(0, 0.01, rows))
+    df = pd.DataFrame({
+        'Stock1_Close': np.round(common_close),
+        'Stock2_Close': np.round(preferred_close),
+        'Stock1_Open': np.round(common_close * (1 + rng.normal(0, 0.005, rows))),
+        'Stock2_Open': np.round(preferred_close * (1 + rng.normal(0, 0.005, rows))),
+        'Dividend_Amount_Raw': np.where(np.arange(rows) % 63 == 30, 361.0, 0.0),
+    }, index=dates)
+    df['Price_Diff_Ratio'] = (df['Stock1_Close'] - df['Stock2_Close']) * 100 / df['Stock2_Close']
+    quantiles = calculate_rolling_quantiles(df['Price_Diff_Ratio'].to_numpy(), {'2year': 730, '5year': 1825})
+    for window_name, values in quantiles.items():
+        df[f'Price_Diff_Ratio_25th_Percentile_{window_name}'] = values[0.25]
+        df[f'Price_Diff_Ratio_75th_Percentile_{window_name}'] = values[0.75]
+    return df
+
+
+class TestBacktestKernel(unittest.TestCase):
+    """Test cases for backtest_kernel and run_single_strategy"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.df = make_backtest_frame()
+        self.company_name = '삼성전자'
+
+    def run_both(self, initial_stock_type, reverse_strategy, window_suffix, df=None):
+        df = self.df if df is None else df
+        initial_shares = int(100_000_000 / df['Stock1_Open'].iloc[0])
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_single_strategy(df, initial_stock_type, initial_shares, 100_000_000, self.company_name,
+                                         reverse_strategy, 'test', window_suffix)
+        expected = reference_single_strategy(df, initial_stock_type, initial_shares, self.company_name,
+                                             reverse_strategy, window_suffix)
+        return result, expected
+
+    def assert_same_result(self, result, expected):
+        for key in ['final_value', 'final_stock_value', 'return_rate', 'current_shares', 'current_stock_type', 'cash']:
+            self.assertEqual(result[key], expected[key], key)
+        self.assertEqual(result['trading_log'].to_records(), expected['trading_log'])
+        self.assertEqual(result['portfolio_values'], expected['portfolio_values'])
+
+    def test_golden_output_all_strategies(self):
+        """Every strategy/window/initial holding matches the iterrows implementation exactly"""
+        for initial_stock_type in (f'{self.company_name} 보통주', f'{self.company_name} 우선주'):
+            for reverse_strategy in (False, True):
+                for window_suffix in ('2year', '5year'):
+                    with self.subTest(initial=initial_stock_type, reverse=reverse_strategy, window=window_suffix):
+                        result, expected = self.run_both(initial_stock_type, reverse_strategy, window_suffix)
+                        self.assertGreater(len(expected['trading_log']), 10)
+                        self.assert_same_result(result, expected)
+
+    def test_switch_and_dividend_on_same_day(self):
+        """Only the last log entry of a day carries the portfolio value"""
+        df = self.df.copy()
+        df['Dividend_Amount_Raw'] = 100.0
+        result, expected = self.run_both(f'{self.company_name} 보통주', False, '2year', df)
+
+        self.assert_same_result(result, expected)
+        trading_log = result['trading_log']
+        same_day_switch = trading_log.actions == ACTION_SWITCH
+        self.assertTrue(same_day_switch.any())
+        self.assertTrue((trading_log.portfolio_value[same_day_switch] == 0).all())
+
+    def test_unknown_initial_stock_type_never_trades(self):
+        """An initial holding that matches neither name is kept, as before"""
+        result, expected = self.run_both('기타 보유', False, '2year')
+
+        self.assert_same_result(result, expected)
+        self.assertEqual(result['trading_log'].trade_count, 0)
+
+    def test_batch_matches_single_runs(self):
+        """All windows x basic/reverse in one batch equal the individual runs"""
+        initial_stock_type = f'{self.company_name} 보통주'
+        initial_shares = int(100_000_000 / self.df['Stock1_Open'].iloc[0])
+        configs = [(f'{kind}_{window}', window, kind == '반대전략')
+                   for window in ('2year', '5year') for kind in ('기본전략', '반대전략')]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            kernel_results = run_strategy_batch(self.df, initial_stock_type, initial_shares, self.company_name, configs)
+            for strategy_name, window_suffix, reverse_strategy in configs:
+                batched = summarize_strategy_result(self.df, kernel_results[strategy_name], initial_stock_type,
+                                                    initial_shares, 100_000_000, self.company_name,
+                                                    strategy_name, window_suffix)
+                expected = reference_single_strategy(self.df, initial_stock_type, initial_shares, self.company_name,
+                                                     reverse_strategy, window_suffix)
+                self.assert_same_result(batched, expected)
+
+    def test_sweep_sized_batch(self):
+        """A 60-strategy batch with mixed holdings matches one kernel call per strategy"""
+        rng = np.random.default_rng(3)
+        ratio = self.df['Price_Diff_Ratio'].to_numpy()
+        arrays = [self.df[column].to_numpy() for column in ['Stock1_Open', 'Stock1_Close', 'Stock2_Open', 'Stock2_Close']]
+        dividends = self.df['Dividend_Amount_Raw'].to_numpy()
+
+        params = []
+        for _ in range(60):
+            lower, upper = np.sort(rng.uniform(0.05, 0.95, 2))
+            window = int(rng.integers(50, 800))
+            rolling = pd.Series(ratio).rolling(window, min_periods=1)
+            params.append((rolling.quantile(lower).to_numpy(), rolling.quantile(upper).to_numpy(),
+                           bool(rng.integers(2)), int(rng.integers(2)), float(rng.integers(100, 2000))))
+
+        signals = [prepare_signals(ratio, q_low, q_high, reverse) for q_low, q_high, reverse, _, _ in params]
+        batch = run_switching_batch(*arrays, dividends, [sig[0] for sig in signals], [sig[1] for sig in signals],
+                                    [p[3] for p in params], [p[4] for p in params])
+
+        for (q_low, q_high, reverse, holding, shares), batched in zip(params, batch):
+            single = run_switching_kernel(*arrays, dividends, ratio, q_low, q_high, holding, shares, reverse)
+            np.testing.assert_array_equal(batched['values'], single['values'])
+            self.assertEqual(batched['events'], single['events'])
+            self.assertEqual((batched['holding'], batched['shares'], batched['cash']),
+                             (single['holding'], single['shares'], single['cash']))
+
+    def test_signals_use_previous_day(self):
+        """Signals are shifted by one day and the first day never trades"""
+        to_common, to_preferred = prepare_signals([1.0, 5.0, 0.0], [2.0, 2.0, 2.0], [4.0, 4.0, 4.0])
+        np.testing.assert_array_equal(to_common, [False, True, False])
+        np.testing.assert_array_equal(to_preferred, [False, False, True])
+
+    def test_kernel_without_dividends(self):
+        """The kernel accepts missing dividend data"""
+        prices = np.full(4, 100.0)
+        result = run_switching_kernel(prices, prices, prices, prices, None,
+                                      [1.0, 5.0, 0.0, 0.0], [2.0] * 4, [4.0] * 4, HOLD_COMMON, 10)
+
+        # day 2: common -> preferred, day 3: preferred -> common
+        self.assertEqual([event[3] for event in result['events']], [HOLD_PREFERRED, HOLD_COMMON])
+        self.assertEqual(result['holding'], HOLD_COMMON)
+        np.testing.assert_array_equal(result['values'], [1000.0] * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
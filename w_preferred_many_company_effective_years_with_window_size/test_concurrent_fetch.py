@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the concurrent metadata fetch layer
+Requests go to a local stub HTTP server instead of Yahoo
+"""
+
+import unittest
+import contextlib
+import io
+import json
+import threading
+import time
+import tempfile
+import shutil
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from concurrent_fetch import HostRateLimiter, call_with_retry, fetch_concurrently
+from market_data_cache import MarketDataCache
+
+
+class StubQuoteServer:
+    """Local HTTP server answering /info/<ticker> with a JSON quote after a short delay"""
+
+    def __init__(self, delay=0.2, failures=None):
+        self.delay = delay
+        self.failures = dict(failures or {})  # ticker -> number of 429 responses before success
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                ticker = self.path.rsplit('/', 1)[-1]
+                with stub.lock:
+                    stub.requests.append((ticker, time.monotonic()))
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    failing = stub.failures.get(ticker, 0) > 0
+                    if failing:
+                        stub.failures[ticker] -= 1
+                time.sleep(stub.delay)
+                with stub.lock:
+                    stub.in_flight -= 1
+                if failing:
+                    self.send_error(429, 'Too Many Requests')
+                    return
+                body = json.dumps({'shortName': ticker, 'regularMarketPrice': 100.0}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def fetch_info(self, ticker):
+        with urllib.request.urlopen(f'{self.url}/info/{ticker}', timeout=5) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+
+class StubHttpFetcher:
+    """MarketDataCache fetcher that reads info from the stub server"""
+
+    def __init__(self, server):
+        self.server = server
+        self.host = '127.0.0.1'
+
+    def info(self, ticker):
+        return self.server.fetch_info(ticker)
+
+
+class FakeClock:
+    """Clock whose sleep advances time instead of waiting"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestConcurrentFetch(unittest.TestCase):
+    """Test cases for concurrent_fetch"""
+
+    def test_requests_run_in_parallel(self):
+        """Slow requests overlap instead of running one after another"""
+        tickers = [f'T{i}' for i in range(8)]
+        with StubQuoteServer(delay=0.2) as server:
+            started = time.monotonic()
+            outcomes = fetch_concurrently(server.fetch_info, [(t, (t,)) for t in tickers], max_workers=8)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(list(outcomes), tickers)
+        self.assertEqual([outcomes[t]['result']['shortName'] for t in tickers], tickers)
+        self.assertGreater(server.max_in_flight, 1)
+        self.assertLess(elapsed, 0.2 * len(tickers) / 2)
+
+    def test_max_workers_bounds_concurrency(self):
+        """No more than max_workers requests are in flight at once"""
+        with StubQuoteServer(delay=0.05) as server:
+            fetch_concurrently(server.fetch_info, [(f'T{i}', (f'T{i}',)) for i in range(6)], max_workers=2)
+
+        self.assertLessEqual(server.max_in_flight, 2)
+        self.assertEqual(len(server.requests), 6)
+
+    def test_rate_limited_responses_are_retried(self):
+        """429 responses are retried with backoff; exhausted retries only fail that request"""
+        with StubQuoteServer(delay=0.0, failures={'SLOW': 2, 'DOWN': 10}) as server:
+            outcomes = fetch_concurrently(server.fetch_info, [(t, (t,)) for t in ('OK', 'SLOW', 'DOWN')],
+                                          retries=2, backoff=0.01)
+
+        self.assertEqual(outcomes['OK']['result']['shortName'], 'OK')
+        self.assertEqual(outcomes['SLOW']['result']['shortName'], 'SLOW')
+        self.assertIsNone(outcomes['DOWN']['result'])
+        self.assertIn('429', outcomes['DOWN']['error'])
+        self.assertEqual(sum(1 for ticker, _ in server.requests if ticker == 'SLOW'), 3)
+        self.assertEqual(sum(1 for ticker, _ in server.requests if ticker == 'DOWN'), 3)
+
+    def test_rate_limiter_spaces_requests_per_host(self):
+        """Requests to one host start 1/rate seconds apart; other hosts are not delayed"""
+        starts = []
+
+        with StubQuoteServer(delay=0.0) as server:
+            def timed_fetch(ticker):
+                starts.append(time.monotonic())  # recorded when the limiter lets the request go
+                return server.fetch_info(ticker)
+
+            limiter = HostRateLimiter(rate_per_second=20)
+            fetch_concurrently(timed_fetch, [(f'T{i}', (f'T{i}',)) for i in range(6)],
+                               rate_limiter=limiter, host='127.0.0.1')
+
+        starts.sort()
+        self.assertEqual(len(server.requests), 6)
+        self.assertGreaterEqual(starts[-1] - starts[0], 5 * 0.05 * 0.9)
+
+        clock = FakeClock()
+        limiter = HostRateLimiter(rate_per_second=2, clock=clock, sleep=clock.sleep)
+        for host in ('a', 'a', 'b', 'a'):
+            limiter.wait(host)
+        self.assertEqual(clock.sleeps, [0.5, 0.5])
+
+    def test_call_with_retry_backoff(self):
+        """Backoff doubles after each failure and non-retryable errors are raised at once"""
+        attempts = []
+        sleeps = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError('reset')
+            return 'ok'
+
+        self.assertEqual(call_with_retry(flaky, retries=3, backoff=0.5, sleep=sleeps.append), 'ok')
+        self.assertEqual(sleeps, [0.5, 1.0])
+
+        with self.assertRaises(KeyError):
+            call_with_retry(lambda: {}['missing'], retries=3, retry_on=(ConnectionError,), sleep=sleeps.append)
+        self.assertEqual(sleeps, [0.5, 1.0])
+
+    def test_market_data_cache_fetch_snapshots_from_stub_server(self):
+        """fetch_snapshots fills the info cache concurrently and later calls are served from disk"""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        tickers = ['BAC', 'BAC-PK', 'JPM', 'JPM-PC']
+
+        with StubQuoteServer(delay=0.1, failures={'JPM': 1}) as server:
+            cache = MarketDataCache(cache_dir=cache_dir, offline=False, fetcher=StubHttpFetcher(server),
+                                    rate_per_second=None)
+            with contextlib.redirect_stdout(io.StringIO()):
+                snapshots = cache.fetch_snapshots(tickers, fields=('info',), backoff=0.01)
+                again = cache.fetch_snapshots(tickers, fields=('info',))
+
+        self.assertEqual({t: snapshots[t]['info']['shortName'] for t in tickers}, {t: t for t in tickers})
+        self.assertEqual(again, snapshots)
+        self.assertEqual(len(server.requests), len(tickers) + 1)
+        self.assertGreater(server.max_in_flight, 1)
+        self.assertEqual(cache.info('BAC')['regularMarketPrice'], 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
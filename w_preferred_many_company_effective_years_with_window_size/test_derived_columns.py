@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the vectorized derived column computation
+Checks parity with the original DataFrame.apply implementation in stock_diff.py
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from derived_columns import (
+    add_dividend_yield_column, add_price_diff_columns, safe_ratio,
+    _apply_derived_columns, _synthetic_price_frame
+)
+
+
+class TestDerivedColumns(unittest.TestCase):
+    """Test cases for derived_columns"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.df = _synthetic_price_frame(rows=500)
+        # Zero preferred price rows exercise the 0 fallback
+        self.df.iloc[[3, 100], self.df.columns.get_loc('Stock2_Close')] = 0.0
+
+    def test_parity_with_apply(self):
+        """Vectorized columns match the row-wise apply results exactly"""
+        expected = _apply_derived_columns(self.df.copy())
+        result = add_dividend_yield_column(add_price_diff_columns(self.df.copy()))
+
+        for column in ['Price_Difference', 'Price_Diff_Ratio', 'Dividend_Yield_on_Preferred']:
+            np.testing.assert_array_equal(result[column].to_numpy(), expected[column].to_numpy(dtype=float))
+
+    def test_zero_denominator_returns_zero(self):
+        """Zero or NaN preferred price gives 0 like the original fallback"""
+        result = add_dividend_yield_column(add_price_diff_columns(self.df.copy()))
+
+        self.assertEqual(result['Price_Diff_Ratio'].iloc[3], 0)
+        self.assertEqual(result['Dividend_Yield_on_Preferred'].iloc[100], 0)
+        self.assertEqual(safe_ratio(5.0, np.nan), 0)
+
+    def test_rows_mask_only_updates_selected_rows(self):
+        """With a row mask only the new rows are computed"""
+        df = add_dividend_yield_column(add_price_diff_columns(self.df.copy()))
+        df.iloc[-10:, df.columns.get_loc('Stock1_Close')] += 1000
+        rows = np.zeros(len(df), dtype=bool)
+        rows[-5:] = True
+
+        before = df['Price_Diff_Ratio'].copy()
+        add_price_diff_columns(df, rows=rows)
+        expected = _apply_derived_columns(df.copy())
+
+        np.testing.assert_array_equal(df['Price_Diff_Ratio'].to_numpy()[:-5], before.to_numpy()[:-5])
+        np.testing.assert_array_equal(df['Price_Diff_Ratio'].to_numpy()[-5:],
+                                      expected['Price_Diff_Ratio'].to_numpy()[-5:])
+
+    def test_safe_ratio_scalar(self):
+        """Scalar inputs return a float, as used by us_diff"""
+        self.assertEqual(safe_ratio(2.0, 50.0), 4.0)
+        self.assertEqual(safe_ratio(3.0, 2.0, scale=1), 1.5)
+        self.assertEqual(safe_ratio(1.0, 0), 0)
+        self.assertIsInstance(safe_ratio(1.0, 4.0), float)
+
+
+if __name__ == '__main__':
+    unittest.main()
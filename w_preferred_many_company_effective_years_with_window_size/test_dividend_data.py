@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for dividend series normalization, merging and the dividend registry
+"""
+
+import unittest
+from unittest.mock import patch
+import contextlib
+import io
+import tempfile
+import shutil
+import pandas as pd
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import dividend_data
+from dividend_data import (
+    DEFAULT_REGISTRY_PATH, import_dividends, load_dividend_registry, merge_dividend_data,
+    normalize_dividend_series, registry_dividends, validate_dividend_registry
+)
+
+def external_dividends():
+    """Build a registry-style dividend series"""
+    index = pd.DatetimeIndex(['2023-12-26', '2024-03-27', '2024-06-26'], name='Date')
+    return pd.Series([362.0, 361.0, 361.0], index=index, name='Dividends')
+
+
+def yfinance_dividends():
+    """Build a tz-aware dividend series like yf.Ticker(...).dividends"""
+    index = pd.DatetimeIndex(['2023-12-26', '2024-06-26', '2024-09-26'], tz='Asia/Seoul', name='Date')
+    return pd.Series([300.0, 300.0, 361.0], index=index, name='Dividends')
+
+
+class TestDividendData(unittest.TestCase):
+    """Test cases for dividend_data"""
+
+    def test_normalize_drops_timezone_without_mutating_input(self):
+        """Timezones are dropped on a new series and the caller's index is left alone"""
+        original = yfinance_dividends()
+        normalized = normalize_dividend_series(original)
+
+        self.assertIsNone(normalized.index.tz)
+        self.assertEqual(normalized.index[0], pd.Timestamp('2023-12-26'))
+        self.assertIsNotNone(original.index.tz)
+
+    def test_merge_keeps_external_values_first(self):
+        """Shared dates keep the external amount and yfinance-only dates are added"""
+        external = external_dividends()
+        yfinance = yfinance_dividends()
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            merged = merge_dividend_data(external, yfinance)
+
+        expected = pd.Series([362.0, 361.0, 361.0, 361.0],
+                             index=pd.to_datetime(['2023-12-26', '2024-03-27', '2024-06-26', '2024-09-26']))
+        pd.testing.assert_series_equal(merged, expected, check_names=False, check_freq=False)
+        self.assertIn('1개 새로운 배당금', output.getvalue())
+        self.assertIsNotNone(yfinance.index.tz)
+        pd.testing.assert_series_equal(external, external_dividends())
+
+    def test_merge_with_one_side_empty(self):
+        """An empty side returns the other side normalized"""
+        merged = merge_dividend_data(pd.Series(dtype=float), yfinance_dividends())
+
+        self.assertIsNone(merged.index.tz)
+        self.assertEqual(len(merged), 3)
+        self.assertTrue(merge_dividend_data(pd.Series(dtype=float), pd.Series(dtype=float)).empty)
+
+
+class TestDividendRegistry(unittest.TestCase):
+    """Test cases for the external dividend registry"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        self.registry_path = os.path.join(self.directory, 'dividend_registry.csv')
+        with open(self.registry_path, 'w', encoding='utf-8') as f:
+            f.write("ticker,ex_dividend_date,dividend\n"
+                    "005930.KS,2024-03-27,361.0\n"
+                    "005935.KS,2023-12-26,362.0\n"
+                    "005935.KS,2024-03-27,361.0\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write_csv(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_repository_registry_is_valid(self):
+        """The shipped dividend_registry.csv passes validation"""
+        registry = load_dividend_registry(DEFAULT_REGISTRY_PATH)
+
+        self.assertIn('005935.KS', registry)
+        self.assertEqual(registry['005935.KS'].loc['2020-12-28'], 1933.0)
+
+    def test_registry_is_loaded_once_per_file_version(self):
+        """The file is parsed once and re-read only after it changes"""
+        with patch.object(dividend_data, '_read_registry_frame', wraps=dividend_data._read_registry_frame) as reader:
+            first = registry_dividends('005935.KS', self.registry_path)
+            first.iloc[0] = 0.0  # callers may modify their copy
+            second = registry_dividends('005935.KS', self.registry_path)
+            with contextlib.redirect_stdout(io.StringIO()):
+                import_dividends([self.write_csv('new.csv', "ticker,ex_dividend_date,dividend\n"
+                                                            "005935.KS,2024-06-26,361.0\n")],
+                                 path=self.registry_path)
+            third = registry_dividends('005935.KS', self.registry_path)
+
+        self.assertEqual(second.iloc[0], 362.0)
+        self.assertEqual(len(third), 3)
+        self.assertEqual(reader.call_count, 3)  # initial load, import, reload after import
+        self.assertTrue(registry_dividends('000000.KS', self.registry_path).empty)
+
+    def test_validation_reports_duplicates_and_order(self):
+        """Duplicate ticker/date rows, unordered dates and bad values are reported by line"""
+        df = pd.DataFrame({
+            'ticker': ['A', 'A', 'A', 'B', 'A'],
+            'ex_dividend_date': ['2024-03-01', '2024-03-01', '2024-01-01', '2024-02-30', '2024-05-01'],
+            'dividend': [1.0, 1.0, 1.0, -1.0, 1.0],
+        })
+        errors = validate_dividend_registry(df)
+
+        self.assertTrue(any(error.startswith('3번째 줄') and '중복' in error for error in errors))
+        self.assertTrue(any(error.startswith('4번째 줄') and '날짜 순서' in error for error in errors))
+        self.assertTrue(any(error.startswith('5번째 줄') and '날짜 형식' in error for error in errors))
+        self.assertTrue(any(error.startswith('5번째 줄') and '배당금' in error for error in errors))
+        self.assertTrue(any(error.startswith('6번째 줄') and '티커 순서' in error for error in errors))
+        self.assertEqual(validate_dividend_registry(df.drop(columns='dividend')), ["필수 컬럼 없음: ['dividend']"])
+
+        broken = self.write_csv('broken.csv', "ticker,ex_dividend_date,dividend\nA,2024-03-01,1\nA,2024-01-01,1\n")
+        with self.assertRaises(ValueError):
+            load_dividend_registry(broken)
+
+    def test_bulk_import_investing_format(self):
+        """Investing.com exports are imported for a ticker; shared dates are updated"""
+        investing = self.write_csv('investing.csv', '"Ex-dividend Date","Dividend"\n'
+                                                    '"6월 26, 2024","361.00"\n'
+                                                    '"3월 27, 2024","365.00"\n'
+                                                    '"12월 26, 2023","1,932.00"\n')
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = import_dividends([investing], ticker='005935.KS', path=self.registry_path)
+
+        self.assertEqual(summary, {'added': 1, 'updated': 2, 'total': 4})
+        dividends = registry_dividends('005935.KS', self.registry_path)
+        self.assertEqual(list(dividends), [1932.0, 365.0, 361.0])
+        self.assertEqual(registry_dividends('005930.KS', self.registry_path).iloc[0], 361.0)
+
+        duplicated = self.write_csv('dup.csv', '"Ex-dividend Date","Dividend"\n"6월 26, 2024","1"\n"6월 26, 2024","2"\n')
+        with self.assertRaises(ValueError):
+            import_dividends([duplicated], ticker='005935.KS', path=self.registry_path)
+        with self.assertRaises(ValueError):
+            import_dividends([investing], path=self.registry_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the entry point import-time benchmark
+"""
+
+import unittest
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from import_benchmark import find_regressions, load_results, measure_import, parse_importtime, save_results
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |     640000 | pandas
+import time:        80 |        200 |   companies
+import time:      1500 |     655000 | stock_diff
+"""
+
+
+class TestImportBenchmark(unittest.TestCase):
+    """Test cases for import_benchmark"""
+
+    def test_parse_importtime(self):
+        """Cumulative times are read per module in seconds and the header is skipped"""
+        timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+        self.assertEqual(timings['stock_diff'], 0.655)
+        self.assertEqual(timings['companies'], 0.0002)
+        self.assertNotIn('imported package', timings)
+
+    def test_measure_import_in_fresh_process(self):
+        """A real entry point is measured with the heavy modules it loads"""
+        result = measure_import('companies', repeats=1)
+
+        self.assertEqual(result['module'], 'companies')
+        self.assertGreater(result['seconds'], 0)
+        self.assertEqual(result['heavy_modules'], [])
+        with self.assertRaises(RuntimeError):
+            measure_import('no_such_entry_point', repeats=1)
+
+    def test_regressions_against_saved_baseline(self):
+        """Slower imports and newly loaded heavy modules are reported"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        path = os.path.join(directory, 'baseline.json')
+        save_results([{'module': 'stock_diff', 'seconds': 0.6, 'heavy_modules': ['pandas']},
+                      {'module': 'companies', 'seconds': 0.001, 'heavy_modules': []}], path)
+        baseline = load_results(path)
+
+        current = [{'module': 'stock_diff', 'seconds': 0.65, 'heavy_modules': ['pandas']},
+                   {'module': 'companies', 'seconds': 0.001, 'heavy_modules': ['matplotlib']}]
+        self.assertEqual(find_regressions(current, baseline), ["companies: import 시 새로 로드됨 ['matplotlib']"])
+
+        current[0]['seconds'] = 1.5
+        self.assertEqual(len(find_regressions(current, baseline)), 2)
+        self.assertEqual(load_results(os.path.join(directory, 'missing.json')), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
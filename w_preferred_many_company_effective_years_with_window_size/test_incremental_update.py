@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the incremental analysis data update engine
+"""
+
+import unittest
+from unittest.mock import patch
+import contextlib
+import io
+import tempfile
+import shutil
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import incremental_update
+from incremental_update import (
+    affected_ranges, build_window_state, compute_analysis_frame, load_window_state, save_window_state,
+    update_analysis_frame, window_state_matches
+)
+
+WINDOW_CONFIGS = {'2year': 20, '3year': 35, '5year': 60}
+
+
+def make_price_frame(rows=300, seed=1):
+    """Build price/dividend input data shaped like the stock_diff master frame"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2020-01-01', periods=rows)
+    close1 = 100 + rng.normal(0, 5, rows)
+    close2 = 80 + rng.normal(0, 5, rows)
+    dividends = np.zeros(rows)
+    dividends[[50, 180]] = [3.0, 3.5]
+    return pd.DataFrame({
+        'Stock1_Close': close1,
+        'Stock2_Close': close2,
+        'Stock1_Open': close1 + 1,
+        'Stock2_Open': close2 + 1,
+        'Dividend_Amount_Raw': dividends,
+    }, index=dates)
+
+
+def quietly(func, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+class TestIncrementalUpdate(unittest.TestCase):
+    """Test cases for incremental_update"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.prices = make_price_frame()
+        self.stored = quietly(compute_analysis_frame, self.prices, WINDOW_CONFIGS)
+
+    def assert_matches_full_recompute(self, stored, fresh):
+        updated, summary = update_analysis_frame(stored, fresh, WINDOW_CONFIGS)
+        expected = quietly(compute_analysis_frame, fresh, WINDOW_CONFIGS)
+        pd.testing.assert_frame_equal(updated, expected, check_exact=True, check_freq=False)
+        return summary
+
+    def test_unchanged_data_returns_stored_frame(self):
+        """Identical inputs return the stored frame object so the file is not rewritten"""
+        updated, summary = update_analysis_frame(self.stored, self.prices.copy(), WINDOW_CONFIGS)
+
+        self.assertIs(updated, self.stored)
+        self.assertEqual(summary['changed'] + summary['added'] + summary['removed'], 0)
+
+    def test_appended_rows(self):
+        """New trading days only recompute the new rows"""
+        summary = self.assert_matches_full_recompute(self.stored.iloc[:-5], self.prices)
+
+        self.assertEqual(summary['added'], 5)
+        self.assertEqual(summary['recomputed'], 5)
+        self.assertEqual(summary['first_changed'], self.prices.index[-5])
+
+    def test_revised_close_recomputes_trailing_windows(self):
+        """A revised old close recomputes only the rows whose windows contain it"""
+        fresh = self.prices.copy()
+        fresh.iloc[120, fresh.columns.get_loc('Stock2_Close')] = 70.0
+
+        summary = self.assert_matches_full_recompute(self.stored, fresh)
+
+        self.assertEqual(summary['changed'], 1)
+        self.assertEqual(summary['recomputed'], max(WINDOW_CONFIGS.values()))
+
+    def test_new_dividend_refills_following_rows(self):
+        """A dividend added to dividend_data updates the forward-filled amount and yield"""
+        fresh = self.prices.copy()
+        fresh.iloc[100, fresh.columns.get_loc('Dividend_Amount_Raw')] = 2.0
+
+        summary = self.assert_matches_full_recompute(self.stored, fresh)
+
+        self.assertEqual(summary['changed'], 1)
+        self.assertEqual(summary['recomputed'], 0)
+
+    def test_removed_and_inserted_dates(self):
+        """Dates dropped from or added inside the history shift the windows that span them"""
+        self.assert_matches_full_recompute(self.stored, self.prices.drop(self.prices.index[[3, 150]]))
+        self.assert_matches_full_recompute(self.stored.drop(self.stored.index[[10, 200]]), self.prices)
+
+    def test_rows_outside_fresh_range_are_kept(self):
+        """Stored rows before the fresh data range are kept as they are"""
+        updated, _ = update_analysis_frame(self.stored, self.prices.iloc[100:], WINDOW_CONFIGS)
+
+        self.assertIs(updated, self.stored)
+
+    def test_daily_appends_from_window_state_match_full_recompute(self):
+        """Regression: appending day by day from the persisted window state equals a cold recompute"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        state_path = os.path.join(directory, 'X_stock_analysis_3년.window_state.npz')
+
+        stored = quietly(compute_analysis_frame, self.prices.iloc[:230], WINDOW_CONFIGS)
+        save_window_state(state_path, build_window_state(stored, WINDOW_CONFIGS))
+        for end in range(231, len(self.prices) + 1, 7):
+            fresh = self.prices.iloc[:end]
+            window_state = load_window_state(state_path, WINDOW_CONFIGS)
+            # appends must continue from the state instead of re-filling the windows
+            with patch.object(incremental_update, '_recompute_quantile_ranges', side_effect=AssertionError):
+                stored, summary = update_analysis_frame(stored, fresh, WINDOW_CONFIGS, window_state)
+            save_window_state(state_path, build_window_state(stored, WINDOW_CONFIGS))
+
+            expected = quietly(compute_analysis_frame, fresh, WINDOW_CONFIGS)
+            pd.testing.assert_frame_equal(stored, expected, check_exact=True, check_freq=False)
+            self.assertEqual(summary['recomputed'], summary['added'])
+
+    def test_window_state_round_trip_and_validation(self):
+        """The state file restores the same windows and is rejected for other data or window sizes"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        state_path = os.path.join(directory, 'state.npz')
+
+        save_window_state(state_path, build_window_state(self.stored, WINDOW_CONFIGS))
+        state = load_window_state(state_path, WINDOW_CONFIGS)
+
+        self.assertEqual(state['rows'], len(self.stored))
+        np.testing.assert_array_equal(state['windows']['5year'][1], self.stored['Price_Diff_Ratio'].to_numpy()[-60:])
+        self.assertTrue(window_state_matches(state, self.stored))
+        self.assertFalse(window_state_matches(state, self.stored.iloc[:-1]))
+        self.assertIsNone(load_window_state(state_path, {'2year': 21}))
+        self.assertIsNone(load_window_state(os.path.join(directory, 'missing.npz'), WINDOW_CONFIGS))
+
+    def test_affected_ranges(self):
+        """Overlapping windows are merged and clipped to the frame length"""
+        self.assertEqual(affected_ranges([2, 5, 30], 10, 35), [(2, 14), (30, 34)])
+        self.assertEqual(affected_ranges([], 10, 35), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the opt-in stage timing and profiling layer
+"""
+
+import unittest
+from unittest.mock import patch
+import argparse
+import contextlib
+import io
+import json
+import pstats
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import instrumentation
+from instrumentation import (
+    TIMING_ENV, add_instrumentation_arguments, chrome_trace, clear_stages, drain_stages, finish_session,
+    recorded_stages, stage, start_from_args, summarize_stages, timed, write_chrome_trace
+)
+from parallel_runner import run_tasks
+
+
+@timed()
+def _square(value):
+    """Timed module-level task (picklable for worker processes)"""
+    with stage('square.inner', value=value):
+        return value * value
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for instrumentation"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        environ = patch.dict(os.environ, {TIMING_ENV: '1'})
+        environ.start()
+        self.addCleanup(environ.stop)
+        clear_stages()
+        self.addCleanup(clear_stages)
+
+    def test_disabled_by_default(self):
+        """Nothing is recorded unless timing is turned on"""
+        with patch.dict(os.environ, {TIMING_ENV: ''}):
+            with stage('ignored'):
+                pass
+            self.assertEqual(_square(3), 9)
+
+        self.assertEqual(recorded_stages(), [])
+
+    def test_nested_stages_and_decorator(self):
+        """Decorated functions keep their name and result, and failed blocks are still recorded"""
+        self.assertEqual(_square(4), 16)
+        self.assertEqual(_square.__name__, '_square')
+        with self.assertRaises(ValueError):
+            with stage('failing'):
+                raise ValueError('boom')
+
+        names = [event['name'] for event in recorded_stages()]
+        self.assertEqual(names, ['square.inner', 'test_instrumentation._square', 'failing'])
+        inner, outer = recorded_stages()[:2]
+        self.assertEqual(inner['args'], {'value': '4'})
+        self.assertLessEqual(inner['seconds'], outer['seconds'])
+
+        rows = summarize_stages([
+            {'name': 'a', 'seconds': 1.0}, {'name': 'b', 'seconds': 0.5}, {'name': 'a', 'seconds': 2.0},
+        ])
+        self.assertEqual(rows[0], {'name': 'a', 'count': 2, 'total': 3.0, 'max': 2.0})
+        self.assertEqual(rows[1]['name'], 'b')
+
+    def test_chrome_trace_format(self):
+        """Stages become complete events in microseconds, outer stages first"""
+        _square(2)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        path = write_chrome_trace(os.path.join(directory, 'trace.json'))
+
+        with open(path, encoding='utf-8') as f:
+            trace = json.load(f)
+        self.assertEqual(trace, chrome_trace())
+        events = trace['traceEvents']
+        self.assertEqual([event['name'] for event in events], ['test_instrumentation._square', 'square.inner'])
+        self.assertTrue(all(event['ph'] == 'X' and event['pid'] == os.getpid() for event in events))
+        self.assertGreaterEqual(events[1]['ts'], events[0]['ts'])
+        self.assertEqual(os.listdir(directory), ['trace.json'])
+
+    def test_worker_stages_are_collected(self):
+        """Stages recorded in worker processes are merged into the parent with the task stages"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            outcomes = run_tasks(_square, [(value, (value,)) for value in range(3)], jobs=2)
+
+        self.assertEqual([outcome['result'] for outcome in outcomes.values()], [0, 1, 4])
+        events = recorded_stages()
+        self.assertEqual(sorted(event['name'] for event in events if event['name'].startswith('task')),
+                         ['task: 0', 'task: 1', 'task: 2'])
+        self.assertEqual(len([event for event in events if event['name'] == 'square.inner']), 3)
+        self.assertNotIn(os.getpid(), {event['pid'] for event in events})
+        self.assertEqual(drain_stages(), [])  # 작업 프로세스의 단계는 부모 프로세스 것이 아님
+
+    def test_session_writes_profile_trace_and_summary(self):
+        """--profile and --trace write their files and the summary lists the slowest stages"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        profile_path = os.path.join(directory, 'run.prof')
+        trace_path = os.path.join(directory, 'trace.json')
+        parser = argparse.ArgumentParser()
+        add_instrumentation_arguments(parser)
+        args = parser.parse_args(['--profile', profile_path, '--trace', trace_path])
+
+        with patch.dict(os.environ, {TIMING_ENV: ''}), patch('atexit.register'):
+            start_from_args(args)
+            self.addCleanup(setattr, instrumentation, '_session', None)
+            self.assertTrue(instrumentation.is_enabled())
+            _square(5)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                finish_session()
+                finish_session()  # 두 번째 호출은 아무것도 하지 않음
+
+        self.assertIn('가장 오래 걸린 단계', output.getvalue())
+        self.assertEqual(output.getvalue().count('test_instrumentation._square'), 1)
+        self.assertIn('_square', ''.join(str(key) for key in pstats.Stats(profile_path).stats))
+        with open(trace_path, encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)['traceEvents']), 2)
+
+        args = parser.parse_args([])
+        with patch('instrumentation.start_session') as start_session:
+            start_from_args(args)
+        start_session.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
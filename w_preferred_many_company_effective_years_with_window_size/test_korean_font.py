@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the cached Korean font lookup
+"""
+
+import unittest
+from unittest.mock import patch
+import contextlib
+import io
+import json
+import tempfile
+import shutil
+from types import SimpleNamespace
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import korean_font
+from korean_font import apply_korean_font, find_korean_font, resolve_korean_font
+
+
+class TestKoreanFont(unittest.TestCase):
+    """Test cases for korean_font"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.directory, 'font_cache.json')
+        korean_font._resolved_fonts.clear()
+
+    def tearDown(self):
+        korean_font._resolved_fonts.clear()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_find_korean_font_priority(self):
+        """Exact names win in candidate order, then case-insensitive partial matches"""
+        fonts = ['DejaVu Sans', 'NanumBarunGothic', 'NanumGothic']
+
+        self.assertEqual(find_korean_font(['NanumGothic', 'NanumBarunGothic'], fonts), 'NanumGothic')
+        self.assertEqual(find_korean_font(['Malgun Gothic', 'nanumbarun'], fonts), 'NanumBarunGothic')
+        self.assertIsNone(find_korean_font(['AppleGothic'], fonts))
+
+    def test_font_is_discovered_once_per_environment(self):
+        """The scan runs once; the same process and later processes reuse the result"""
+        with patch.object(korean_font, 'find_korean_font', return_value='NanumGothic') as finder, \
+                contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(resolve_korean_font(self.cache_path), 'NanumGothic')
+            self.assertEqual(resolve_korean_font(self.cache_path), 'NanumGothic')
+            korean_font._resolved_fonts.clear()  # a new process (e.g. a pool worker) only has the file
+            self.assertEqual(resolve_korean_font(self.cache_path), 'NanumGothic')
+
+        self.assertEqual(finder.call_count, 1)
+        with open(self.cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+        self.assertEqual([entry['family'] for entry in cache.values()], ['NanumGothic'])
+
+    def test_environment_change_or_refresh_rescans(self):
+        """A different environment, a corrupted cache or refresh=True run the scan again"""
+        environment = korean_font.font_environment()
+        with patch.object(korean_font, 'find_korean_font', side_effect=[None, 'NanumGothic', 'AppleGothic']) as finder, \
+                contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(resolve_korean_font(self.cache_path))
+
+            korean_font._resolved_fonts.clear()
+            with patch.object(korean_font, 'font_environment', return_value=dict(environment, fontlist_mtime=1)):
+                self.assertEqual(resolve_korean_font(self.cache_path), 'NanumGothic')
+
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                f.write('{broken')
+            korean_font._resolved_fonts.clear()
+            self.assertEqual(resolve_korean_font(self.cache_path, refresh=True), 'AppleGothic')
+
+        self.assertEqual(finder.call_count, 3)
+
+    def test_apply_sets_rcparams(self):
+        """The resolved family is applied; a missing Korean font falls back to sans-serif"""
+        plt = SimpleNamespace(rcParams={})
+        with patch.object(korean_font, 'resolve_korean_font', return_value='NanumGothic'):
+            self.assertTrue(apply_korean_font(plt, self.cache_path))
+        self.assertEqual(plt.rcParams, {'font.family': 'NanumGothic', 'axes.unicode_minus': False})
+
+        with patch.object(korean_font, 'resolve_korean_font', return_value=None):
+            self.assertFalse(apply_korean_font(plt, self.cache_path))
+        self.assertEqual(plt.rcParams['font.family'], 'sans-serif')
+
+
+if __name__ == '__main__':
+    unittest.main()
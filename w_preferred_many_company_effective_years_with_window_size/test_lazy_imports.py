@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for deferred imports of heavy plotting/fetching dependencies
+"""
+
+import unittest
+import subprocess
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lazy_imports import LazyModule, lazy_pyplot, lazy_seaborn
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def modules_loaded_by(statement):
+    """Run an import statement in a fresh interpreter and return the heavy modules it loaded"""
+    code = (f"import sys; {statement}; "
+            "print(','.join(m for m in ('matplotlib', 'seaborn', 'yfinance', 'pandas') if m in sys.modules))")
+    completed = subprocess.run([sys.executable, '-c', code], cwd=SCRIPT_DIR, capture_output=True, text=True,
+                               check=True)
+    return [name for name in completed.stdout.strip().split(',') if name]
+
+
+class TestLazyModule(unittest.TestCase):
+    """Test cases for LazyModule"""
+
+    def test_module_is_imported_on_first_attribute_access(self):
+        """The module is imported and set up once, on first use"""
+        calls = []
+        lazy = LazyModule('json', setup=calls.append)
+
+        self.assertFalse(lazy.loaded)
+        self.assertEqual(lazy.dumps([1]), '[1]')
+        self.assertEqual(lazy.loads('2'), 2)
+        self.assertTrue(lazy.loaded)
+        self.assertEqual(len(calls), 1)
+        self.assertIs(calls[0], sys.modules['json'])
+
+    def test_seaborn_applies_pyplot_setup_first(self):
+        """Using seaborn runs the pyplot font setup even if pyplot was never touched"""
+        configured = []
+        plt = lazy_pyplot(configure=configured.append, backend='Agg')
+        sns = lazy_seaborn(plt)
+
+        sns.set_style('whitegrid')
+        self.assertTrue(plt.loaded)
+        self.assertEqual(len(configured), 1)
+        self.assertEqual(plt.get_backend().lower(), 'agg')
+
+
+class TestEntryPointImports(unittest.TestCase):
+    """Entry points must not load plotting or fetching libraries at import time"""
+
+    def test_company_list_needs_no_heavy_modules(self):
+        """companies (used by make interactive) and the stock_diff CLI import without pandas"""
+        self.assertEqual(modules_loaded_by('from companies import PREFERRED_STOCK_COMPANIES'), [])
+        self.assertEqual(modules_loaded_by('import stock_diff'), [])
+
+    def test_entry_points_defer_plotting_and_fetching(self):
+        """Script modules import without matplotlib, seaborn or yfinance"""
+        for module_name in ('price_diff_analysis', 'us_diff', 'analyze_ratio', 'analyze_all_companies',
+                            'comprehensive_company_comparison_report', 'backtest_strategy_with_report',
+                            'strategy_sweep', 'pipeline'):
+            with self.subTest(module=module_name):
+                self.assertEqual(modules_loaded_by(f'import {module_name}'), ['pandas'])
+
+    def test_stock_diff_list_skips_pandas(self):
+        """stock_diff.py --list prints the company list without importing pandas, also with other options"""
+        for options in (['--list'], ['-l'], ['--list', '--offline', '--jobs', '2']):
+            with self.subTest(options=options):
+                completed = subprocess.run([sys.executable, '-X', 'importtime', 'stock_diff.py', *options],
+                                           cwd=SCRIPT_DIR, capture_output=True, text=True, check=True)
+
+                self.assertIn('삼성전자', completed.stdout)
+                imported = [line.split('|')[-1].strip() for line in completed.stderr.splitlines() if '|' in line]
+                self.assertNotIn('pandas', imported)
+
+    def test_stock_diff_reexports_company_list(self):
+        """stock_diff still exposes the same company dictionary and analysis functions"""
+        import companies
+        import price_diff_analysis
+        import stock_diff
+        from stock_diff import generate_stock_data_for_periods
+
+        self.assertIs(stock_diff.PREFERRED_STOCK_COMPANIES, companies.PREFERRED_STOCK_COMPANIES)
+        self.assertIs(generate_stock_data_for_periods, price_diff_analysis.generate_stock_data_for_periods)
+        self.assertIs(stock_diff.ANALYSIS_PERIODS, price_diff_analysis.ANALYSIS_PERIODS)
+        with self.assertRaises(AttributeError):
+            stock_diff.no_such_function
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the on-disk market data cache
+All tests run from fixtures without network access
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+from datetime import timedelta
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import market_data_cache
+from market_data_cache import MarketDataCache, company_tickers, to_long_prices, wide_prices
+
+
+def make_price_frame(ticker, start_date, end_date):
+    """Build a yf.download-like frame with (Price, Ticker) MultiIndex columns"""
+    dates = pd.bdate_range(start_date, end_date, inclusive='left')
+    values = np.arange(len(dates), dtype=float) + 100
+    frame = pd.DataFrame({'Close': values, 'Open': values - 1}, index=dates)
+    frame.columns = pd.MultiIndex.from_product([frame.columns, [ticker]], names=['Price', 'Ticker'])
+    return frame
+
+
+class FakeFetcher:
+    """Fixture data source that records every request"""
+
+    def __init__(self):
+        self.calls = []
+
+    def download(self, ticker, start_date, end_date):
+        self.calls.append(('download', ticker, start_date, end_date))
+        return make_price_frame(ticker, start_date, end_date)
+
+    def download_many(self, tickers, start_date, end_date):
+        self.calls.append(('download_many', tuple(tickers), start_date, end_date))
+        return pd.concat([make_price_frame(ticker, start_date, end_date) for ticker in tickers], axis=1)
+
+    def dividends(self, ticker):
+        self.calls.append(('dividends', ticker))
+        return pd.Series([361.0, 361.0], index=pd.to_datetime(['2024-03-27', '2024-06-26']), name='Dividends')
+
+    def info(self, ticker):
+        self.calls.append(('info', ticker))
+        return {'shortName': ticker, 'regularMarketPrice': 55000, 'firstTradeDate': pd.Timestamp('2000-01-04')}
+
+    def history(self, ticker, period):
+        self.calls.append(('history', ticker, period))
+        return make_price_frame(ticker, '2024-06-24', '2024-06-29')
+
+
+class OfflineFetcher:
+    """Data source that fails the test if the network would be used"""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"network access attempted: {name}")
+
+
+class TestMarketDataCache(unittest.TestCase):
+    """Test cases for MarketDataCache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.fetcher = FakeFetcher()
+        self.cache = MarketDataCache(cache_dir=self.cache_dir, offline=False, fetcher=self.fetcher)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def offline_cache(self):
+        return MarketDataCache(cache_dir=self.cache_dir, offline=True, fetcher=OfflineFetcher())
+
+    def test_download_is_cached(self):
+        """A repeated request is served from disk"""
+        first = self.cache.download('005930.KS', '2024-01-01', '2024-03-01')
+        second = self.cache.download('005930.KS', '2024-01-01', '2024-03-01')
+
+        self.assertEqual(len(self.fetcher.calls), 1)
+        pd.testing.assert_frame_equal(first, second)
+        pd.testing.assert_frame_equal(first, make_price_frame('005930.KS', '2024-01-01', '2024-03-01'))
+
+    def test_download_subrange_uses_cache(self):
+        """A sub-range of a cached range needs no fetch"""
+        self.cache.download('005930.KS', '2024-01-01', '2024-06-01')
+        sliced = self.cache.download('005930.KS', '2024-02-01', '2024-03-01')
+
+        self.assertEqual(len(self.fetcher.calls), 1)
+        self.assertEqual(sliced.index[0], pd.Timestamp('2024-02-01'))
+        self.assertLess(sliced.index[-1], pd.Timestamp('2024-03-01'))
+
+    def test_download_merges_missing_ranges(self):
+        """Only the uncovered head and tail are fetched and merged"""
+        self.cache.download('005930.KS', '2024-02-01', '2024-03-01')
+        merged = self.cache.download('005930.KS', '2024-01-01', '2024-04-01')
+
+        self.assertEqual(self.fetcher.calls[1:], [
+            ('download', '005930.KS', '2024-01-01', '2024-02-01'),
+            ('download', '005930.KS', '2024-03-01', '2024-04-01'),
+        ])
+        expected_dates = pd.bdate_range('2024-01-01', '2024-04-01', inclusive='left')
+        self.assertTrue(merged.index.equals(expected_dates))
+
+    def test_expired_prices_are_refetched(self):
+        """An entry older than its TTL is fetched again"""
+        cache = MarketDataCache(cache_dir=self.cache_dir, offline=False, fetcher=self.fetcher,
+                                ttls={'prices': timedelta(0)})
+        cache.download('005930.KS', '2024-01-01', '2024-02-01')
+        cache.download('005930.KS', '2024-01-01', '2024-02-01')
+
+        self.assertEqual(len(self.fetcher.calls), 2)
+
+    def test_offline_serves_cached_data(self):
+        """Offline mode returns cached data regardless of TTL and never fetches"""
+        expected = self.cache.download('005935.KS', '2024-01-01', '2024-03-01')
+        self.cache.dividends('005935.KS')
+        self.cache.info('005935.KS')
+
+        offline = self.offline_cache()
+        offline.ttls = {field: timedelta(0) for field in offline.ttls}
+        pd.testing.assert_frame_equal(offline.download('005935.KS', '2024-01-01', '2024-03-01'), expected)
+        self.assertEqual(offline.ticker('005935.KS').dividends.sum(), 722.0)
+        self.assertEqual(offline.ticker('005935.KS').info['regularMarketPrice'], 55000)
+
+    def test_offline_miss_returns_empty(self):
+        """Offline cache misses return empty results"""
+        offline = self.offline_cache()
+
+        self.assertTrue(offline.download('000000.KS', '2024-01-01', '2024-03-01').empty)
+        self.assertTrue(offline.dividends('000000.KS').empty)
+        self.assertTrue(offline.history('000000.KS').empty)
+        self.assertEqual(offline.info('000000.KS'), {})
+
+    def test_snapshot_fields_are_cached(self):
+        """info, dividends and history are fetched once within their TTL"""
+        ticker = self.cache.ticker('005930.KS')
+        for _ in range(2):
+            info = ticker.info
+            dividends = ticker.dividends
+            history = ticker.history(period='5d')
+
+        self.assertEqual(sorted(call[0] for call in self.fetcher.calls), ['dividends', 'history', 'info'])
+        self.assertEqual(info['shortName'], '005930.KS')
+        self.assertEqual(info['firstTradeDate'], '2000-01-04 00:00:00')
+        self.assertEqual(len(dividends), 2)
+        self.assertFalse(history.empty)
+
+    def test_offline_flag_from_environment(self):
+        """MARKET_DATA_OFFLINE enables offline mode"""
+        with patch.dict(os.environ, {market_data_cache.OFFLINE_ENV: '1',
+                                     market_data_cache.CACHE_DIR_ENV: self.cache_dir}):
+            cache = MarketDataCache()
+        self.assertTrue(cache.offline)
+        self.assertEqual(cache.cache_dir, self.cache_dir)
+
+    def test_to_long_prices_normalizes_every_shape(self):
+        """(Price, Ticker), (Ticker, Price) and single-level frames give the same long frame"""
+        wide = pd.concat([make_price_frame(ticker, '2024-01-01', '2024-01-10') for ticker in ('A', 'B')], axis=1)
+        expected = to_long_prices(wide)
+
+        self.assertEqual(list(expected.columns), ['Date', 'Ticker', 'Open', 'Close'])
+        self.assertEqual(list(expected['Ticker'].unique()), ['A', 'B'])
+        pd.testing.assert_frame_equal(to_long_prices(wide.swaplevel(axis=1)), expected)
+
+        single = make_price_frame('A', '2024-01-01', '2024-01-10').droplevel('Ticker', axis=1)
+        pd.testing.assert_frame_equal(to_long_prices(single, ['A']), expected[expected['Ticker'] == 'A'])
+        with self.assertRaises(ValueError):
+            to_long_prices(single)
+        self.assertTrue(to_long_prices(pd.DataFrame()).empty)
+
+    def test_wide_prices_round_trip(self):
+        """wide_prices returns one ticker with single-level columns"""
+        frame = make_price_frame('A', '2024-01-01', '2024-02-01')
+        prices = wide_prices(to_long_prices(frame), 'A')
+
+        pd.testing.assert_frame_equal(prices[['Close', 'Open']], frame.droplevel('Ticker', axis=1),
+                                      check_names=False, check_freq=False)
+        self.assertTrue(wide_prices(to_long_prices(frame), 'B').empty)
+
+    def test_download_many_uses_one_request(self):
+        """Uncached tickers are fetched in one call and later per-ticker requests hit the cache"""
+        self.cache.download('005930.KS', '2024-01-01', '2024-03-01')
+        prices = self.cache.download_many(['005930.KS', '005935.KS', '005380.KS'], '2024-01-01', '2024-03-01')
+
+        self.assertEqual(self.fetcher.calls[1:], [
+            ('download_many', ('005935.KS', '005380.KS'), '2024-01-01', '2024-03-01'),
+        ])
+        self.assertEqual(list(prices['Ticker'].unique()), ['005930.KS', '005935.KS', '005380.KS'])
+
+        pd.testing.assert_frame_equal(self.cache.download('005935.KS', '2024-02-01', '2024-03-01'),
+                                      make_price_frame('005935.KS', '2024-01-01', '2024-03-01').loc['2024-02-01':],
+                                      check_names=False, check_freq=False, check_like=True)
+        self.assertEqual(len(self.fetcher.calls), 2)
+
+        offline = self.offline_cache().download_many(['005380.KS', '000000.KS'], '2024-01-01', '2024-03-01')
+        self.assertEqual(list(offline['Ticker'].unique()), ['005380.KS'])
+
+    def test_fetch_snapshots_skips_fresh_entries(self):
+        """Only missing or expired fields are requested; offline mode reads the cache only"""
+        self.cache.info('005930.KS')
+        snapshots = self.cache.fetch_snapshots(['005930.KS', '005935.KS', '005930.KS'],
+                                               fields=('info', 'dividends', 'history'))
+
+        self.assertEqual(sorted(call[:2] for call in self.fetcher.calls), [
+            ('dividends', '005930.KS'), ('dividends', '005935.KS'),
+            ('history', '005930.KS'), ('history', '005935.KS'),
+            ('info', '005930.KS'), ('info', '005935.KS'),
+        ])
+        self.assertEqual(snapshots['005935.KS']['info']['shortName'], '005935.KS')
+        self.assertEqual(snapshots['005935.KS']['dividends'].sum(), 722.0)
+
+        offline = self.offline_cache().fetch_snapshots(['005935.KS', '000000.KS'], fields=('info',))
+        self.assertEqual(offline['005935.KS']['info']['shortName'], '005935.KS')
+        self.assertEqual(offline['000000.KS']['info'], {})
+        with self.assertRaises(ValueError):
+            self.cache.fetch_snapshots(['005930.KS'], fields=('prices',))
+
+    def test_company_tickers(self):
+        """Common and preferred tickers are collected from both company table layouts"""
+        companies = {
+            'KR': {'common': '005930.KS', 'preferred': '005935.KS'},
+            'US': {'common': 'BAC', 'preferred_stocks': {'BAC-PK': 'BAC-PK', 'BAC-PL': 'BAC-PL'}},
+            'Dup': {'common': 'BAC', 'preferred_stocks': {}},
+        }
+        self.assertEqual(company_tickers(companies), ['005930.KS', '005935.KS', 'BAC', 'BAC-PK', 'BAC-PL'])
+
+    def test_stock_diff_runs_offline_from_fixtures(self):
+        """stock_diff builds its price frame from a pre-populated cache without network"""
+        import stock_diff
+
+        self.cache.download('005930.KS', '2024-01-01', '2024-03-01')
+        self.cache.download('005935.KS', '2024-01-01', '2024-03-01')
+
+        with patch.object(market_data_cache, '_default_cache', self.offline_cache()):
+            price_df = stock_diff.download_price_data('005930.KS', '005935.KS', '2024-01-01', '2024-03-01')
+
+        self.assertEqual(list(price_df.columns),
+                         ['Stock1_Close', 'Stock2_Close', 'Stock1_Open', 'Stock2_Open', 'Dividend_Amount_Raw'])
+        self.assertEqual(len(price_df), len(pd.bdate_range('2024-01-01', '2024-03-01', inclusive='left')))
+        self.assertEqual(price_df['Dividend_Amount_Raw'].sum(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the per-company / per-period process pool runner
+"""
+
+import unittest
+import contextlib
+import io
+import time
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from parallel_runner import resolve_jobs, run_tasks
+
+
+def square_with_log(company_name, value):
+    """Print a few log lines (with pauses so workers interleave) and return value ** 2"""
+    for step in range(3):
+        print(f"{company_name} step {step}")
+        time.sleep(0.01)
+    return value ** 2
+
+
+def fail_for_bad_ticker(company_name, value):
+    """Raise for one company to check failure isolation"""
+    if company_name == 'bad':
+        print("bad: downloading")
+        raise ValueError("no price data for bad")
+    return value
+
+
+class TestParallelRunner(unittest.TestCase):
+    """Test cases for parallel_runner"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tasks = [(f'company{i}', (f'company{i}', i)) for i in range(6)]
+
+    def test_parallel_matches_sequential_in_task_order(self):
+        """Results are identical and keep the task order regardless of completion order"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            sequential = run_tasks(square_with_log, self.tasks, jobs=1)
+            parallel = run_tasks(square_with_log, self.tasks, jobs=3)
+
+        self.assertEqual(list(parallel), [key for key, _ in self.tasks])
+        self.assertEqual(parallel, sequential)
+        self.assertEqual([outcome['result'] for outcome in parallel.values()], [i ** 2 for i in range(6)])
+
+    def test_worker_logs_are_printed_as_blocks(self):
+        """Each worker's output is captured and printed contiguously"""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            run_tasks(square_with_log, self.tasks, jobs=3)
+
+        lines = output.getvalue().splitlines()
+        for key, _ in self.tasks:
+            first = lines.index(f"{key} step 0")
+            self.assertEqual(lines[first:first + 3], [f"{key} step {step}" for step in range(3)])
+
+    def test_failure_is_isolated(self):
+        """One failing task is reported and the remaining tasks still complete"""
+        tasks = [('good1', ('good1', 1)), ('bad', ('bad', 2)), ('good2', ('good2', 3))]
+        for jobs in (1, 2):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                outcomes = run_tasks(fail_for_bad_ticker, tasks, jobs=jobs)
+
+            self.assertEqual(outcomes['good1'], {'result': 1, 'error': None})
+            self.assertEqual(outcomes['good2'], {'result': 3, 'error': None})
+            self.assertIsNone(outcomes['bad']['result'])
+            self.assertIn('no price data for bad', outcomes['bad']['error'])
+            self.assertIn('❌ bad 작업 실패', output.getvalue())
+
+    def test_resolve_jobs(self):
+        """None means sequential, 0 or less means all cores"""
+        self.assertEqual(resolve_jobs(None), 1)
+        self.assertEqual(resolve_jobs(4), 4)
+        self.assertEqual(resolve_jobs(0), os.cpu_count() or 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the single-process pipeline runner
+"""
+
+import unittest
+from unittest.mock import patch
+import contextlib
+import io
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pipeline import (
+    PIPELINE_STAGES, STATUS_BLOCKED, STATUS_FAILED, STATUS_INCOMPLETE, STATUS_RUN, STATUS_SKIPPED,
+    PipelineStage, StageIncomplete, run_pipeline, select_stages
+)
+from render_profile import RENDER_PROFILE_ENV
+
+
+class TestPipeline(unittest.TestCase):
+    """Test cases for pipeline"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.directory, 'state.json')
+        self.data_path = os.path.join(self.directory, 'data.txt')
+        self.calls = []
+
+        def produce(options):
+            self.calls.append('produce')
+            with open(self.data_path, 'w', encoding='utf-8') as f:
+                f.write(options['value'])
+
+        def consume(options):
+            self.calls.append('consume')
+
+        self.stages = [
+            PipelineStage('produce', 'produce', produce,
+                          inputs=lambda options: ([], {'value': options['value']}),
+                          outputs=lambda options: [self.data_path]),
+            PipelineStage('consume', 'consume', consume, deps=['produce'],
+                          inputs=lambda options: ([self.data_path], {})),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def run_quietly(self, value, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = run_pipeline({'value': value}, state_path=self.state_path, stages=self.stages, **kwargs)
+        return [item['status'] for item in summary]
+
+    def test_unchanged_inputs_are_skipped(self):
+        """A second run with the same inputs skips every stage"""
+        self.assertEqual(self.run_quietly('a'), [STATUS_RUN, STATUS_RUN])
+        self.assertEqual(self.run_quietly('a'), [STATUS_SKIPPED, STATUS_SKIPPED])
+        self.assertEqual(self.calls, ['produce', 'consume'])
+
+        self.assertEqual(self.run_quietly('a', force=True), [STATUS_RUN, STATUS_RUN])
+
+    def test_changed_inputs_rerun_downstream(self):
+        """New upstream output reruns the stages that read it"""
+        self.run_quietly('a')
+        self.assertEqual(self.run_quietly('b'), [STATUS_RUN, STATUS_RUN])
+
+        os.remove(self.data_path)
+        self.assertEqual(self.run_quietly('b'), [STATUS_RUN, STATUS_SKIPPED])
+
+    def test_failed_stage_blocks_dependents(self):
+        """A failing stage is reported and its dependents are not run"""
+        def broken(options):
+            raise RuntimeError('download failed')
+        self.stages[0].run = broken
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            summary = run_pipeline({'value': 'a'}, state_path=self.state_path, stages=self.stages)
+
+        self.assertEqual([item['status'] for item in summary], [STATUS_FAILED, STATUS_BLOCKED])
+        self.assertIn('download failed', output.getvalue())
+        self.assertIn('=== 파이프라인 단계별 실행 시간 ===', output.getvalue())
+        self.assertFalse(os.path.exists(self.state_path))
+
+    def test_partial_failure_reruns_next_time(self):
+        """A stage that reports failed companies still feeds its dependents but is not marked done"""
+        produce = self.stages[0].run
+
+        def partial(options):
+            produce(options)
+            raise StageIncomplete([('LG화학', '20년')])
+        self.stages[0].run = partial
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            summary = run_pipeline({'value': 'a'}, state_path=self.state_path, stages=self.stages)
+        self.assertEqual([item['status'] for item in summary], [STATUS_INCOMPLETE, STATUS_RUN])
+        self.assertIn('LG화학 20년', output.getvalue())
+
+        self.stages[0].run = produce
+        self.assertEqual(self.run_quietly('a'), [STATUS_RUN, STATUS_SKIPPED])
+        self.assertEqual(self.run_quietly('a'), [STATUS_SKIPPED, STATUS_SKIPPED])
+
+    def test_failure_forgets_previous_run(self):
+        """After a failed run the stage is not skipped even if its inputs go back to the old values"""
+        self.run_quietly('a')
+        produce = self.stages[0].run
+
+        def broken(options):
+            raise RuntimeError('download failed')
+        self.stages[0].run = broken
+        self.assertEqual(self.run_quietly('b'), [STATUS_FAILED, STATUS_BLOCKED])
+
+        self.stages[0].run = produce
+        self.assertEqual(self.run_quietly('a'), [STATUS_RUN, STATUS_SKIPPED])
+
+    def test_changed_stage_source_reruns(self):
+        """Editing a stage module reruns that stage"""
+        source_path = os.path.join(self.directory, 'stage_module.py')
+        with open(source_path, 'w', encoding='utf-8') as f:
+            f.write('VERSION = 1\n')
+        self.stages[1].sources = (source_path,)
+
+        self.run_quietly('a')
+        self.assertEqual(self.run_quietly('a'), [STATUS_SKIPPED, STATUS_SKIPPED])
+        with open(source_path, 'w', encoding='utf-8') as f:
+            f.write('VERSION = 2\n')
+        self.assertEqual(self.run_quietly('a'), [STATUS_SKIPPED, STATUS_RUN])
+
+    def test_every_stage_declares_outputs(self):
+        """Deleted reports and charts are rebuilt, and charts follow the render profile"""
+        options = {'company': '삼성전자'}
+        with patch.dict(os.environ, {RENDER_PROFILE_ENV: 'svg'}):
+            outputs = {stage.name: stage.outputs(options) for stage in PIPELINE_STAGES}
+        with patch.dict(os.environ, {RENDER_PROFILE_ENV: 'none'}):
+            no_charts = {stage.name: stage.outputs(options) for stage in PIPELINE_STAGES}
+
+        for stage in PIPELINE_STAGES:
+            with self.subTest(stage=stage.name):
+                self.assertTrue(stage.sources)
+                if stage.name != 'dividend_compare':  # 회사를 지정하면 파일을 만들지 않음
+                    self.assertTrue(outputs[stage.name])
+                self.assertFalse([path for path in outputs[stage.name] if path.endswith('.png')])
+                self.assertFalse([path for path in no_charts[stage.name] if path.endswith(('.png', '.svg'))])
+        self.assertIn('./삼성전자_comprehensive_analysis_report.md', outputs['backtest'])
+        self.assertIn('./삼성전자_strategy_comparison_20년.svg', outputs['backtest'])
+        self.assertIn('./dividend_yield_comparison_report.md', PIPELINE_STAGES[2].outputs({}))
+
+    def test_select_stages(self):
+        """--stages keeps declaration order and rejects unknown names"""
+        names = [stage.name for stage in select_stages(['backtest', 'stock_data'])]
+        self.assertEqual(names, ['stock_data', 'backtest'])
+        self.assertEqual(len(select_stages()), len(PIPELINE_STAGES))
+        with self.assertRaises(ValueError):
+            select_stages(['unknown'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the synthetic-data pipeline benchmark
+"""
+
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from market_data_cache import YFinanceFetcher
+from pipeline_benchmark import (
+    find_regressions, load_results, make_price_history, run_benchmark, save_results
+)
+
+
+class TestPipelineBenchmark(unittest.TestCase):
+    """Test cases for pipeline_benchmark"""
+
+    def test_synthetic_history_has_both_tickers_and_dividends(self):
+        """Prices look like yf.download output and dividends fall on trading days"""
+        prices, dividends = make_price_history(2)
+
+        self.assertEqual(len(prices), 504)
+        self.assertEqual(sorted(set(prices.columns.get_level_values('Ticker'))), ['005930.KS', '005935.KS'])
+        self.assertIn('Close', prices.columns.get_level_values('Price'))
+        self.assertEqual(len(dividends), 8)
+        self.assertTrue(dividends.index.isin(prices.index).all())
+
+    def test_stages_run_offline(self):
+        """Each stage is measured on synthetic data without calling yfinance or leaving files behind"""
+        previous_directory = os.getcwd()
+        with patch.object(YFinanceFetcher, 'download_many', side_effect=AssertionError('network used')):
+            results = run_benchmark(years=(1,), stages=('stock_diff', 'rolling_quantiles', 'single_strategy', 'reports'),
+                                    repeats=1)
+
+        self.assertEqual([result['stage'] for result in results],
+                         ['stock_diff', 'rolling_quantiles', 'single_strategy', 'reports'])
+        self.assertTrue(all(result['rows'] == 252 and result['seconds'] > 0 for result in results))
+        self.assertEqual(os.getcwd(), previous_directory)
+
+        with self.assertRaises(ValueError):
+            run_benchmark(years=(1,), stages=('plotting',))
+
+    def test_regressions_against_saved_baseline(self):
+        """Stages slower than the saved baseline are reported per stage and horizon"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        path = os.path.join(directory, 'baseline.json')
+
+        save_results([
+            {'stage': 'stock_diff', 'years': 30, 'rows': 7560, 'seconds': 0.2},
+            {'stage': 'reports', 'years': 30, 'rows': 7560, 'seconds': 0.01},
+        ], path)
+        baseline = load_results(path)
+        self.assertEqual(sorted(baseline), ['reports/30년', 'stock_diff/30년'])
+
+        current = [
+            {'stage': 'stock_diff', 'years': 30, 'rows': 7560, 'seconds': 0.3},
+            {'stage': 'reports', 'years': 30, 'rows': 7560, 'seconds': 0.011},
+            {'stage': 'reports', 'years': 100, 'rows': 25200, 'seconds': 1.0},
+        ]
+        self.assertEqual(find_regressions(current, baseline), ['stock_diff/30년: 0.200s -> 0.300s'])
+        self.assertEqual(load_results(os.path.join(directory, 'missing.json')), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
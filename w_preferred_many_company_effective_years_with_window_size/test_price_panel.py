@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the memory-mapped multi-company price panel
+"""
+
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import price_panel
+from analysis_storage import PYARROW_AVAILABLE, read_analysis_file, save_analysis_data
+from price_panel import ensure_price_panel, load_panel_frame, panel_path
+
+
+def _analysis_frame(days, seed, extra=False):
+    """Small analysis frame with a NaN and optional company-specific column"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2020-01-01', periods=days, freq='B', name='Date')
+    df = pd.DataFrame({
+        'Stock1_Close': rng.uniform(50000, 60000, days),
+        'Stock2_Close': rng.uniform(40000, 50000, days),
+        'Price_Diff_Ratio': rng.normal(20, 3, days),
+    }, index=index)
+    df.iloc[2, 2] = np.nan
+    if extra:
+        df['Dividend_Yield_on_Preferred'] = rng.uniform(1, 3, days)
+    return df
+
+
+class TestPricePanel(unittest.TestCase):
+    """Test cases for price_panel"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.addCleanup(price_panel._open_panels.clear)
+        self.frames = {
+            '삼성전자': _analysis_frame(30, 1, extra=True),
+            'LG화학': _analysis_frame(12, 2),
+        }
+        for company_name, df in self.frames.items():
+            save_analysis_data(df, company_name, '3년', directory=self.directory)
+
+    def test_pyarrow_is_installed(self):
+        """pyarrow is a project dependency, so the panel must not fall back to per-file reads"""
+        self.assertTrue(PYARROW_AVAILABLE, 'pyarrow is missing from the environment (run uv sync)')
+        self.assertTrue(os.path.exists(ensure_price_panel('3년', directory=self.directory)))
+
+    def test_panel_matches_analysis_files(self):
+        """Each company reads back the same rows and columns as its own analysis file"""
+        path = ensure_price_panel('3년', directory=self.directory)
+
+        self.assertEqual(path, panel_path('3년', self.directory))
+        for company_name in self.frames:
+            expected = read_analysis_file(
+                os.path.join(self.directory, f'{company_name}_stock_analysis_3년.parquet'))
+            df = load_panel_frame(company_name, '3년', directory=self.directory)
+            pd.testing.assert_frame_equal(df, expected, check_freq=False)
+
+        # 요청한 순서대로, 회사에 없는 컬럼은 제외
+        df = load_panel_frame('LG화학', '3년', columns=['Price_Diff_Ratio', 'Dividend_Yield_on_Preferred'],
+                              directory=self.directory)
+        self.assertEqual(list(df.columns), ['Price_Diff_Ratio'])
+        self.assertTrue(np.isnan(df['Price_Diff_Ratio'].iloc[2]))
+
+        with self.assertRaises(FileNotFoundError):
+            load_panel_frame('LG전자', '3년', directory=self.directory)
+
+    def test_frames_are_zero_copy_views(self):
+        """Numeric columns come straight from the memory map and are read-only"""
+        df = load_panel_frame('삼성전자', '3년', columns=['Price_Diff_Ratio', 'Stock1_Close'],
+                              directory=self.directory)
+
+        self.assertFalse(df['Price_Diff_Ratio'].to_numpy().flags.writeable)
+        self.assertFalse(df['Stock1_Close'].to_numpy().flags.writeable)
+        copied = df.copy()
+        copied.iloc[0, 0] = 0.0
+        self.assertNotEqual(df.iloc[0, 0], 0.0)
+
+    def test_rebuilt_only_when_sources_change(self):
+        """The panel is reused until an analysis file changes or a new company appears"""
+        ensure_price_panel('3년', directory=self.directory)
+        with patch('price_panel.build_price_panel') as build:
+            ensure_price_panel('3년', directory=self.directory)
+            load_panel_frame('삼성전자', '3년', directory=self.directory)
+        build.assert_not_called()
+
+        updated = self.frames['LG화학'].iloc[:5]
+        save_analysis_data(updated, 'LG화학', '3년', directory=self.directory)
+        # build=False는 오래된 패널 대신 데이터 파일을 직접 읽음
+        with patch('price_panel.build_price_panel') as build:
+            self.assertEqual(len(load_panel_frame('LG화학', '3년', directory=self.directory, build=False)), 5)
+        build.assert_not_called()
+
+        self.assertEqual(len(load_panel_frame('LG화학', '3년', directory=self.directory)), 5)
+        save_analysis_data(_analysis_frame(8, 3), 'LG전자', '3년', directory=self.directory)
+        self.assertEqual(len(load_panel_frame('LG전자', '3년', directory=self.directory)), 8)
+        self.assertEqual(sorted(name for name in os.listdir(self.directory) if name.startswith('price_panel')),
+                         ['price_panel_3년.arrow'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for chart render profiles
+"""
+
+import unittest
+from unittest.mock import patch
+import contextlib
+import io
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lazy_imports import lazy_pyplot
+from render_profile import (
+    RENDER_PROFILE_ENV, chart_path, get_render_profile, save_chart, saved_chart_paths, set_render_profile
+)
+
+plt = lazy_pyplot(configure=None)
+
+
+class TestRenderProfile(unittest.TestCase):
+    """Test cases for render_profile"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        environ = patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        os.environ.pop(RENDER_PROFILE_ENV, None)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def render(self, name):
+        """Draw a small line chart and save it with the current profile"""
+        fig, ax = plt.subplots(figsize=(4, 3))
+        ax.plot([1, 2, 3], [3, 1, 2])
+        try:
+            return save_chart(fig, os.path.join(self.directory, name))
+        finally:
+            plt.close(fig)
+
+    def test_default_profile_is_report(self):
+        """Without configuration charts are 300 DPI PNGs as before"""
+        self.assertEqual(get_render_profile(), 'report')
+        path = self.render('report.png')
+
+        self.assertTrue(path.endswith('report.png'))
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(4), b'\x89PNG')
+
+    def test_draft_is_smaller_than_report(self):
+        """The draft profile writes a lower-resolution PNG under the same name"""
+        report_path = self.render('report.png')
+        with contextlib.redirect_stdout(io.StringIO()):
+            set_render_profile('draft')
+        draft_path = self.render('draft.png')
+
+        self.assertTrue(draft_path.endswith('draft.png'))
+        self.assertLess(os.path.getsize(draft_path), os.path.getsize(report_path))
+
+    def test_svg_and_none_profiles(self):
+        """svg changes the extension for the file and for references; none writes nothing"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            set_render_profile('svg')
+        svg_path = self.render('chart.png')
+
+        self.assertEqual(svg_path, os.path.join(self.directory, 'chart.svg'))
+        self.assertEqual(chart_path('./chart.png'), './chart.svg')
+        with open(svg_path, encoding='utf-8') as f:
+            self.assertIn('<svg', f.read())
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            set_render_profile('none')
+        self.assertIsNone(self.render('skipped.png'))
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'skipped.png')))
+        self.assertEqual(chart_path('./chart.png'), './chart.png')
+
+    def test_saved_chart_paths(self):
+        """Expected chart files follow the profile, and none expects no chart files"""
+        self.assertEqual(saved_chart_paths(['./a.png', 'b.png'], 'svg'), ['./a.svg', 'b.svg'])
+        self.assertEqual(saved_chart_paths(['./a.png'], 'draft'), ['./a.png'])
+        self.assertEqual(saved_chart_paths(['./a.png'], 'none'), [])
+
+    def test_profile_is_shared_through_environment(self):
+        """set_render_profile updates the environment so worker processes inherit it"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            set_render_profile('draft')
+        self.assertEqual(os.environ[RENDER_PROFILE_ENV], 'draft')
+
+        with self.assertRaises(ValueError):
+            set_render_profile('poster')
+
+        os.environ[RENDER_PROFILE_ENV] = 'poster'
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(get_render_profile(), 'report')
+        self.assertIn('poster', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for streaming report writing
+"""
+
+import unittest
+import contextlib
+import io
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from report_writer import ReportWriter, link_or_copy, open_report, save_report_files
+
+
+class TestReportWriter(unittest.TestCase):
+    """Test cases for report_writer"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def read(self, path):
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def test_commit_writes_main_and_backup(self):
+        """Sections streamed into the report end up in the main file and its backup"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = open_report('테스트_summary_backtest_report', '3년')
+            report.write("# 제목\n")
+            report.writelines(["| a | b |\n", "|---|---|\n"])
+            main_path, backup_path = report.commit()
+
+        self.assertEqual(main_path, './테스트_summary_backtest_report_3년.md')
+        self.assertTrue(backup_path.startswith('./report_backup/테스트_summary_backtest_report_3년_'))
+        self.assertEqual(self.read(main_path), "# 제목\n| a | b |\n|---|---|\n")
+        self.assertEqual(self.read(backup_path), self.read(main_path))
+        self.assertEqual([name for name in os.listdir('.') if name.endswith('.tmp')], [])
+
+    def test_backup_keeps_content_after_next_report(self):
+        """Replacing the main report later does not change a hardlinked backup"""
+        os.makedirs('backup')
+        first = ReportWriter('report.md', 'backup/report_1.md', quiet=True)
+        first.write("first\n")
+        first.commit()
+        if hasattr(os, 'link'):
+            self.assertTrue(os.path.samefile('report.md', 'backup/report_1.md'))
+
+        second = ReportWriter('report.md', 'backup/report_2.md', quiet=True)
+        second.write("second\n")
+        second.commit()
+
+        self.assertEqual(self.read('report.md'), "second\n")
+        self.assertEqual(self.read('backup/report_1.md'), "first\n")
+        self.assertEqual(self.read('backup/report_2.md'), "second\n")
+
+    def test_failed_report_keeps_previous_file(self):
+        """A report abandoned by an exception leaves the previous report and no temporary file"""
+        save = ReportWriter('report.md', quiet=True)
+        save.write("previous\n")
+        save.commit()
+
+        with self.assertRaises(ValueError):
+            with ReportWriter('report.md', quiet=True) as report:
+                report.write("partial\n")
+                raise ValueError('section failed')
+
+        report = ReportWriter('report.md', quiet=True)
+        report.write("discarded\n")
+        report.discard()
+
+        self.assertEqual(self.read('report.md'), "previous\n")
+        self.assertEqual(sorted(os.listdir('.')), ['report.md'])
+
+    def test_link_or_copy_replaces_target(self):
+        """An existing target is replaced with the source content"""
+        with open('source.md', 'w', encoding='utf-8') as f:
+            f.write("new\n")
+        with open('target.md', 'w', encoding='utf-8') as f:
+            f.write("old\n")
+
+        link_or_copy('source.md', 'target.md')
+
+        self.assertEqual(self.read('target.md'), "new\n")
+
+    def test_save_report_files_compatibility(self):
+        """The string-based helper still saves both files"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            main_path, backup_path = save_report_files("내용\n", '테스트_report')
+
+        self.assertEqual(self.read(main_path), "내용\n")
+        self.assertEqual(self.read(backup_path), "내용\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
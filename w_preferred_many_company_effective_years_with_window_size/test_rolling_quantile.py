@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the sliding-window quantile engine
+Checks parity with the original pd.Series(window).quantile loop in stock_diff.py
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from rolling_quantile import (
+    SlidingWindowQuantile, calculate_rolling_quantiles, quantile_from_sorted
+)
+
+
+def reference_rolling_quantile(values, window_size, quantile):
+    """Original expanding-then-sliding implementation from stock_diff.py"""
+    result = []
+    for i in range(len(values)):
+        if i < window_size:
+            window_data = values[:i+1]
+        else:
+            window_data = values[i-window_size+1:i+1]
+        result.append(pd.Series(window_data).quantile(quantile))
+    return np.array(result)
+
+
+class TestRollingQuantile(unittest.TestCase):
+    """Test cases for rolling_quantile"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(42)
+        # Price_Diff_Ratio-like series: random walk with repeated values
+        self.values = np.round(20 + np.cumsum(rng.normal(0, 0.8, 2500)), 2)
+        self.window_configs = {'2year': 730, '3year': 1095, '5year': 1825}
+
+    def test_parity_with_pandas_loop(self):
+        """All windows and quantiles match the original loop exactly"""
+        results = calculate_rolling_quantiles(self.values, self.window_configs)
+
+        for window_name, window_size in self.window_configs.items():
+            for q in (0.25, 0.75):
+                expected = reference_rolling_quantile(self.values, window_size, q)
+                np.testing.assert_array_equal(results[window_name][q], expected)
+
+    def test_parity_with_small_windows_and_other_quantiles(self):
+        """Parity holds for tiny windows and arbitrary quantiles"""
+        quantiles = (0.0, 0.1, 0.5, 0.9, 1.0)
+        window_configs = {'w1': 1, 'w2': 2, 'w7': 7}
+        results = calculate_rolling_quantiles(self.values[:200], window_configs, quantiles)
+
+        for window_name, window_size in window_configs.items():
+            for q in quantiles:
+                expected = reference_rolling_quantile(self.values[:200], window_size, q)
+                np.testing.assert_array_equal(results[window_name][q], expected)
+
+    def test_nan_values_are_skipped(self):
+        """NaN is ignored like pandas, and an all-NaN window yields NaN"""
+        values = np.array([np.nan, 1.0, np.nan, 3.0, 2.0, np.nan, np.nan, np.nan, 5.0])
+        results = calculate_rolling_quantiles(values, {'w3': 3}, (0.25, 0.75))
+
+        for q in (0.25, 0.75):
+            expected = reference_rolling_quantile(values, 3, q)
+            np.testing.assert_array_equal(results['w3'][q], expected)
+        self.assertTrue(np.isnan(results['w3'][0.25][0]))
+        self.assertTrue(np.isnan(results['w3'][0.25][7]))
+
+    def test_empty_input(self):
+        """Empty input returns empty arrays"""
+        results = calculate_rolling_quantiles([], {'2year': 730})
+        self.assertEqual(len(results['2year'][0.25]), 0)
+        self.assertTrue(np.isnan(quantile_from_sorted([], 0.5)))
+
+    def test_window_keeps_size(self):
+        """The window never holds more than window_size values"""
+        window = SlidingWindowQuantile(3)
+        for value in [5, 1, 4, 2, 3]:
+            window.push(value)
+        self.assertEqual(len(window), 3)
+        self.assertEqual(window.push(10), (2.5, 6.5))
+
+    def test_restored_state_continues_like_uninterrupted_window(self):
+        """A window rebuilt from state() gives the same quantiles as one that was never stopped"""
+        values = np.append(self.values[:300], np.nan)
+        window = SlidingWindowQuantile(50)
+        for value in values[:250]:
+            window.push(value)
+
+        restored = SlidingWindowQuantile.from_state(50, *window.state())
+        resorted = SlidingWindowQuantile.from_state(50, window.state()[0])
+        for value in values[250:]:
+            expected = window.push(value)
+            self.assertEqual(restored.push(value), expected)
+            self.assertEqual(resorted.push(value), expected)
+
+        with self.assertRaises(ValueError):
+            SlidingWindowQuantile.from_state(3, [1.0, 2.0, 3.0, 4.0])
+
+    def test_invalid_window_size(self):
+        """Non-positive window size raises ValueError"""
+        with self.assertRaises(ValueError):
+            SlidingWindowQuantile(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
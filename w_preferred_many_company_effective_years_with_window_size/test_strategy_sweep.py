@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the switching strategy parameter sweep
+"""
+
+import unittest
+import contextlib
+import io
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analysis_storage import save_analysis_data
+from backtest_strategy_with_report import run_strategy_batch, summarize_strategy_result
+from rolling_quantile import calculate_rolling_quantiles
+from strategy_sweep import (
+    build_parameter_grid, run_parameter_sweep, save_sweep_results, sweep_strategies
+)
+
+
+def make_period_frame(rows=900, seed=11):
+    """Build a stock_diff-like period frame with 2year quantile columns"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2020-01-02', periods=rows)
+    common_close = 60000 * np.exp(np.cumsum(rng.normal(0, 0.012, rows)))
+    preferred_close = common_close * (0.82 + 0.04 * np.sin(np.arange(rows) / 35))
+    df = pd.DataFrame({
+        'Stock1_Close': np.round(common_close),
+        'Stock2_Close': np.round(preferred_close),
+        'Stock1_Open': np.round(common_close * (1 + rng.normal(0, 0.004, rows))),
+        'Stock2_Open': np.round(preferred_close * (1 + rng.normal(0, 0.004, rows))),
+        'Dividend_Amount_Raw': np.where(np.arange(rows) % 63 == 20, 361.0, 0.0),
+    }, index=dates)
+    df['Price_Diff_Ratio'] = (df['Stock1_Close'] - df['Stock2_Close']) * 100 / df['Stock2_Close']
+    quantiles = calculate_rolling_quantiles(df['Price_Diff_Ratio'].to_numpy(), {'2year': 730})
+    df['Price_Diff_Ratio_25th_Percentile_2year'] = quantiles['2year'][0.25]
+    df['Price_Diff_Ratio_75th_Percentile_2year'] = quantiles['2year'][0.75]
+    return df
+
+
+class TestStrategySweep(unittest.TestCase):
+    """Test cases for strategy_sweep"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        self.df = make_period_frame()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_grid_skips_inverted_thresholds(self):
+        """Only lower < upper combinations are generated"""
+        grid = build_parameter_grid((0.2, 0.5), (0.5, 0.8), (365,), ('기본',))
+        self.assertEqual([(p['lower_quantile'], p['upper_quantile']) for p in grid], [(0.2, 0.5), (0.2, 0.8), (0.5, 0.8)])
+
+    def test_default_point_matches_comprehensive_backtest(self):
+        """(0.25, 0.75, 730) reproduces the report's 2-year basic/reverse strategies"""
+        grid = build_parameter_grid((0.25,), (0.75,), (730,))
+        results = sweep_strategies(self.df, grid).set_index('strategy')
+
+        initial_stock_type = '테스트 보통주'
+        initial_shares = int(100_000_000 / self.df['Stock1_Open'].iloc[0])
+        df_backtest = self.df.iloc[1:].copy()
+        configs = [('기본', '2year', False), ('반대', '2year', True)]
+        with contextlib.redirect_stdout(io.StringIO()):
+            kernel_results = run_strategy_batch(df_backtest, initial_stock_type, initial_shares, '테스트', configs)
+            for strategy_name, window_suffix, _ in configs:
+                expected = summarize_strategy_result(df_backtest, kernel_results[strategy_name], initial_stock_type,
+                                                     initial_shares, 100_000_000, '테스트', strategy_name, window_suffix)
+                self.assertEqual(results.loc[strategy_name, 'final_value'], expected['final_value'])
+                self.assertEqual(results.loc[strategy_name, 'return_rate'], expected['return_rate'])
+
+    def test_parallel_sweep_matches_sequential(self):
+        """The process pool gives the same ranked table and skips missing data"""
+        for company_name, seed in [('회사A', 1), ('회사B', 2)]:
+            save_analysis_data(make_period_frame(seed=seed), company_name, '3년', directory=self.directory)
+        grid = build_parameter_grid((0.1, 0.25), (0.75, 0.9), (120, 730))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            sequential = run_parameter_sweep(['회사A', '회사B', '없는회사'], ['3년'], grid, jobs=1, directory=self.directory)
+            parallel = run_parameter_sweep(['회사A', '회사B', '없는회사'], ['3년'], grid, jobs=2, directory=self.directory)
+
+        pd.testing.assert_frame_equal(parallel, sequential)
+        self.assertEqual(sorted(sequential['company'].unique()), ['회사A', '회사B'])
+        self.assertEqual(len(sequential), 2 * len(grid))
+        first = sequential[sequential['company'] == '회사A']
+        self.assertEqual(first['rank'].tolist(), list(range(1, len(grid) + 1)))
+        self.assertTrue(first['return_rate'].is_monotonic_decreasing)
+
+    def test_save_writes_table_and_heatmap(self):
+        """Results are written as CSV, Markdown and one heatmap per company/period"""
+        save_analysis_data(self.df, '회사A', '3년', directory=self.directory)
+        grid = build_parameter_grid((0.1, 0.25), (0.75, 0.9), (730,))
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = run_parameter_sweep(['회사A'], ['3년'], grid, jobs=1, directory=self.directory)
+            saved = save_sweep_results(results, top=3, directory=self.directory)
+
+        self.assertEqual(sorted(os.path.basename(path) for path in saved),
+                         ['strategy_sweep_report.md', 'strategy_sweep_results.csv', '회사A_strategy_sweep_3년.png'])
+        with open(os.path.join(self.directory, 'strategy_sweep_report.md'), encoding='utf-8') as f:
+            report = f.read()
+        self.assertIn('## 회사A 3년', report)
+        self.assertEqual(sum(line.startswith('| ') and line[2].isdigit() for line in report.splitlines()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
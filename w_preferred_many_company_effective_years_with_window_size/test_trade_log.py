@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the array-backed trading log
+"""
+
+import unittest
+import pickle
+import tempfile
+import shutil
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backtest_kernel import EVENT_DIVIDEND, EVENT_SWITCH, HOLD_COMMON, HOLD_PREFERRED
+from trade_log import ACTION_DIVIDEND, ACTION_INITIAL, ACTION_SWITCH, TradeLog
+
+STOCK_NAMES = {HOLD_COMMON: '테스트 보통주', HOLD_PREFERRED: '테스트 우선주'}
+
+
+def make_trade_log():
+    """Log with a switch to preferred, a dividend and a switch back on the same day"""
+    index = pd.bdate_range('2024-01-02', periods=6)
+    events = [
+        # (day, kind, from, to, shares_before, shares_after, price, buy_price, amount, cash_after)
+        (2, EVENT_SWITCH, HOLD_COMMON, HOLD_PREFERRED, 100.0, 125.0, 60000.0, 48000.0, 6000000.0, 0.0),
+        (4, EVENT_DIVIDEND, HOLD_PREFERRED, HOLD_PREFERRED, 125.0, 125.0, 361.0, 0.0, 45125.0, 45125.0),
+        (4, EVENT_SWITCH, HOLD_PREFERRED, HOLD_COMMON, 125.0, 99.5, 49000.0, 61557.79, 6125000.0, 45125.0),
+    ]
+    values = np.arange(1, 7) * 1_000_000.0
+    ratio = np.linspace(20, 25, 6)
+    q25, q75 = ratio - 1, ratio + 1
+    return TradeLog.from_kernel_events(index, events, values, ratio, q25, q75, HOLD_COMMON, 100, STOCK_NAMES)
+
+
+class TestTradeLog(unittest.TestCase):
+    """Test cases for trade_log"""
+
+    def test_counters_are_precomputed(self):
+        """Counts used by the reports are available without scanning the log"""
+        log = make_trade_log()
+
+        self.assertEqual(len(log), 4)
+        self.assertEqual(list(log.actions), [ACTION_INITIAL, ACTION_SWITCH, ACTION_DIVIDEND, ACTION_SWITCH])
+        self.assertEqual(log.trade_count, 2)
+        self.assertEqual(log.dividend_count, 1)
+        self.assertEqual(log.common_to_preferred, 1)
+        self.assertEqual(log.preferred_to_common, 1)
+        self.assertEqual(log.dividend_total, 45125.0)
+        self.assertEqual(list(log.trade_dates().strftime('%Y-%m-%d')), ['2024-01-04', '2024-01-08'])
+
+    def test_records_keep_legacy_format(self):
+        """Formatted strings appear only in the exported records"""
+        records = make_trade_log().to_records()
+
+        self.assertEqual(records[0]['Action'], '초기보유')
+        self.assertEqual(records[0]['Current_Shares'], 100)
+        self.assertEqual(records[0]['Portfolio_Value'], 1_000_000.0)
+        self.assertEqual(records[1]['Stock_Type'], '테스트 보통주 -> 테스트 우선주')
+        self.assertEqual(records[1]['Shares_Traded'], '매도 100.00주 -> 매수 125.00주')
+        self.assertEqual(records[1]['Price_Per_Share'], '매도가 60,000원 -> 매수가 48,000원')
+        self.assertEqual(records[1]['Total_Amount'], '매도금 6,000,000원 -> 매수금 6,000,000원')
+        self.assertEqual((records[1]['Price_Diff_Ratio'], records[1]['Q25']), (21.0, 20.0))
+        self.assertEqual(records[2]['Shares_Traded'], '125.00주')
+        self.assertEqual(records[2]['Total_Amount'], '45,125원')
+        self.assertEqual((records[2]['Price_Diff_Ratio'], records[2]['Q25']), (24.0, 0.0))
+
+        # 같은 날 기록은 마지막 기록에만 포트폴리오 가치
+        self.assertEqual([record['Portfolio_Value'] for record in records[2:]], [0.0, 5_000_000.0])
+
+    def test_frame_round_trips_through_csv_and_pickle(self):
+        """to_frame writes the trading_log CSV columns and the log pickles for worker processes"""
+        log = make_trade_log()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        path = os.path.join(directory, 'trading_log.csv')
+
+        log.to_frame().to_csv(path, index=False, encoding='utf-8-sig')
+        loaded = pd.read_csv(path, encoding='utf-8-sig')
+
+        self.assertEqual(list(loaded.columns), list(log.to_records()[0]))
+        self.assertEqual(list(loaded['Action']), ['초기보유', '매도->매수', '배당금수령', '매도->매수'])
+
+        restored = pickle.loads(pickle.dumps(log))
+        self.assertEqual(restored.to_records(), log.to_records())
+        self.assertEqual(restored.trade_count, 2)
+
+    def test_log_without_events(self):
+        """A strategy that never trades has only the initial holding"""
+        index = pd.bdate_range('2024-01-02', periods=3)
+        log = TradeLog.from_kernel_events(index, [], np.ones(3), np.zeros(3), np.zeros(3), np.zeros(3),
+                                          HOLD_PREFERRED, 10, STOCK_NAMES)
+
+        self.assertEqual(len(log), 1)
+        self.assertEqual((log.trade_count, log.dividend_count), (0, 0))
+        self.assertEqual(log.to_records()[0]['Stock_Type'], '테스트 우선주')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+배열 기반 매매 기록 (run_single_strategy / summarize_strategy_result의 trading_log)
+
+매매/배당 이벤트마다 서식 문자열이 든 딕셔너리를 만드는 대신 숫자 컬럼(NumPy 배열)과
+동작 코드(ACTION_*)로 저장하고, 리포트가 반복해서 세던 값(매매 횟수, 배당 횟수, 방향별 교체 횟수)은
+기록을 만들 때 한 번 계산해 둡니다.
+'매도 123.45주 -> 매수 ...' 같은 문자열은 CSV/Markdown으로 내보낼 때만 만듭니다. (to_records, to_frame)
+"""
+
+import numpy as np
+import pandas as pd
+
+from backtest_kernel import EVENT_SWITCH, HOLD_COMMON, HOLD_PREFERRED
+
+ACTION_INITIAL = 0
+ACTION_SWITCH = 1
+ACTION_DIVIDEND = 2
+
+# CSV/리포트에 표시하는 동작 이름 (기존 'Action' 값)
+ACTION_LABELS = {
+    ACTION_INITIAL: '초기보유',
+    ACTION_SWITCH: '매도->매수',
+    ACTION_DIVIDEND: '배당금수령',
+}
+
+# 숫자 컬럼 (모두 float64)
+NUMERIC_COLUMNS = ('shares_before', 'shares_after', 'price', 'buy_price', 'amount',
+                   'cash_balance', 'portfolio_value', 'ratio', 'q25', 'q75')
+
+
+class TradeLog:
+    """
+    한 전략의 매매 기록
+
+    Args:
+        dates (pd.DatetimeIndex): 기록별 날짜
+        actions (array-like): 기록별 동작 코드 (ACTION_*)
+        from_holdings (array-like): 이전 보유 코드 (backtest_kernel.HOLD_*)
+        to_holdings (array-like): 이후 보유 코드
+        stock_names (dict): 보유 코드 -> 주식 유형 이름
+        **columns: NUMERIC_COLUMNS 배열
+
+    Attributes:
+        trade_count (int): 매매(교체) 횟수
+        dividend_count (int): 배당금 수령 횟수
+        common_to_preferred (int): 보통주 -> 우선주 교체 횟수
+        preferred_to_common (int): 우선주 -> 보통주 교체 횟수
+        dividend_total (float): 배당금 합계
+    """
+
+    def __init__(self, dates, actions, from_holdings, to_holdings, stock_names, **columns):
+        self.dates = pd.DatetimeIndex(dates)
+        self.actions = np.asarray(actions, dtype=np.int8)
+        self.from_holdings = np.asarray(from_holdings, dtype=np.int8)
+        self.to_holdings = np.asarray(to_holdings, dtype=np.int8)
+        self.stock_names = dict(stock_names)
+        for name in NUMERIC_COLUMNS:
+            setattr(self, name, np.asarray(columns[name], dtype=float))
+
+        # 리포트에서 쓰는 횟수는 기록을 만들 때 한 번만 계산
+        switches = self.actions == ACTION_SWITCH
+        dividends = self.actions == ACTION_DIVIDEND
+        self.trade_count = int(switches.sum())
+        self.dividend_count = int(dividends.sum())
+        self.common_to_preferred = int((switches & (self.from_holdings == HOLD_COMMON)
+                                        & (self.to_holdings == HOLD_PREFERRED)).sum())
+        self.preferred_to_common = int((switches & (self.from_holdings == HOLD_PREFERRED)
+                                        & (self.to_holdings == HOLD_COMMON)).sum())
+        self.dividend_total = float(self.amount[dividends].sum())
+
+    @classmethod
+    def from_kernel_events(cls, index, events, portfolio_values, ratio, q25, q75,
+                           initial_holding, initial_shares, stock_names):
+        """
+        backtest_kernel 이벤트로 매매 기록을 만듭니다. (초기 보유 기록 + 매매/배당 이벤트)
+
+        같은 날 여러 기록이 있으면 마지막 기록에만 종가 기준 포트폴리오 가치를 기록합니다.
+        매매 기록의 비율/분위수는 신호를 만든 전일 값, 배당 기록의 비율은 당일 값입니다.
+
+        Args:
+            index (pd.DatetimeIndex): 백테스트 날짜
+            events (list): 커널 이벤트 튜플 목록
+            portfolio_values (np.ndarray): 일별 포트폴리오 가치
+            ratio (np.ndarray): 일별 Price_Diff_Ratio
+            q25 (np.ndarray): 일별 25% 분위수
+            q75 (np.ndarray): 일별 75% 분위수
+            initial_holding (int): 초기 보유 코드
+            initial_shares (float): 초기 보유 주식 수
+            stock_names (dict): 보유 코드 -> 주식 유형 이름
+
+        Returns:
+            TradeLog: 매매 기록
+        """
+        count = len(events) + 1
+        days = np.zeros(count, dtype=np.int64)
+        actions = np.full(count, ACTION_INITIAL, dtype=np.int8)
+        from_holdings = np.full(count, initial_holding, dtype=np.int8)
+        to_holdings = np.full(count, initial_holding, dtype=np.int8)
+        columns = {name: np.zeros(count) for name in NUMERIC_COLUMNS}
+        columns['shares_after'][0] = initial_shares
+
+        if events:
+            (event_days, kinds, event_from, event_to, shares_before, shares_after,
+             price, buy_price, amount, cash_after) = zip(*events)
+            days[1:] = event_days
+            switches = np.array([kind == EVENT_SWITCH for kind in kinds])
+            actions[1:] = np.where(switches, ACTION_SWITCH, ACTION_DIVIDEND)
+            from_holdings[1:] = event_from
+            to_holdings[1:] = event_to
+            columns['shares_before'][1:] = shares_before
+            columns['shares_after'][1:] = shares_after
+            columns['price'][1:] = price
+            columns['buy_price'][1:] = buy_price
+            columns['amount'][1:] = amount
+            columns['cash_balance'][1:] = cash_after
+
+            event_days = days[1:]
+            signal_days = np.where(switches, event_days - 1, event_days)
+            columns['ratio'][1:] = ratio[signal_days]
+            columns['q25'][1:] = np.where(switches, q25[event_days - 1], 0.0)
+            columns['q75'][1:] = np.where(switches, q75[event_days - 1], 0.0)
+
+        is_last_of_day = np.ones(count, dtype=bool)
+        is_last_of_day[1:-1] = days[1:-1] != days[2:]
+        is_last_of_day[0] = True  # 초기 보유 기록은 항상 첫날 가치
+        columns['portfolio_value'][1:] = np.where(is_last_of_day[1:], portfolio_values[days[1:]], 0.0)
+        columns['portfolio_value'][0] = portfolio_values[0]
+        columns['ratio'][0] = ratio[0]
+
+        return cls(index[days], actions, from_holdings, to_holdings, stock_names, **columns)
+
+    def __len__(self):
+        return len(self.actions)
+
+    def trade_dates(self):
+        """매매(교체) 기록의 날짜"""
+        return self.dates[self.actions == ACTION_SWITCH]
+
+    def to_records(self):
+        """
+        기존 형식의 기록 목록으로 변환합니다. (서식 문자열 포함, CSV/Markdown 출력용)
+
+        Returns:
+            list: 기록 딕셔너리 목록
+        """
+        names = self.stock_names
+        dates = self.dates.strftime('%Y-%m-%d')
+        records = []
+        for i in range(len(self)):
+            action = int(self.actions[i])
+            shares_after = self.shares_after[i]
+            to_name = names[int(self.to_holdings[i])]
+            if action == ACTION_SWITCH:
+                stock_type = f'{names[int(self.from_holdings[i])]} -> {to_name}'
+                shares = f'매도 {self.shares_before[i]:.2f}주 -> 매수 {shares_after:.2f}주'
+                price = f'매도가 {self.price[i]:,.0f}원 -> 매수가 {self.buy_price[i]:,.0f}원'
+                total = f'매도금 {self.amount[i]:,.0f}원 -> 매수금 {shares_after * self.buy_price[i]:,.0f}원'
+            elif action == ACTION_DIVIDEND:
+                stock_type = to_name
+                shares = f'{shares_after:.2f}주'
+                price = f'{self.price[i]:,.0f}원/주'
+                total = f'{self.amount[i]:,.0f}원'
+            else:
+                stock_type, shares, price, total = to_name, 0, 0, 0
+            records.append({
+                'Date': dates[i],
+                'Action': ACTION_LABELS[action],
+                'Stock_Type': stock_type,
+                'Shares_Traded': shares,
+                'Price_Per_Share': price,
+                'Total_Amount': total,
+                'Current_Shares': shares_after,
+                'Current_Stock_Type': to_name,
+                'Cash_Balance': self.cash_balance[i],
+                'Portfolio_Value': self.portfolio_value[i],
+                'Price_Diff_Ratio': self.ratio[i],
+                'Q25': self.q25[i],
+                'Q75': self.q75[i],
+            })
+        return records
+
+    def to_frame(self):
+        """
+        CSV 저장용 DataFrame (기존 trading_log CSV와 같은 컬럼)
+
+        Returns:
+            pd.DataFrame: 매매 기록
+        """
+        return pd.DataFrame(self.to_records())
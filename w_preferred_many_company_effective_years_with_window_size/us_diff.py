@@ -1,23 +1,34 @@
 # -*- coding: utf-8 -*-
-import yfinance as yf
 import pandas as pd
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
 import platform
-import matplotlib.font_manager as fm
+from datetime import datetime, timedelta
+from lazy_imports import lazy_pyplot, lazy_seaborn
+from market_data_cache import company_tickers, get_market_data_cache, set_offline, to_long_prices, wide_prices
+from derived_columns import safe_ratio
+from dividend_data import normalize_dividend_series
+
+
+def configure_english_font(plt):
+    """
+    OS에 맞게 영문 폰트를 설정합니다. (그래프를 처음 그릴 때 한 번 호출)
+
+    Args:
+        plt (module): matplotlib.pyplot
+    """
+    system_name = platform.system()
+    if system_name == 'Windows':
+        plt.rcParams['font.family'] = 'Arial'
+    elif system_name == 'Darwin':  # Mac OS
+        plt.rcParams['font.family'] = 'Arial'
+    elif system_name == 'Linux':
+        plt.rcParams['font.family'] = 'DejaVu Sans'
 
-# OS에 맞게 폰트 설정
-system_name = platform.system()
-if system_name == 'Windows':
-    plt.rcParams['font.family'] = 'Arial'
-elif system_name == 'Darwin':  # Mac OS
-    plt.rcParams['font.family'] = 'Arial'
-elif system_name == 'Linux':
-    plt.rcParams['font.family'] = 'DejaVu Sans'
+    plt.rcParams['axes.unicode_minus'] = False
 
-plt.rcParams['axes.unicode_minus'] = False
+# matplotlib/seaborn은 그래프를 처음 그릴 때 import (lazy_imports)
+plt = lazy_pyplot(configure=configure_english_font)
+sns = lazy_seaborn(plt)
 
 # 미국 우선주를 가진 주요 회사들의 리스트 (검증된 티커만 포함)
 US_PREFERRED_STOCK_COMPANIES = {
@@ -87,6 +98,50 @@ US_PREFERRED_STOCK_COMPANIES = {
     }
 }
 
+# 최근 종가 조회 구간 (history(period="5d")의 5거래일을 덮도록 달력 기준 10일)
+RECENT_PRICE_DAYS = 10
+
+# prefetch_us_prices()로 받은 모든 미국 티커의 최근 가격 (long 형식)
+_recent_prices = None
+
+def prefetch_us_prices():
+    """
+    모든 미국 회사의 보통주/우선주 최근 가격을 한 번의 일괄 요청으로 받습니다.
+    
+    Returns:
+        pd.DataFrame: long 형식 가격 데이터 (Date, Ticker, 가격 필드)
+    """
+    global _recent_prices
+    today = datetime.now()
+    start_date = (today - timedelta(days=RECENT_PRICE_DAYS)).strftime('%Y-%m-%d')
+    end_date = (today + timedelta(days=1)).strftime('%Y-%m-%d')
+    try:
+        _recent_prices = get_market_data_cache().download_many(
+            company_tickers(US_PREFERRED_STOCK_COMPANIES), start_date, end_date
+        )
+    except Exception as e:
+        print(f"⚠️ 가격 일괄 다운로드 실패 - 티커별로 조회합니다: {e}")
+        _recent_prices = to_long_prices(None)
+    return _recent_prices
+
+def get_recent_prices(ticker):
+    """
+    티커의 최근 가격을 일괄 다운로드 결과에서 가져옵니다.
+    일괄 결과에 없는 티커는 history(period="5d")로 개별 조회합니다.
+    
+    Args:
+        ticker (str): 티커 심볼
+        
+    Returns:
+        pd.DataFrame: 날짜 인덱스, 가격 필드 컬럼
+    """
+    if _recent_prices is None:
+        prefetch_us_prices()
+    prices = wide_prices(_recent_prices, ticker)
+    if prices.empty:
+        prices = get_market_data_cache().ticker(ticker).history(period="5d")
+    return prices
+
 def validate_us_ticker_availability():
     """
     미국 우선주 티커들이 yfinance에서 사용 가능한지 검증합니다.
@@ -101,6 +156,9 @@ def validate_us_ticker_availability():
     total_companies = len(US_PREFERRED_STOCK_COMPANIES)
     successful_companies = 0
     
+    # 모든 티커의 종목 정보를 동시에 받아 캐시에 저장 (아래 검증은 캐시에서 읽음)
+    get_market_data_cache().fetch_snapshots(company_tickers(US_PREFERRED_STOCK_COMPANIES), fields=('info',))
+    
     for company_name, company_info in US_PREFERRED_STOCK_COMPANIES.items():
         print(f"\n🏢 {company_name} ({company_info['sector']})")
         print("-" * 60)
@@ -118,9 +176,9 @@ def validate_us_ticker_availability():
         print(f"📈 보통주 검증: {common_ticker}")
         
         try:
-            common_stock = yf.Ticker(common_ticker)
+            common_stock = get_market_data_cache().ticker(common_ticker)
             common_info = common_stock.info
-            common_hist = common_stock.history(period="5d")
+            common_hist = get_recent_prices(common_ticker)
             
             if not common_hist.empty and 'shortName' in common_info:
                 company_results['common_stock'] = {
@@ -159,9 +217,9 @@ def validate_us_ticker_availability():
                 print(f"  🔍 {preferred_ticker} 검증 중...")
                 
                 try:
-                    preferred_stock = yf.Ticker(preferred_ticker)
+                    preferred_stock = get_market_data_cache().ticker(preferred_ticker)
                     preferred_info = preferred_stock.info
-                    preferred_hist = preferred_stock.history(period="5d")
+                    preferred_hist = get_recent_prices(preferred_ticker)
                     
                     if not preferred_hist.empty and 'shortName' in preferred_info:
                         company_results['preferred_stocks'][series_name] = {
@@ -262,6 +320,9 @@ def generate_comprehensive_dividend_analysis():
     
     analysis_results = []
     
+    # 모든 티커의 배당금을 동시에 받아 캐시에 저장 (아래 분석은 캐시에서 읽음)
+    get_market_data_cache().fetch_snapshots(company_tickers(US_PREFERRED_STOCK_COMPANIES), fields=('dividends',))
+    
     for company_name, company_info in US_PREFERRED_STOCK_COMPANIES.items():
         print(f"\n🏢 {company_name} 분석 중...")
         
@@ -276,12 +337,12 @@ def generate_comprehensive_dividend_analysis():
             
             try:
                 # 주식 정보 가져오기
-                common_stock = yf.Ticker(common_ticker)
-                preferred_stock = yf.Ticker(preferred_ticker)
+                common_stock = get_market_data_cache().ticker(common_ticker)
+                preferred_stock = get_market_data_cache().ticker(preferred_ticker)
                 
                 # 현재 가격
-                common_hist = common_stock.history(period="5d")
-                preferred_hist = preferred_stock.history(period="5d")
+                common_hist = get_recent_prices(common_ticker)
+                preferred_hist = get_recent_prices(preferred_ticker)
                 
                 if common_hist.empty or preferred_hist.empty:
                     print(f"    ❌ 가격 데이터 없음")
@@ -300,13 +361,13 @@ def generate_comprehensive_dividend_analysis():
                 
                 # 배당금 날짜를 naive datetime으로 변환
                 if not common_dividends.empty:
-                    common_dividends.index = pd.to_datetime(common_dividends.index).tz_localize(None)
+                    common_dividends = normalize_dividend_series(common_dividends)
                     common_recent = common_dividends[common_dividends.index >= one_year_ago]
                 else:
                     common_recent = pd.Series()
                 
                 if not preferred_dividends.empty:
-                    preferred_dividends.index = pd.to_datetime(preferred_dividends.index).tz_localize(None)
+                    preferred_dividends = normalize_dividend_series(preferred_dividends)
                     preferred_recent = preferred_dividends[preferred_dividends.index >= one_year_ago]
                 else:
                     preferred_recent = pd.Series()
@@ -315,8 +376,8 @@ def generate_comprehensive_dividend_analysis():
                 preferred_annual_dividend = preferred_recent.sum() if not preferred_recent.empty else 0
                 
                 # 배당률 계산
-                common_yield = (common_annual_dividend / common_price * 100) if common_price > 0 else 0
-                preferred_yield = (preferred_annual_dividend / preferred_price * 100) if preferred_price > 0 else 0
+                common_yield = safe_ratio(common_annual_dividend, common_price)
+                preferred_yield = safe_ratio(preferred_annual_dividend, preferred_price)
                 
                 # 우선주 프리미엄 계산
                 yield_premium = preferred_yield - common_yield
@@ -331,13 +392,13 @@ def generate_comprehensive_dividend_analysis():
                     'common_price': common_price,
                     'preferred_price': preferred_price,
                     'price_diff': common_price - preferred_price,
-                    'price_diff_ratio': ((common_price - preferred_price) / preferred_price * 100) if preferred_price > 0 else 0,
+                    'price_diff_ratio': safe_ratio(common_price - preferred_price, preferred_price),
                     'common_annual_dividend': common_annual_dividend,
                     'preferred_annual_dividend': preferred_annual_dividend,
                     'common_yield': common_yield,
                     'preferred_yield': preferred_yield,
                     'yield_premium': yield_premium,
-                    'dividend_ratio': (preferred_annual_dividend / common_annual_dividend) if common_annual_dividend > 0 else 0
+                    'dividend_ratio': safe_ratio(preferred_annual_dividend, common_annual_dividend, scale=1)
                 }
                 
                 analysis_results.append(result)
@@ -558,13 +619,16 @@ def get_us_preferred_dividend_comparison(company_name, ticker_pair=None):
     print("-" * 60)
     
     try:
+        # 두 종목의 배당금을 동시에 받아 캐시에 저장
+        get_market_data_cache().fetch_snapshots([common_ticker, preferred_ticker], fields=('dividends',))
+        
         # 주식 정보 가져오기
-        common_stock = yf.Ticker(common_ticker)
-        preferred_stock = yf.Ticker(preferred_ticker)
+        common_stock = get_market_data_cache().ticker(common_ticker)
+        preferred_stock = get_market_data_cache().ticker(preferred_ticker)
         
         # 현재 가격
-        common_hist = common_stock.history(period="5d")
-        preferred_hist = preferred_stock.history(period="5d")
+        common_hist = get_recent_prices(common_ticker)
+        preferred_hist = get_recent_prices(preferred_ticker)
         
         if common_hist.empty or preferred_hist.empty:
             print(f"❌ 가격 데이터를 가져올 수 없습니다.")
@@ -583,13 +647,13 @@ def get_us_preferred_dividend_comparison(company_name, ticker_pair=None):
         
         # 배당금 날짜를 naive datetime으로 변환
         if not common_dividends.empty:
-            common_dividends.index = pd.to_datetime(common_dividends.index).tz_localize(None)
+            common_dividends = normalize_dividend_series(common_dividends)
             common_recent = common_dividends[common_dividends.index >= one_year_ago]
         else:
             common_recent = pd.Series()
         
         if not preferred_dividends.empty:
-            preferred_dividends.index = pd.to_datetime(preferred_dividends.index).tz_localize(None)
+            preferred_dividends = normalize_dividend_series(preferred_dividends)
             preferred_recent = preferred_dividends[preferred_dividends.index >= one_year_ago]
         else:
             preferred_recent = pd.Series()
@@ -598,8 +662,8 @@ def get_us_preferred_dividend_comparison(company_name, ticker_pair=None):
         preferred_annual_dividend = preferred_recent.sum() if not preferred_recent.empty else 0
         
         # 배당률 계산
-        common_yield = (common_annual_dividend / common_price * 100) if common_price > 0 else 0
-        preferred_yield = (preferred_annual_dividend / preferred_price * 100) if preferred_price > 0 else 0
+        common_yield = safe_ratio(common_annual_dividend, common_price)
+        preferred_yield = safe_ratio(preferred_annual_dividend, preferred_price)
         
         result = {
             'company_name': company_name,
@@ -619,9 +683,9 @@ def get_us_preferred_dividend_comparison(company_name, ticker_pair=None):
             },
             'comparison': {
                 'price_difference': common_price - preferred_price,
-                'price_diff_ratio': ((common_price - preferred_price) / preferred_price * 100) if preferred_price > 0 else 0,
+                'price_diff_ratio': safe_ratio(common_price - preferred_price, preferred_price),
                 'dividend_difference': preferred_annual_dividend - common_annual_dividend,
-                'dividend_ratio': (preferred_annual_dividend / common_annual_dividend) if common_annual_dividend > 0 else 0,
+                'dividend_ratio': safe_ratio(preferred_annual_dividend, common_annual_dividend, scale=1),
                 'yield_difference': preferred_yield - common_yield
             }
         }
@@ -822,9 +886,13 @@ if __name__ == "__main__":
     parser.add_argument('--company', '-c', type=str, help='특정 회사 분석')
     parser.add_argument('--sector', '-s', type=str, help='특정 섹터 분석')
     parser.add_argument('--list', '-l', action='store_true', help='지원 회사 목록 출력')
+    parser.add_argument('--offline', action='store_true', help='네트워크 없이 로컬 시장 데이터 캐시만 사용')
     
     args = parser.parse_args()
     
+    if args.offline:
+        set_offline(True)
+    
     if args.list:
         print("\n📋 지원하는 미국 회사들 (검증된 티커만):")
         print("=" * 80)